@@ -1502,8 +1502,9 @@ class LoggingMode:
 
 class IvyWithGlobalProps(sys.modules[__name__].__class__):
     def __setattr__(self, name, value, internal=False):
-        previous_frame = inspect.currentframe().f_back
-        filename = inspect.getframeinfo(previous_frame)[0]
+        # the file name of the caller is all that's needed, and getframeinfo would
+        # read its source file on every call
+        filename = inspect.currentframe().f_back.f_code.co_filename
         internal = internal and _is_from_internal(filename)
         if not internal and name in GLOBAL_PROPS:
             raise ivy.utils.exceptions.IvyException(
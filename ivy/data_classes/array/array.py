@@ -8,6 +8,7 @@ from typing import Optional
 
 # local
 import ivy
+from ivy.utils.backend.handler import _register_live_array
 from .conversions import args_to_native, to_ivy
 from .activations import _ArrayWithActivations
 from .creation import _ArrayWithCreation
@@ -138,6 +139,7 @@ class Array(
         self._view_attributes(data)
 
     def _init(self, data, dynamic_backend=None):
+        previous_backend = self.__dict__.get("_backend")
         if ivy.is_ivy_array(data):
             self._data = data.data
         elif ivy.is_native_array(data):
@@ -166,6 +168,7 @@ class Array(
         else:
             self._dynamic_backend = ivy.dynamic_backend
         self.weak_type = False  # to handle 0-D jax front weak typed arrays
+        _register_live_array(self, previous_backend)
 
     def _view_attributes(self, data):
         self._base = None
@@ -191,6 +194,7 @@ class Array(
         from ivy.functional.ivy.gradients import _variable, _is_variable, _variable_data
         from ivy.utils.backend.handler import _determine_backend_from_args
 
+        previous_backend = self._backend
         if value == False:
             self._backend = _determine_backend_from_args(self).backend
 
@@ -210,6 +214,7 @@ class Array(
 
             self._backend = ivy.backend
 
+        _register_live_array(self, previous_backend)
         self._dynamic_backend = value
 
     @property
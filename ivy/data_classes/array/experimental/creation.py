@@ -124,6 +124,294 @@ class _ArrayWithCreationExperimental(abc.ABC):
         """
         return ivy.unsorted_segment_sum(self._data, segment_ids, num_segments)
 
+    def unsorted_segment_max(
+        self: ivy.Array,
+        segment_ids: ivy.Array,
+        num_segments: Union[int, ivy.Array],
+    ) -> ivy.Array:
+        r"""
+        ivy.Array instance method variant of ivy.unsorted_segment_max. This method
+        simply wraps the function, and so the docstring for ivy.unsorted_segment_max
+        also applies to this method with minimal changes.
+
+        Parameters
+        ----------
+        self
+            The array from which to gather values.
+        segment_ids
+            Must be in the same size with the first dimension of `self`. Has to be of
+            integer data type. The index-th element of `segment_ids` array is the
+            segment identifier for the index-th element of `self`.
+        num_segments
+            An integer or array representing the total number of distinct segment IDs.
+
+        Returns
+        -------
+        ret
+            The output array, of the maximum of the values of `self` in each segment.
+        """
+        return ivy.unsorted_segment_max(self._data, segment_ids, num_segments)
+
+    def unsorted_segment_prod(
+        self: ivy.Array,
+        segment_ids: ivy.Array,
+        num_segments: Union[int, ivy.Array],
+    ) -> ivy.Array:
+        r"""
+        ivy.Array instance method variant of ivy.unsorted_segment_prod. This method
+        simply wraps the function, and so the docstring for ivy.unsorted_segment_prod
+        also applies to this method with minimal changes.
+
+        Parameters
+        ----------
+        self
+            The array from which to gather values.
+        segment_ids
+            Must be in the same size with the first dimension of `self`. Has to be of
+            integer data type. The index-th element of `segment_ids` array is the
+            segment identifier for the index-th element of `self`.
+        num_segments
+            An integer or array representing the total number of distinct segment IDs.
+
+        Returns
+        -------
+        ret
+            The output array, of the product of the values of `self` in each segment.
+        """
+        return ivy.unsorted_segment_prod(self._data, segment_ids, num_segments)
+
+    def unsorted_segment_mean(
+        self: ivy.Array,
+        segment_ids: ivy.Array,
+        num_segments: Union[int, ivy.Array],
+    ) -> ivy.Array:
+        r"""
+        ivy.Array instance method variant of ivy.unsorted_segment_mean. This method
+        simply wraps the function, and so the docstring for ivy.unsorted_segment_mean
+        also applies to this method with minimal changes.
+
+        Parameters
+        ----------
+        self
+            The array from which to gather values.
+        segment_ids
+            Must be in the same size with the first dimension of `self`. Has to be of
+            integer data type. The index-th element of `segment_ids` array is the
+            segment identifier for the index-th element of `self`.
+        num_segments
+            An integer or array representing the total number of distinct segment IDs.
+
+        Returns
+        -------
+        ret
+            The output array, of the mean of the values of `self` in each segment.
+        """
+        return ivy.unsorted_segment_mean(self._data, segment_ids, num_segments)
+
+    def unsorted_segment_sqrt_n(
+        self: ivy.Array,
+        segment_ids: ivy.Array,
+        num_segments: Union[int, ivy.Array],
+    ) -> ivy.Array:
+        r"""
+        ivy.Array instance method variant of ivy.unsorted_segment_sqrt_n. This method
+        simply wraps the function, and so the docstring for ivy.unsorted_segment_sqrt_n
+        also applies to this method with minimal changes.
+
+        Parameters
+        ----------
+        self
+            The array from which to gather values.
+        segment_ids
+            Must be in the same size with the first dimension of `self`. Has to be of
+            integer data type. The index-th element of `segment_ids` array is the
+            segment identifier for the index-th element of `self`.
+        num_segments
+            An integer or array representing the total number of distinct segment IDs.
+
+        Returns
+        -------
+        ret
+            The output array, of the sum divided by the square root of the count of the
+            values of `self` in each segment.
+        """
+        return ivy.unsorted_segment_sqrt_n(self._data, segment_ids, num_segments)
+
+    def segment_sum(
+        self: ivy.Array,
+        segment_ids: ivy.Array,
+        num_segments: Optional[int] = None,
+    ) -> ivy.Array:
+        r"""
+        ivy.Array instance method variant of ivy.segment_sum. This method simply wraps
+        the function, and so the docstring for ivy.segment_sum also applies to this
+        method with minimal changes.
+
+        Parameters
+        ----------
+        self
+            The array from which to gather values.
+        segment_ids
+            Must be in the same size with the first dimension of `self`. Has to be of
+            integer data type, and sorted. The index-th element of `segment_ids` array
+            is the segment identifier for the index-th element of `self`.
+        num_segments
+            The total number of distinct segment IDs. Default is ``None``, the last
+            segment ID plus one.
+
+        Returns
+        -------
+        ret
+            The output array, of the sum of the values of `self` in each segment.
+        """
+        return ivy.segment_sum(self._data, segment_ids, num_segments)
+
+    def segment_min(
+        self: ivy.Array,
+        segment_ids: ivy.Array,
+        num_segments: Optional[int] = None,
+    ) -> ivy.Array:
+        r"""
+        ivy.Array instance method variant of ivy.segment_min. This method simply wraps
+        the function, and so the docstring for ivy.segment_min also applies to this
+        method with minimal changes.
+
+        Parameters
+        ----------
+        self
+            The array from which to gather values.
+        segment_ids
+            Must be in the same size with the first dimension of `self`. Has to be of
+            integer data type, and sorted. The index-th element of `segment_ids` array
+            is the segment identifier for the index-th element of `self`.
+        num_segments
+            The total number of distinct segment IDs. Default is ``None``, the last
+            segment ID plus one.
+
+        Returns
+        -------
+        ret
+            The output array, of the minimum of the values of `self` in each segment.
+        """
+        return ivy.segment_min(self._data, segment_ids, num_segments)
+
+    def segment_max(
+        self: ivy.Array,
+        segment_ids: ivy.Array,
+        num_segments: Optional[int] = None,
+    ) -> ivy.Array:
+        r"""
+        ivy.Array instance method variant of ivy.segment_max. This method simply wraps
+        the function, and so the docstring for ivy.segment_max also applies to this
+        method with minimal changes.
+
+        Parameters
+        ----------
+        self
+            The array from which to gather values.
+        segment_ids
+            Must be in the same size with the first dimension of `self`. Has to be of
+            integer data type, and sorted. The index-th element of `segment_ids` array
+            is the segment identifier for the index-th element of `self`.
+        num_segments
+            The total number of distinct segment IDs. Default is ``None``, the last
+            segment ID plus one.
+
+        Returns
+        -------
+        ret
+            The output array, of the maximum of the values of `self` in each segment.
+        """
+        return ivy.segment_max(self._data, segment_ids, num_segments)
+
+    def segment_prod(
+        self: ivy.Array,
+        segment_ids: ivy.Array,
+        num_segments: Optional[int] = None,
+    ) -> ivy.Array:
+        r"""
+        ivy.Array instance method variant of ivy.segment_prod. This method simply wraps
+        the function, and so the docstring for ivy.segment_prod also applies to this
+        method with minimal changes.
+
+        Parameters
+        ----------
+        self
+            The array from which to gather values.
+        segment_ids
+            Must be in the same size with the first dimension of `self`. Has to be of
+            integer data type, and sorted. The index-th element of `segment_ids` array
+            is the segment identifier for the index-th element of `self`.
+        num_segments
+            The total number of distinct segment IDs. Default is ``None``, the last
+            segment ID plus one.
+
+        Returns
+        -------
+        ret
+            The output array, of the product of the values of `self` in each segment.
+        """
+        return ivy.segment_prod(self._data, segment_ids, num_segments)
+
+    def segment_mean(
+        self: ivy.Array,
+        segment_ids: ivy.Array,
+        num_segments: Optional[int] = None,
+    ) -> ivy.Array:
+        r"""
+        ivy.Array instance method variant of ivy.segment_mean. This method simply wraps
+        the function, and so the docstring for ivy.segment_mean also applies to this
+        method with minimal changes.
+
+        Parameters
+        ----------
+        self
+            The array from which to gather values.
+        segment_ids
+            Must be in the same size with the first dimension of `self`. Has to be of
+            integer data type, and sorted. The index-th element of `segment_ids` array
+            is the segment identifier for the index-th element of `self`.
+        num_segments
+            The total number of distinct segment IDs. Default is ``None``, the last
+            segment ID plus one.
+
+        Returns
+        -------
+        ret
+            The output array, of the mean of the values of `self` in each segment.
+        """
+        return ivy.segment_mean(self._data, segment_ids, num_segments)
+
+    def segment_sqrt_n(
+        self: ivy.Array,
+        segment_ids: ivy.Array,
+        num_segments: Optional[int] = None,
+    ) -> ivy.Array:
+        r"""
+        ivy.Array instance method variant of ivy.segment_sqrt_n. This method simply
+        wraps the function, and so the docstring for ivy.segment_sqrt_n also applies to
+        this method with minimal changes.
+
+        Parameters
+        ----------
+        self
+            The array from which to gather values.
+        segment_ids
+            Must be in the same size with the first dimension of `self`. Has to be of
+            integer data type, and sorted. The index-th element of `segment_ids` array
+            is the segment identifier for the index-th element of `self`.
+        num_segments
+            The total number of distinct segment IDs. Default is ``None``, the last
+            segment ID plus one.
+
+        Returns
+        -------
+        ret
+            The output array, of the sum divided by the square root of the count of the
+            values of `self` in each segment.
+        """
+        return ivy.segment_sqrt_n(self._data, segment_ids, num_segments)
+
     def blackman_window(
         self: ivy.Array,
         /,
@@ -1173,3 +1173,60 @@ class _ArrayWithLayersExperimental(abc.ABC):
             name=name,
             out=out,
         )
+
+    def istft(
+        self: ivy.Array,
+        frame_length: int,
+        frame_step: int,
+        /,
+        *,
+        fft_length: Optional[int] = None,
+        window_fn: Optional[Callable] = None,
+        name: Optional[str] = None,
+        out: Optional[ivy.Array] = None,
+    ) -> ivy.Array:
+        """
+        Compute the inverse Short-time Fourier Transform of stfts.
+
+        Parameters
+        ----------
+        self
+            A [..., frames, fft_unique_bins] array of complex STFT values, where
+            fft_unique_bins is fft_length // 2 + 1.
+        frame_length
+            An integer scalar. The window length in samples.
+        frame_step
+            An integer scalar. The number of samples to step.
+        fft_length
+            An integer scalar. The size of the FFT that produced the stfts. If not
+            provided, uses the smallest power of 2 enclosing frame_length.
+        window_fn
+            A callable that takes a window length and returns a [window_length]
+            array of samples, to window the frames with. If set to None, no
+            windowing is used.
+        name
+            An optional name for the operation.
+        out
+            Optional output array for writing the result.
+
+        Returns
+        -------
+        ret
+            A [..., samples] array of real signals, where samples is
+            (frames - 1) * frame_step + frame_length.
+
+        Examples
+        --------
+        >>> x = ivy.array([1., 2., 3., 4., 5., 6.])
+        >>> x.stft(3, 3, fft_length=4).istft(3, 3, fft_length=4)
+        ivy.array([1., 2., 3., 4., 5., 6.])
+        """
+        return ivy.istft(
+            self._data,
+            frame_length,
+            frame_step,
+            fft_length=fft_length,
+            window_fn=window_fn,
+            name=name,
+            out=out,
+        )
@@ -451,7 +451,9 @@ class _ArrayWithLinearAlgebraExperimental(abc.ABC):
         *,
         init: Optional[Union[Literal["svd", "random"], ivy.TuckerTensor]] = "svd",
         seed: Optional[int] = None,
-        svd: Optional[Literal["truncated_svd"]] = "truncated_svd",
+        svd: Optional[
+            Literal["truncated_svd", "symeig_svd", "randomized_svd", "streaming_svd"]
+        ] = "truncated_svd",
         non_negative: Optional[bool] = False,
         mask: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
         svd_mask_repeats: Optional[int] = 5,
@@ -471,11 +473,12 @@ class _ArrayWithLinearAlgebraExperimental(abc.ABC):
             modes to consider in the input tensor
         seed
             Used to create a random seed distribution
-            when init == 'random'
+            when init == 'random' or svd == 'randomized_svd'
         init
             initialization scheme for tucker decomposition.
         svd
-            function to use to compute the SVD
+            function to use to compute the SVD, one of 'truncated_svd', 'symeig_svd',
+            'randomized_svd' and 'streaming_svd', or a callable
         non_negative
             if True, non-negative factors are returned
         mask
@@ -514,7 +517,9 @@ class _ArrayWithLinearAlgebraExperimental(abc.ABC):
         *,
         n_iter_max: Optional[int] = 100,
         init: Optional[Union[Literal["svd", "random"], ivy.TuckerTensor]] = "svd",
-        svd: Optional[Literal["truncated_svd"]] = "truncated_svd",
+        svd: Optional[
+            Literal["truncated_svd", "symeig_svd", "randomized_svd", "streaming_svd"]
+        ] = "truncated_svd",
         seed: Optional[int] = None,
         mask: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
         svd_mask_repeats: Optional[int] = 5,
@@ -544,10 +549,11 @@ class _ArrayWithLinearAlgebraExperimental(abc.ABC):
             if a TuckerTensor is provided, this is used for initialization
         svd
             str, default is 'truncated_svd'
-            function to use to compute the SVD,
+            function to use to compute the SVD, one of 'truncated_svd', 'symeig_svd',
+            'randomized_svd' and 'streaming_svd', or a callable
         seed
             Used to create a random seed distribution
-            when init == 'random'
+            when init == 'random' or svd == 'randomized_svd'
         mask
             array of booleans with the same shape as ``tensor`` should be 0 where
             the values are missing and 1 everywhere else. Note:  if tensor is
@@ -596,7 +602,9 @@ class _ArrayWithLinearAlgebraExperimental(abc.ABC):
         fixed_factors: Optional[Sequence[int]] = None,
         n_iter_max: Optional[int] = 100,
         init: Optional[Union[Literal["svd", "random"], ivy.TuckerTensor]] = "svd",
-        svd: Optional[Literal["truncated_svd"]] = "truncated_svd",
+        svd: Optional[
+            Literal["truncated_svd", "symeig_svd", "randomized_svd", "streaming_svd"]
+        ] = "truncated_svd",
         seed: Optional[int] = None,
         mask: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
         svd_mask_repeats: Optional[int] = 5,
@@ -626,10 +634,11 @@ class _ArrayWithLinearAlgebraExperimental(abc.ABC):
             if a TuckerTensor is provided, this is used for initialization
         svd
             str, default is 'truncated_svd'
-            function to use to compute the SVD,
+            function to use to compute the SVD, one of 'truncated_svd', 'symeig_svd',
+            'randomized_svd' and 'streaming_svd', or a callable
         seed
             Used to create a random seed distribution
-            when init == 'random'
+            when init == 'random' or svd == 'randomized_svd'
         mask
             array of booleans with the same shape as ``tensor`` should be 0 where
             the values are missing and 1 everywhere else. Note:  if tensor is
@@ -676,6 +685,142 @@ class _ArrayWithLinearAlgebraExperimental(abc.ABC):
             verbose=verbose,
         )
 
+    def parafac(
+        self: Union[ivy.Array, ivy.NativeArray],
+        rank: int,
+        /,
+        *,
+        n_iter_max: Optional[int] = 100,
+        init: Optional[Union[Literal["svd", "random"], ivy.CPTensor]] = "svd",
+        svd: Optional[
+            Literal["truncated_svd", "symeig_svd", "randomized_svd", "streaming_svd"]
+        ] = "truncated_svd",
+        normalize_factors: Optional[bool] = False,
+        tol: Optional[float] = 1e-8,
+        seed: Optional[int] = None,
+        mask: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
+        l2_reg: Optional[float] = 0.0,
+        linesearch: Optional[bool] = False,
+        cvg_criterion: Optional[
+            Literal["abs_rec_error", "rec_error"]
+        ] = "abs_rec_error",
+        verbose: Optional[bool] = False,
+        return_errors: Optional[bool] = False,
+    ):
+        """
+        ivy.Array instance method variant of ivy.parafac. This method simply wraps the
+        function, and so the docstring for ivy.parafac also applies to this method with
+        minimal changes.
+
+        Parameters
+        ----------
+        x
+            input tensor
+        rank
+            number of components
+        n_iter_max
+            maximum number of iteration
+        init
+            {'svd', 'random'}, or CPTensor optional
+            if a CPTensor is provided, this is used for initialization
+        svd
+            str, default is 'truncated_svd'
+            function to use to compute the SVD when init == 'svd', one of
+            'truncated_svd', 'symeig_svd', 'randomized_svd' and 'streaming_svd', or a
+            callable
+        normalize_factors
+            if True, aggregate the weights of each factor in a 1D-tensor
+            of shape (rank, ), which will contain the norms of the factors
+        tol
+            tolerance: the algorithm stops when the variation in
+            the reconstruction error is less than the tolerance.
+        seed
+            Used to create a random seed distribution
+            when init == 'random' or svd == 'randomized_svd'
+        mask
+            array of booleans with the same shape as ``tensor`` should be 0 where
+            the values are missing and 1 everywhere else. The missing values are
+            imputed from the reconstruction at each iteration.
+        l2_reg
+            L2 regularization of the factors.
+        linesearch
+            whether to extrapolate the factors every other iteration, which is kept
+            only if it lowers the reconstruction error
+        cvg_criterion
+            {'abs_rec_error', 'rec_error'}, stop when the absolute variation in the
+            reconstruction error, or its decrease, is less than `tol`
+        verbose
+            if True, the reconstruction error is printed at each iteration.
+        return_errors
+            if True, list of reconstruction errors are returned.
+
+        Returns
+        -------
+            ivy.CPTensor or ivy.CPTensor and
+            list of reconstruction errors if return_errors is True.
+        """
+        return ivy.parafac(
+            self._data,
+            rank,
+            n_iter_max=n_iter_max,
+            init=init,
+            svd=svd,
+            normalize_factors=normalize_factors,
+            tol=tol,
+            seed=seed,
+            mask=mask,
+            l2_reg=l2_reg,
+            linesearch=linesearch,
+            cvg_criterion=cvg_criterion,
+            verbose=verbose,
+            return_errors=return_errors,
+        )
+
+    def tensor_train(
+        self: Union[ivy.Array, ivy.NativeArray],
+        rank: Union[int, Sequence[int]],
+        /,
+        *,
+        svd: Optional[
+            Literal["truncated_svd", "symeig_svd", "randomized_svd", "streaming_svd"]
+        ] = "truncated_svd",
+        seed: Optional[int] = None,
+        verbose: Optional[bool] = False,
+    ):
+        """
+        ivy.Array instance method variant of ivy.tensor_train. This method simply wraps
+        the function, and so the docstring for ivy.tensor_train also applies to this
+        method with minimal changes.
+
+        Parameters
+        ----------
+        x
+            input tensor
+        rank
+            maximum allowable TT-ranks of the decomposition,
+            if int, the same rank is used for all the cores
+        svd
+            str, default is 'truncated_svd'
+            function to use to compute the SVD, one of 'truncated_svd', 'symeig_svd',
+            'randomized_svd' and 'streaming_svd', or a callable
+        seed
+            Used to create a random seed distribution
+            when svd == 'randomized_svd'
+        verbose
+            if True, the rank of each core is printed.
+
+        Returns
+        -------
+            ivy.TTTensor
+        """
+        return ivy.tensor_train(
+            self._data,
+            rank,
+            svd=svd,
+            seed=seed,
+            verbose=verbose,
+        )
+
     def dot(
         self: Union[ivy.Array, ivy.NativeArray],
         b: Union[ivy.Array, ivy.NativeArray],
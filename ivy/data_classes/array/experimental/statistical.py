@@ -439,6 +439,7 @@ class _ArrayWithStatisticalExperimental(abc.ABC):
         *,
         weights: Optional[ivy.Array] = None,
         minlength: int = 0,
+        axis: Optional[int] = None,
         out: Optional[ivy.Array] = None,
     ) -> ivy.Array:
         """
@@ -454,6 +455,9 @@ class _ArrayWithStatisticalExperimental(abc.ABC):
             Optional weights, array of the same shape as self.
         minlength
             A minimum number of bins for the output array.
+        axis
+            The axis to count the values along, separately for each position of the
+            other axes. If ``None``, all of self is counted. Default: ``None``.
         out
             An array of the same shape as the returned array, or of the shape
             (minlength,) if minlength is specified.
@@ -477,9 +481,49 @@ class _ArrayWithStatisticalExperimental(abc.ABC):
             self._data,
             weights=weights,
             minlength=minlength,
+            axis=axis,
             out=out,
         )
 
+    def digitize(
+        self: ivy.Array,
+        bins: Union[ivy.Array, ivy.NativeArray],
+        /,
+        *,
+        right: bool = False,
+        out: Optional[ivy.Array] = None,
+    ) -> ivy.Array:
+        """
+        ivy.Array instance method variant of ivy.digitize. This method simply wraps the
+        function, and so the docstring for ivy.digitize also applies to this method with
+        minimal changes.
+
+        Parameters
+        ----------
+        self
+            Input array of values to bin.
+        bins
+            Array of bin edges, monotonically increasing or decreasing along the last
+            axis.
+        right
+            Whether the intervals include their right edge instead of their left edge.
+            Default: ``False``.
+        out
+            optional output array, for writing the result to.
+
+        Returns
+        -------
+        ret
+            The indices of the bins, of the same shape as self.
+
+        Examples
+        --------
+        >>> x = ivy.array([0.2, 6.4, 3.0, 1.6])
+        >>> x.digitize(ivy.array([0.0, 1.0, 2.5, 4.0, 10.0]))
+        ivy.array([1, 4, 3, 2])
+        """
+        return ivy.digitize(self._data, bins, right=right, out=out)
+
     def igamma(
         self: ivy.Array,
         /,
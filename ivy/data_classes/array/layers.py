@@ -297,6 +297,7 @@ class _ArrayWithLayers(abc.ABC):
         dropout_p: Optional[float] = 0.0,
         is_causal: Optional[bool] = False,
         training: Optional[bool] = False,
+        block_size: Optional[int] = None,
         out: Optional[ivy.Array] = None,
     ) -> ivy.Array:
         """
@@ -333,6 +334,9 @@ class _ArrayWithLayers(abc.ABC):
             `is_causal` are set.
         training
             If True, dropout is used, otherwise dropout is not activated.
+        block_size
+            If set, keys and values are processed in tiles of this many positions
+            with an online softmax. Default is ``None``.
         out
             optional output array, for writing the result to. It must have a shape
             that the inputs broadcast to.
@@ -389,6 +393,7 @@ class _ArrayWithLayers(abc.ABC):
             dropout_p=dropout_p,
             is_causal=is_causal,
             training=training,
+            block_size=block_size,
             out=out,
         )
 
@@ -413,6 +418,7 @@ class _ArrayWithLayers(abc.ABC):
         average_attention_weights: bool = True,
         dropout: float = 0.0,
         training: bool = False,
+        block_size: Optional[int] = None,
         out: Optional[ivy.Array] = None,
     ) -> ivy.Array:
         return ivy.multi_head_attention(
@@ -434,6 +440,7 @@ class _ArrayWithLayers(abc.ABC):
             average_attention_weights=average_attention_weights,
             dropout=dropout,
             training=training,
+            block_size=block_size,
             out=out,
         )
 
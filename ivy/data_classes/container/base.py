@@ -1150,9 +1150,32 @@ class ContainerBase(dict, abc.ABC):
         else:
             raise ivy.utils.exceptions.IvyException("Unsupported format")
 
+    @staticmethod
+    def _h5_dataset_as_memmap(dataset, slice_obj=slice(None)):
+        """
+        Memory-map an h5py dataset, if it is stored contiguously and uncompressed.
+
+        Returns ``None`` for chunked or filtered datasets, which cannot be mapped.
+        """
+        offset = dataset.id.get_offset()
+        if dataset.chunks is not None or offset is None or dataset.size == 0:
+            return None
+        mapped = np.memmap(
+            dataset.file.filename,
+            mode="r",
+            dtype=dataset.dtype,
+            shape=dataset.shape,
+            offset=offset,
+        )
+        return mapped[slice_obj]
+
     @staticmethod
     def cont_from_disk_as_hdf5(
-        h5_obj_or_filepath, slice_obj=slice(None), alphabetical_keys=True, ivyh=None
+        h5_obj_or_filepath,
+        slice_obj=slice(None),
+        alphabetical_keys=True,
+        ivyh=None,
+        lazy=False,
     ):
         """
         Load container object from disk, as an h5py file, at the specified hdf5
@@ -1163,13 +1186,20 @@ class ContainerBase(dict, abc.ABC):
         h5_obj_or_filepath
             Filepath where the container object is saved to disk, or h5 object.
         slice_obj
-            slice object to slice all h5 elements. (Default value = slice(None))
+            slice object to slice all h5 elements. Only the selected rows are read
+            from disk. (Default value = slice(None))
         alphabetical_keys
             Whether to sort the container keys alphabetically, or preserve the dict
             order. Default is ``True``.
         ivyh
             Handle to ivy module to use for the calculations. Default is ``None``, which
             results in the global ivy.
+        lazy
+            Whether to leave the leaves on disk until they are accessed. Contiguous
+            datasets are returned as read-only numpy memory maps, and all others as
+            h5py datasets (or numpy arrays of the selected rows, if ``slice_obj``
+            selects a subset). The file is kept open in this case. Default is
+            ``False``.
 
         Returns
         -------
@@ -1191,16 +1221,28 @@ class ContainerBase(dict, abc.ABC):
         for key, value in items:
             if isinstance(value, h5py.Group):
                 container_dict[key] = ivy.Container.cont_from_disk_as_hdf5(
-                    value, slice_obj, ivyh
+                    value, slice_obj, alphabetical_keys, ivyh, lazy
                 )
             elif isinstance(value, h5py.Dataset):
-                container_dict[key] = ivy.default(ivyh, ivy).array(
-                    list(value[slice_obj]), dtype=str(value[slice_obj].dtype)
-                )
+                if lazy:
+                    mapped = ivy.Container._h5_dataset_as_memmap(value, slice_obj)
+                    if mapped is not None:
+                        container_dict[key] = mapped
+                    elif isinstance(slice_obj, slice) and slice_obj == slice(None):
+                        container_dict[key] = value
+                    else:
+                        container_dict[key] = value[slice_obj]
+                else:
+                    # a single hyperslab read straight into a numpy array
+                    container_dict[key] = ivy.default(ivyh, ivy).asarray(
+                        value[slice_obj]
+                    )
             else:
                 raise ivy.utils.exceptions.IvyException(
                     "Item found inside h5_obj which was neither a Group nor a Dataset."
                 )
+        if type(h5_obj_or_filepath) is str and not lazy:
+            h5_obj.close()
         return ivy.Container(container_dict, ivyh=ivyh)
 
     @staticmethod
@@ -2016,7 +2058,14 @@ class ContainerBase(dict, abc.ABC):
             raise ValueError("Unsupported format")
 
     def cont_to_disk_as_hdf5(
-        self, h5_obj_or_filepath, starting_index=0, mode="a", max_batch_size=None
+        self,
+        h5_obj_or_filepath,
+        starting_index=0,
+        mode="a",
+        max_batch_size=None,
+        chunks=True,
+        compression=None,
+        compression_opts=None,
     ):
         """
         Save container object to disk, as an h5py file, at the specified filepath.
@@ -2034,6 +2083,17 @@ class ContainerBase(dict, abc.ABC):
         max_batch_size
             Maximum batch size for the container on disk, this is useful if later
             appending to file. (Default value = None)
+        chunks
+            Chunk shape of newly created datasets, or ``True`` for h5py to choose one.
+            If ``None`` or ``False`` and no compression is used, datasets are stored
+            contiguously with a fixed size, which allows loading them as memory maps.
+            Default is ``True``.
+        compression
+            Compression filter for newly created datasets, e.g. ``"gzip"`` or
+            ``"lzf"``. Default is ``None``.
+        compression_opts
+            Options for the compression filter, e.g. the gzip level. Default is
+            ``None``.
         """
         ivy.utils.assertions.check_exists(
             h5py,
@@ -2053,7 +2113,13 @@ class ContainerBase(dict, abc.ABC):
                 else:
                     h5_group = h5_obj[key]
                 value.cont_to_disk_as_hdf5(
-                    h5_group, starting_index, mode, max_batch_size
+                    h5_group,
+                    starting_index,
+                    mode,
+                    max_batch_size,
+                    chunks,
+                    compression,
+                    compression_opts,
                 )
             else:
                 value_as_np = self._cont_ivy.to_numpy(value)
@@ -2066,16 +2132,29 @@ class ContainerBase(dict, abc.ABC):
                 )
                 if key not in h5_obj.keys():
                     dataset_shape = [max_bs] + list(value_shape[1:])
-                    maxshape = [None for _ in dataset_shape]
+                    resizable = bool(chunks) or compression is not None
                     h5_obj.create_dataset(
-                        key, dataset_shape, dtype=value_as_np.dtype, maxshape=maxshape
+                        key,
+                        dataset_shape,
+                        dtype=value_as_np.dtype,
+                        maxshape=(
+                            [None for _ in dataset_shape] if resizable else None
+                        ),
+                        chunks=chunks or None,
+                        compression=compression,
+                        compression_opts=compression_opts,
                     )
+                dataset = h5_obj[key]
                 space_left = max_bs - starting_index
                 amount_to_write = min(this_batch_size, space_left)
-                for i in range(amount_to_write):
-                    h5_obj[key][starting_index + i : starting_index + i + 1] = (
-                        value_as_np[i : i + 1]
-                    )
+                if dataset.shape[0] < starting_index + amount_to_write:
+                    dataset.resize(starting_index + amount_to_write, axis=0)
+                # a single slab write of all rows
+                dataset[starting_index : starting_index + amount_to_write] = (
+                    value_as_np[:amount_to_write]
+                )
+        if type(h5_obj_or_filepath) is str:
+            h5_obj.close()
 
     def cont_to_disk_as_pickled(self, pickle_filepath):
         """
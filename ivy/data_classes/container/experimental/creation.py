@@ -955,6 +955,882 @@ class _ContainerWithCreationExperimental(ContainerBase):
             num_segments,
         )
 
+    @staticmethod
+    def static_unsorted_segment_max(
+        data: ivy.Container,
+        segment_ids: ivy.Container,
+        num_segments: Union[int, ivy.Container],
+        *,
+        key_chains: Optional[Union[List[str], Dict[str, str], ivy.Container]] = None,
+        to_apply: Union[bool, ivy.Container] = True,
+        prune_unapplied: Union[bool, ivy.Container] = False,
+        map_sequences: Union[bool, ivy.Container] = False,
+    ) -> ivy.Container:
+        r"""
+        ivy.Container static method variant of ivy.unsorted_segment_max. This method
+        simply wraps the function, and so the docstring for ivy.unsorted_segment_max
+        also applies to this method with minimal changes.
+
+        Parameters
+        ----------
+        data
+            input array or container from which to gather the input.
+        segment_ids
+            Must be in the same size with the first dimension of `data`. Has to be of
+            integer data type. The index-th element of `segment_ids` array is the
+            segment identifier for the index-th element of `data`.
+        num_segments
+            An integer or array representing the total number of distinct segment IDs.
+        key_chains
+            The key-chains to apply or not apply the method to. Default is ``None``.
+        to_apply
+            If True, the method will be applied to key_chains, otherwise key_chains
+            will be skipped. Default is ``True``.
+        prune_unapplied
+            Whether to prune key_chains for which the function was not applied.
+            Default is ``False``.
+        map_sequences
+            Whether to also map method to sequences (lists, tuples).
+            Default is ``False``.
+
+        Returns
+        -------
+        ret
+            A container, of the maximum of the values of `data` in each segment.
+        """
+        return ContainerBase.cont_multi_map_in_function(
+            "unsorted_segment_max",
+            data,
+            segment_ids,
+            num_segments,
+            key_chains=key_chains,
+            to_apply=to_apply,
+            prune_unapplied=prune_unapplied,
+            map_sequences=map_sequences,
+        )
+
+    def unsorted_segment_max(
+        self: ivy.Container,
+        segment_ids: ivy.Container,
+        num_segments: Union[int, ivy.Container],
+    ):
+        r"""
+        ivy.Container instance method variant of ivy.unsorted_segment_max. This method
+        simply wraps the function, and so the docstring for ivy.unsorted_segment_max
+        also applies to this method with minimal changes.
+
+        Parameters
+        ----------
+        self
+            input array or container from which to gather the input.
+        segment_ids
+            Must be in the same size with the first dimension of `self`. Has to be of
+            integer data type. The index-th element of `segment_ids` array is the
+            segment identifier for the index-th element of `self`.
+        num_segments
+            An integer or array representing the total number of distinct segment IDs.
+
+        Returns
+        -------
+        ret
+            A container, of the maximum of the values of `self` in each segment.
+        """
+        return self.static_unsorted_segment_max(
+            self,
+            segment_ids,
+            num_segments,
+        )
+
+    @staticmethod
+    def static_unsorted_segment_prod(
+        data: ivy.Container,
+        segment_ids: ivy.Container,
+        num_segments: Union[int, ivy.Container],
+        *,
+        key_chains: Optional[Union[List[str], Dict[str, str], ivy.Container]] = None,
+        to_apply: Union[bool, ivy.Container] = True,
+        prune_unapplied: Union[bool, ivy.Container] = False,
+        map_sequences: Union[bool, ivy.Container] = False,
+    ) -> ivy.Container:
+        r"""
+        ivy.Container static method variant of ivy.unsorted_segment_prod. This method
+        simply wraps the function, and so the docstring for ivy.unsorted_segment_prod
+        also applies to this method with minimal changes.
+
+        Parameters
+        ----------
+        data
+            input array or container from which to gather the input.
+        segment_ids
+            Must be in the same size with the first dimension of `data`. Has to be of
+            integer data type. The index-th element of `segment_ids` array is the
+            segment identifier for the index-th element of `data`.
+        num_segments
+            An integer or array representing the total number of distinct segment IDs.
+        key_chains
+            The key-chains to apply or not apply the method to. Default is ``None``.
+        to_apply
+            If True, the method will be applied to key_chains, otherwise key_chains
+            will be skipped. Default is ``True``.
+        prune_unapplied
+            Whether to prune key_chains for which the function was not applied.
+            Default is ``False``.
+        map_sequences
+            Whether to also map method to sequences (lists, tuples).
+            Default is ``False``.
+
+        Returns
+        -------
+        ret
+            A container, of the product of the values of `data` in each segment.
+        """
+        return ContainerBase.cont_multi_map_in_function(
+            "unsorted_segment_prod",
+            data,
+            segment_ids,
+            num_segments,
+            key_chains=key_chains,
+            to_apply=to_apply,
+            prune_unapplied=prune_unapplied,
+            map_sequences=map_sequences,
+        )
+
+    def unsorted_segment_prod(
+        self: ivy.Container,
+        segment_ids: ivy.Container,
+        num_segments: Union[int, ivy.Container],
+    ):
+        r"""
+        ivy.Container instance method variant of ivy.unsorted_segment_prod. This method
+        simply wraps the function, and so the docstring for ivy.unsorted_segment_prod
+        also applies to this method with minimal changes.
+
+        Parameters
+        ----------
+        self
+            input array or container from which to gather the input.
+        segment_ids
+            Must be in the same size with the first dimension of `self`. Has to be of
+            integer data type. The index-th element of `segment_ids` array is the
+            segment identifier for the index-th element of `self`.
+        num_segments
+            An integer or array representing the total number of distinct segment IDs.
+
+        Returns
+        -------
+        ret
+            A container, of the product of the values of `self` in each segment.
+        """
+        return self.static_unsorted_segment_prod(
+            self,
+            segment_ids,
+            num_segments,
+        )
+
+    @staticmethod
+    def static_unsorted_segment_mean(
+        data: ivy.Container,
+        segment_ids: ivy.Container,
+        num_segments: Union[int, ivy.Container],
+        *,
+        key_chains: Optional[Union[List[str], Dict[str, str], ivy.Container]] = None,
+        to_apply: Union[bool, ivy.Container] = True,
+        prune_unapplied: Union[bool, ivy.Container] = False,
+        map_sequences: Union[bool, ivy.Container] = False,
+    ) -> ivy.Container:
+        r"""
+        ivy.Container static method variant of ivy.unsorted_segment_mean. This method
+        simply wraps the function, and so the docstring for ivy.unsorted_segment_mean
+        also applies to this method with minimal changes.
+
+        Parameters
+        ----------
+        data
+            input array or container from which to gather the input.
+        segment_ids
+            Must be in the same size with the first dimension of `data`. Has to be of
+            integer data type. The index-th element of `segment_ids` array is the
+            segment identifier for the index-th element of `data`.
+        num_segments
+            An integer or array representing the total number of distinct segment IDs.
+        key_chains
+            The key-chains to apply or not apply the method to. Default is ``None``.
+        to_apply
+            If True, the method will be applied to key_chains, otherwise key_chains
+            will be skipped. Default is ``True``.
+        prune_unapplied
+            Whether to prune key_chains for which the function was not applied.
+            Default is ``False``.
+        map_sequences
+            Whether to also map method to sequences (lists, tuples).
+            Default is ``False``.
+
+        Returns
+        -------
+        ret
+            A container, of the mean of the values of `data` in each segment.
+        """
+        return ContainerBase.cont_multi_map_in_function(
+            "unsorted_segment_mean",
+            data,
+            segment_ids,
+            num_segments,
+            key_chains=key_chains,
+            to_apply=to_apply,
+            prune_unapplied=prune_unapplied,
+            map_sequences=map_sequences,
+        )
+
+    def unsorted_segment_mean(
+        self: ivy.Container,
+        segment_ids: ivy.Container,
+        num_segments: Union[int, ivy.Container],
+    ):
+        r"""
+        ivy.Container instance method variant of ivy.unsorted_segment_mean. This method
+        simply wraps the function, and so the docstring for ivy.unsorted_segment_mean
+        also applies to this method with minimal changes.
+
+        Parameters
+        ----------
+        self
+            input array or container from which to gather the input.
+        segment_ids
+            Must be in the same size with the first dimension of `self`. Has to be of
+            integer data type. The index-th element of `segment_ids` array is the
+            segment identifier for the index-th element of `self`.
+        num_segments
+            An integer or array representing the total number of distinct segment IDs.
+
+        Returns
+        -------
+        ret
+            A container, of the mean of the values of `self` in each segment.
+        """
+        return self.static_unsorted_segment_mean(
+            self,
+            segment_ids,
+            num_segments,
+        )
+
+    @staticmethod
+    def static_unsorted_segment_sqrt_n(
+        data: ivy.Container,
+        segment_ids: ivy.Container,
+        num_segments: Union[int, ivy.Container],
+        *,
+        key_chains: Optional[Union[List[str], Dict[str, str], ivy.Container]] = None,
+        to_apply: Union[bool, ivy.Container] = True,
+        prune_unapplied: Union[bool, ivy.Container] = False,
+        map_sequences: Union[bool, ivy.Container] = False,
+    ) -> ivy.Container:
+        r"""
+        ivy.Container static method variant of ivy.unsorted_segment_sqrt_n. This method
+        simply wraps the function, and so the docstring for ivy.unsorted_segment_sqrt_n
+        also applies to this method with minimal changes.
+
+        Parameters
+        ----------
+        data
+            input array or container from which to gather the input.
+        segment_ids
+            Must be in the same size with the first dimension of `data`. Has to be of
+            integer data type. The index-th element of `segment_ids` array is the
+            segment identifier for the index-th element of `data`.
+        num_segments
+            An integer or array representing the total number of distinct segment IDs.
+        key_chains
+            The key-chains to apply or not apply the method to. Default is ``None``.
+        to_apply
+            If True, the method will be applied to key_chains, otherwise key_chains
+            will be skipped. Default is ``True``.
+        prune_unapplied
+            Whether to prune key_chains for which the function was not applied.
+            Default is ``False``.
+        map_sequences
+            Whether to also map method to sequences (lists, tuples).
+            Default is ``False``.
+
+        Returns
+        -------
+        ret
+            A container, of the sum divided by the square root of the count of the
+            values of `data` in each segment.
+        """
+        return ContainerBase.cont_multi_map_in_function(
+            "unsorted_segment_sqrt_n",
+            data,
+            segment_ids,
+            num_segments,
+            key_chains=key_chains,
+            to_apply=to_apply,
+            prune_unapplied=prune_unapplied,
+            map_sequences=map_sequences,
+        )
+
+    def unsorted_segment_sqrt_n(
+        self: ivy.Container,
+        segment_ids: ivy.Container,
+        num_segments: Union[int, ivy.Container],
+    ):
+        r"""
+        ivy.Container instance method variant of ivy.unsorted_segment_sqrt_n. This
+        method simply wraps the function, and so the docstring for
+        ivy.unsorted_segment_sqrt_n also applies to this method with minimal changes.
+
+        Parameters
+        ----------
+        self
+            input array or container from which to gather the input.
+        segment_ids
+            Must be in the same size with the first dimension of `self`. Has to be of
+            integer data type. The index-th element of `segment_ids` array is the
+            segment identifier for the index-th element of `self`.
+        num_segments
+            An integer or array representing the total number of distinct segment IDs.
+
+        Returns
+        -------
+        ret
+            A container, of the sum divided by the square root of the count of the
+            values of `self` in each segment.
+        """
+        return self.static_unsorted_segment_sqrt_n(
+            self,
+            segment_ids,
+            num_segments,
+        )
+
+    @staticmethod
+    def static_segment_sum(
+        data: ivy.Container,
+        segment_ids: ivy.Container,
+        num_segments: Optional[Union[int, ivy.Container]] = None,
+        *,
+        key_chains: Optional[Union[List[str], Dict[str, str], ivy.Container]] = None,
+        to_apply: Union[bool, ivy.Container] = True,
+        prune_unapplied: Union[bool, ivy.Container] = False,
+        map_sequences: Union[bool, ivy.Container] = False,
+    ) -> ivy.Container:
+        r"""
+        ivy.Container static method variant of ivy.segment_sum. This method simply wraps
+        the function, and so the docstring for ivy.segment_sum also applies to this
+        method with minimal changes.
+
+        Parameters
+        ----------
+        data
+            input array or container from which to gather the input.
+        segment_ids
+            Must be in the same size with the first dimension of `data`. Has to be of
+            integer data type, and sorted. The index-th element of `segment_ids` array
+            is the segment identifier for the index-th element of `data`.
+        num_segments
+            The total number of distinct segment IDs. Default is ``None``, the last
+            segment ID plus one.
+        key_chains
+            The key-chains to apply or not apply the method to. Default is ``None``.
+        to_apply
+            If True, the method will be applied to key_chains, otherwise key_chains
+            will be skipped. Default is ``True``.
+        prune_unapplied
+            Whether to prune key_chains for which the function was not applied.
+            Default is ``False``.
+        map_sequences
+            Whether to also map method to sequences (lists, tuples).
+            Default is ``False``.
+
+        Returns
+        -------
+        ret
+            A container, of the sum of the values of `data` in each segment.
+        """
+        return ContainerBase.cont_multi_map_in_function(
+            "segment_sum",
+            data,
+            segment_ids,
+            num_segments,
+            key_chains=key_chains,
+            to_apply=to_apply,
+            prune_unapplied=prune_unapplied,
+            map_sequences=map_sequences,
+        )
+
+    def segment_sum(
+        self: ivy.Container,
+        segment_ids: ivy.Container,
+        num_segments: Optional[Union[int, ivy.Container]] = None,
+    ):
+        r"""
+        ivy.Container instance method variant of ivy.segment_sum. This method simply
+        wraps the function, and so the docstring for ivy.segment_sum also applies to
+        this method with minimal changes.
+
+        Parameters
+        ----------
+        self
+            input array or container from which to gather the input.
+        segment_ids
+            Must be in the same size with the first dimension of `self`. Has to be of
+            integer data type, and sorted. The index-th element of `segment_ids` array
+            is the segment identifier for the index-th element of `self`.
+        num_segments
+            The total number of distinct segment IDs. Default is ``None``, the last
+            segment ID plus one.
+
+        Returns
+        -------
+        ret
+            A container, of the sum of the values of `self` in each segment.
+        """
+        return self.static_segment_sum(
+            self,
+            segment_ids,
+            num_segments,
+        )
+
+    @staticmethod
+    def static_segment_min(
+        data: ivy.Container,
+        segment_ids: ivy.Container,
+        num_segments: Optional[Union[int, ivy.Container]] = None,
+        *,
+        key_chains: Optional[Union[List[str], Dict[str, str], ivy.Container]] = None,
+        to_apply: Union[bool, ivy.Container] = True,
+        prune_unapplied: Union[bool, ivy.Container] = False,
+        map_sequences: Union[bool, ivy.Container] = False,
+    ) -> ivy.Container:
+        r"""
+        ivy.Container static method variant of ivy.segment_min. This method simply wraps
+        the function, and so the docstring for ivy.segment_min also applies to this
+        method with minimal changes.
+
+        Parameters
+        ----------
+        data
+            input array or container from which to gather the input.
+        segment_ids
+            Must be in the same size with the first dimension of `data`. Has to be of
+            integer data type, and sorted. The index-th element of `segment_ids` array
+            is the segment identifier for the index-th element of `data`.
+        num_segments
+            The total number of distinct segment IDs. Default is ``None``, the last
+            segment ID plus one.
+        key_chains
+            The key-chains to apply or not apply the method to. Default is ``None``.
+        to_apply
+            If True, the method will be applied to key_chains, otherwise key_chains
+            will be skipped. Default is ``True``.
+        prune_unapplied
+            Whether to prune key_chains for which the function was not applied.
+            Default is ``False``.
+        map_sequences
+            Whether to also map method to sequences (lists, tuples).
+            Default is ``False``.
+
+        Returns
+        -------
+        ret
+            A container, of the minimum of the values of `data` in each segment.
+        """
+        return ContainerBase.cont_multi_map_in_function(
+            "segment_min",
+            data,
+            segment_ids,
+            num_segments,
+            key_chains=key_chains,
+            to_apply=to_apply,
+            prune_unapplied=prune_unapplied,
+            map_sequences=map_sequences,
+        )
+
+    def segment_min(
+        self: ivy.Container,
+        segment_ids: ivy.Container,
+        num_segments: Optional[Union[int, ivy.Container]] = None,
+    ):
+        r"""
+        ivy.Container instance method variant of ivy.segment_min. This method simply
+        wraps the function, and so the docstring for ivy.segment_min also applies to
+        this method with minimal changes.
+
+        Parameters
+        ----------
+        self
+            input array or container from which to gather the input.
+        segment_ids
+            Must be in the same size with the first dimension of `self`. Has to be of
+            integer data type, and sorted. The index-th element of `segment_ids` array
+            is the segment identifier for the index-th element of `self`.
+        num_segments
+            The total number of distinct segment IDs. Default is ``None``, the last
+            segment ID plus one.
+
+        Returns
+        -------
+        ret
+            A container, of the minimum of the values of `self` in each segment.
+        """
+        return self.static_segment_min(
+            self,
+            segment_ids,
+            num_segments,
+        )
+
+    @staticmethod
+    def static_segment_max(
+        data: ivy.Container,
+        segment_ids: ivy.Container,
+        num_segments: Optional[Union[int, ivy.Container]] = None,
+        *,
+        key_chains: Optional[Union[List[str], Dict[str, str], ivy.Container]] = None,
+        to_apply: Union[bool, ivy.Container] = True,
+        prune_unapplied: Union[bool, ivy.Container] = False,
+        map_sequences: Union[bool, ivy.Container] = False,
+    ) -> ivy.Container:
+        r"""
+        ivy.Container static method variant of ivy.segment_max. This method simply wraps
+        the function, and so the docstring for ivy.segment_max also applies to this
+        method with minimal changes.
+
+        Parameters
+        ----------
+        data
+            input array or container from which to gather the input.
+        segment_ids
+            Must be in the same size with the first dimension of `data`. Has to be of
+            integer data type, and sorted. The index-th element of `segment_ids` array
+            is the segment identifier for the index-th element of `data`.
+        num_segments
+            The total number of distinct segment IDs. Default is ``None``, the last
+            segment ID plus one.
+        key_chains
+            The key-chains to apply or not apply the method to. Default is ``None``.
+        to_apply
+            If True, the method will be applied to key_chains, otherwise key_chains
+            will be skipped. Default is ``True``.
+        prune_unapplied
+            Whether to prune key_chains for which the function was not applied.
+            Default is ``False``.
+        map_sequences
+            Whether to also map method to sequences (lists, tuples).
+            Default is ``False``.
+
+        Returns
+        -------
+        ret
+            A container, of the maximum of the values of `data` in each segment.
+        """
+        return ContainerBase.cont_multi_map_in_function(
+            "segment_max",
+            data,
+            segment_ids,
+            num_segments,
+            key_chains=key_chains,
+            to_apply=to_apply,
+            prune_unapplied=prune_unapplied,
+            map_sequences=map_sequences,
+        )
+
+    def segment_max(
+        self: ivy.Container,
+        segment_ids: ivy.Container,
+        num_segments: Optional[Union[int, ivy.Container]] = None,
+    ):
+        r"""
+        ivy.Container instance method variant of ivy.segment_max. This method simply
+        wraps the function, and so the docstring for ivy.segment_max also applies to
+        this method with minimal changes.
+
+        Parameters
+        ----------
+        self
+            input array or container from which to gather the input.
+        segment_ids
+            Must be in the same size with the first dimension of `self`. Has to be of
+            integer data type, and sorted. The index-th element of `segment_ids` array
+            is the segment identifier for the index-th element of `self`.
+        num_segments
+            The total number of distinct segment IDs. Default is ``None``, the last
+            segment ID plus one.
+
+        Returns
+        -------
+        ret
+            A container, of the maximum of the values of `self` in each segment.
+        """
+        return self.static_segment_max(
+            self,
+            segment_ids,
+            num_segments,
+        )
+
+    @staticmethod
+    def static_segment_prod(
+        data: ivy.Container,
+        segment_ids: ivy.Container,
+        num_segments: Optional[Union[int, ivy.Container]] = None,
+        *,
+        key_chains: Optional[Union[List[str], Dict[str, str], ivy.Container]] = None,
+        to_apply: Union[bool, ivy.Container] = True,
+        prune_unapplied: Union[bool, ivy.Container] = False,
+        map_sequences: Union[bool, ivy.Container] = False,
+    ) -> ivy.Container:
+        r"""
+        ivy.Container static method variant of ivy.segment_prod. This method simply
+        wraps the function, and so the docstring for ivy.segment_prod also applies to
+        this method with minimal changes.
+
+        Parameters
+        ----------
+        data
+            input array or container from which to gather the input.
+        segment_ids
+            Must be in the same size with the first dimension of `data`. Has to be of
+            integer data type, and sorted. The index-th element of `segment_ids` array
+            is the segment identifier for the index-th element of `data`.
+        num_segments
+            The total number of distinct segment IDs. Default is ``None``, the last
+            segment ID plus one.
+        key_chains
+            The key-chains to apply or not apply the method to. Default is ``None``.
+        to_apply
+            If True, the method will be applied to key_chains, otherwise key_chains
+            will be skipped. Default is ``True``.
+        prune_unapplied
+            Whether to prune key_chains for which the function was not applied.
+            Default is ``False``.
+        map_sequences
+            Whether to also map method to sequences (lists, tuples).
+            Default is ``False``.
+
+        Returns
+        -------
+        ret
+            A container, of the product of the values of `data` in each segment.
+        """
+        return ContainerBase.cont_multi_map_in_function(
+            "segment_prod",
+            data,
+            segment_ids,
+            num_segments,
+            key_chains=key_chains,
+            to_apply=to_apply,
+            prune_unapplied=prune_unapplied,
+            map_sequences=map_sequences,
+        )
+
+    def segment_prod(
+        self: ivy.Container,
+        segment_ids: ivy.Container,
+        num_segments: Optional[Union[int, ivy.Container]] = None,
+    ):
+        r"""
+        ivy.Container instance method variant of ivy.segment_prod. This method simply
+        wraps the function, and so the docstring for ivy.segment_prod also applies to
+        this method with minimal changes.
+
+        Parameters
+        ----------
+        self
+            input array or container from which to gather the input.
+        segment_ids
+            Must be in the same size with the first dimension of `self`. Has to be of
+            integer data type, and sorted. The index-th element of `segment_ids` array
+            is the segment identifier for the index-th element of `self`.
+        num_segments
+            The total number of distinct segment IDs. Default is ``None``, the last
+            segment ID plus one.
+
+        Returns
+        -------
+        ret
+            A container, of the product of the values of `self` in each segment.
+        """
+        return self.static_segment_prod(
+            self,
+            segment_ids,
+            num_segments,
+        )
+
+    @staticmethod
+    def static_segment_mean(
+        data: ivy.Container,
+        segment_ids: ivy.Container,
+        num_segments: Optional[Union[int, ivy.Container]] = None,
+        *,
+        key_chains: Optional[Union[List[str], Dict[str, str], ivy.Container]] = None,
+        to_apply: Union[bool, ivy.Container] = True,
+        prune_unapplied: Union[bool, ivy.Container] = False,
+        map_sequences: Union[bool, ivy.Container] = False,
+    ) -> ivy.Container:
+        r"""
+        ivy.Container static method variant of ivy.segment_mean. This method simply
+        wraps the function, and so the docstring for ivy.segment_mean also applies to
+        this method with minimal changes.
+
+        Parameters
+        ----------
+        data
+            input array or container from which to gather the input.
+        segment_ids
+            Must be in the same size with the first dimension of `data`. Has to be of
+            integer data type, and sorted. The index-th element of `segment_ids` array
+            is the segment identifier for the index-th element of `data`.
+        num_segments
+            The total number of distinct segment IDs. Default is ``None``, the last
+            segment ID plus one.
+        key_chains
+            The key-chains to apply or not apply the method to. Default is ``None``.
+        to_apply
+            If True, the method will be applied to key_chains, otherwise key_chains
+            will be skipped. Default is ``True``.
+        prune_unapplied
+            Whether to prune key_chains for which the function was not applied.
+            Default is ``False``.
+        map_sequences
+            Whether to also map method to sequences (lists, tuples).
+            Default is ``False``.
+
+        Returns
+        -------
+        ret
+            A container, of the mean of the values of `data` in each segment.
+        """
+        return ContainerBase.cont_multi_map_in_function(
+            "segment_mean",
+            data,
+            segment_ids,
+            num_segments,
+            key_chains=key_chains,
+            to_apply=to_apply,
+            prune_unapplied=prune_unapplied,
+            map_sequences=map_sequences,
+        )
+
+    def segment_mean(
+        self: ivy.Container,
+        segment_ids: ivy.Container,
+        num_segments: Optional[Union[int, ivy.Container]] = None,
+    ):
+        r"""
+        ivy.Container instance method variant of ivy.segment_mean. This method simply
+        wraps the function, and so the docstring for ivy.segment_mean also applies to
+        this method with minimal changes.
+
+        Parameters
+        ----------
+        self
+            input array or container from which to gather the input.
+        segment_ids
+            Must be in the same size with the first dimension of `self`. Has to be of
+            integer data type, and sorted. The index-th element of `segment_ids` array
+            is the segment identifier for the index-th element of `self`.
+        num_segments
+            The total number of distinct segment IDs. Default is ``None``, the last
+            segment ID plus one.
+
+        Returns
+        -------
+        ret
+            A container, of the mean of the values of `self` in each segment.
+        """
+        return self.static_segment_mean(
+            self,
+            segment_ids,
+            num_segments,
+        )
+
+    @staticmethod
+    def static_segment_sqrt_n(
+        data: ivy.Container,
+        segment_ids: ivy.Container,
+        num_segments: Optional[Union[int, ivy.Container]] = None,
+        *,
+        key_chains: Optional[Union[List[str], Dict[str, str], ivy.Container]] = None,
+        to_apply: Union[bool, ivy.Container] = True,
+        prune_unapplied: Union[bool, ivy.Container] = False,
+        map_sequences: Union[bool, ivy.Container] = False,
+    ) -> ivy.Container:
+        r"""
+        ivy.Container static method variant of ivy.segment_sqrt_n. This method simply
+        wraps the function, and so the docstring for ivy.segment_sqrt_n also applies to
+        this method with minimal changes.
+
+        Parameters
+        ----------
+        data
+            input array or container from which to gather the input.
+        segment_ids
+            Must be in the same size with the first dimension of `data`. Has to be of
+            integer data type, and sorted. The index-th element of `segment_ids` array
+            is the segment identifier for the index-th element of `data`.
+        num_segments
+            The total number of distinct segment IDs. Default is ``None``, the last
+            segment ID plus one.
+        key_chains
+            The key-chains to apply or not apply the method to. Default is ``None``.
+        to_apply
+            If True, the method will be applied to key_chains, otherwise key_chains
+            will be skipped. Default is ``True``.
+        prune_unapplied
+            Whether to prune key_chains for which the function was not applied.
+            Default is ``False``.
+        map_sequences
+            Whether to also map method to sequences (lists, tuples).
+            Default is ``False``.
+
+        Returns
+        -------
+        ret
+            A container, of the sum divided by the square root of the count of the
+            values of `data` in each segment.
+        """
+        return ContainerBase.cont_multi_map_in_function(
+            "segment_sqrt_n",
+            data,
+            segment_ids,
+            num_segments,
+            key_chains=key_chains,
+            to_apply=to_apply,
+            prune_unapplied=prune_unapplied,
+            map_sequences=map_sequences,
+        )
+
+    def segment_sqrt_n(
+        self: ivy.Container,
+        segment_ids: ivy.Container,
+        num_segments: Optional[Union[int, ivy.Container]] = None,
+    ):
+        r"""
+        ivy.Container instance method variant of ivy.segment_sqrt_n. This method simply
+        wraps the function, and so the docstring for ivy.segment_sqrt_n also applies to
+        this method with minimal changes.
+
+        Parameters
+        ----------
+        self
+            input array or container from which to gather the input.
+        segment_ids
+            Must be in the same size with the first dimension of `self`. Has to be of
+            integer data type, and sorted. The index-th element of `segment_ids` array
+            is the segment identifier for the index-th element of `self`.
+        num_segments
+            The total number of distinct segment IDs. Default is ``None``, the last
+            segment ID plus one.
+
+        Returns
+        -------
+        ret
+            A container, of the sum divided by the square root of the count of the
+            values of `self` in each segment.
+        """
+        return self.static_segment_sqrt_n(
+            self,
+            segment_ids,
+            num_segments,
+        )
+
     @staticmethod
     def static_blackman_window(
         window_length: Union[int, ivy.Container],
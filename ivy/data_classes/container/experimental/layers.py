@@ -2406,3 +2406,161 @@ class _ContainerWithLayersExperimental(ContainerBase):
             name=name,
             out=out,
         )
+
+    @staticmethod
+    def static_istft(
+        stfts: ivy.Container,
+        frame_length: Union[int, ivy.Container],
+        frame_step: Union[int, ivy.Container],
+        /,
+        *,
+        fft_length: Optional[Union[int, ivy.Container]] = None,
+        window_fn: Optional[Union[Callable, ivy.Container]] = None,
+        name: Optional[Union[str, ivy.Container]] = None,
+        key_chains: Optional[Union[List[str], Dict[str, str], ivy.Container]] = None,
+        to_apply: Union[bool, ivy.Container] = True,
+        prune_unapplied: Union[bool, ivy.Container] = False,
+        map_sequences: Union[bool, ivy.Container] = False,
+        out: Optional[ivy.Container] = None,
+    ) -> ivy.Container:
+        """
+        ivy.Container static method variant of ivy.istft.
+
+        This method simply wraps the function, and so the docstring for
+        ivy.istft also applies to this method with minimal changes.
+
+        Parameters
+        ----------
+        stfts
+            Container of [..., frames, fft_unique_bins] arrays of complex STFT
+            values, where fft_unique_bins is fft_length // 2 + 1.
+        frame_length
+            An integer scalar. The window length in samples.
+        frame_step
+            An integer scalar. The number of samples to step.
+        fft_length
+            An integer scalar. The size of the FFT that produced the stfts. If not
+            provided, uses the smallest power of 2 enclosing frame_length.
+        window_fn
+            A callable that takes a window length and returns a [window_length]
+            array of samples, to window the frames with. If set to None, no
+            windowing is used.
+        name
+            An optional name for the operation.
+        key_chains
+            The key-chains to apply or not apply the method to. Default is ``None``.
+        to_apply
+            If True, the method will be applied to key_chains, otherwise key_chains
+            will be skipped. Default is ``True``.
+        prune_unapplied
+            Whether to prune key_chains for which the function was not applied.
+            Default is ``False``.
+        map_sequences
+            Whether to also map method to sequences (lists, tuples).
+            Default is ``False``.
+        out
+            Optional output container for writing the result.
+
+        Returns
+        -------
+        ret
+            Container of [..., samples] arrays of real signals, where samples is
+            (frames - 1) * frame_step + frame_length.
+        """
+        return ContainerBase.cont_multi_map_in_function(
+            "istft",
+            stfts,
+            frame_length,
+            frame_step,
+            fft_length=fft_length,
+            window_fn=window_fn,
+            name=name,
+            key_chains=key_chains,
+            to_apply=to_apply,
+            prune_unapplied=prune_unapplied,
+            map_sequences=map_sequences,
+            out=out,
+        )
+
+    def istft(
+        self: ivy.Container,
+        frame_length: Union[int, ivy.Container],
+        frame_step: Union[int, ivy.Container],
+        /,
+        *,
+        fft_length: Optional[Union[int, ivy.Container]] = None,
+        window_fn: Optional[Union[Callable, ivy.Container]] = None,
+        name: Optional[Union[str, ivy.Container]] = None,
+        key_chains: Optional[Union[List[str], Dict[str, str], ivy.Container]] = None,
+        to_apply: Union[bool, ivy.Container] = True,
+        prune_unapplied: Union[bool, ivy.Container] = False,
+        map_sequences: Union[bool, ivy.Container] = False,
+        out: Optional[ivy.Container] = None,
+    ) -> ivy.Container:
+        """
+        ivy.Container instance method variant of ivy.istft.
+
+        This method simply wraps the function, and so the docstring for
+        ivy.istft also applies to this method with minimal changes.
+
+        Parameters
+        ----------
+        self
+            Container of [..., frames, fft_unique_bins] arrays of complex STFT
+            values, where fft_unique_bins is fft_length // 2 + 1.
+        frame_length
+            An integer scalar. The window length in samples.
+        frame_step
+            An integer scalar. The number of samples to step.
+        fft_length
+            An integer scalar. The size of the FFT that produced the stfts. If not
+            provided, uses the smallest power of 2 enclosing frame_length.
+        window_fn
+            A callable that takes a window length and returns a [window_length]
+            array of samples, to window the frames with. If set to None, no
+            windowing is used.
+        name
+            An optional name for the operation.
+        key_chains
+            The key-chains to apply or not apply the method to. Default is ``None``.
+        to_apply
+            If True, the method will be applied to key_chains, otherwise key_chains
+            will be skipped. Default is ``True``.
+        prune_unapplied
+            Whether to prune key_chains for which the function was not applied.
+            Default is ``False``.
+        map_sequences
+            Whether to also map method to sequences (lists, tuples).
+            Default is ``False``.
+        out
+            Optional output container for writing the result.
+
+        Returns
+        -------
+        ret
+            Container of [..., samples] arrays of real signals, where samples is
+            (frames - 1) * frame_step + frame_length.
+
+        Examples
+        --------
+        >>> x = ivy.Container(a=ivy.array([1., 2., 3., 4.]), b=ivy.array([4., 3.]))
+        >>> y = ivy.Container.static_stft(x, 2, 2, fft_length=2)
+        >>> print(y.istft(2, 2, fft_length=2))
+        {
+            a: ivy.array([1., 2., 3., 4.]),
+            b: ivy.array([4., 3.])
+        }
+        """
+        return self.static_istft(
+            self,
+            frame_length,
+            frame_step,
+            fft_length=fft_length,
+            window_fn=window_fn,
+            name=name,
+            key_chains=key_chains,
+            to_apply=to_apply,
+            prune_unapplied=prune_unapplied,
+            map_sequences=map_sequences,
+            out=out,
+        )
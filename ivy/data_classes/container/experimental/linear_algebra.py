@@ -1401,7 +1401,14 @@ class _ContainerWithLinearAlgebraExperimental(ContainerBase):
             Union[Literal["svd", "random"], ivy.TuckerTensor, ivy.Container]
         ] = "svd",
         seed: Optional[Union[int, ivy.Container]] = None,
-        svd: Optional[Union[Literal["truncated_svd"], ivy.Container]] = "truncated_svd",
+        svd: Optional[
+            Union[
+                Literal[
+                    "truncated_svd", "symeig_svd", "randomized_svd", "streaming_svd"
+                ],
+                ivy.Container,
+            ]
+        ] = "truncated_svd",
         non_negative: Optional[Union[bool, ivy.Container]] = False,
         mask: Optional[Union[ivy.Array, ivy.NativeArray, ivy.Container]] = None,
         svd_mask_repeats: Optional[Union[int, ivy.Container]] = 5,
@@ -1425,11 +1432,12 @@ class _ContainerWithLinearAlgebraExperimental(ContainerBase):
             modes to consider in the input tensor
         seed
             Used to create a random seed distribution
-            when init == 'random'
+            when init == 'random' or svd == 'randomized_svd'
         init
             initialization scheme for tucker decomposition.
         svd
-            function to use to compute the SVD
+            function to use to compute the SVD, one of 'truncated_svd', 'symeig_svd',
+            'randomized_svd' and 'streaming_svd', or a callable
         non_negative
             if True, non-negative factors are returned
         mask
@@ -1475,7 +1483,14 @@ class _ContainerWithLinearAlgebraExperimental(ContainerBase):
             Union[Literal["svd", "random"], ivy.TuckerTensor, ivy.Container]
         ] = "svd",
         seed: Optional[Union[int, ivy.Container]] = None,
-        svd: Optional[Union[Literal["truncated_svd"], ivy.Container]] = "truncated_svd",
+        svd: Optional[
+            Union[
+                Literal[
+                    "truncated_svd", "symeig_svd", "randomized_svd", "streaming_svd"
+                ],
+                ivy.Container,
+            ]
+        ] = "truncated_svd",
         non_negative: Optional[Union[bool, ivy.Container]] = False,
         mask: Optional[Union[ivy.Array, ivy.NativeArray, ivy.Container]] = None,
         svd_mask_repeats: Optional[Union[int, ivy.Container]] = 5,
@@ -1499,11 +1514,12 @@ class _ContainerWithLinearAlgebraExperimental(ContainerBase):
             modes to consider in the input tensor
         seed
             Used to create a random seed distribution
-            when init == 'random'
+            when init == 'random' or svd == 'randomized_svd'
         init
             initialization scheme for tucker decomposition.
         svd
-            function to use to compute the SVD
+            function to use to compute the SVD, one of 'truncated_svd', 'symeig_svd',
+            'randomized_svd' and 'streaming_svd', or a callable
         non_negative
             if True, non-negative factors are returned
         mask
@@ -1549,7 +1565,14 @@ class _ContainerWithLinearAlgebraExperimental(ContainerBase):
         init: Optional[
             Union[Literal["svd", "random"], ivy.TuckerTensor, ivy.Container]
         ] = "svd",
-        svd: Optional[Union[Literal["truncated_svd"], ivy.Container]] = "truncated_svd",
+        svd: Optional[
+            Union[
+                Literal[
+                    "truncated_svd", "symeig_svd", "randomized_svd", "streaming_svd"
+                ],
+                ivy.Container,
+            ]
+        ] = "truncated_svd",
         seed: Optional[Union[int, ivy.Container]] = None,
         mask: Optional[Union[ivy.Array, ivy.NativeArray, ivy.Container]] = None,
         svd_mask_repeats: Optional[Union[int, ivy.Container]] = 5,
@@ -1576,11 +1599,12 @@ class _ContainerWithLinearAlgebraExperimental(ContainerBase):
             modes to consider in the input tensor
         seed
             Used to create a random seed distribution
-            when init == 'random'
+            when init == 'random' or svd == 'randomized_svd'
         init
             initialization scheme for tucker decomposition.
         svd
-            function to use to compute the SVD
+            function to use to compute the SVD, one of 'truncated_svd', 'symeig_svd',
+            'randomized_svd' and 'streaming_svd', or a callable
         mask
             array of booleans with the same shape as ``tensor`` should be 0 where
             the values are missing and 1 everywhere else. Note:  if tensor is
@@ -1627,7 +1651,14 @@ class _ContainerWithLinearAlgebraExperimental(ContainerBase):
         init: Optional[
             Union[Literal["svd", "random"], ivy.TuckerTensor, ivy.Container]
         ] = "svd",
-        svd: Optional[Union[Literal["truncated_svd"], ivy.Container]] = "truncated_svd",
+        svd: Optional[
+            Union[
+                Literal[
+                    "truncated_svd", "symeig_svd", "randomized_svd", "streaming_svd"
+                ],
+                ivy.Container,
+            ]
+        ] = "truncated_svd",
         seed: Optional[Union[int, ivy.Container]] = None,
         mask: Optional[Union[ivy.Array, ivy.NativeArray, ivy.Container]] = None,
         svd_mask_repeats: Optional[Union[int, ivy.Container]] = 5,
@@ -1654,11 +1685,12 @@ class _ContainerWithLinearAlgebraExperimental(ContainerBase):
             modes to consider in the input tensor
         seed
             Used to create a random seed distribution
-            when init == 'random'
+            when init == 'random' or svd == 'randomized_svd'
         init
             initialization scheme for tucker decomposition.
         svd
-            function to use to compute the SVD
+            function to use to compute the SVD, one of 'truncated_svd', 'symeig_svd',
+            'randomized_svd' and 'streaming_svd', or a callable
         mask
             array of booleans with the same shape as ``tensor`` should be 0 where
             the values are missing and 1 everywhere else. Note:  if tensor is
@@ -1705,7 +1737,14 @@ class _ContainerWithLinearAlgebraExperimental(ContainerBase):
         init: Optional[
             Union[Literal["svd", "random"], ivy.TuckerTensor, ivy.Container]
         ] = "svd",
-        svd: Optional[Union[Literal["truncated_svd"], ivy.Container]] = "truncated_svd",
+        svd: Optional[
+            Union[
+                Literal[
+                    "truncated_svd", "symeig_svd", "randomized_svd", "streaming_svd"
+                ],
+                ivy.Container,
+            ]
+        ] = "truncated_svd",
         seed: Optional[Union[int, ivy.Container]] = None,
         mask: Optional[Union[ivy.Array, ivy.NativeArray, ivy.Container]] = None,
         svd_mask_repeats: Optional[Union[int, ivy.Container]] = 5,
@@ -1739,10 +1778,11 @@ class _ContainerWithLinearAlgebraExperimental(ContainerBase):
             if a TuckerTensor is provided, this is used for initialization
         svd
             str, default is 'truncated_svd'
-            function to use to compute the SVD,
+            function to use to compute the SVD, one of 'truncated_svd', 'symeig_svd',
+            'randomized_svd' and 'streaming_svd', or a callable
         seed
             Used to create a random seed distribution
-            when init == 'random'
+            when init == 'random' or svd == 'randomized_svd'
         mask
             array of booleans with the same shape as ``tensor`` should be 0 where
             the values are missing and 1 everywhere else. Note:  if tensor is
@@ -1803,7 +1843,14 @@ class _ContainerWithLinearAlgebraExperimental(ContainerBase):
         init: Optional[
             Union[Literal["svd", "random"], ivy.TuckerTensor, ivy.Container]
         ] = "svd",
-        svd: Optional[Union[Literal["truncated_svd"], ivy.Container]] = "truncated_svd",
+        svd: Optional[
+            Union[
+                Literal[
+                    "truncated_svd", "symeig_svd", "randomized_svd", "streaming_svd"
+                ],
+                ivy.Container,
+            ]
+        ] = "truncated_svd",
         seed: Optional[Union[int, ivy.Container]] = None,
         mask: Optional[Union[ivy.Array, ivy.NativeArray, ivy.Container]] = None,
         svd_mask_repeats: Optional[Union[int, ivy.Container]] = 5,
@@ -1837,10 +1884,11 @@ class _ContainerWithLinearAlgebraExperimental(ContainerBase):
             if a TuckerTensor is provided, this is used for initialization
         svd
             str, default is 'truncated_svd'
-            function to use to compute the SVD,
+            function to use to compute the SVD, one of 'truncated_svd', 'symeig_svd',
+            'randomized_svd' and 'streaming_svd', or a callable
         seed
             Used to create a random seed distribution
-            when init == 'random'
+            when init == 'random' or svd == 'randomized_svd'
         mask
             array of booleans with the same shape as ``tensor`` should be 0 where
             the values are missing and 1 everywhere else. Note:  if tensor is
@@ -1890,6 +1938,382 @@ class _ContainerWithLinearAlgebraExperimental(ContainerBase):
             map_sequences=map_sequences,
         )
 
+    @staticmethod
+    def static_parafac(
+        x: Union[ivy.Array, ivy.NativeArray, ivy.Container],
+        rank: Union[int, ivy.Container],
+        /,
+        *,
+        n_iter_max: Optional[Union[int, ivy.Container]] = 100,
+        init: Optional[
+            Union[Literal["svd", "random"], ivy.CPTensor, ivy.Container]
+        ] = "svd",
+        svd: Optional[
+            Union[
+                Literal[
+                    "truncated_svd", "symeig_svd", "randomized_svd", "streaming_svd"
+                ],
+                ivy.Container,
+            ]
+        ] = "truncated_svd",
+        normalize_factors: Optional[Union[bool, ivy.Container]] = False,
+        tol: Optional[Union[float, ivy.Container]] = 1e-8,
+        seed: Optional[Union[int, ivy.Container]] = None,
+        mask: Optional[Union[ivy.Array, ivy.NativeArray, ivy.Container]] = None,
+        l2_reg: Optional[Union[float, ivy.Container]] = 0.0,
+        linesearch: Optional[Union[bool, ivy.Container]] = False,
+        cvg_criterion: Optional[
+            Union[Literal["abs_rec_error", "rec_error"], ivy.Container]
+        ] = "abs_rec_error",
+        verbose: Optional[Union[bool, ivy.Container]] = False,
+        return_errors: Optional[Union[bool, ivy.Container]] = False,
+        key_chains: Optional[Union[List[str], Dict[str, str], ivy.Container]] = None,
+        to_apply: Union[bool, ivy.Container] = True,
+        prune_unapplied: Union[bool, ivy.Container] = False,
+        map_sequences: Union[bool, ivy.Container] = False,
+    ) -> Tuple[ivy.Container, Sequence[ivy.Container]]:
+        """
+        ivy.Container static method variant of ivy.parafac. This method simply
+        wraps the function, and so the docstring for ivy.parafac also applies to
+        this method with minimal changes.
+
+        Parameters
+        ----------
+        x
+            input tensor
+        rank
+            number of components
+        n_iter_max
+            maximum number of iteration
+        init
+            {'svd', 'random'}, or CPTensor optional
+            if a CPTensor is provided, this is used for initialization
+        svd
+            str, default is 'truncated_svd'
+            function to use to compute the SVD when init == 'svd', one of
+            'truncated_svd', 'symeig_svd', 'randomized_svd' and 'streaming_svd', or a
+            callable
+        normalize_factors
+            if True, aggregate the weights of each factor in a 1D-tensor
+            of shape (rank, ), which will contain the norms of the factors
+        tol
+            tolerance: the algorithm stops when the variation in
+            the reconstruction error is less than the tolerance.
+        seed
+            Used to create a random seed distribution
+            when init == 'random' or svd == 'randomized_svd'
+        mask
+            array of booleans with the same shape as ``tensor`` should be 0 where
+            the values are missing and 1 everywhere else. The missing values are
+            imputed from the reconstruction at each iteration.
+        l2_reg
+            L2 regularization of the factors.
+        linesearch
+            whether to extrapolate the factors every other iteration, which is kept
+            only if it lowers the reconstruction error
+        cvg_criterion
+            {'abs_rec_error', 'rec_error'}, stop when the absolute variation in the
+            reconstruction error, or its decrease, is less than `tol`
+        verbose
+            if True, the reconstruction error is printed at each iteration.
+        return_errors
+            if True, list of reconstruction errors are returned.
+        key_chains
+            The key-chains to apply or not apply the method to. Default is ``None``.
+        to_apply
+            If True, the method will be applied to key_chains, otherwise key_chains
+            will be skipped. Default is ``True``.
+        prune_unapplied
+            Whether to prune key_chains for which the function was not applied.
+            Default is ``False``.
+        map_sequences
+            Whether to also map method to sequences (lists, tuples).
+            Default is ``False``.
+
+        Returns
+        -------
+            Container of ivy.CPTensors or ivy.CPTensors and
+            container of reconstruction errors if return_errors is True.
+        """
+        return ContainerBase.cont_multi_map_in_function(
+            "parafac",
+            x,
+            rank,
+            n_iter_max=n_iter_max,
+            init=init,
+            svd=svd,
+            normalize_factors=normalize_factors,
+            tol=tol,
+            seed=seed,
+            mask=mask,
+            l2_reg=l2_reg,
+            linesearch=linesearch,
+            cvg_criterion=cvg_criterion,
+            verbose=verbose,
+            return_errors=return_errors,
+            key_chains=key_chains,
+            to_apply=to_apply,
+            prune_unapplied=prune_unapplied,
+            map_sequences=map_sequences,
+        )
+
+    def parafac(
+        self: Union[ivy.Array, ivy.NativeArray, ivy.Container],
+        rank: Union[int, ivy.Container],
+        /,
+        *,
+        n_iter_max: Optional[Union[int, ivy.Container]] = 100,
+        init: Optional[
+            Union[Literal["svd", "random"], ivy.CPTensor, ivy.Container]
+        ] = "svd",
+        svd: Optional[
+            Union[
+                Literal[
+                    "truncated_svd", "symeig_svd", "randomized_svd", "streaming_svd"
+                ],
+                ivy.Container,
+            ]
+        ] = "truncated_svd",
+        normalize_factors: Optional[Union[bool, ivy.Container]] = False,
+        tol: Optional[Union[float, ivy.Container]] = 1e-8,
+        seed: Optional[Union[int, ivy.Container]] = None,
+        mask: Optional[Union[ivy.Array, ivy.NativeArray, ivy.Container]] = None,
+        l2_reg: Optional[Union[float, ivy.Container]] = 0.0,
+        linesearch: Optional[Union[bool, ivy.Container]] = False,
+        cvg_criterion: Optional[
+            Union[Literal["abs_rec_error", "rec_error"], ivy.Container]
+        ] = "abs_rec_error",
+        verbose: Optional[Union[bool, ivy.Container]] = False,
+        return_errors: Optional[Union[bool, ivy.Container]] = False,
+        key_chains: Optional[Union[List[str], Dict[str, str], ivy.Container]] = None,
+        to_apply: Union[bool, ivy.Container] = True,
+        prune_unapplied: Union[bool, ivy.Container] = False,
+        map_sequences: Union[bool, ivy.Container] = False,
+    ) -> Tuple[ivy.Container, Sequence[ivy.Container]]:
+        """
+        ivy.Container instance method variant of ivy.parafac. This method simply
+        wraps the function, and so the docstring for ivy.parafac also applies to
+        this method with minimal changes.
+
+        Parameters
+        ----------
+        x
+            input tensor
+        rank
+            number of components
+        n_iter_max
+            maximum number of iteration
+        init
+            {'svd', 'random'}, or CPTensor optional
+            if a CPTensor is provided, this is used for initialization
+        svd
+            str, default is 'truncated_svd'
+            function to use to compute the SVD when init == 'svd', one of
+            'truncated_svd', 'symeig_svd', 'randomized_svd' and 'streaming_svd', or a
+            callable
+        normalize_factors
+            if True, aggregate the weights of each factor in a 1D-tensor
+            of shape (rank, ), which will contain the norms of the factors
+        tol
+            tolerance: the algorithm stops when the variation in
+            the reconstruction error is less than the tolerance.
+        seed
+            Used to create a random seed distribution
+            when init == 'random' or svd == 'randomized_svd'
+        mask
+            array of booleans with the same shape as ``tensor`` should be 0 where
+            the values are missing and 1 everywhere else. The missing values are
+            imputed from the reconstruction at each iteration.
+        l2_reg
+            L2 regularization of the factors.
+        linesearch
+            whether to extrapolate the factors every other iteration, which is kept
+            only if it lowers the reconstruction error
+        cvg_criterion
+            {'abs_rec_error', 'rec_error'}, stop when the absolute variation in the
+            reconstruction error, or its decrease, is less than `tol`
+        verbose
+            if True, the reconstruction error is printed at each iteration.
+        return_errors
+            if True, list of reconstruction errors are returned.
+        key_chains
+            The key-chains to apply or not apply the method to. Default is ``None``.
+        to_apply
+            If True, the method will be applied to key_chains, otherwise key_chains
+            will be skipped. Default is ``True``.
+        prune_unapplied
+            Whether to prune key_chains for which the function was not applied.
+            Default is ``False``.
+        map_sequences
+            Whether to also map method to sequences (lists, tuples).
+            Default is ``False``.
+
+        Returns
+        -------
+            Container of ivy.CPTensors or ivy.CPTensors and
+            container of reconstruction errors if return_errors is True.
+        """
+        return self.static_parafac(
+            self,
+            rank,
+            n_iter_max=n_iter_max,
+            init=init,
+            svd=svd,
+            normalize_factors=normalize_factors,
+            tol=tol,
+            seed=seed,
+            mask=mask,
+            l2_reg=l2_reg,
+            linesearch=linesearch,
+            cvg_criterion=cvg_criterion,
+            verbose=verbose,
+            return_errors=return_errors,
+            key_chains=key_chains,
+            to_apply=to_apply,
+            prune_unapplied=prune_unapplied,
+            map_sequences=map_sequences,
+        )
+
+    @staticmethod
+    def static_tensor_train(
+        x: Union[ivy.Array, ivy.NativeArray, ivy.Container],
+        rank: Union[int, Sequence[int], ivy.Container],
+        /,
+        *,
+        svd: Optional[
+            Union[
+                Literal[
+                    "truncated_svd", "symeig_svd", "randomized_svd", "streaming_svd"
+                ],
+                ivy.Container,
+            ]
+        ] = "truncated_svd",
+        seed: Optional[Union[int, ivy.Container]] = None,
+        verbose: Optional[Union[bool, ivy.Container]] = False,
+        key_chains: Optional[Union[List[str], Dict[str, str], ivy.Container]] = None,
+        to_apply: Union[bool, ivy.Container] = True,
+        prune_unapplied: Union[bool, ivy.Container] = False,
+        map_sequences: Union[bool, ivy.Container] = False,
+    ) -> ivy.Container:
+        """
+        ivy.Container static method variant of ivy.tensor_train. This method
+        simply wraps the function, and so the docstring for ivy.tensor_train
+        also applies to this method with minimal changes.
+
+        Parameters
+        ----------
+        x
+            input tensor
+        rank
+            maximum allowable TT-ranks of the decomposition,
+            if int, the same rank is used for all the cores
+        svd
+            str, default is 'truncated_svd'
+            function to use to compute the SVD, one of 'truncated_svd', 'symeig_svd',
+            'randomized_svd' and 'streaming_svd', or a callable
+        seed
+            Used to create a random seed distribution
+            when svd == 'randomized_svd'
+        verbose
+            if True, the rank of each core is printed.
+        key_chains
+            The key-chains to apply or not apply the method to. Default is ``None``.
+        to_apply
+            If True, the method will be applied to key_chains, otherwise key_chains
+            will be skipped. Default is ``True``.
+        prune_unapplied
+            Whether to prune key_chains for which the function was not applied.
+            Default is ``False``.
+        map_sequences
+            Whether to also map method to sequences (lists, tuples).
+            Default is ``False``.
+
+        Returns
+        -------
+            Container of ivy.TTTensors
+        """
+        return ContainerBase.cont_multi_map_in_function(
+            "tensor_train",
+            x,
+            rank,
+            svd=svd,
+            seed=seed,
+            verbose=verbose,
+            key_chains=key_chains,
+            to_apply=to_apply,
+            prune_unapplied=prune_unapplied,
+            map_sequences=map_sequences,
+        )
+
+    def tensor_train(
+        self: Union[ivy.Array, ivy.NativeArray, ivy.Container],
+        rank: Union[int, Sequence[int], ivy.Container],
+        /,
+        *,
+        svd: Optional[
+            Union[
+                Literal[
+                    "truncated_svd", "symeig_svd", "randomized_svd", "streaming_svd"
+                ],
+                ivy.Container,
+            ]
+        ] = "truncated_svd",
+        seed: Optional[Union[int, ivy.Container]] = None,
+        verbose: Optional[Union[bool, ivy.Container]] = False,
+        key_chains: Optional[Union[List[str], Dict[str, str], ivy.Container]] = None,
+        to_apply: Union[bool, ivy.Container] = True,
+        prune_unapplied: Union[bool, ivy.Container] = False,
+        map_sequences: Union[bool, ivy.Container] = False,
+    ) -> ivy.Container:
+        """
+        ivy.Container instance method variant of ivy.tensor_train. This method
+        simply wraps the function, and so the docstring for ivy.tensor_train
+        also applies to this method with minimal changes.
+
+        Parameters
+        ----------
+        x
+            input tensor
+        rank
+            maximum allowable TT-ranks of the decomposition,
+            if int, the same rank is used for all the cores
+        svd
+            str, default is 'truncated_svd'
+            function to use to compute the SVD, one of 'truncated_svd', 'symeig_svd',
+            'randomized_svd' and 'streaming_svd', or a callable
+        seed
+            Used to create a random seed distribution
+            when svd == 'randomized_svd'
+        verbose
+            if True, the rank of each core is printed.
+        key_chains
+            The key-chains to apply or not apply the method to. Default is ``None``.
+        to_apply
+            If True, the method will be applied to key_chains, otherwise key_chains
+            will be skipped. Default is ``True``.
+        prune_unapplied
+            Whether to prune key_chains for which the function was not applied.
+            Default is ``False``.
+        map_sequences
+            Whether to also map method to sequences (lists, tuples).
+            Default is ``False``.
+
+        Returns
+        -------
+            Container of ivy.TTTensors
+        """
+        return self.static_tensor_train(
+            self,
+            rank,
+            svd=svd,
+            seed=seed,
+            verbose=verbose,
+            key_chains=key_chains,
+            to_apply=to_apply,
+            prune_unapplied=prune_unapplied,
+            map_sequences=map_sequences,
+        )
+
     @staticmethod
     def static_dot(
         a: Union[ivy.Array, ivy.NativeArray, ivy.Container],
@@ -1063,6 +1063,7 @@ class _ContainerWithStatisticalExperimental(ContainerBase):
         *,
         weights: Optional[ivy.Container] = None,
         minlength: Union[int, ivy.Container] = 0,
+        axis: Optional[Union[int, ivy.Container]] = None,
         key_chains: Optional[Union[List[str], Dict[str, str], ivy.Container]] = None,
         to_apply: Union[bool, ivy.Container] = True,
         prune_unapplied: Union[bool, ivy.Container] = False,
@@ -1082,6 +1083,9 @@ class _ContainerWithStatisticalExperimental(ContainerBase):
             An optional input container including arrays.
         minlength
             A minimum number of bins for the output array.
+        axis
+            The axis to count the values along, separately for each position of the
+            other axes. If ``None``, all of x is counted. Default: ``None``.
 
         Returns
         -------
@@ -1104,6 +1108,7 @@ class _ContainerWithStatisticalExperimental(ContainerBase):
             x,
             weights=weights,
             minlength=minlength,
+            axis=axis,
             key_chains=key_chains,
             to_apply=to_apply,
             prune_unapplied=prune_unapplied,
@@ -1117,6 +1122,7 @@ class _ContainerWithStatisticalExperimental(ContainerBase):
         *,
         weights: Optional[ivy.Container] = None,
         minlength: Union[int, ivy.Container] = 0,
+        axis: Optional[Union[int, ivy.Container]] = None,
         out: Optional[ivy.Container] = None,
     ) -> ivy.Container:
         """
@@ -1132,6 +1138,9 @@ class _ContainerWithStatisticalExperimental(ContainerBase):
             An optional input array.
         minlength
             A minimum number of bins for the output array.
+        axis
+            The axis to count the values along, separately for each position of the
+            other axes. If ``None``, all of self is counted. Default: ``None``.
 
         Returns
         -------
@@ -1140,13 +1149,116 @@ class _ContainerWithStatisticalExperimental(ContainerBase):
 
         Examples
         --------
-        >>> a = ivy.Container([[10.0, ivy.nan, 4], [3, 2, 1]])
-        >>> a.bincount(a)
-            3.0
-        >>> a.bincount(a, axis=0)
-            array([6.5, 2. , 2.5])
+        >>> a = ivy.Container(a=ivy.array([[0, 1, 1], [2, 2, 0]]))
+        >>> print(a.bincount(axis=-1))
+        {
+            a: ivy.array([[1, 2, 0],
+                          [1, 0, 2]])
+        }
+        """
+        return self.static_bincount(
+            self, weights=weights, minlength=minlength, axis=axis, out=out
+        )
+
+    @staticmethod
+    def static_digitize(
+        x: Union[ivy.Container, ivy.Array, ivy.NativeArray],
+        bins: Union[ivy.Container, ivy.Array, ivy.NativeArray],
+        /,
+        *,
+        right: Union[bool, ivy.Container] = False,
+        key_chains: Optional[Union[List[str], Dict[str, str], ivy.Container]] = None,
+        to_apply: Union[bool, ivy.Container] = True,
+        prune_unapplied: Union[bool, ivy.Container] = False,
+        map_sequences: Union[bool, ivy.Container] = False,
+        out: Optional[ivy.Container] = None,
+    ) -> ivy.Container:
+        """
+        ivy.Container static method variant of ivy.digitize. This method simply wraps
+        the function, and so the docstring for ivy.digitize also applies to this method
+        with minimal changes.
+
+        Parameters
+        ----------
+        x
+            Input container of values to bin.
+        bins
+            Array or container of bin edges, monotonically increasing or decreasing
+            along the last axis.
+        right
+            Whether the intervals include their right edge instead of their left edge.
+            Default: ``False``.
+        out
+            optional output container, for writing the result to.
+
+        Returns
+        -------
+        ret
+            A container of the bin indices, of the same shapes as x.
+
+        Examples
+        --------
+        >>> x = ivy.Container(a=ivy.array([0.2, 6.4]), b=ivy.array([3.0, 1.6]))
+        >>> bins = ivy.array([0.0, 1.0, 2.5, 4.0, 10.0])
+        >>> print(ivy.Container.static_digitize(x, bins))
+        {
+            a: ivy.array([1, 4]),
+            b: ivy.array([3, 2])
+        }
+        """
+        return ContainerBase.cont_multi_map_in_function(
+            "digitize",
+            x,
+            bins,
+            right=right,
+            key_chains=key_chains,
+            to_apply=to_apply,
+            prune_unapplied=prune_unapplied,
+            map_sequences=map_sequences,
+            out=out,
+        )
+
+    def digitize(
+        self: ivy.Container,
+        bins: Union[ivy.Container, ivy.Array, ivy.NativeArray],
+        /,
+        *,
+        right: Union[bool, ivy.Container] = False,
+        out: Optional[ivy.Container] = None,
+    ) -> ivy.Container:
+        """
+        ivy.Container instance method variant of ivy.digitize. This method simply wraps
+        the function, and so the docstring for ivy.digitize also applies to this method
+        with minimal changes.
+
+        Parameters
+        ----------
+        self
+            Input container of values to bin.
+        bins
+            Array or container of bin edges, monotonically increasing or decreasing
+            along the last axis.
+        right
+            Whether the intervals include their right edge instead of their left edge.
+            Default: ``False``.
+        out
+            optional output container, for writing the result to.
+
+        Returns
+        -------
+        ret
+            A container of the bin indices, of the same shapes as self.
+
+        Examples
+        --------
+        >>> x = ivy.Container(a=ivy.array([0.2, 6.4]), b=ivy.array([3.0, 1.6]))
+        >>> print(x.digitize(ivy.array([0.0, 1.0, 2.5, 4.0, 10.0])))
+        {
+            a: ivy.array([1, 4]),
+            b: ivy.array([3, 2])
+        }
         """
-        return self.static_bincount(self, weights=weights, minlength=minlength, out=out)
+        return self.static_digitize(self, bins, right=right, out=out)
 
     @staticmethod
     def static_igamma(
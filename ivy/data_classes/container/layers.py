@@ -773,6 +773,7 @@ class _ContainerWithLayers(ContainerBase):
         dropout_p: Optional[float] = 0.0,
         is_causal: Optional[bool] = False,
         training: Optional[bool] = False,
+        block_size: Optional[Union[int, ivy.Container]] = None,
         key_chains: Optional[Union[List[str], Dict[str, str], ivy.Container]] = None,
         to_apply: Union[bool, ivy.Container] = True,
         prune_unapplied: Union[bool, ivy.Container] = False,
@@ -813,6 +814,9 @@ class _ContainerWithLayers(ContainerBase):
             `is_causal` are set.
         training
             If True, dropout is used, otherwise dropout is not activated.
+        block_size
+            If set, keys and values are processed in tiles of this many positions
+            with an online softmax. Default is ``None``.
         key_chains
             The key-chains to apply or not apply the method to. Default is ``None``.
         to_apply
@@ -878,6 +882,7 @@ class _ContainerWithLayers(ContainerBase):
             dropout_p=dropout_p,
             is_causal=is_causal,
             training=training,
+            block_size=block_size,
             key_chains=key_chains,
             to_apply=to_apply,
             prune_unapplied=prune_unapplied,
@@ -896,6 +901,7 @@ class _ContainerWithLayers(ContainerBase):
         dropout_p: Optional[float] = 0.0,
         is_causal: Optional[bool] = False,
         training: Optional[bool] = False,
+        block_size: Optional[Union[int, ivy.Container]] = None,
         key_chains: Optional[Union[List[str], Dict[str, str], ivy.Container]] = None,
         to_apply: Union[bool, ivy.Container] = True,
         prune_unapplied: Union[bool, ivy.Container] = False,
@@ -936,6 +942,9 @@ class _ContainerWithLayers(ContainerBase):
             `is_causal` are set.
         training
             If True, dropout is used, otherwise dropout is not activated.
+        block_size
+            If set, keys and values are processed in tiles of this many positions
+            with an online softmax. Default is ``None``.
         key_chains
             The key-chains to apply or not apply the method to. Default is ``None``.
         to_apply
@@ -1016,6 +1025,7 @@ class _ContainerWithLayers(ContainerBase):
             dropout_p=dropout_p,
             is_causal=is_causal,
             training=training,
+            block_size=block_size,
             key_chains=key_chains,
             to_apply=to_apply,
             prune_unapplied=prune_unapplied,
@@ -1059,6 +1069,7 @@ class _ContainerWithLayers(ContainerBase):
         average_attention_weights: Union[bool, ivy.Container] = True,
         dropout: Union[float, ivy.Container] = 0.0,
         training: Union[bool, ivy.Container] = False,
+        block_size: Optional[Union[int, ivy.Container]] = None,
         key_chains: Optional[Union[List[str], Dict[str, str], ivy.Container]] = None,
         to_apply: Union[bool, ivy.Container] = True,
         prune_unapplied: Union[bool, ivy.Container] = False,
@@ -1085,6 +1096,7 @@ class _ContainerWithLayers(ContainerBase):
             average_attention_weights=average_attention_weights,
             dropout=dropout,
             training=training,
+            block_size=block_size,
             key_chains=key_chains,
             to_apply=to_apply,
             prune_unapplied=prune_unapplied,
@@ -1127,6 +1139,7 @@ class _ContainerWithLayers(ContainerBase):
         average_attention_weights: Union[bool, ivy.Container] = True,
         dropout: Union[float, ivy.Container] = 0.0,
         training: Union[bool, ivy.Container] = False,
+        block_size: Optional[Union[int, ivy.Container]] = None,
         key_chains: Optional[Union[List[str], Dict[str, str], ivy.Container]] = None,
         to_apply: Union[bool, ivy.Container] = True,
         prune_unapplied: Union[bool, ivy.Container] = False,
@@ -1152,6 +1165,7 @@ class _ContainerWithLayers(ContainerBase):
             average_attention_weights=average_attention_weights,
             dropout=dropout,
             training=training,
+            block_size=block_size,
             key_chains=key_chains,
             to_apply=to_apply,
             prune_unapplied=prune_unapplied,
@@ -781,16 +781,30 @@ class CPTensor(FactorizedTensor):
         mttkrp
             dot(unfold(x, mode), khatri-rao(factors))
         """
-        mttkrp_parts = []
         weights, factors = cp_tensor
-        rank = ivy.shape(factors[0])[1]
-        for r in range(rank):
-            component = ivy.multi_mode_dot(
-                x, [ivy.conj(f[:, r]) for f in factors], skip=mode
+        ndim = len(x.shape)
+        modes = sorted(
+            (m for m in range(ndim) if m != mode), key=lambda m: -x.shape[m]
+        )
+        if not modes:
+            mttkrp = ivy.expand_dims(x, axis=1) * ivy.ones_like(factors[0][:1])
+        else:
+            # contract the largest mode first, which shrinks the tensor the most, and
+            # keep the rank as the last axis of the partial products, so that neither
+            # the khatri-rao product nor any unfolding is formed
+            mttkrp = ivy.tensordot(
+                x, ivy.conj(factors[modes[0]]), axes=([modes[0]], [0])
             )
-            mttkrp_parts.append(component)
+            remaining = [m for m in range(ndim) if m != modes[0]]
+            for m in modes[1:]:
+                axis = remaining.index(m)
+                shape = [1] * len(remaining) + [-1]
+                shape[axis] = x.shape[m]
+                factor = ivy.reshape(ivy.conj(factors[m]), shape)
+                mttkrp = ivy.sum(mttkrp * factor, axis=axis)
+                remaining.pop(axis)
 
         if weights is None:
-            return ivy.stack(mttkrp_parts, axis=1)
+            return mttkrp
         else:
-            return ivy.stack(mttkrp_parts, axis=1) * ivy.reshape(weights, (1, -1))
+            return mttkrp * ivy.reshape(weights, (1, -1))
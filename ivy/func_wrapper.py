@@ -6,7 +6,7 @@ import weakref
 import warnings
 import copy as python_copy
 from types import FunctionType
-from typing import Callable, Literal
+from typing import Callable, Literal, Optional
 import inspect
 import numpy as np
 
@@ -1065,6 +1065,263 @@ def handle_partial_mixed_function(fn) -> Callable:
     return _handle_partial_mixed_function
 
 
+# Fused Dispatch #
+# ---------------#
+
+# wrappers whose work can be decided in a single pass over plain (flat) inputs
+_FUSABLE_DECORATORS = {
+    "handle_complex_input",
+    "infer_device",
+    "handle_device_shifting",
+    "infer_dtype",
+    "handle_array_function",
+    "outputs_to_ivy_arrays",
+    "outputs_to_ivy_shapes",
+    "outputs_to_native_arrays",
+    "inputs_to_native_arrays",
+    "inputs_to_native_shapes",
+    "inputs_to_ivy_arrays",
+    "handle_out_argument",
+    "handle_array_like_without_promotion",
+    "handle_nestable",
+    "handle_ragged",
+    "handle_backend_invalid",
+    "handle_exceptions",
+    "handle_nans",
+}
+
+_PLAIN_LEAF_TYPES = (bool, int, float, complex, str, slice, type(None), type(Ellipsis))
+
+
+def _is_plain_leaf(x):
+    if isinstance(x, _PLAIN_LEAF_TYPES):
+        return True
+    if type(x) in (tuple, list):
+        return all(isinstance(v, _PLAIN_LEAF_TYPES) for v in x)
+    return isinstance(x, (ivy.NativeDtype, ivy.NativeDevice))
+
+
+def _is_plain_array(x):
+    # subclasses may override `__ivy_array_function__`, so only exact ivy.Array
+    return type(x) is ivy.Array or isinstance(x, ivy.NativeArray)
+
+
+def _array_like_positions(fn):
+    # the positional arguments handle_array_like_without_promotion would convert
+    try:
+        type_hints = inspect.signature(fn).parameters
+    except (TypeError, ValueError):
+        return ()
+    positions = []
+    for i, (parameter, param) in enumerate(type_hints.items()):
+        annotation_str = str(param.annotation)
+        if (
+            ("rray" in annotation_str or "Tensor" in annotation_str)
+            and parameter != "out"
+            and all(
+                sq not in annotation_str
+                for sq in ["Sequence", "List", "Tuple", "float", "int", "bool"]
+            )
+        ):
+            positions.append(i)
+    return tuple(positions)
+
+
+def _first_plain_array(args, kwargs):
+    for x in args:
+        if _is_plain_array(x):
+            return x
+    for x in kwargs.values():
+        if _is_plain_array(x):
+            return x
+    return None
+
+
+def _fuse_dispatch(
+    fn: Callable,
+    base_fn: Callable,
+    applied: list,
+    partial_mixed_handler: Optional[Callable] = None,
+) -> Callable:
+    """
+    Fuse the wrapper chain `fn` built around `base_fn` into a single dispatch.
+
+    The wrappers listed in `applied` are decided together in one pass over the
+    arguments. When every input is flat and plain (``ivy.Array`` and native arrays,
+    scalars, strings, dtypes and devices), no container, ragged array or `out` is
+    passed, and no global mode (nan policy, soft device mode, disabled array mode)
+    requires the full machinery, the wrapper work is done inline before calling
+    `base_fn`. Any other call falls back to the nested chain `fn`, which is kept as
+    `__wrapped__`, so the fused callable behaves the same as the chain.
+
+    Parameters
+    ----------
+    fn
+        the fully wrapped function.
+    base_fn
+        the function the wrappers in `applied` were applied to.
+    applied
+        the names of the wrappers applied to `base_fn`, in the order of
+        `FN_DECORATORS`.
+    partial_mixed_handler
+        the condition under which a partial mixed function is run by `base_fn`,
+        rather than by its compositional implementation, which the fast path can't
+        call.
+
+    Returns
+    -------
+    ret
+        the fused dispatch function, or `fn` itself if some applied wrapper can't be
+        fused.
+    """
+    if not applied or not set(applied).issubset(_FUSABLE_DECORATORS):
+        return fn
+    applied = set(applied)
+    check_nans = "handle_nans" in applied
+    check_backend = "handle_backend_invalid" in applied
+    check_array_like = "handle_array_like_without_promotion" in applied
+    handle_out = "handle_out_argument" in applied
+    inputs_to_ivy = "inputs_to_ivy_arrays" in applied
+    inputs_to_native = "inputs_to_native_arrays" in applied
+    outputs_to_native = "outputs_to_native_arrays" in applied
+    outputs_to_ivy = "outputs_to_ivy_arrays" in applied
+    dtype_inference = "infer_dtype" in applied
+    device_shifting = "handle_device_shifting" in applied
+    device_inference = "infer_device" in applied
+    complex_input = "handle_complex_input" in applied
+    array_like_positions = None
+
+    def _call_base(*args, **kwargs):
+        if device_inference:
+            device = kwargs.pop("device", None)
+            arr = None if ivy.exists(device) else _first_plain_array(args, kwargs)
+            kwargs["device"] = ivy.default_device(device, item=arr, as_native=True)
+        if complex_input:
+            kwargs.pop("complex_mode", None)
+        return base_fn(*args, **kwargs)
+
+    @functools.wraps(fn)
+    def _fast_path(*args, **kwargs):
+        if check_backend:
+            for x in args + tuple(kwargs.values()):
+                if type(x) is not ivy.Array:
+                    continue
+                target_backend = ivy.utils.backend.handler._determine_backend_from_args(
+                    x
+                )
+                if (
+                    target_backend is not None
+                    and ivy.backend != ""
+                    and ivy.current_backend_str() != target_backend.backend
+                ):
+                    raise ivy.utils.exceptions.IvyInvalidBackendException(
+                        "Operation not allowed. Array was instantiated with backend"
+                        f" {target_backend.backend}. But current backend is"
+                        f" {ivy.backend}. Please set dynamic=True"
+                        " for the array if you want to convert it to the target"
+                        " backend"
+                    )
+        if handle_out:
+            kwargs["out"] = None
+        if inputs_to_ivy:
+            args = tuple(ivy.to_ivy(x) for x in args)
+            kwargs = {k: ivy.to_ivy(v) for k, v in kwargs.items()}
+        if inputs_to_native:
+            args = tuple(x.data if isinstance(x, ivy.Array) else x for x in args)
+            kwargs = {
+                k: v.data if isinstance(v, ivy.Array) else v for k, v in kwargs.items()
+            }
+        if dtype_inference:
+            dtype = kwargs.pop("dtype", None)
+            arr = None if ivy.exists(dtype) else _first_plain_array(args, kwargs)
+            dtype = ivy.default_dtype(dtype=dtype, item=arr, as_native=True)
+            ivy.utils.assertions._check_jax_x64_flag(dtype)
+            kwargs["dtype"] = dtype
+        if device_shifting:
+            dev = None
+            if "device" in kwargs and kwargs["device"] is not None:
+                dev = ivy.as_native_dev(kwargs["device"])
+            devices = tuple(
+                ivy.dev(x)
+                for x in args + tuple(kwargs.values())
+                if _is_plain_array(x) and ivy.is_native_array(x)
+            )
+            unique_devices = set(devices)
+            if len(unique_devices) > 1:
+                raise ivy.utils.exceptions.IvyException(
+                    "Expected all input arrays to be on the same device, "
+                    f"but found atleast two devices - {devices}, "
+                    "set `ivy.set_soft_device_mode(True)` to handle this problem."
+                )
+            dst_dev = (
+                dev
+                if dev is not None
+                else None if len(unique_devices) == 0 else next(iter(unique_devices))
+            )
+            with ivy.DefaultDevice(ivy.default_device(dst_dev)):
+                ret = ivy.handle_soft_device_variable(*args, fn=_call_base, **kwargs)
+        else:
+            ret = _call_base(*args, **kwargs)
+        if outputs_to_ivy:
+            ret = (
+                ivy.to_ivy(ret, nested=True, include_derived={"tuple": True})
+                if isinstance(ret, (tuple, list, dict))
+                else ivy.to_ivy(ret)
+            )
+        if outputs_to_native:
+            ret = ivy.to_native(ret, nested=True, include_derived={"tuple": True})
+        return ret
+
+    if "handle_exceptions" in applied:
+        _fast_path = getattr(ivy, "handle_exceptions")(_fast_path)
+
+    @functools.wraps(fn)
+    def _fused_dispatch(*args, **kwargs):
+        """
+        Dispatch to the fused fast path if the inputs allow it, and to the nested
+        wrapper chain otherwise.
+
+        Parameters
+        ----------
+        args
+            The arguments to be passed to the function.
+
+        kwargs
+            The keyword arguments to be passed to the function.
+
+        Returns
+        -------
+            The return of the function.
+        """
+        nonlocal array_like_positions
+        if (
+            not ivy.array_mode
+            or (check_nans and ivy.nan_policy != "nothing")
+            or (device_shifting and ivy.soft_device_mode)
+            or kwargs.get("out") is not None
+            or (complex_input and (not args or ivy.is_complex_dtype(args[0])))
+        ):
+            return fn(*args, **kwargs)
+        for x in args:
+            if not (_is_plain_array(x) or _is_plain_leaf(x)):
+                return fn(*args, **kwargs)
+        for x in kwargs.values():
+            if not (_is_plain_array(x) or _is_plain_leaf(x)):
+                return fn(*args, **kwargs)
+        if check_array_like:
+            if array_like_positions is None:
+                array_like_positions = _array_like_positions(fn)
+            for i in array_like_positions:
+                if i < len(args) and not _is_plain_array(args[i]):
+                    return fn(*args, **kwargs)
+        if partial_mixed_handler and not partial_mixed_handler(*args, **kwargs):
+            return fn(*args, **kwargs)
+        return _fast_path(*args, **kwargs)
+
+    _fused_dispatch.fused_dispatch = True
+    return _fused_dispatch
+
+
 # Functions #
 
 
@@ -1137,6 +1394,7 @@ def _wrap_function(
             add_wrappers = backend_wrappers.get("to_add")
             skip_wrappers = backend_wrappers.get("to_skip")
 
+        base_fn, applied = to_wrap, []
         for attr in FN_DECORATORS:
             if hasattr(original, attr) and not hasattr(to_wrap, attr):
                 if partial_mixed and attr == "handle_partial_mixed_function":
@@ -1144,8 +1402,10 @@ def _wrap_function(
                     to_wrap = handle_partial_mixed_function(to_wrap)
                 if attr not in skip_wrappers:
                     to_wrap = getattr(ivy, attr)(to_wrap)
+                    applied.append(attr)
             if attr in add_wrappers:
                 to_wrap = getattr(ivy, attr)(to_wrap)
+                applied.append(attr)
 
         # we should remove the all the decorators
         # after handle_mixed_fuction in FN_DECORATORS
@@ -1159,6 +1419,12 @@ def _wrap_function(
                 if hasattr(to_wrap.compos, attr):
                     to_wrap.compos = to_wrap.compos.__wrapped__
             to_wrap.compos.__dict__["array_spec"] = array_spec
+        to_wrap = _fuse_dispatch(
+            to_wrap,
+            base_fn,
+            applied,
+            base_fn.partial_mixed_handler if partial_mixed else None,
+        )
     return to_wrap
 
 
@@ -8,6 +8,7 @@ import jaxlib.xla_extension
 # local
 from ivy.functional.backends.jax import JaxArray
 import ivy
+from ivy.functional.ivy.general import cache_fn
 
 # Array API Standard #
 # ------------------ #
@@ -83,7 +84,7 @@ def unsorted_segment_min(
     num_segments: int,
 ) -> JaxArray:
     # added this check to keep the same behaviour as tensorflow
-    ivy.utils.assertions.check_unsorted_segment_min_valid_params(
+    ivy.utils.assertions.check_unsorted_segment_valid_params(
         data, segment_ids, num_segments
     )
     return jax.ops.segment_min(data, segment_ids, num_segments)
@@ -94,16 +95,34 @@ def unsorted_segment_sum(
     segment_ids: JaxArray,
     num_segments: int,
 ) -> JaxArray:
-    # Used the same check which is used for unsorted_segment_min as
-    # the check should be same
-    # Might require to change the assertion function name to
-    # check_unsorted_segment_valid_params
-    ivy.utils.assertions.check_unsorted_segment_min_valid_params(
+    ivy.utils.assertions.check_unsorted_segment_valid_params(
         data, segment_ids, num_segments
     )
     return jax.ops.segment_sum(data, segment_ids, num_segments)
 
 
+def unsorted_segment_max(
+    data: JaxArray,
+    segment_ids: JaxArray,
+    num_segments: int,
+) -> JaxArray:
+    ivy.utils.assertions.check_unsorted_segment_valid_params(
+        data, segment_ids, num_segments
+    )
+    return jax.ops.segment_max(data, segment_ids, num_segments)
+
+
+def unsorted_segment_prod(
+    data: JaxArray,
+    segment_ids: JaxArray,
+    num_segments: int,
+) -> JaxArray:
+    ivy.utils.assertions.check_unsorted_segment_valid_params(
+        data, segment_ids, num_segments
+    )
+    return jax.ops.segment_prod(data, segment_ids, num_segments)
+
+
 def blackman_window(
     size: int,
     /,
@@ -131,6 +150,7 @@ def trilu(
     return jnp.tril(x, k)
 
 
+@cache_fn(max_size=32)
 def mel_weight_matrix(
     num_mel_bins: int,
     dft_length: int,
@@ -16,7 +16,11 @@ from ivy.functional.ivy.layers import (
     _validate_max_pool_params,
     _depth_max_pooling_helper,
 )
-from ivy.functional.ivy.experimental.layers import _padding_ceil_mode, _get_size
+from ivy.functional.ivy.experimental.layers import (
+    _padding_ceil_mode,
+    _get_size,
+    _stft_params,
+)
 from ivy.func_wrapper import with_supported_dtypes
 from ivy.func_wrapper import with_unsupported_dtypes
 from . import backend_version
@@ -917,63 +921,18 @@ def stft(
                 " than or equal to 1"
             )
 
-    input_dtype = signals.dtype
-    if input_dtype == jnp.float32:
-        dtype = jnp.complex64
-    elif input_dtype == jnp.float64:
-        dtype = jnp.complex128
-
-    def stft_1D(signals, frame_length, frame_step, fft_length, pad_end):
-        if fft_length is None:
-            fft_length = 1
-            while fft_length < frame_length:
-                fft_length *= 2
-
-        num_samples = signals.shape[-1]
-
-        if pad_end:
-            num_samples = signals.shape[-1]
-            num_frames = -(-num_samples // frame_step)
-            pad_length = max(
-                0, frame_length + frame_step * (num_frames - 1) - num_samples
-            )
-
-            signals = jnp.pad(signals, [(0, pad_length)])
-        else:
-            num_frames = 1 + (num_samples - frame_length) // frame_step
-
-        stft_result = []
-
-        if window_fn is None:
-            window = 1
-        else:
-            window = window_fn(frame_length)
-
-        for i in range(num_frames):
-            start = i * frame_step
-            end = start + frame_length
-            frame = signals[..., start:end]
-            windowed_frame = frame * window
-            pad_length = fft_length - frame_length
-            windowed_frame = jnp.pad(windowed_frame, [(0, pad_length)])
-            windowed_frame = jnp.asarray(windowed_frame, dtype=dtype)
-
-            fft_frame = jnp.fft.fft(windowed_frame, axis=-1)
-            slit = int((fft_length // 2 + 1))
-            stft_result.append(fft_frame[..., 0:slit])
-
-        stft = jnp.stack(stft_result, axis=0)
-        return stft
-
-    def stft_helper(nested_list, frame_length, frame_step, fft_length):
-        nested_list = nested_list
-        if len(jnp.shape(nested_list)) > 1:
-            return [
-                stft_helper(sublist, frame_length, frame_step, fft_length)
-                for sublist in nested_list
-            ]
-        else:
-            return stft_1D(nested_list, frame_length, frame_step, fft_length, pad_end)
+    fft_length, num_frames, pad_length = _stft_params(
+        signals.shape[-1], frame_length, frame_step, fft_length, pad_end
+    )
+    signals = jnp.pad(signals, [(0, 0)] * (signals.ndim - 1) + [(0, pad_length)])
+    # gather all the frames at once
+    indices = (
+        jnp.arange(num_frames)[:, None] * frame_step + jnp.arange(frame_length)[None]
+    )
+    frames = signals[..., indices]
+    if window_fn is not None:
+        frames = frames * window_fn(frame_length)
 
-    to_return = stft_helper(signals, frame_length, frame_step, fft_length)
-    return jnp.asarray(to_return, dtype=dtype)
+    if jnp.iscomplexobj(frames):
+        return jnp.fft.fft(frames, n=fft_length, axis=-1)[..., : fft_length // 2 + 1]
+    return jnp.fft.rfft(frames, n=fft_length, axis=-1)
@@ -1,3 +1,4 @@
+import math
 import jax.numpy as jnp
 from typing import Optional, Union, Tuple, Sequence
 
@@ -245,14 +246,30 @@ def bincount(
     *,
     weights: Optional[JaxArray] = None,
     minlength: int = 0,
+    axis: Optional[int] = None,
     out: Optional[JaxArray] = None,
 ) -> JaxArray:
+    dtype = x.dtype if weights is None else weights.dtype
+    if axis is None:
+        if weights is not None:
+            weights = weights.ravel()
+        ret = jnp.bincount(x.ravel(), weights=weights, minlength=minlength)
+        return ret.astype(dtype)
+    # count all the positions of the other axes at once, with the values of each
+    # offset past those of the previous ones
+    # jnp.bincount counts negative values as 0, rather than in the bins of the
+    # previous row once offset
+    x = jnp.clip(jnp.moveaxis(x, axis, -1), 0)
+    length = int(jnp.max(x, initial=minlength - 1)) + 1
+    num_rows = math.prod(x.shape[:-1])
+    offsets = jnp.arange(num_rows).reshape((*x.shape[:-1], 1))
     if weights is not None:
-        ret = jnp.bincount(x, weights=weights, minlength=minlength)
-        ret = ret.astype(weights.dtype)
-    else:
-        ret = jnp.bincount(x, minlength=minlength).astype(x.dtype)
-    return ret
+        weights = jnp.moveaxis(weights, axis, -1).ravel()
+    ret = jnp.bincount(
+        (x + offsets * length).ravel(), weights=weights, length=num_rows * length
+    )
+    ret = ret.reshape((*x.shape[:-1], length))
+    return jnp.moveaxis(ret, -1, axis).astype(dtype)
 
 
 def cov(
@@ -308,86 +325,32 @@ def cummax(
     elif x.dtype in (jnp.complex128, jnp.complex64):
         x = jnp.real(x).astype(jnp.float64)
 
-    if exclusive or (reverse and exclusive):
-        if exclusive and reverse:
-            indices = __find_cummax_indices(jnp.flip(x, axis=axis), axis=axis)
-            x = jlax.cummax(jnp.flip(x, axis=axis), axis=axis)
-            x, indices = jnp.swapaxes(x, axis, -1), jnp.swapaxes(indices, axis, -1)
-            x, indices = jnp.concatenate(
-                (jnp.zeros_like(x[..., -1:]), x[..., :-1]), -1
-            ), jnp.concatenate(
-                (jnp.zeros_like(indices[..., -1:]), indices[..., :-1]), -1
-            )
-            x, indices = jnp.swapaxes(x, axis, -1), jnp.swapaxes(indices, axis, -1)
-            res, indices = jnp.flip(x, axis=axis), jnp.flip(indices, axis=axis)
-        elif exclusive:
-            x = jnp.swapaxes(x, axis, -1)
-            x = jnp.concatenate((jnp.zeros_like(x[..., -1:]), x[..., :-1]), -1)
-            x = jnp.swapaxes(x, axis, -1)
-            indices = __find_cummax_indices(x, axis=axis)
-            res = jlax.cummax(x, axis=axis)
-        return res, indices
-
+    x = jnp.moveaxis(x, axis, -1)
     if reverse:
-        y = jnp.flip(x, axis=axis)
-        indices = __find_cummax_indices(y, axis=axis)
-        indices = jnp.flip(indices, axis=axis)
-    else:
-        indices = __find_cummax_indices(x, axis=axis)
-    return jlax.cummax(x, axis, reverse=reverse), indices
-
-
-def __find_cummax_indices(
-    x: JaxArray,
-    axis: int = 0,
-) -> JaxArray:
-    n, indice, indices = 0, [], []
-
-    if isinstance(x[0], JaxArray) and len(x[0].shape) >= 1:
-        if axis >= 1:
-            for ret1 in x:
-                indice = __find_cummax_indices(ret1, axis=axis - 1)
-                indices.append(indice)
-        else:
-            z_list = __get_index(x.tolist())
-            indices, n1 = x.copy(), {}
-            indices = jnp.zeros(jnp.asarray(indices.shape), dtype=x.dtype)
-            z_list = sorted(z_list, key=lambda i: i[1])
-            for y, y_index in z_list:
-                multi_index = y_index
-                if tuple(multi_index[1:]) not in n1:
-                    n1[tuple(multi_index[1:])] = multi_index[0]
-                    indices = indices.at[y_index].set(multi_index[0])
-                elif (
-                    y >= x[tuple([n1[tuple(multi_index[1:])]] + list(multi_index[1:]))]
-                ):
-                    n1[tuple(multi_index[1:])] = multi_index[0]
-                    indices = indices.at[y_index].set(multi_index[0])
-                else:
-                    indices = indices.at[y_index].set(n1[tuple(multi_index[1:])])
-    else:
-        n, indices = 0, []
-        for idx, y in enumerate(x):
-            if idx == 0 or x[n] <= y:
-                n = idx
-            indices.append(n)
-
-    return jnp.asarray(indices, dtype="int64")
-
-
-def __get_index(lst, indices=None, prefix=None):
-    if indices is None:
-        indices = []
-    if prefix is None:
-        prefix = []
-
-    if isinstance(lst, list):
-        for i, sub_lst in enumerate(lst):
-            sub_indices = prefix + [i]
-            __get_index(sub_lst, indices, sub_indices)
-    else:
-        indices.append((lst, tuple(prefix)))
-    return indices
+        x = jnp.flip(x, axis=-1)
+    elif exclusive:
+        x = jnp.concatenate((jnp.zeros_like(x[..., :1]), x[..., :-1]), -1)
+    values = jlax.cummax(x, axis=x.ndim - 1)
+    # the index of each maximum is the last position at which it was reached, or
+    # at which a nan was met, so it is propagated by a running maximum of these
+    # positions
+    reached = x == values
+    if jnp.issubdtype(x.dtype, jnp.floating):
+        reached = reached | jnp.isnan(x)
+    indices = jnp.where(reached, jnp.arange(x.shape[-1]), 0)
+    indices = jlax.cummax(indices, axis=x.ndim - 1)
+    if reverse:
+        if exclusive:
+            values = jnp.concatenate(
+                (jnp.zeros_like(values[..., :1]), values[..., :-1]), -1
+            )
+            indices = jnp.concatenate(
+                (jnp.zeros_like(indices[..., :1]), indices[..., :-1]), -1
+            )
+        values, indices = jnp.flip(values, axis=-1), jnp.flip(indices, axis=-1)
+    values = jnp.moveaxis(values, -1, axis)
+    indices = jnp.moveaxis(indices, -1, axis).astype("int64")
+    return values, indices
 
 
 @with_unsupported_dtypes({"0.4.14 and below": "bfloat16"}, backend_version)
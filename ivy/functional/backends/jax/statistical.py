@@ -215,3 +215,6 @@ def einsum(
     equation: str, *operands: JaxArray, out: Optional[JaxArray] = None
 ) -> JaxArray:
     return jnp.einsum(equation, *operands)
+
+
+einsum.partial_mixed_handler = lambda equation, *operands, **kwargs: len(operands) < 3
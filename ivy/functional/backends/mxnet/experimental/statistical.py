@@ -85,6 +85,7 @@ def bincount(
     *,
     weights: Optional[Union[(None, mx.ndarray.NDArray)]] = None,
     minlength: int = 0,
+    axis: Optional[int] = None,
     out: Optional[Union[(None, mx.ndarray.NDArray)]] = None,
 ) -> Union[(None, mx.ndarray.NDArray)]:
     raise IvyNotImplementedException()
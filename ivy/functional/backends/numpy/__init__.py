@@ -216,6 +216,16 @@ from .experimental import *
 from . import control_flow_ops
 from .control_flow_ops import *
 
+# record the differentiable functions on the gradient tape
+from .gradients import _record_primitives
+
+_record_primitives(globals())
+
+# record the backend functions on the batch traces of vmap
+from .batching import _trace_primitives
+
+_trace_primitives(globals())
+
 
 # sub-backends
 
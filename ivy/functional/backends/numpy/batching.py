@@ -0,0 +1,874 @@
+"""Batching rules of the NumPy backend, used to vectorize ``vmap``."""
+
+# global
+import functools
+import inspect
+import numbers
+import string
+import types
+import numpy as np
+
+# local
+import ivy
+from ivy.functional.backends.numpy.gradients import _is_tensor, _parse_einsum
+
+
+# Batch Trace #
+# ----------- #
+
+# maps backend function names to their batching rules
+_batch_rules = {}
+
+# traces which are currently recording, innermost last
+_active_traces = []
+
+# backend functions which are never recorded on a trace, as they call back into
+# functions whose own backend calls are the ones to batch
+_untraced = {
+    "vmap",
+    "handle_soft_device_variable",
+    "if_else",
+    "while_loop",
+    "wrap__array_ufunc__",
+}
+
+# backend functions returning python values which depend on the shapes and dtypes
+# of their inputs only, and thus are the same for every example
+_shape_queries = {"dtype_bits", "get_num_dims", "shape"}
+
+
+def _batch_rule(*fn_names):
+    """
+    Register the decorated function as the batching rule of the named backend
+    functions.
+
+    A rule is called as ``rule(fn, bound, batched)``, where ``fn`` is the backend
+    function and ``bound`` holds the arguments of the call, with batched arrays
+    in place of the traced ones. ``batched(x)`` tells whether an argument is
+    batched, in which case its batch axis is the first one. The rule returns the
+    output(s) of the call with the batch axis first for every example, or
+    ``NotImplemented`` if it cannot batch this particular call.
+    """
+
+    def _register(rule):
+        for fn_name in fn_names:
+            _batch_rules[fn_name] = rule
+        return rule
+
+    return _register
+
+
+def _untrust():
+    """
+    Mark the traces which are recording as not to be replayed.
+
+    Called when the traced function computes on the traced arrays without going
+    through the backend functions, or gets python values out of them, as the
+    trace then misses computations or control flow which may differ between
+    the examples.
+    """
+    for trace in _active_traces:
+        if trace._recording:
+            trace._trusted = False
+
+
+def _plain(x):
+    if isinstance(x, _TracedArray):
+        return x.view(np.ndarray)
+    if type(x) in (list, tuple):
+        return type(x)(_plain(a) for a in x)
+    return x
+
+
+class _TracedArray(np.ndarray):
+    """
+    View of a traced array, which detects the numpy computations done on it by
+    the traced function itself.
+
+    The backend functions compute on it freely while they are being recorded,
+    anything else untrusts the trace.
+    """
+
+    def __array_finalize__(self, obj):
+        # views and copies made by the ndarray methods, such as reshape or
+        # indexing
+        if isinstance(obj, _TracedArray):
+            _untrust()
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        _untrust()
+        if "out" in kwargs:
+            kwargs["out"] = _plain(kwargs["out"])
+        return getattr(ufunc, method)(*_plain(inputs), **kwargs)
+
+    def __array_function__(self, func, types, args, kwargs):
+        _untrust()
+        return func(*_plain(args), **{k: _plain(v) for k, v in kwargs.items()})
+
+
+def _untrusting(method):
+    @functools.wraps(method)
+    def _untrusted(self, *args, **kwargs):
+        _untrust()
+        return method(self, *args, **kwargs)
+
+    return _untrusted
+
+
+# the conversions to python values, and the accesses to the examples' elements,
+# which may give numpy scalars instead of views
+for _name in (
+    "__bool__",
+    "__complex__",
+    "__float__",
+    "__getitem__",
+    "__index__",
+    "__int__",
+    "__iter__",
+    "__setitem__",
+    "item",
+    "tolist",
+):
+    setattr(_TracedArray, _name, _untrusting(getattr(np.ndarray, _name)))
+
+
+def _to_traced(ret):
+    if type(ret) in (list, tuple):
+        return type(ret)(_to_traced(r) for r in ret)
+    if isinstance(ret, ivy.Array):
+        return ivy.Array(_to_traced(ret.data))
+    if isinstance(ret, (np.ndarray, np.generic)) and not isinstance(
+        ret, _TracedArray
+    ):
+        return np.asarray(ret).view(_TracedArray)
+    return ret
+
+
+def _has_value(ret):
+    if isinstance(ret, (list, tuple)):
+        return any(_has_value(r) for r in ret)
+    return isinstance(ret, numbers.Number) and not isinstance(ret, np.generic)
+
+
+def _traced(fn_name, fn):
+    signature = None
+
+    @functools.wraps(fn)
+    def _recorded(*args, **kwargs):
+        nonlocal signature
+        if not _active_traces:
+            return fn(*args, **kwargs)
+        traces = [
+            trace
+            for trace in _active_traces
+            if trace._recording
+            and (trace._traces(args) or trace._traces(kwargs.values()))
+        ]
+        if not traces:
+            return fn(*args, **kwargs)
+        # the function is batched as a whole, so the backend calls it makes
+        # internally are not recorded
+        for trace in traces:
+            trace._recording = False
+        try:
+            ret = _to_traced(fn(*args, **kwargs))
+        finally:
+            for trace in traces:
+                trace._recording = True
+        if (
+            _has_value(ret)
+            and not fn_name.startswith("is_")
+            and fn_name not in _shape_queries
+        ):
+            # python values such as those of to_scalar may drive control flow
+            # which differs between the examples
+            for trace in traces:
+                trace._trusted = False
+        if signature is None:
+            signature = inspect.signature(fn)
+        # decorators of some backend functions fill in required arguments, which
+        # are then left for them to fill in again when the call is batched
+        bound = signature.bind_partial(*args, **kwargs)
+        bound.apply_defaults()
+        for trace in traces:
+            trace._record(fn_name, fn, bound, ret)
+        return ret
+
+    return _recorded
+
+
+def _trace_primitives(namespace):
+    """Replace the public backend functions by their versions recorded on traces."""
+    for fn_name, fn in list(namespace.items()):
+        if (
+            isinstance(fn, types.FunctionType)
+            and not fn_name.startswith("_")
+            and fn_name not in _untraced
+            and fn.__module__.startswith("ivy.functional.backends.numpy")
+        ):
+            namespace[fn_name] = _traced(fn_name, fn)
+
+
+class _Trace:
+    """
+    Record the backend functions called on the traced arrays of one example.
+
+    Like the gradient tape, arrays are tracked by identity and the outputs of
+    recorded calls are traced in turn. The trace holds references to every traced
+    array, so their ids remain unique for as long as it is alive. It is only
+    replayed while trusted, see ``_TracedArray``.
+    """
+
+    def __init__(self):
+        self._nodes = []
+        self._traced = {}
+        self._recording = True
+        self._trusted = True
+
+    def __enter__(self):
+        _active_traces.append(self)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        _active_traces.remove(self)
+
+    def trace(self, x):
+        if _is_tensor(x):
+            self._traced[id(x)] = x
+        return x
+
+    def _traces(self, args):
+        for arg in args:
+            if isinstance(arg, (list, tuple)):
+                if self._traces(arg):
+                    return True
+            elif id(arg) in self._traced:
+                return True
+        return False
+
+    def _record(self, fn_name, fn, bound, ret):
+        multiple = isinstance(ret, (list, tuple))
+        # some backend functions return ivy arrays, which are unwrapped later
+        outputs = [
+            o.data if isinstance(o, ivy.Array) else o
+            for o in (ret if multiple else [ret])
+        ]
+        if not any(_is_tensor(o) for o in outputs):
+            return
+        for o in outputs:
+            self.trace(o)
+        self._nodes.append((fn_name, fn, bound, outputs, multiple))
+
+
+# Replay #
+# ------ #
+
+
+def _unwrap(ret):
+    if isinstance(ret, (list, tuple)):
+        return [_unwrap(r) for r in ret]
+    return ret.data if isinstance(ret, ivy.Array) else ret
+
+
+def _loop(fn, bound, batched, size):
+    # call the function once per example and stack the outputs
+    def _example(arg, b):
+        if isinstance(arg, (list, tuple)):
+            return type(arg)(_example(a, b) for a in arg)
+        return arg[b] if batched(arg) else arg
+
+    rets = [
+        _unwrap(
+            fn(
+                *[_example(a, b) for a in bound.args],
+                **{k: _example(v, b) for k, v in bound.kwargs.items()},
+            )
+        )
+        for b in range(size)
+    ]
+    if isinstance(rets[0], list):
+        return [np.stack([r[i] for r in rets]) for i in range(len(rets[0]))]
+    return np.stack(rets)
+
+
+def _batch_trace(trace, env, size):
+    """
+    Replay the calls recorded on ``trace`` on the whole batch.
+
+    ``env`` maps the ids of the traced inputs to their batched values, and is
+    filled with the batched values of every traced output. Returns the names of
+    the functions which had to be looped over the examples.
+    """
+    fallbacks = []
+    for fn_name, fn, bound, outputs, multiple in trace._nodes:
+        batched_ids = set()
+
+        def _substitute(arg):
+            if type(arg) in (list, tuple):
+                return type(arg)(_substitute(a) for a in arg)
+            if id(arg) in env:
+                arg = env[id(arg)]
+                batched_ids.add(id(arg))
+            return arg
+
+        arguments = {k: _substitute(v) for k, v in bound.arguments.items()}
+        if "out" in arguments:
+            arguments["out"] = None
+        signature = bound.signature
+        batched_bound = inspect.BoundArguments(signature, arguments)
+
+        def batched(x):
+            return id(x) in batched_ids
+
+        ret = NotImplemented
+        rule = _batch_rules.get(fn_name)
+        if rule is not None:
+            try:
+                ret = rule(
+                    fn, inspect.BoundArguments(signature, dict(arguments)), batched
+                )
+            except Exception:
+                # the loop below reproduces any genuine error of the call
+                ret = NotImplemented
+        if ret is not NotImplemented:
+            ret = _unwrap(ret)
+            rets = ret if multiple else [ret]
+            if not (isinstance(rets, list) and len(rets) == len(outputs)) or any(
+                _is_tensor(o) and np.shape(r) != (size,) + np.shape(o)
+                for o, r in zip(outputs, rets)
+            ):
+                ret = NotImplemented
+        if ret is NotImplemented:
+            fallbacks.append(fn_name)
+            ret = _loop(fn, batched_bound, batched, size)
+        for o, r in zip(outputs, ret if multiple else [ret]):
+            if _is_tensor(o):
+                r = np.asarray(r)
+                env[id(o)] = r if r.dtype == o.dtype else r.astype(o.dtype)
+    return fallbacks
+
+
+def _map_nest(fn, nest):
+    if isinstance(nest, (list, tuple)):
+        return type(nest)(_map_nest(fn, n) for n in nest)
+    if isinstance(nest, dict):
+        return {k: _map_nest(fn, n) for k, n in nest.items()}
+    return fn(nest)
+
+
+def _stack_nests(nests):
+    first = nests[0]
+    if isinstance(first, (list, tuple)):
+        return type(first)(
+            _stack_nests([n[i] for n in nests]) for i in range(len(first))
+        )
+    if isinstance(first, dict):
+        return {k: _stack_nests([n[k] for n in nests]) for k in first}
+    return np.stack([ivy.to_native(n) for n in nests])
+
+
+def _loop_call(func, args, mapped, size, done=None):
+    # done maps the examples func was already called on to its returns, so that
+    # functions with side effects are called once per example, as without vmap
+    done = {} if done is None else done
+    return _stack_nests(
+        [
+            (
+                _map_nest(_plain, done[b])
+                if b in done
+                else func(*[arg[b] if m else arg for arg, m in zip(args, mapped)])
+            )
+            for b in range(size)
+        ]
+    )
+
+
+def _allclose(x, y):
+    x, y = np.asarray(x), np.asarray(y)
+    if x.shape != y.shape or x.dtype != y.dtype:
+        return False
+    if not np.issubdtype(x.dtype, np.inexact):
+        return np.array_equal(x, y)
+    rtol = 1e-2 if np.finfo(x.dtype).bits <= 16 else 1e-4
+    return np.allclose(x, y, rtol=rtol, atol=rtol * 1e-2, equal_nan=True)
+
+
+def _batched_call(func, args, mapped, size):
+    """
+    Call ``func`` on a batch of examples, by tracing it on the first example and
+    replaying the trace on the whole batch with the batching rules.
+
+    ``func`` is called on each example in turn instead if the trace cannot be
+    trusted, because ``func`` computes on the examples with numpy directly or
+    branches on their values.
+
+    The batch axis of the ``mapped`` arguments is the first one. Returns the
+    batched return of ``func``, and the names of the backend functions which had
+    no batching rule and were looped over the examples instead.
+    """
+    if size < 2:
+        return _loop_call(func, args, mapped, size), []
+    examples = [
+        arg[0].view(_TracedArray) if m else arg for arg, m in zip(args, mapped)
+    ]
+    with _Trace() as trace:
+        for x, m in zip(examples, mapped):
+            if m:
+                trace.trace(x)
+        ret = ivy.to_native(func(*examples), nested=True)
+    name = getattr(func, "__name__", type(func).__name__)
+    if not trace._trusted:
+        return _loop_call(func, args, mapped, size, {0: ret}), [name]
+    env = {id(x): arg for x, arg, m in zip(examples, args, mapped) if m}
+    try:
+        fallbacks = _batch_trace(trace, env, size)
+    except Exception:
+        # the outputs of a looped function may have a different shape for each
+        # example, which only func as a whole can make up for
+        return _loop_call(func, args, mapped, size, {0: ret}), [name]
+
+    def _batched(x):
+        if id(x) in env:
+            return env[id(x)]
+        # outputs which do not depend on the mapped arguments
+        x = np.asarray(x)
+        return np.broadcast_to(x, (size,) + x.shape)
+
+    batched_ret = _map_nest(_batched, ret)
+    # as a last safeguard, against computations which escape the trace without
+    # touching the traced arrays, such as converting them with np.asarray, the
+    # batched result is checked against the last example
+    last = ivy.to_native(
+        func(*[arg[-1] if m else arg for arg, m in zip(args, mapped)]), nested=True
+    )
+    matches = []
+    _map_nest(lambda x: matches.append(x), last)
+    batched_leaves = []
+    _map_nest(lambda x: batched_leaves.append(x[-1]), batched_ret)
+    if len(matches) != len(batched_leaves) or not all(
+        _allclose(x, y) for x, y in zip(batched_leaves, matches)
+    ):
+        return (
+            _loop_call(func, args, mapped, size, {0: ret, size - 1: last}),
+            fallbacks + [name],
+        )
+    return batched_ret, fallbacks
+
+
+# Batching Rules #
+# -------------- #
+
+
+def _example_ndim(x, batched):
+    return np.ndim(x) - 1 if batched(x) else np.ndim(x)
+
+
+def _expand(x, ndim):
+    # insert unit axes after the batch axis, so that the examples of ``x``
+    # broadcast against unbatched arrays with ``ndim`` dimensions
+    return np.reshape(x, x.shape[:1] + (1,) * (ndim + 1 - x.ndim) + x.shape[1:])
+
+
+def _shift_axis(axis, ndim):
+    # map an axis of an example with ``ndim`` dimensions to the batched array
+    if isinstance(axis, (list, tuple)):
+        return tuple(_shift_axis(a, ndim) for a in axis)
+    return axis % ndim + 1 if ndim else axis + 1
+
+
+def _only_batched(bound, batched, name):
+    return all(not batched(v) for k, v in bound.arguments.items() if k != name)
+
+
+def _call(fn, bound):
+    return fn(*bound.args, **bound.kwargs)
+
+
+@_batch_rule(
+    "abs", "acos", "acosh", "add", "asin", "asinh", "atan", "atan2", "atanh",
+    "bitwise_and", "bitwise_invert", "bitwise_left_shift", "bitwise_or",
+    "bitwise_right_shift", "bitwise_xor", "ceil", "cos", "cosh", "divide", "equal",
+    "exp", "exp2", "expm1", "floor", "floor_divide", "fmin", "greater",
+    "greater_equal", "isfinite", "isinf", "isnan", "lcm", "less", "less_equal", "log",
+    "log10", "log1p", "log2", "logaddexp", "logaddexp2", "logical_and", "logical_not",
+    "logical_or", "logical_xor", "multiply", "negative", "not_equal", "positive",
+    "pow", "remainder", "round", "sign", "sin", "sinh", "sqrt", "square", "subtract",
+    "tan", "tanh", "trunc", "erf", "maximum", "minimum", "reciprocal", "deg2rad",
+    "rad2deg", "isreal", "fmod", "angle", "gcd", "imag", "nan_to_num", "real",
+    "relu", "leaky_relu", "gelu", "sigmoid", "softplus", "softsign", "mish",
+    "hardswish", "where", "clip", "astype", "asarray", "array", "copy_array",
+    "to_numpy", "stop_gradient", "to_device", "zeros_like", "ones_like",
+    "empty_like", "full_like",
+)  # fmt: skip
+def _elementwise_batch_rule(fn, bound, batched):
+    tensors = [k for k, v in bound.arguments.items() if _is_tensor(v)]
+    ndim = max(_example_ndim(bound.arguments[k], batched) for k in tensors)
+    for k in tensors:
+        if batched(bound.arguments[k]):
+            bound.arguments[k] = _expand(bound.arguments[k], ndim)
+    return _call(fn, bound)
+
+
+@_batch_rule("broadcast_arrays")
+def _broadcast_arrays_batch_rule(fn, bound, batched):
+    arrays = bound.arguments["arrays"]
+    ndim = max(_example_ndim(x, batched) for x in arrays)
+    size = next(x.shape[0] for x in arrays if batched(x))
+    arrays = [_expand(x, ndim) if batched(x) else x for x in arrays]
+    # every output of the rule is batched, including those of unbatched inputs
+    arrays.append(np.empty((size,) + (1,) * ndim, dtype=bool))
+    return _call(fn, inspect.BoundArguments(bound.signature, {"arrays": arrays}))[
+        :-1
+    ]
+
+
+@_batch_rule(
+    "sum", "mean", "prod", "max", "min", "var", "std", "all", "any", "vector_norm",
+    "flip",
+)  # fmt: skip
+def _reduction_batch_rule(fn, bound, batched):
+    x = bound.arguments["x"]
+    if not _only_batched(bound, batched, "x"):
+        return NotImplemented
+    axis = bound.arguments["axis"]
+    bound.arguments["axis"] = (
+        tuple(range(1, x.ndim)) if axis is None else _shift_axis(axis, x.ndim - 1)
+    )
+    return _call(fn, bound)
+
+
+@_batch_rule(
+    "softmax", "log_softmax", "cumsum", "cumprod", "sort", "argsort", "unstack",
+    "split", "roll", "repeat", "matrix_norm",
+)  # fmt: skip
+def _axis_batch_rule(fn, bound, batched):
+    x = bound.arguments["x"]
+    if not _only_batched(bound, batched, "x"):
+        return NotImplemented
+    axis = bound.arguments["axis"]
+    if axis is None:
+        if fn.__name__ not in ("softmax", "log_softmax"):
+            return NotImplemented
+        axis = -1
+    bound.arguments["axis"] = _shift_axis(axis, x.ndim - 1)
+    return _call(fn, bound)
+
+
+@_batch_rule("argmax", "argmin")
+def _arg_reduction_batch_rule(fn, bound, batched):
+    x = bound.arguments["x"]
+    if not _only_batched(bound, batched, "x"):
+        return NotImplemented
+    if bound.arguments["axis"] is not None:
+        bound.arguments["axis"] = _shift_axis(bound.arguments["axis"], x.ndim - 1)
+        return _call(fn, bound)
+    keepdims = bound.arguments["keepdims"]
+    bound.arguments.update(x=np.reshape(x, (x.shape[0], -1)), axis=1, keepdims=False)
+    ret = _call(fn, bound)
+    return np.reshape(ret, (x.shape[0],) + (1,) * (x.ndim - 1)) if keepdims else ret
+
+
+@_batch_rule("expand_dims")
+def _expand_dims_batch_rule(fn, bound, batched):
+    x, axis = bound.arguments["x"], bound.arguments["axis"]
+    # negative axes count from the end, which the batch axis leaves unchanged
+    axes = axis if isinstance(axis, (list, tuple)) else (axis,)
+    bound.arguments["axis"] = tuple(a if a < 0 else a + 1 for a in axes)
+    return _call(fn, bound) if x.ndim > 0 else NotImplemented
+
+
+@_batch_rule("squeeze")
+def _squeeze_batch_rule(fn, bound, batched):
+    x, axis = bound.arguments["x"], bound.arguments["axis"]
+    if axis is None:
+        axis = tuple(i for i, d in enumerate(x.shape[1:]) if d == 1)
+    bound.arguments["axis"] = _shift_axis(axis, x.ndim - 1)
+    return _call(fn, bound)
+
+
+@_batch_rule("reshape")
+def _reshape_batch_rule(fn, bound, batched):
+    x = bound.arguments["x"]
+    if not _only_batched(bound, batched, "x") or bound.arguments["order"] != "C":
+        return NotImplemented
+    bound.arguments["shape"] = (x.shape[0],) + tuple(bound.arguments["shape"])
+    return _call(fn, bound)
+
+
+@_batch_rule("permute_dims")
+def _permute_dims_batch_rule(fn, bound, batched):
+    ndim = bound.arguments["x"].ndim - 1
+    bound.arguments["axes"] = (0,) + _shift_axis(tuple(bound.arguments["axes"]), ndim)
+    return _call(fn, bound)
+
+
+@_batch_rule("swapaxes")
+def _swapaxes_batch_rule(fn, bound, batched):
+    ndim = bound.arguments["x"].ndim - 1
+    for k in ("axis0", "axis1"):
+        bound.arguments[k] = _shift_axis(bound.arguments[k], ndim)
+    return _call(fn, bound)
+
+
+@_batch_rule("trace", "diagonal")
+def _diagonal_batch_rule(fn, bound, batched):
+    if not _only_batched(bound, batched, "x"):
+        return NotImplemented
+    ndim = bound.arguments["x"].ndim - 1
+    for k in ("axis1", "axis2"):
+        bound.arguments[k] = _shift_axis(bound.arguments[k], ndim)
+    return _call(fn, bound)
+
+
+@_batch_rule(
+    "matrix_transpose", "inv", "det", "slogdet", "cholesky", "eigh", "eigvalsh", "qr",
+    "svd", "svdvals", "pinv", "tril", "triu",
+)  # fmt: skip
+def _matrix_batch_rule(fn, bound, batched):
+    # these act on the last two axes, and broadcast over any leading ones
+    if not _only_batched(bound, batched, "x"):
+        return NotImplemented
+    return _call(fn, bound)
+
+
+@_batch_rule("broadcast_to")
+def _broadcast_to_batch_rule(fn, bound, batched):
+    x, shape = bound.arguments["x"], tuple(bound.arguments["shape"])
+    if x.ndim - 1 > len(shape):
+        return NotImplemented
+    bound.arguments.update(x=_expand(x, len(shape)), shape=x.shape[:1] + shape)
+    return _call(fn, bound)
+
+
+@_batch_rule("tile")
+def _tile_batch_rule(fn, bound, batched):
+    x, repeats = bound.arguments["x"], bound.arguments["repeats"]
+    if not _only_batched(bound, batched, "x"):
+        return NotImplemented
+    repeats = (repeats,) if isinstance(repeats, int) else tuple(repeats)
+    ndim = max(x.ndim - 1, len(repeats))
+    bound.arguments.update(
+        x=_expand(x, ndim), repeats=(1,) * (ndim + 1 - len(repeats)) + repeats
+    )
+    return _call(fn, bound)
+
+
+@_batch_rule("constant_pad", "zero_pad")
+def _pad_batch_rule(fn, bound, batched):
+    if not _only_batched(bound, batched, "x") or bound.arguments["x"].ndim < 2:
+        return NotImplemented
+    bound.arguments["pad_width"] = [[0, 0]] + list(bound.arguments["pad_width"])
+    return _call(fn, bound)
+
+
+@_batch_rule("concat", "stack")
+def _join_batch_rule(fn, bound, batched):
+    name, xs = next(iter(bound.arguments.items()))
+    axis = bound.arguments["axis"]
+    if axis is None:
+        return NotImplemented
+    size = next(x.shape[0] for x in xs if batched(x))
+    ndim = np.ndim(xs[0]) - batched(xs[0])
+    bound.arguments[name] = [
+        x if batched(x) else np.broadcast_to(x, (size,) + np.shape(x)) for x in xs
+    ]
+    # stack inserts a new axis, so its axis counts the output dimensions
+    ndim += fn.__name__ == "stack"
+    bound.arguments["axis"] = _shift_axis(axis, ndim)
+    return _call(fn, bound)
+
+
+def _matmul_operand(x, transpose, adjoint):
+    if adjoint:
+        x = np.conjugate(x)
+    if transpose or adjoint:
+        x = np.swapaxes(x, -1, -2)
+    return x
+
+
+@_batch_rule("matmul")
+def _matmul_batch_rule(fn, bound, batched):
+    args = bound.arguments
+    x1, x2 = args["x1"], args["x2"]
+    b1, b2 = batched(x1), batched(x2)
+    x1 = _matmul_operand(x1, args["transpose_a"], args["adjoint_a"])
+    x2 = _matmul_operand(x2, args["transpose_b"], args["adjoint_b"])
+    # promote vectors to matrices, as matmul does for each example
+    vector1, vector2 = x1.ndim - b1 == 1, x2.ndim - b2 == 1
+    if vector1:
+        x1 = np.expand_dims(x1, -2)
+    if vector2:
+        x2 = np.expand_dims(x2, -1)
+    ndim = max(x1.ndim - b1, x2.ndim - b2)
+    x1 = _expand(x1, ndim) if b1 else x1
+    x2 = _expand(x2, ndim) if b2 else x2
+    args.update(
+        x1=x1,
+        x2=x2,
+        transpose_a=False,
+        transpose_b=False,
+        adjoint_a=False,
+        adjoint_b=False,
+    )
+    ret = _call(fn, bound)
+    if vector1:
+        ret = np.squeeze(ret, -2)
+    if vector2:
+        ret = np.squeeze(ret, -1)
+    return ret
+
+
+def _tensordot(x1, x2, axes1, axes2, b1, b2):
+    n1, n2 = x1.ndim - b1, x2.ndim - b2
+    axes1 = [a % n1 for a in axes1]
+    axes2 = [a % n2 for a in axes2]
+    x1, x2 = ivy.promote_types_of_inputs(x1, x2)
+    if not b2:
+        return np.tensordot(x1, x2, axes=([a + 1 for a in axes1], axes2))
+    if not b1:
+        ret = np.tensordot(x1, x2, axes=(axes1, [a + 1 for a in axes2]))
+        return np.moveaxis(ret, n1 - len(axes1), 0)
+    # move the contracted axes together and contract them with a batched matmul
+    free1 = [a for a in range(n1) if a not in axes1]
+    free2 = [a for a in range(n2) if a not in axes2]
+    x1 = np.transpose(x1, [0] + [a + 1 for a in free1 + axes1])
+    x2 = np.transpose(x2, [0] + [a + 1 for a in axes2 + free2])
+    size = x1.shape[0]
+    out_shape = x1.shape[1 : len(free1) + 1] + x2.shape[len(axes2) + 1 :]
+    contracted = int(np.prod(x1.shape[len(free1) + 1 :]))
+    ret = np.matmul(
+        np.reshape(x1, (size, -1, contracted)), np.reshape(x2, (size, contracted, -1))
+    )
+    return np.reshape(ret, (size,) + out_shape)
+
+
+@_batch_rule("tensordot")
+def _tensordot_batch_rule(fn, bound, batched):
+    x1, x2, axes = bound.arguments["x1"], bound.arguments["x2"], bound.arguments["axes"]
+    if isinstance(axes, int):
+        n1 = x1.ndim - batched(x1)
+        axes1, axes2 = list(range(n1 - axes, n1)), list(range(axes))
+    else:
+        axes1, axes2 = [[a] if isinstance(a, int) else list(a) for a in axes]
+    return _tensordot(x1, x2, axes1, axes2, batched(x1), batched(x2))
+
+
+@_batch_rule("vecdot")
+def _vecdot_batch_rule(fn, bound, batched):
+    x1, x2, axis = bound.arguments["x1"], bound.arguments["x2"], bound.arguments["axis"]
+    return _tensordot(x1, x2, [axis], [axis], batched(x1), batched(x2))
+
+
+@_batch_rule("inner")
+def _inner_batch_rule(fn, bound, batched):
+    x1, x2 = bound.arguments["x1"], bound.arguments["x2"]
+    return _tensordot(x1, x2, [-1], [-1], batched(x1), batched(x2))
+
+
+@_batch_rule("outer")
+def _outer_batch_rule(fn, bound, batched):
+    # outer flattens the examples first
+    x1, x2 = bound.arguments["x1"], bound.arguments["x2"]
+    b1, b2 = batched(x1), batched(x2)
+    x1, x2 = [
+        np.reshape(x, (x.shape[0], -1)) if b else np.ravel(x)
+        for x, b in ((x1, b1), (x2, b2))
+    ]
+    return _tensordot(
+        np.expand_dims(x1, -1), np.expand_dims(x2, -2), [-1], [-2], b1, b2
+    )
+
+
+@_batch_rule("einsum")
+def _einsum_batch_rule(fn, bound, batched):
+    operands = bound.arguments["operands"]
+    inputs, output = _parse_einsum(
+        bound.arguments["equation"], [_example_ndim(o, batched) for o in operands]
+    )
+    used = set("".join(inputs))
+    letter = next(c for c in string.ascii_letters if c not in used)
+    inputs = [letter + s if batched(o) else s for s, o in zip(inputs, operands)]
+    bound.arguments["equation"] = ",".join(inputs) + "->" + letter + output
+    return _call(fn, bound)
+
+
+def _advanced(q):
+    return isinstance(q, (list, np.ndarray)) and np.ndim(q) > 0 or _is_tensor(q)
+
+
+@_batch_rule("get_item")
+def _get_item_batch_rule(fn, bound, batched):
+    x, query = bound.arguments["x"], bound.arguments["query"]
+    if batched(query):
+        if batched(x):
+            # index each example with its own integer indices
+            if query.dtype == bool:
+                return NotImplemented
+            arange = np.arange(x.shape[0]).reshape((-1,) + (1,) * (query.ndim - 1))
+            bound.arguments["query"] = (arange, query)
+            return _call(fn, bound)
+        return _call(fn, bound) if query.dtype != bool else NotImplemented
+    query = query if isinstance(query, tuple) else (query,)
+    if any(batched(q) for q in query):
+        return NotImplemented
+    # advanced indices which are not adjacent move to the front of the result,
+    # in front of the batch axis
+    advanced = [i for i, q in enumerate(query) if _advanced(q)]
+    if advanced and advanced[-1] - advanced[0] >= len(advanced):
+        return NotImplemented
+    bound.arguments["query"] = (slice(None),) + query
+    return _call(fn, bound)
+
+
+@_batch_rule("gather")
+def _gather_batch_rule(fn, bound, batched):
+    params, indices = bound.arguments["params"], bound.arguments["indices"]
+    ndim = params.ndim - batched(params)
+    axis = bound.arguments["axis"] % ndim
+    batch_dims = bound.arguments["batch_dims"] % ndim
+    if not batched(params) and batch_dims == 0:
+        return np.moveaxis(_call(fn, bound), axis, 0)
+    size = params.shape[0] if batched(params) else indices.shape[0]
+    if not batched(params):
+        params = np.broadcast_to(params, (size,) + params.shape)
+    if not batched(indices):
+        if batch_dims == 0:
+            bound.arguments.update(params=params, axis=axis + 1)
+            return _call(fn, bound)
+        indices = np.broadcast_to(indices, (size,) + np.shape(indices))
+    bound.arguments.update(
+        params=params, indices=indices, axis=axis + 1, batch_dims=batch_dims + 1
+    )
+    return _call(fn, bound)
+
+
+@_batch_rule("take_along_axis")
+def _take_along_axis_batch_rule(fn, bound, batched):
+    arr, indices = bound.arguments["arr"], bound.arguments["indices"]
+    size = arr.shape[0] if batched(arr) else indices.shape[0]
+    ndim = arr.ndim - batched(arr)
+    bound.arguments.update(
+        arr=arr if batched(arr) else np.broadcast_to(arr, (size,) + arr.shape),
+        indices=(
+            indices
+            if batched(indices)
+            else np.broadcast_to(indices, (size,) + indices.shape)
+        ),
+        axis=_shift_axis(bound.arguments["axis"], ndim),
+    )
+    return _call(fn, bound)
+
+
+@_batch_rule(
+    "conv1d", "conv2d", "conv3d", "conv_general_dilated", "depthwise_conv2d",
+    "max_pool1d", "max_pool2d", "max_pool3d", "avg_pool1d", "avg_pool2d",
+    "avg_pool3d",
+)  # fmt: skip
+def _conv_batch_rule(fn, bound, batched):
+    # merge the batch axis into the leading axis of the examples
+    x = bound.arguments["x"]
+    if not _only_batched(bound, batched, "x"):
+        return NotImplemented
+    bound.arguments["x"] = np.reshape(x, (-1,) + x.shape[2:])
+    ret = _call(fn, bound)
+    return np.reshape(ret, x.shape[:2] + ret.shape[1:])
@@ -6,6 +6,7 @@ import numpy as np
 # local
 from ivy.functional.backends.numpy.device import _to_device
 import ivy
+from ivy.functional.ivy.general import cache_fn
 
 # Array API Standard #
 # -------------------#
@@ -87,30 +88,74 @@ def indices(
     return np.indices(dimensions, dtype=dtype, sparse=sparse)
 
 
+def _segment_initial(dtype, ufunc):
+    # the value of segments without any element, as in tf.math.unsorted_segment_*
+    if ufunc is np.add:
+        return 0
+    if ufunc is np.multiply:
+        return 1
+    if np.issubdtype(dtype, np.floating):
+        info = np.finfo(dtype)
+    elif np.issubdtype(dtype, np.integer):
+        info = np.iinfo(dtype)
+    elif dtype == np.bool_:
+        return ufunc is np.minimum
+    else:
+        raise ValueError("Unsupported data type")
+    return info.max if ufunc is np.minimum else info.min
+
+
+def _unsorted_segment_reduce(data, segment_ids, num_segments, ufunc):
+    ivy.utils.assertions.check_unsorted_segment_valid_params(
+        data, segment_ids, num_segments
+    )
+    initial = _segment_initial(data.dtype, ufunc)
+    res = np.full((num_segments,) + data.shape[1:], initial, dtype=data.dtype)
+    if segment_ids.size and segment_ids.min() < 0:
+        kept = segment_ids >= 0
+        data, segment_ids = data[kept], segment_ids[kept]
+    if segment_ids.size and np.all(segment_ids[:-1] <= segment_ids[1:]):
+        # sorted ids, such as those of contiguous segments, are reduced in place
+        # one run of equal ids at a time, much faster than the scatter below
+        # in the dtype of the ids whenever it holds them all, so that searchsorted
+        # does not cast the ids
+        dtype = np.promote_types(segment_ids.dtype, np.min_scalar_type(num_segments))
+        starts = np.searchsorted(segment_ids, np.arange(num_segments, dtype=dtype))
+        non_empty = starts < np.append(starts[1:], segment_ids.size)
+        res[non_empty] = ufunc.reduceat(data, starts[non_empty], axis=0)
+        return res
+    # a single unbuffered scatter over the flattened output, which unlike a mask
+    # per segment is linear in the size of data whatever the number of segments
+    segment_ids = segment_ids.astype(np.intp, copy=False)
+    inner = res[0].size
+    if inner != 1:
+        segment_ids = (segment_ids[:, None] * inner + np.arange(inner)).ravel()
+    ufunc.at(res.reshape(-1), segment_ids, data.reshape(-1))
+    return res
+
+
 def unsorted_segment_min(
     data: np.ndarray,
     segment_ids: np.ndarray,
     num_segments: int,
 ) -> np.ndarray:
-    ivy.utils.assertions.check_unsorted_segment_min_valid_params(
-        data, segment_ids, num_segments
-    )
+    return _unsorted_segment_reduce(data, segment_ids, num_segments, np.minimum)
 
-    if data.dtype in [np.float32, np.float64]:
-        init_val = np.finfo(data.dtype).max
-    elif data.dtype in [np.int32, np.int64, np.int8, np.int16, np.uint8]:
-        init_val = np.iinfo(data.dtype).max
-    else:
-        raise ValueError("Unsupported data type")
 
-    res = np.full((num_segments,) + data.shape[1:], init_val, dtype=data.dtype)
+def unsorted_segment_max(
+    data: np.ndarray,
+    segment_ids: np.ndarray,
+    num_segments: int,
+) -> np.ndarray:
+    return _unsorted_segment_reduce(data, segment_ids, num_segments, np.maximum)
 
-    for i in range(num_segments):
-        mask_index = segment_ids == i
-        if np.any(mask_index):
-            res[i] = np.min(data[mask_index], axis=0)
 
-    return res
+def unsorted_segment_prod(
+    data: np.ndarray,
+    segment_ids: np.ndarray,
+    num_segments: int,
+) -> np.ndarray:
+    return _unsorted_segment_reduce(data, segment_ids, num_segments, np.multiply)
 
 
 def blackman_window(
@@ -142,22 +187,7 @@ def unsorted_segment_sum(
     segment_ids: np.ndarray,
     num_segments: int,
 ) -> np.ndarray:
-    # Used the same check which is used for unsorted_segment_min as the
-    # check should be same
-    # Might require to change the assertion function name to
-    # check_unsorted_segment_valid_params
-    ivy.utils.assertions.check_unsorted_segment_min_valid_params(
-        data, segment_ids, num_segments
-    )
-
-    res = np.zeros((num_segments,) + data.shape[1:], dtype=data.dtype)
-
-    for i in range(num_segments):
-        mask_index = segment_ids == i
-        if np.any(mask_index):
-            res[i] = np.sum(data[mask_index], axis=0)
-
-    return res
+    return _unsorted_segment_reduce(data, segment_ids, num_segments, np.add)
 
 
 def trilu(
@@ -173,6 +203,7 @@ def trilu(
     return np.tril(x, k)
 
 
+@cache_fn(max_size=32)
 def mel_weight_matrix(
     num_mel_bins: int,
     dft_length: int,
@@ -13,7 +13,11 @@ from ivy.functional.ivy.layers import (
     _depth_max_pooling_helper,
 )
 from ivy.functional.backends.numpy.layers import _add_dilations
-from ivy.functional.ivy.experimental.layers import _padding_ceil_mode
+from ivy.functional.ivy.experimental.layers import (
+    _padding_ceil_mode,
+    _stft_params,
+    _istft_params,
+)
 from ivy.func_wrapper import with_supported_dtypes
 from ivy.func_wrapper import with_unsupported_dtypes
 from . import backend_version
@@ -1093,63 +1097,56 @@ def stft(
                 " than or equal to 1"
             )
 
-    input_dtype = signals.dtype
-    if input_dtype == np.float32:
-        dtype = np.complex64
-    elif input_dtype == np.float64:
-        dtype = np.complex128
-
-    def stft_1D(signals, frame_length, frame_step, fft_length, pad_end):
-        if fft_length is None:
-            fft_length = 1
-            while fft_length < frame_length:
-                fft_length *= 2
-
-        num_samples = signals.shape[-1]
-
-        if pad_end:
-            num_samples = signals.shape[-1]
-            num_frames = -(-num_samples // frame_step)
-            pad_length = max(
-                0, frame_length + frame_step * (num_frames - 1) - num_samples
-            )
-
-            signals = np.pad(signals, [(0, pad_length)])
-        else:
-            num_frames = 1 + (num_samples - frame_length) // frame_step
+    fft_length, num_frames, pad_length = _stft_params(
+        signals.shape[-1], frame_length, frame_step, fft_length, pad_end
+    )
+    if pad_length:
+        signals = np.pad(signals, [(0, 0)] * (signals.ndim - 1) + [(0, pad_length)])
+    if num_frames:
+        # a strided view of the frames, which are only copied once windowed
+        frames = np.lib.stride_tricks.sliding_window_view(
+            signals, frame_length, axis=-1
+        )
+        frames = frames[..., : frame_step * num_frames : frame_step, :]
+    else:
+        frames = np.zeros(signals.shape[:-1] + (0, frame_length), signals.dtype)
+    if window_fn is not None:
+        frames = frames * np.asarray(window_fn(frame_length))
 
-        stft_result = []
+    num_bins = fft_length // 2 + 1
+    if np.iscomplexobj(frames):
+        ret = np.fft.fft(frames, n=fft_length, axis=-1)[..., :num_bins]
+    else:
+        ret = np.fft.rfft(frames, n=fft_length, axis=-1)
+    return ret.astype(np.result_type(signals.dtype, np.complex64), copy=False)
 
-        if window_fn is None:
-            window = 1
-        else:
-            window = window_fn(frame_length)
-
-        for i in range(num_frames):
-            start = i * frame_step
-            end = start + frame_length
-            frame = signals[..., start:end]
-            windowed_frame = frame * window
-            pad_length = fft_length - frame_length
-            windowed_frame = np.pad(windowed_frame, [(0, pad_length)])
-            windowed_frame = np.array(windowed_frame, dtype=dtype)
-
-            fft_frame = np.fft.fft(windowed_frame, axis=-1)
-            slit = int((fft_length // 2 + 1))
-            stft_result.append(fft_frame[..., 0:slit])
-
-        stft = np.stack(stft_result, axis=0)
-        return stft
-
-    def stft_helper(nested_list, frame_length, frame_step, fft_length):
-        nested_list = nested_list
-        if len(np.shape(nested_list)) > 1:
-            return [
-                stft_helper(sublist, frame_length, frame_step, fft_length)
-                for sublist in nested_list
-            ]
-        else:
-            return stft_1D(nested_list, frame_length, frame_step, fft_length, pad_end)
 
-    to_return = stft_helper(signals, frame_length, frame_step, fft_length)
-    return np.array(to_return, dtype=dtype)
+def istft(
+    stfts: np.ndarray,
+    frame_length: int,
+    frame_step: int,
+    /,
+    *,
+    fft_length: Optional[int] = None,
+    window_fn: Optional[Callable] = None,
+    name: Optional[str] = None,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    fft_length = _istft_params(stfts.shape[-1], frame_length, frame_step, fft_length)
+    dtype = np.finfo(stfts.dtype).dtype
+    frames = np.fft.irfft(stfts, n=fft_length, axis=-1)[..., :frame_length]
+    if frame_length > fft_length:
+        no_pad = [(0, 0)] * (frames.ndim - 1)
+        frames = np.pad(frames, no_pad + [(0, frame_length - fft_length)])
+    if window_fn is not None:
+        frames = frames * np.asarray(window_fn(frame_length))
+
+    # overlap-add each block of frame_step samples of all the frames at once
+    *batch, num_frames, _ = frames.shape
+    num_blocks = -(-frame_length // frame_step)
+    ret = np.zeros((*batch, num_frames + num_blocks - 1, frame_step), dtype)
+    for i in range(num_blocks):
+        block = frames[..., i * frame_step : (i + 1) * frame_step]
+        ret[..., i : i + num_frames, : block.shape[-1]] += block
+    ret = ret.reshape((*batch, (num_frames + num_blocks - 1) * frame_step))
+    return ret[..., : (num_frames - 1) * frame_step + frame_length]
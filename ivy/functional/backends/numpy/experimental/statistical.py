@@ -8,6 +8,31 @@ from ..statistical import _infer_dtype
 from copy import deepcopy
 
 
+def _bincount_rows(x, length, weights=None):
+    # count the values below length of each row of x with a single bincount, by
+    # offsetting the values of each row past those of the previous rows
+    num_rows = x.shape[0]
+    ids = x + np.arange(num_rows)[:, None] * length
+    if weights is not None:
+        weights = weights.ravel()
+    ret = np.bincount(ids.ravel(), weights=weights, minlength=num_rows * length)
+    return ret.reshape(num_rows, length)
+
+
+def _histogram_rows(a, bins, weights=None, density=False):
+    # the histogram of each row of a over the same bin edges, as np.histogram
+    num_bins = bins.size - 1
+    ids = np.searchsorted(bins, a, side="right") - 1
+    # the last bin includes its right edge
+    ids[a == bins[-1]] = num_bins - 1
+    # values outside the bins, and nans, are counted in a bin which is dropped
+    ids[(ids < 0) | (ids >= num_bins)] = num_bins
+    ret = _bincount_rows(ids, num_bins + 1, weights=weights)[:, :num_bins]
+    if density:
+        ret = ret / np.diff(bins).astype(np.float64) / ret.sum(-1, keepdims=True)
+    return ret
+
+
 @with_unsupported_dtypes(
     {"1.25.2 and below": ("bfloat16",)},
     backend_version,
@@ -47,71 +72,16 @@ def histogram(
     if extend_upper_interval and max_a > bins[-1]:
         bins[-1] = max_a
     if a.ndim > 0 and axis is not None:
-        inverted_shape_dims = list(np.flip(np.arange(a.ndim)))
-        if isinstance(axis, int):
-            axis = [axis]
-        shape_axes = 1
-        for dimension in axis:
-            inverted_shape_dims.remove(dimension)
-            inverted_shape_dims.append(dimension)
-            shape_axes *= a.shape[dimension]
-        a_along_axis_1d = (
-            a.transpose(inverted_shape_dims).flatten().reshape((-1, shape_axes))
-        )
-        if weights is None:
-            ret = []
-            for a_1d in a_along_axis_1d:
-                ret_1d = np.histogram(
-                    a_1d,
-                    bins=bins,
-                    range=range,
-                    # TODO: waiting tensorflow version support to density
-                    # density=density,
-                )[0]
-                ret.append(ret_1d)
-        else:
-            weights_along_axis_1d = (
-                weights.transpose(inverted_shape_dims)
-                .flatten()
-                .reshape((-1, shape_axes))
-            )
-            ret = []
-            for a_1d, weights_1d in zip(a_along_axis_1d, weights_along_axis_1d):
-                ret_1d = np.histogram(
-                    a_1d,
-                    weights=weights_1d,
-                    bins=bins,
-                    range=range,
-                    # TODO: waiting tensorflow version support to density
-                    # density=density,
-                )[0]
-                ret.append(ret_1d)
-        out_shape = list(a.shape)
-        for dimension in sorted(axis, reverse=True):
-            del out_shape[dimension]
-        out_shape.insert(0, len(bins) - 1)
-        ret = np.array(ret)
-        ret = ret.flatten()
-        index = np.zeros(len(out_shape), dtype=int)
-        ret_shaped = np.zeros(out_shape)
-        dim = 0
-        i = 0
-        if list(index) == list(np.array(out_shape) - 1):
-            ret_shaped[tuple(index)] = ret[i]
-        while list(index) != list(np.array(out_shape) - 1):
-            ret_shaped[tuple(index)] = ret[i]
-            dim_full_flag = False
-            while index[dim] == out_shape[dim] - 1:
-                index[dim] = 0
-                dim += 1
-                dim_full_flag = True
-            index[dim] += 1
-            i += 1
-            if dim_full_flag:
-                dim = 0
-        if list(index) == list(np.array(out_shape) - 1):
-            ret_shaped[tuple(index)] = ret[i]
-        ret = ret_shaped
+        axis = [axis] if isinstance(axis, int) else list(axis)
+        # one row of values for each position of the other axes
+        last_axes = list(np.arange(-len(axis), 0))
+        batch_shape = tuple(np.delete(a.shape, axis))
+        rows_shape = (math.prod(batch_shape), math.prod(a.shape[i] for i in axis))
+        rows = np.moveaxis(a, axis, last_axes).reshape(rows_shape)
+        if weights is not None:
+            weights = np.moveaxis(weights, axis, last_axes).reshape(rows_shape)
+        ret = _histogram_rows(rows, bins, weights=weights, density=density)
+        ret = ret.T.reshape((len(bins) - 1, *batch_shape)).astype(np.float64)
     else:
         ret = np.histogram(
             a=a, bins=bins, range=range, weights=weights, density=density
@@ -377,15 +347,27 @@ def bincount(
     *,
     weights: Optional[np.ndarray] = None,
     minlength: int = 0,
+    axis: Optional[int] = None,
     out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
+    dtype = x.dtype if weights is None else weights.dtype
+    if axis is None:
+        if weights is not None:
+            weights = weights.ravel()
+        ret = np.bincount(x.ravel(), weights=weights, minlength=minlength)
+        return ret.astype(dtype)
+    # count each position of the other axes as a row
+    x = np.moveaxis(x, axis, -1)
+    # a negative value would be counted in the bins of the previous row
+    if np.min(x, initial=0) < 0:
+        raise ValueError("'list' argument must have no negative elements")
+    length = int(np.max(x, initial=minlength - 1)) + 1
+    rows_shape = (math.prod(x.shape[:-1]), x.shape[-1])
     if weights is not None:
-        ret = np.bincount(x, weights=weights, minlength=minlength)
-        ret = ret.astype(weights.dtype)
-    else:
-        ret = np.bincount(x, minlength=minlength)
-        ret = ret.astype(x.dtype)
-    return ret
+        weights = np.moveaxis(weights, axis, -1).reshape(rows_shape)
+    ret = _bincount_rows(x.reshape(rows_shape), length, weights=weights)
+    ret = ret.reshape((*x.shape[:-1], length))
+    return np.moveaxis(ret, -1, axis).astype(dtype)
 
 
 bincount.support_native_out = False
@@ -435,84 +417,32 @@ def cummax(
     elif x.dtype in (np.complex128, np.complex64):
         x = np.real(x).astype(np.float64)
 
-    if exclusive or reverse:
-        if exclusive and reverse:
-            indices = __find_cummax_indices(np.flip(x, axis=axis), axis=axis)
-            x = np.maximum.accumulate(np.flip(x, axis=axis), axis=axis, dtype=x.dtype)
-            x = np.swapaxes(x, axis, -1)
-            indices = np.swapaxes(indices, axis, -1)
-            x, indices = np.concatenate(
-                (np.zeros_like(x[..., -1:]), x[..., :-1]), -1
-            ), np.concatenate((np.zeros_like(indices[..., -1:]), indices[..., :-1]), -1)
-            x, indices = np.swapaxes(x, axis, -1), np.swapaxes(indices, axis, -1)
-            res, indices = np.flip(x, axis=axis), np.flip(indices, axis=axis)
-
-        elif exclusive:
-            x = np.swapaxes(x, axis, -1)
-            x = np.concatenate((np.zeros_like(x[..., -1:]), x[..., :-1]), -1)
-            x = np.swapaxes(x, axis, -1)
-            indices = __find_cummax_indices(x, axis=axis)
-            res = np.maximum.accumulate(x, axis=axis, dtype=x.dtype)
-        elif reverse:
-            x = np.flip(x, axis=axis)
-            indices = __find_cummax_indices(x, axis=axis)
-            x = np.maximum.accumulate(x, axis=axis)
-            res, indices = np.flip(x, axis=axis), np.flip(indices, axis=axis)
-        return res, indices
-    indices = __find_cummax_indices(x, axis=axis)
-    return np.maximum.accumulate(x, axis=axis, dtype=x.dtype), indices
-
-
-def __find_cummax_indices(
-    x: np.ndarray,
-    axis: int = 0,
-) -> np.ndarray:
-    indices = []
-    if x[0] is np.ndarray:
-        if axis >= 1:
-            for ret1 in x:
-                indice = __find_cummax_indices(ret1, axis=axis - 1)
-                indices.append(indice)
-
-        else:
-            indice_list = __get_index(x.tolist())
-            indices, n1 = x.copy(), {}
-            indices.fill(0)
-            indice_list = sorted(indice_list, key=lambda i: i[1])
-            for y, y_index in indice_list:
-                multi_index = y_index
-                if tuple(multi_index[1:]) not in n1:
-                    n1[tuple(multi_index[1:])] = multi_index[0]
-                    indices[y_index] = multi_index[0]
-                elif (
-                    y >= x[tuple([n1[tuple(multi_index[1:])]] + list(multi_index[1:]))]
-                ):
-                    n1[tuple(multi_index[1:])] = multi_index[0]
-                    indices[y_index] = multi_index[0]
-                else:
-                    indices[y_index] = n1[tuple(multi_index[1:])]
-    else:
-        n = 0
-        for index1, ret1 in enumerate(x):
-            if x[n] <= ret1 or index1 == 0:
-                n = index1
-            indices.append(n)
-    return np.array(indices, dtype=np.int64)
-
-
-def __get_index(lst, indices=None, prefix=None):
-    if indices is None:
-        indices = []
-    if prefix is None:
-        prefix = []
-
-    if isinstance(lst, list):
-        for i, sub_lst in enumerate(lst):
-            sub_indices = prefix + [i]
-            __get_index(sub_lst, indices, sub_indices)
-    else:
-        indices.append((lst, tuple(prefix)))
-    return indices
+    x = np.moveaxis(x, axis, -1)
+    if reverse:
+        x = np.flip(x, axis=-1)
+    elif exclusive:
+        x = np.concatenate((np.zeros_like(x[..., :1]), x[..., :-1]), -1)
+    values = np.maximum.accumulate(x, axis=-1)
+    # the index of each maximum is the last position at which it was reached, or
+    # at which a nan was met, so it is propagated by a running maximum of these
+    # positions
+    reached = x == values
+    if np.issubdtype(x.dtype, np.floating):
+        reached |= np.isnan(x)
+    indices = np.where(reached, np.arange(x.shape[-1]), 0)
+    indices = np.maximum.accumulate(indices, axis=-1)
+    if reverse:
+        if exclusive:
+            values = np.concatenate(
+                (np.zeros_like(values[..., :1]), values[..., :-1]), -1
+            )
+            indices = np.concatenate(
+                (np.zeros_like(indices[..., :1]), indices[..., :-1]), -1
+            )
+        values, indices = np.flip(values, axis=-1), np.flip(indices, axis=-1)
+    values = np.moveaxis(values, -1, axis)
+    indices = np.moveaxis(indices, -1, axis).astype(np.int64)
+    return values, indices
 
 
 @with_unsupported_dtypes({"1.25.2 and below": "bfloat16"}, backend_version)
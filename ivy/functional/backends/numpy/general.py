@@ -1,6 +1,7 @@
 """Collection of Numpy general functions, wrapped to fit Ivy syntax and signature."""
 
 # global
+import logging
 from typing import Optional, Union, Sequence, Callable, Tuple
 import numpy as np
 from operator import mul
@@ -10,6 +11,7 @@ from numbers import Number
 
 # local
 import ivy
+from ivy.functional.backends.numpy.batching import _batched_call, _map_nest
 from ivy.functional.backends.numpy.device import _to_device
 from ivy.functional.backends.numpy.helpers import _scalar_output_to_0d_array
 from ivy.func_wrapper import with_unsupported_dtypes
@@ -352,6 +354,10 @@ def vmap(
     in_axes: Union[int, Sequence[int], Sequence[None]] = 0,
     out_axes: int = 0,
 ) -> Callable:
+    # names of the backend functions which were looped over the examples, in all
+    # calls of the vectorized function so far
+    fallback_ops = set()
+
     @ivy.output_to_native_arrays
     @ivy.inputs_to_native_arrays
     def _vmap(*args):
@@ -397,39 +403,30 @@ def vmap(
                 in_axes, message="single value in_axes should not be None"
             )
 
-        # Handling None in in_axes by broadcasting the axis_size
-        if isinstance(in_axes, (tuple, list)) and None in in_axes:
-            none_axis_index = list()
-            for index, axis in enumerate(in_axes):
-                if axis is None:
-                    none_axis_index.append(index)
-
-            for none_mapped_axis in none_axis_index:
-                args[none_mapped_axis] = np.broadcast_to(
-                    args[none_mapped_axis],
-                    (tuple(axis_size) + args[none_mapped_axis].shape),
-                )
-
-        # set up the axis to be mapped to index zero.
-        if isinstance(in_axes, (tuple, list)):
-            for i in range(len(in_axes)):
-                if in_axes[i] is not None:
-                    args[i] = np.moveaxis(args[i], in_axes[i], 0)
-        elif isinstance(in_axes, int):
-            args[0] = np.moveaxis(args[0], in_axes, 0)
-
-        # vectorisation. To be optimized.
-        arr_results = []
-        for arrays in zip(*args):
-            single_op = func(*arrays)
-            arr_results.append(single_op)
-        res = np.stack(arr_results)
+        # set up the axis to be mapped to index zero. Unmapped arguments are
+        # passed to every example as they are.
+        axes = in_axes if isinstance(in_axes, (list, tuple)) else [in_axes] * len(args)
+        mapped = [axis is not None for axis in axes]
+        for i, axis in enumerate(axes):
+            if axis is not None:
+                args[i] = np.moveaxis(args[i], axis, 0)
+
+        # vectorisation, by batching the backend functions called by func
+        res, fallbacks = _batched_call(func, args, mapped, axis_size.pop())
+        new_fallbacks = set(fallbacks) - fallback_ops
+        if new_fallbacks:
+            logging.warning(
+                "vmap looped over the examples for the functions it could not "
+                "batch: {}".format(", ".join(sorted(new_fallbacks)))
+            )
+            fallback_ops.update(new_fallbacks)
 
         if out_axes:
-            res = np.moveaxis(res, 0, out_axes)
+            res = _map_nest(lambda x: np.moveaxis(x, 0, out_axes), res)
 
         return res
 
+    _vmap.fallback_ops = fallback_ops
     return _vmap
 
 
@@ -1,22 +1,1022 @@
 """Collection of NumPy gradient functions, wrapped to fit Ivy syntax and signature."""
 
 # global
-import logging
-from typing import Optional, Sequence, Union
+import functools
+import inspect
+import math
+import types
+import numpy as np
+from typing import Callable, Optional, Sequence, Union, Tuple
+
+# local
 import ivy
+from ivy.functional.ivy.gradients import (
+    _get_required_float_variables,
+    _get_y_and_ret_idxs,
+    _get_native_y,
+    _set_duplicates,
+    _process_func_ret_and_grads,
+)
+from ivy.functional.backends.numpy.layers import (
+    _CONV_BLOCK_BYTES,
+    _add_dilations,
+    _conv_pad_list,
+    _conv_windows,
+    _dilate_pad_conv,
+)
 
 
-def variable(x, /):
-    logging.warning(
-        "NumPy does not support autograd, declaring a 'variable' "
-        "is identical to declaring an 'array' when using numpy backend."
+# Reverse-mode Tape #
+# ------------------ #
+
+# maps backend function names to their vector-Jacobian product rules
+_vjp_rules = {}
+
+# tapes which are currently recording, innermost last
+_active_tapes = []
+
+# backend functions without a VJP rule which may return new floating arrays from
+# watched arrays, as their outputs have no gradient, or leave the tape on purpose
+_unchecked = {
+    "ceil",
+    "empty_like",
+    "floor",
+    "full_like",
+    "ones_like",
+    "round",
+    "sign",
+    "stop_gradient",
+    "to_list",
+    "to_numpy",
+    "to_scalar",
+    "trunc",
+    "zeros_like",
+    # functions calling back into functions whose own backend calls are checked
+    "execute_with_gradients",
+    "grad",
+    "handle_soft_device_variable",
+    "if_else",
+    "jac",
+    "value_and_grad",
+    "vmap",
+    "while_loop",
+    "wrap__array_ufunc__",
+}
+
+
+def _vjp(*fn_names):
+    """
+    Register the decorated function as the VJP rule of the named backend functions.
+
+    A rule is called as ``rule(g, ret, *args, **kwargs)``, where ``g`` is the
+    cotangent of the output ``ret`` (a list of cotangents for functions returning
+    a sequence of arrays) and ``args``/``kwargs`` are the inputs of the recorded
+    call. It returns a dict mapping argument names to their cotangents, with a
+    list of cotangents for arguments which are sequences of arrays.
+    """
+
+    def _register(rule):
+        for fn_name in fn_names:
+            _vjp_rules[fn_name] = rule
+        return rule
+
+    return _register
+
+
+def _is_tensor(x):
+    return isinstance(x, (np.ndarray, np.generic))
+
+
+def _primitive(fn, rule):
+    signature = inspect.signature(fn)
+
+    @functools.wraps(fn)
+    def _recorded(*args, **kwargs):
+        if not _active_tapes:
+            return fn(*args, **kwargs)
+        tapes = [
+            tape
+            for tape in _active_tapes
+            if tape._recording
+            and (tape._watches(args) or tape._watches(kwargs.values()))
+        ]
+        if not tapes:
+            return fn(*args, **kwargs)
+        # the primitive is differentiated as a whole, so the backend calls it
+        # makes internally are not recorded
+        for tape in tapes:
+            tape._recording = False
+        try:
+            ret = fn(*args, **kwargs)
+        finally:
+            for tape in tapes:
+                tape._recording = True
+        bound = signature.bind(*args, **kwargs)
+        for tape in tapes:
+            tape._record(rule, bound, ret)
+        return ret
+
+    return _recorded
+
+
+def _checked(fn_name, fn):
+    # functions without a VJP rule can still be differentiated when they are
+    # composed of recorded functions, and raise if they return a new floating
+    # array from watched arrays, which would otherwise get no gradient
+    @functools.wraps(fn)
+    def _unrecorded(*args, **kwargs):
+        if not _active_tapes:
+            return fn(*args, **kwargs)
+        tapes = [
+            tape
+            for tape in _active_tapes
+            if tape._recording
+            and (tape._watches(args) or tape._watches(kwargs.values()))
+        ]
+        ret = fn(*args, **kwargs)
+        for tape in tapes:
+            for o in ret if isinstance(ret, (list, tuple)) else [ret]:
+                o = o.data if isinstance(o, ivy.Array) else o
+                if (
+                    _is_tensor(o)
+                    and np.issubdtype(o.dtype, np.inexact)
+                    and id(o) not in tape._watched
+                ):
+                    raise ivy.utils.exceptions.IvyNotImplementedException(
+                        f"the numpy backend cannot differentiate {fn_name}, which "
+                        "has no gradient rule"
+                    )
+        return ret
+
+    return _unrecorded
+
+
+def _record_primitives(namespace):
+    """
+    Replace the backend functions with VJP rules by their recording versions, and
+    the other public backend functions by versions checking that they aren't
+    differentiated.
+    """
+    for fn_name, fn in list(namespace.items()):
+        if fn_name in _vjp_rules:
+            namespace[fn_name] = _primitive(fn, _vjp_rules[fn_name])
+        elif (
+            isinstance(fn, types.FunctionType)
+            and not fn_name.startswith("_")
+            and fn_name not in _unchecked
+            and fn.__module__.startswith("ivy.functional.backends.numpy")
+        ):
+            namespace[fn_name] = _checked(fn_name, fn)
+
+
+class _Tape:
+    """
+    Record the differentiable primitives called on watched arrays.
+
+    Arrays are tracked by identity, and the outputs of recorded primitives are
+    watched in turn. The tape holds references to every watched array, so their
+    ids remain unique for as long as it is alive.
+    """
+
+    def __init__(self):
+        self._nodes = []
+        self._watched = {}
+        self._recording = True
+
+    def __enter__(self):
+        _active_tapes.append(self)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        _active_tapes.remove(self)
+
+    def watch(self, x):
+        if _is_tensor(x):
+            self._watched[id(x)] = x
+        return x
+
+    def _watches(self, args):
+        for arg in args:
+            if isinstance(arg, (list, tuple)):
+                if self._watches(arg):
+                    return True
+            elif id(arg) in self._watched:
+                return True
+        return False
+
+    def _record(self, rule, bound, ret):
+        multiple = isinstance(ret, (list, tuple))
+        # some backend functions return ivy arrays, which are unwrapped later
+        outputs = [
+            o.data if isinstance(o, ivy.Array) else o
+            for o in (ret if multiple else [ret])
+        ]
+        # outputs which are already watched (e.g. an input returned unchanged)
+        # keep the cotangent of the array they are
+        out_ids = [
+            id(o) if _is_tensor(o) and id(o) not in self._watched else None
+            for o in outputs
+        ]
+        if all(i is None for i in out_ids):
+            return
+        for o, i in zip(outputs, out_ids):
+            if i is not None:
+                self.watch(o)
+        self._nodes.append((rule, bound, outputs, out_ids, multiple))
+
+    def _accumulate(self, grads, owned, x, g):
+        key = id(x)
+        if key not in self._watched or g is None:
+            return
+        if np.shape(g) != np.shape(x):
+            g = _unbroadcast(g, np.shape(x))
+        prev = grads.get(key)
+        if prev is None:
+            grads[key] = g
+        elif key in owned:
+            # accumulate in-place into the buffers allocated by the tape
+            np.add(prev, g, out=prev, casting="unsafe")
+        else:
+            grads[key] = np.add(prev, g)
+            owned.add(key)
+
+    def backward(self, y, seed=None):
+        """Backpropagate from ``y`` and return the cotangents keyed by array id."""
+        grads, owned = {id(y): np.ones_like(y) if seed is None else seed}, set()
+        for rule, bound, outputs, out_ids, multiple in reversed(self._nodes):
+            # release output cotangents as soon as they are consumed
+            cts = [grads.pop(i, None) if i is not None else None for i in out_ids]
+            if all(ct is None for ct in cts):
+                continue
+            if multiple:
+                g = [
+                    np.zeros_like(o) if ct is None else ct
+                    for o, ct in zip(outputs, cts)
+                ]
+            else:
+                g = cts[0]
+            ret = outputs if multiple else outputs[0]
+            in_grads = rule(g, ret, *bound.args, **bound.kwargs)
+            for name, in_grad in in_grads.items():
+                arg = bound.arguments[name]
+                if isinstance(arg, (list, tuple)):
+                    for a, ga in zip(arg, in_grad):
+                        self._accumulate(grads, owned, a, ga)
+                else:
+                    self._accumulate(grads, owned, arg, in_grad)
+        return grads, owned
+
+    def gradient(self, y, xs, seed=None):
+        """Return the gradient of ``y`` with respect to each array in ``xs``."""
+        grads, owned = self.backward(y, seed=seed)
+
+        def _grad(x):
+            if not _is_tensor(x):
+                return x
+            g = grads.get(id(x))
+            if g is None:
+                return np.zeros_like(x)
+            if id(x) not in owned or g.dtype != x.dtype:
+                # cotangents not allocated by the tape may alias other arrays
+                g = np.array(g, dtype=x.dtype)
+            return g
+
+        if _is_tensor(xs):
+            return _grad(xs)
+        if isinstance(xs, ivy.Container):
+            return xs.cont_map(lambda x, _: _grad(x))
+        return ivy.nested_map(_grad, xs, include_derived=True, shallow=False)
+
+
+# VJP Rules #
+# --------- #
+
+
+def _unbroadcast(g, shape):
+    """Sum ``g`` over the dimensions which were broadcast to reach its shape."""
+    if np.shape(g) == tuple(shape):
+        return g
+    if np.ndim(g) > len(shape):
+        g = np.sum(g, axis=tuple(range(np.ndim(g) - len(shape))))
+    axes = tuple(i for i, s in enumerate(shape) if s == 1 and g.shape[i] != 1)
+    if axes:
+        g = np.sum(g, axis=axes, keepdims=True)
+    return np.reshape(g, shape)
+
+
+def _reduce_axes(x, axis):
+    if axis is None:
+        return tuple(range(x.ndim))
+    axis = (axis,) if isinstance(axis, int) else axis
+    return tuple(a % x.ndim for a in axis)
+
+
+def _expand_reduced(g, x, axis, keepdims):
+    # broadcast the cotangent of a reduction back over the reduced axes
+    if not keepdims:
+        g = np.expand_dims(g, _reduce_axes(x, axis))
+    return np.broadcast_to(g, x.shape)
+
+
+def _elementwise_vjp(derivative):
+    def _rule(g, ret, x, /, **kwargs):
+        return {"x": g * derivative(x, ret)}
+
+    return _rule
+
+
+for _fn_name, _derivative in {
+    "exp": lambda x, ret: ret,
+    "expm1": lambda x, ret: ret + 1,
+    "log": lambda x, ret: 1 / x,
+    "log1p": lambda x, ret: 1 / (1 + x),
+    "log2": lambda x, ret: 1 / (x * math.log(2)),
+    "log10": lambda x, ret: 1 / (x * math.log(10)),
+    "sqrt": lambda x, ret: 0.5 / ret,
+    "square": lambda x, ret: 2 * x,
+    "abs": lambda x, ret: np.sign(x),
+    "sin": lambda x, ret: np.cos(x),
+    "cos": lambda x, ret: -np.sin(x),
+    "tan": lambda x, ret: 1 + ret * ret,
+    "asin": lambda x, ret: 1 / np.sqrt(1 - x * x),
+    "acos": lambda x, ret: -1 / np.sqrt(1 - x * x),
+    "atan": lambda x, ret: 1 / (1 + x * x),
+    "sinh": lambda x, ret: np.cosh(x),
+    "cosh": lambda x, ret: np.sinh(x),
+    "tanh": lambda x, ret: 1 - ret * ret,
+    "asinh": lambda x, ret: 1 / np.sqrt(x * x + 1),
+    "acosh": lambda x, ret: 1 / np.sqrt(x * x - 1),
+    "atanh": lambda x, ret: 1 / (1 - x * x),
+    "reciprocal": lambda x, ret: -ret * ret,
+    "erf": lambda x, ret: 2 / math.sqrt(math.pi) * np.exp(-x * x),
+    "relu": lambda x, ret: x > 0,
+    "sigmoid": lambda x, ret: ret * (1 - ret),
+}.items():
+    _vjp(_fn_name)(_elementwise_vjp(_derivative))
+
+
+@_vjp("negative")
+def _negative_vjp(g, ret, x, /, **kwargs):
+    return {"x": -g}
+
+
+@_vjp("positive")
+def _positive_vjp(g, ret, x, /, **kwargs):
+    return {"x": g}
+
+
+@_vjp("add")
+def _add_vjp(g, ret, x1, x2, /, *, alpha=None, out=None):
+    return {
+        "x1": _unbroadcast(g, np.shape(x1)),
+        "x2": _unbroadcast(g if alpha in (1, None) else g * alpha, np.shape(x2)),
+    }
+
+
+@_vjp("subtract")
+def _subtract_vjp(g, ret, x1, x2, /, *, alpha=None, out=None):
+    return {
+        "x1": _unbroadcast(g, np.shape(x1)),
+        "x2": _unbroadcast(-g if alpha in (1, None) else -g * alpha, np.shape(x2)),
+    }
+
+
+@_vjp("multiply")
+def _multiply_vjp(g, ret, x1, x2, /, *, out=None):
+    return {
+        "x1": _unbroadcast(g * x2, np.shape(x1)),
+        "x2": _unbroadcast(g * x1, np.shape(x2)),
+    }
+
+
+@_vjp("divide")
+def _divide_vjp(g, ret, x1, x2, /, *, out=None):
+    g_x1 = g / x2
+    return {
+        "x1": _unbroadcast(g_x1, np.shape(x1)),
+        "x2": _unbroadcast(-g_x1 * ret, np.shape(x2)),
+    }
+
+
+@_vjp("pow")
+def _pow_vjp(g, ret, x1, x2, /, *, out=None):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        g_x2 = g * ret * np.where(x1 > 0, np.log(np.where(x1 > 0, x1, 1)), 0)
+    return {
+        "x1": _unbroadcast(g * x2 * np.power(x1, np.subtract(x2, 1)), np.shape(x1)),
+        "x2": _unbroadcast(g_x2, np.shape(x2)),
+    }
+
+
+@_vjp("atan2")
+def _atan2_vjp(g, ret, x1, x2, /, *, out=None):
+    g = g / (x1 * x1 + x2 * x2)
+    return {
+        "x1": _unbroadcast(g * x2, np.shape(x1)),
+        "x2": _unbroadcast(-g * x1, np.shape(x2)),
+    }
+
+
+@_vjp("maximum", "minimum")
+def _maximum_minimum_vjp(g, ret, x1, x2, /, *, use_where=True, out=None):
+    # the cotangent follows the input which was selected in the forward pass
+    mask = np.equal(ret, x1)
+    return {
+        "x1": _unbroadcast(np.where(mask, g, 0), np.shape(x1)),
+        "x2": _unbroadcast(np.where(mask, 0, g), np.shape(x2)),
+    }
+
+
+@_vjp("where")
+def _where_vjp(g, ret, condition, x1, x2, /, *, out=None):
+    return {
+        "x1": _unbroadcast(np.where(condition, g, 0), np.shape(x1)),
+        "x2": _unbroadcast(np.where(condition, 0, g), np.shape(x2)),
+    }
+
+
+@_vjp("clip")
+def _clip_vjp(g, ret, x, x_min, x_max, /, *, out=None):
+    return {"x": _unbroadcast(np.where(np.equal(ret, x), g, 0), np.shape(x))}
+
+
+@_vjp("leaky_relu")
+def _leaky_relu_vjp(g, ret, x, /, *, alpha=0.2, complex_mode="jax", out=None):
+    return {"x": np.where(x > 0, g, g * alpha)}
+
+
+@_vjp("gelu")
+def _gelu_vjp(g, ret, x, /, *, approximate=False, complex_mode="jax", out=None):
+    if approximate:
+        inner = 0.7978845608 * (x + 0.044715 * x**3)
+        tanh_inner = np.tanh(inner)
+        derivative = 0.5 * (1 + tanh_inner) + 0.5 * x * (
+            1 - tanh_inner**2
+        ) * 0.7978845608 * (1 + 3 * 0.044715 * x**2)
+    else:
+        cdf = 0.5 * (1 + ivy.current_backend().erf(x / math.sqrt(2)))
+        derivative = cdf + x * np.exp(-0.5 * x * x) / math.sqrt(2 * math.pi)
+    return {"x": g * derivative}
+
+
+@_vjp("softplus")
+def _softplus_vjp(
+    g, ret, x, /, *, beta=None, threshold=None, complex_mode="jax", out=None
+):
+    x_beta = x * beta if beta is not None and beta != 1 else x
+    derivative = 1 / (1 + np.exp(-x_beta))
+    if threshold is not None:
+        derivative = np.where(x_beta > threshold, 1, derivative)
+    return {"x": g * derivative}
+
+
+@_vjp("softmax")
+def _softmax_vjp(g, ret, x, /, *, axis=None, out=None):
+    axis = -1 if axis is None else axis
+    return {"x": ret * (g - np.sum(g * ret, axis=axis, keepdims=True))}
+
+
+@_vjp("log_softmax")
+def _log_softmax_vjp(g, ret, x, /, *, axis=-1, complex_mode="jax", out=None):
+    return {"x": g - np.exp(ret) * np.sum(g, axis=axis, keepdims=True)}
+
+
+@_vjp("sum")
+def _sum_vjp(g, ret, x, /, *, axis=None, dtype=None, keepdims=False, out=None):
+    return {"x": _expand_reduced(g, x, axis, keepdims)}
+
+
+@_vjp("mean")
+def _mean_vjp(g, ret, x, /, *, axis=None, keepdims=False, out=None):
+    count = math.prod(x.shape[a] for a in _reduce_axes(x, axis))
+    return {"x": _expand_reduced(g / max(count, 1), x, axis, keepdims)}
+
+
+@_vjp("max", "min")
+def _max_min_vjp(g, ret, x, /, *, axis=None, keepdims=False, out=None):
+    # the cotangent is split evenly between tied extrema
+    ret = ret if keepdims else np.expand_dims(ret, _reduce_axes(x, axis))
+    mask = np.equal(x, ret)
+    counts = np.sum(mask, axis=_reduce_axes(x, axis), keepdims=True)
+    return {"x": _expand_reduced(g, x, axis, keepdims) * mask / counts}
+
+
+@_vjp("prod")
+def _prod_vjp(g, ret, x, /, *, axis=None, dtype=None, keepdims=False, out=None):
+    # the product of all other elements, computed with exclusive cumulative
+    # products so that zeros are handled exactly
+    axes = _reduce_axes(x, axis)
+    kept = tuple(a for a in range(x.ndim) if a not in axes)
+    perm = kept + axes
+    xt = np.transpose(x, perm)
+    flat = np.reshape(xt, xt.shape[: len(kept)] + (-1,))
+    ones = np.ones(flat.shape[:-1] + (1,), dtype=flat.dtype)
+    left = np.cumprod(np.concatenate([ones, flat[..., :-1]], -1), -1)
+    right = np.cumprod(np.concatenate([ones, flat[..., :0:-1]], -1), -1)[..., ::-1]
+    others = np.transpose(np.reshape(left * right, xt.shape), np.argsort(perm))
+    return {"x": _expand_reduced(g, x, axis, keepdims) * others}
+
+
+@_vjp("var")
+def _var_vjp(g, ret, x, /, *, axis=None, correction=0.0, keepdims=False, out=None):
+    axes = _reduce_axes(x, axis)
+    count = math.prod(x.shape[a] for a in axes)
+    centered = x - np.mean(x, axis=axes, keepdims=True)
+    g = _expand_reduced(g, x, axis, keepdims)
+    return {"x": g * 2 * centered / max(count - correction, 1)}
+
+
+@_vjp("std")
+def _std_vjp(g, ret, x, /, *, axis=None, correction=0.0, keepdims=False, out=None):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        g_var = np.where(ret > 0, g / (2 * ret), 0)
+    return _var_vjp(
+        g_var, None, x, axis=axis, correction=correction, keepdims=keepdims
+    )
+
+
+@_vjp("cumsum")
+def _cumsum_vjp(
+    g, ret, x, axis=0, exclusive=False, reverse=False, *, dtype=None, out=None
+):
+    g = np.flip(g, axis) if not reverse else g
+    g = np.cumsum(g, axis)
+    if exclusive:
+        g = np.roll(g, 1, axis)
+        np.moveaxis(g, axis, 0)[0] = 0
+    return {"x": np.flip(g, axis) if not reverse else g}
+
+
+def _cumprod_grad(g, x):
+    # the cotangent of x for the inclusive cumulative product along the last axis
+    if np.all(x != 0):
+        g = np.flip(np.cumsum(np.flip(g * np.cumprod(x, -1), -1), -1), -1)
+        return g / x
+    # with zeros, the products of the other elements up to each output are taken
+    # for every element, which is quadratic in the length of the axis
+    size = x.shape[-1]
+    others = np.repeat(x[..., None, :], size, -2)
+    others[..., range(size), range(size)] = 1
+    return np.sum(np.triu(np.cumprod(others, -1)) * g[..., None, :], -1)
+
+
+@_vjp("cumprod")
+def _cumprod_vjp(
+    g, ret, x, /, *, axis=0, exclusive=False, reverse=False, dtype=None, out=None
+):
+    x, g = np.moveaxis(x, axis, -1), np.moveaxis(g, axis, -1)
+    if reverse:
+        x, g = np.flip(x, -1), np.flip(g, -1)
+    if exclusive:
+        # the inclusive product of the elements shifted by one
+        ones = np.ones_like(x[..., :1])
+        g = _cumprod_grad(g, np.concatenate([ones, x[..., :-1]], -1))
+        g = np.concatenate([g[..., 1:], np.zeros_like(g[..., :1])], -1)
+    else:
+        g = _cumprod_grad(g, x)
+    if reverse:
+        g = np.flip(g, -1)
+    return {"x": np.moveaxis(g, -1, axis)}
+
+
+@_vjp("sort")
+def _sort_vjp(g, ret, x, /, *, axis=-1, descending=False, stable=True, out=None):
+    # the cotangent of each sorted element goes back to where it was taken from
+    indices = np.argsort(x, axis=axis, kind="stable" if stable else "quicksort")
+    if descending:
+        indices = np.flip(indices, axis)
+    g_x = np.zeros(np.shape(x), dtype=g.dtype)
+    np.put_along_axis(g_x, indices, g, axis)
+    return {"x": g_x}
+
+
+@_vjp("matmul")
+def _matmul_vjp(
+    g,
+    ret,
+    x1,
+    x2,
+    /,
+    *,
+    transpose_a=False,
+    transpose_b=False,
+    adjoint_a=False,
+    adjoint_b=False,
+    out=None,
+):
+    a = np.swapaxes(x1, -1, -2) if transpose_a or adjoint_a else x1
+    b = np.swapaxes(x2, -1, -2) if transpose_b or adjoint_b else x2
+    a = np.conj(a) if adjoint_a else a
+    b = np.conj(b) if adjoint_b else b
+    a_2d = a[None] if a.ndim == 1 else a
+    b_2d = b[:, None] if b.ndim == 1 else b
+    g_2d = np.expand_dims(g, -2) if a.ndim == 1 else g
+    g_2d = np.expand_dims(g_2d, -1) if b.ndim == 1 else g_2d
+    g_a = _unbroadcast(g_2d @ np.swapaxes(b_2d, -1, -2), a_2d.shape).reshape(a.shape)
+    g_b = _unbroadcast(np.swapaxes(a_2d, -1, -2) @ g_2d, b_2d.shape).reshape(b.shape)
+    g_a = np.conj(g_a) if adjoint_a else g_a
+    g_b = np.conj(g_b) if adjoint_b else g_b
+    return {
+        "x1": np.swapaxes(g_a, -1, -2) if transpose_a or adjoint_a else g_a,
+        "x2": np.swapaxes(g_b, -1, -2) if transpose_b or adjoint_b else g_b,
+    }
+
+
+@_vjp("outer")
+def _outer_vjp(g, ret, x1, x2, /, *, out=None):
+    return {
+        "x1": np.reshape(g @ np.ravel(x2), np.shape(x1)),
+        "x2": np.reshape(np.ravel(x1) @ g, np.shape(x2)),
+    }
+
+
+@_vjp("vecdot")
+def _vecdot_vjp(g, ret, x1, x2, /, *, axis=-1, out=None):
+    g = np.expand_dims(g, axis)
+    return {
+        "x1": _unbroadcast(g * np.conj(x2), np.shape(x1)),
+        "x2": _unbroadcast(g * x1, np.shape(x2)),
+    }
+
+
+@_vjp("vector_norm")
+def _vector_norm_vjp(
+    g, ret, x, /, *, axis=None, keepdims=False, ord=2, dtype=None, out=None
+):
+    if ord == 0:
+        # the number of non-zero elements is piecewise constant
+        return {}
+    g = _expand_reduced(g, x, axis, keepdims)
+    ret = _expand_reduced(ret, x, axis, keepdims)
+    abs_x = np.abs(x)
+    if ord in (math.inf, -math.inf):
+        # the cotangent is split evenly between tied extrema
+        mask = np.equal(abs_x, ret)
+        counts = np.sum(mask, axis=_reduce_axes(x, axis), keepdims=True)
+        return {"x": g * np.sign(x) * mask / counts}
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if ord == 1:
+            derivative = np.sign(x)
+        elif ord == 2:
+            derivative = np.where(ret > 0, x / ret, 0)
+        else:
+            derivative = np.where(
+                ret > 0, np.sign(x) * (abs_x / ret) ** (ord - 1), 0
+            )
+    return {"x": g * derivative}
+
+
+@_vjp("matrix_norm")
+def _matrix_norm_vjp(
+    g, ret, x, /, *, ord="fro", axis=(-2, -1), keepdims=False, out=None
+):
+    axes = tuple(a % x.ndim for a in axis)
+    x = np.moveaxis(x, axes, (-2, -1))
+    if keepdims:
+        g, ret = np.squeeze(g, axes), np.squeeze(ret, axes)
+    g, ret = g[..., None, None], ret[..., None, None]
+    if ord == "fro":
+        with np.errstate(divide="ignore", invalid="ignore"):
+            derivative = np.where(ret > 0, x / ret, 0)
+    elif ord in ("nuc", 2, -2):
+        u, _, vh = np.linalg.svd(x, full_matrices=False)
+        if ord != "nuc":
+            # the singular vectors of the largest or smallest singular value
+            i = 0 if ord == 2 else vh.shape[-2] - 1
+            u, vh = u[..., i : i + 1], vh[..., i : i + 1, :]
+        derivative = u @ vh
+    else:
+        # the largest or smallest sum of absolute values, of the columns for 1 and
+        # -1 and of the rows for inf and -inf, split evenly between ties
+        sums = np.sum(np.abs(x), axis=-2 if ord in (1, -1) else -1, keepdims=True)
+        mask = np.equal(sums, ret)
+        derivative = np.sign(x) * mask / np.sum(mask, axis=(-2, -1), keepdims=True)
+    return {"x": np.moveaxis(g * derivative, (-2, -1), axes)}
+
+
+def _parse_einsum(equation, ndims):
+    # resolve ellipses and implicit outputs into explicit subscripts
+    equation = equation.replace(" ", "")
+    inputs, _, output = equation.partition("->")
+    inputs = inputs.split(",")
+    used = set(equation)
+    spare = [c for c in map(chr, range(ord("A"), ord("Z") + 1)) if c not in used]
+    max_ellipsis = max(
+        [nd - len(s) + 3 for s, nd in zip(inputs, ndims) if "..." in s] + [0]
     )
+    ellipsis = "".join(spare[:max_ellipsis])
+    inputs = [
+        s.replace("...", ellipsis[max_ellipsis - (nd - len(s) + 3) :])
+        if "..." in s
+        else s
+        for s, nd in zip(inputs, ndims)
+    ]
+    if "->" not in equation:
+        letters = "".join(inputs)
+        output = ellipsis + "".join(
+            sorted(
+                c for c in set(letters) if letters.count(c) == 1 and c not in ellipsis
+            )
+        )
+    else:
+        output = output.replace("...", ellipsis)
+    return inputs, output
+
+
+def _einsum_operand_grads(g, inputs, output, operands):
+    grads = []
+    for i, (subs, operand) in enumerate(zip(inputs, operands)):
+        if len(set(subs)) != len(subs):
+            raise ivy.utils.exceptions.IvyNotImplementedException(
+                "the numpy backend cannot differentiate einsum operands with "
+                f"repeated subscripts, got '{subs}'"
+            )
+        others = [(s, o) for j, (s, o) in enumerate(zip(inputs, operands)) if j != i]
+        available = set(output).union(*[s for s, _ in others])
+        target = "".join(c for c in subs if c in available)
+        grad = np.einsum(
+            ",".join([output] + [s for s, _ in others]) + "->" + target,
+            g,
+            *[o for _, o in others],
+        )
+        # subscripts summed out of this operand alone are constant along them
+        grad = np.reshape(
+            grad,
+            [grad.shape[target.index(c)] if c in available else 1 for c in subs],
+        )
+        grads.append(_unbroadcast(np.broadcast_to(grad, operand.shape), operand.shape))
+    return grads
+
+
+@_vjp("einsum")
+def _einsum_vjp(g, ret, equation, *operands, out=None):
+    inputs, output = _parse_einsum(equation, [np.ndim(o) for o in operands])
+    return {"operands": _einsum_operand_grads(g, inputs, output, operands)}
+
+
+@_vjp("tensordot")
+def _tensordot_vjp(g, ret, x1, x2, /, *, axes=2, out=None):
+    if isinstance(axes, int):
+        axes = (list(range(x1.ndim - axes, x1.ndim)), list(range(axes)))
+    axes_1 = [a % x1.ndim for a in np.atleast_1d(axes[0])]
+    axes_2 = [a % x2.ndim for a in np.atleast_1d(axes[1])]
+    subs_1 = [chr(ord("a") + i) for i in range(x1.ndim)]
+    subs_2 = [chr(ord("a") + x1.ndim + i) for i in range(x2.ndim)]
+    for a_1, a_2 in zip(axes_1, axes_2):
+        subs_2[a_2] = subs_1[a_1]
+    output = [c for i, c in enumerate(subs_1) if i not in axes_1] + [
+        c for i, c in enumerate(subs_2) if i not in axes_2
+    ]
+    g_1, g_2 = _einsum_operand_grads(
+        g, ["".join(subs_1), "".join(subs_2)], "".join(output), [x1, x2]
+    )
+    return {"x1": g_1, "x2": g_2}
+
+
+@_vjp("matrix_transpose")
+def _matrix_transpose_vjp(g, ret, x, /, *, conjugate=False, out=None):
+    g = np.swapaxes(g, -1, -2)
+    return {"x": np.conj(g) if conjugate else g}
+
+
+@_vjp("reshape", "expand_dims", "squeeze")
+def _reshape_vjp(g, ret, x, /, *args, **kwargs):
+    return {"x": np.reshape(g, np.shape(x))}
+
+
+@_vjp("permute_dims")
+def _permute_dims_vjp(g, ret, x, /, axes, *, copy=None, out=None):
+    return {"x": np.transpose(g, np.argsort(axes))}
+
+
+@_vjp("swapaxes")
+def _swapaxes_vjp(g, ret, x, axis0, axis1, /, *, copy=None, out=None):
+    return {"x": np.swapaxes(g, axis0, axis1)}
+
+
+@_vjp("broadcast_to")
+def _broadcast_to_vjp(g, ret, x, /, shape, *, out=None):
+    return {"x": _unbroadcast(g, np.shape(x))}
+
+
+@_vjp("flip")
+def _flip_vjp(g, ret, x, /, *, copy=None, axis=None, out=None):
+    return {"x": np.flip(g, axis)}
+
+
+@_vjp("tile")
+def _tile_vjp(g, ret, x, /, repeats, *, out=None):
+    ndim = max(len(repeats), x.ndim)
+    shape = (1,) * (ndim - x.ndim) + x.shape
+    repeats = (1,) * (ndim - len(repeats)) + tuple(repeats)
+    g = np.reshape(g, [d for r, s in zip(repeats, shape) for d in (r, s)])
+    return {"x": np.reshape(np.sum(g, axis=tuple(range(0, 2 * ndim, 2))), x.shape)}
+
+
+@_vjp("astype")
+def _astype_vjp(g, ret, x, dtype, /, *, copy=True, out=None):
+    if not np.issubdtype(np.dtype(ret.dtype), np.inexact):
+        return {}
+    return {"x": np.asarray(g).astype(x.dtype)}
+
+
+@_vjp("concat")
+def _concat_vjp(g, ret, xs, /, *, axis=0, out=None):
+    if axis is None:
+        g = np.reshape(g, [-1])
+        sizes = [np.size(x) for x in xs]
+        grads = np.split(g, np.cumsum(sizes)[:-1])
+        return {"xs": [np.reshape(g_x, np.shape(x)) for g_x, x in zip(grads, xs)]}
+    sizes = [np.shape(x)[axis] for x in xs]
+    return {"xs": np.split(g, np.cumsum(sizes)[:-1], axis)}
+
+
+@_vjp("stack")
+def _stack_vjp(g, ret, arrays, /, *, axis=0, out=None):
+    return {"arrays": list(np.moveaxis(g, axis, 0))}
+
+
+@_vjp("split")
+def _split_vjp(
+    g, ret, x, /, *, copy=None, num_or_size_splits=None, axis=0, with_remainder=False
+):
+    return {"x": np.concatenate(g, axis)}
+
+
+@_vjp("unstack")
+def _unstack_vjp(g, ret, x, /, *, copy=None, axis=0, keepdims=False):
+    return {"x": np.concatenate(g, axis) if keepdims else np.stack(g, axis)}
+
+
+def _is_basic_query(query):
+    query = query if isinstance(query, tuple) else (query,)
+    return all(
+        q is None or q is Ellipsis or isinstance(q, (int, np.integer, slice))
+        for q in query
+    )
+
+
+@_vjp("get_item")
+def _get_item_vjp(g, ret, x, /, query, *, copy=None):
+    g_x = np.zeros(np.shape(x), dtype=g.dtype)
+    if _is_basic_query(query) or (
+        isinstance(query, np.ndarray) and query.dtype == bool
+    ):
+        # every element is selected at most once
+        g_x[query] = g
+    else:
+        np.add.at(g_x, query, g)
+    return {"x": g_x}
+
+
+@_vjp("gather")
+def _gather_vjp(g, ret, params, indices, /, *, axis=-1, batch_dims=0, out=None):
+    axis = axis % params.ndim
+    batch_dims = batch_dims % params.ndim
+    g_params = np.zeros(params.shape, dtype=g.dtype)
+    for b in np.ndindex(*params.shape[:batch_dims]):
+        np.add.at(
+            g_params[b],
+            (slice(None),) * (axis - batch_dims) + (np.asarray(indices)[b],),
+            g[b],
+        )
+    return {"params": g_params}
+
+
+@_vjp("take_along_axis")
+def _take_along_axis_vjp(g, ret, arr, indices, axis, /, *, mode="fill", out=None):
+    axis = axis % arr.ndim
+    size = arr.shape[axis]
+    if mode == "clip":
+        indices, valid = np.clip(indices, 0, size - 1), True
+    else:
+        valid = (indices >= 0) & (indices < size)
+        indices = np.where(valid, indices, 0)
+    grids = np.ogrid[tuple(slice(s) for s in np.shape(indices))]
+    query = tuple(
+        indices if i == axis else (grid if arr.shape[i] != 1 else 0)
+        for i, grid in enumerate(grids)
+    )
+    g_arr = np.zeros(arr.shape, dtype=g.dtype)
+    np.add.at(g_arr, query, np.where(valid, g, 0))
+    return {"arr": g_arr}
+
+
+def _conv_gemm_vjp(x, filters, g, strides, dilations, dims, g_x, g_filters):
+    # x is the padded input and filters the undilated K_1 x ... x K_dims x I x O
+    # kernel, the cotangents are accumulated into g_x and written to g_filters
+    dilated_shape = [(k - 1) * d + 1 for k, d in zip(filters.shape[:dims], dilations)]
+    windows = _conv_windows(x, dilated_shape, strides, dims)
+    windows = windows[
+        (slice(None),) * (dims + 1) + tuple(slice(None, None, d) for d in dilations)
+    ]
+    sample_bytes = max(1, math.prod(windows.shape[1:]) * windows.itemsize)
+    block_batch = max(1, _CONV_BLOCK_BYTES // sample_bytes)
+    axes = list(range(dims + 1))
+    g_filters[...] = 0
+    for b in range(0, x.shape[0], block_batch):
+        g_filters += np.tensordot(
+            windows[b : b + block_batch], g[b : b + block_batch], axes=(axes, axes)
+        )
+    # scatter the cotangent of each kernel tap back onto the input positions it read
+    out_shape = g.shape[1 : dims + 1]
+    for k in np.ndindex(*filters.shape[:dims]):
+        region = (slice(None),) + tuple(
+            slice(k_i * d, k_i * d + s * (o - 1) + 1, s)
+            for k_i, d, s, o in zip(k, dilations, strides, out_shape)
+        )
+        g_x[region] += np.tensordot(g, filters[k], axes=([-1], [-1]))
+
+
+@_vjp("conv1d", "conv2d", "conv3d", "conv_general_dilated")
+def _conv_vjp(
+    g,
+    ret,
+    x,
+    filters,
+    strides,
+    padding,
+    /,
+    *,
+    dims=None,
+    data_format="channel_last",
+    filter_format="channel_last",
+    feature_group_count=1,
+    x_dilations=1,
+    dilations=1,
+    bias=None,
+    out=None,
+):
+    dims = filters.ndim - 2
+    channel_first = data_format in ("NCW", "NCHW", "NCDHW", "channel_first")
+    strides = [strides] * dims if isinstance(strides, int) else strides
+    dilations = [dilations] * dims if isinstance(dilations, int) else dilations
+    x_dilations = [x_dilations] * dims if isinstance(x_dilations, int) else x_dilations
+    if channel_first:
+        x, g = np.moveaxis(x, 1, -1), np.moveaxis(g, 1, -1)
+    if filter_format == "channel_first":
+        filters = np.transpose(filters, (*range(2, dims + 2), 1, 0))
+
+    # redo the input dilation and padding of the forward pass
+    x_dilated = x
+    for j in range(dims):
+        if x_dilations[j] > 1:
+            x_dilated = _add_dilations(x_dilated, x_dilations[j], axis=j + 1)
+    x_padded, filters_dilated = _dilate_pad_conv(
+        x_dilated, filters, strides, padding, dims, dilations
+    )
+    pad_list = _conv_pad_list(x_dilated, filters_dilated, strides, padding, dims)
+
+    g_x = np.zeros(x_padded.shape, dtype=g.dtype)
+    g_filters = np.empty(filters.shape, dtype=g.dtype)
+    input_dim, output_dim = filters.shape[-2:]
+    group_output_dim = output_dim // feature_group_count
+    for i, j in zip(
+        range(0, x_padded.shape[-1], input_dim),
+        range(0, output_dim, group_output_dim),
+    ):
+        _conv_gemm_vjp(
+            x_padded[..., i : i + input_dim],
+            filters[..., j : j + group_output_dim],
+            g[..., j : j + group_output_dim],
+            strides,
+            dilations,
+            dims,
+            g_x[..., i : i + input_dim],
+            g_filters[..., j : j + group_output_dim],
+        )
+
+    # undo the padding and input dilation
+    g_x = g_x[
+        (slice(None),)
+        + tuple(
+            slice(pad[0], g_x.shape[i + 1] - pad[1]) for i, pad in enumerate(pad_list)
+        )
+    ]
+    g_x = g_x[(slice(None),) + tuple(slice(None, None, d) for d in x_dilations)]
+    if channel_first:
+        g_x = np.moveaxis(g_x, -1, 1)
+    if filter_format == "channel_first":
+        g_filters = np.transpose(g_filters, (dims + 1, dims, *range(dims)))
+    grads = {"x": g_x, "filters": g_filters}
+    if bias is not None:
+        grads["bias"] = _unbroadcast(
+            np.sum(g, axis=tuple(range(g.ndim - 1))), np.shape(bias)
+        )
+    return grads
+
+
+# Gradient Functions #
+# ------------------ #
+
+
+def variable(x, /):
     return x
 
 
 def is_variable(x, /, *, exclusive=False):
-    # NumPy does not support autograd, checking if x is a variable does have any meaning
-    # for NumPy. Return False.
+    # NumPy arrays carry no gradient information of their own, gradients are
+    # tracked by identity on the tape while they are being computed
     return False
 
 
@@ -24,6 +1024,13 @@ def variable_data(x, /):
     return x
 
 
+def _grad_func(tape, y, xs):
+    """Gradient calculation function."""
+    if isinstance(y, ivy.Array):
+        y = y.data
+    return tape.gradient(y, xs)
+
+
 def execute_with_gradients(
     func,
     xs,
@@ -33,67 +1040,103 @@ def execute_with_gradients(
     xs_grad_idxs: Optional[Sequence[Sequence[Union[str, int]]]] = [[0]],
     ret_grad_idxs: Optional[Sequence[Sequence[Union[str, int]]]] = [[0]],
 ):
-    logging.warning(
-        "NumPy does not support autograd, "
-        "'execute_with_gradients' returns None in place of function gradients."
+    # Conversion of required arrays to float variables and duplicate index chains
+    xs, xs_grad_idxs, xs1, required_duplicate_index_chains, _ = (
+        _get_required_float_variables(xs, xs_grad_idxs)
     )
-    xs = ivy.to_ivy(xs)
-    func_ret = func(xs)
-    return func_ret, None
+    with _Tape() as tape:
+        ivy.nested_map(tape.watch, xs1, include_derived=True)
+        func_ret = func(xs)
+        # Getting the relevant outputs from the function return for gradient
+        # calculation
+        ret_grad_idxs, y, ret_idxs = _get_y_and_ret_idxs(func_ret, ret_grad_idxs)
+    xs = xs1
 
+    if _is_tensor(y) or isinstance(y, ivy.Array):
+        # Gradient calculation for a single output
+        grads = _set_duplicates(
+            _grad_func(tape, y, xs), required_duplicate_index_chains
+        )
+    else:
+        # Gradient calculation for multiple outputs
+        y = _get_native_y(y)
+        grad_arr_idxs = ivy.nested_argwhere(y, lambda x: ivy.is_native_array(x))
+        grad_arr_values = ivy.multi_index_nest(y, grad_arr_idxs)
+        grads_ = [_grad_func(tape, arr_value, xs) for arr_value in grad_arr_values]
+        grads = grads_
+        if isinstance(ret_idxs, list) and len(ret_idxs):
+            grads = {
+                ret_idxs[i]: _set_duplicates(grad, required_duplicate_index_chains)
+                for i, grad in enumerate(grads_)
+            }
 
-def value_and_grad(func):
-    logging.warning(
-        "NumPy does not support autograd, 'value_and_grad' "
-        "has no effect on the array, as gradients are not supported in the first place."
-    )
+    return _process_func_ret_and_grads(func_ret, grads, retain_grads)
 
-    def grad_fn(xs):
-        grads = ivy.nested_map(
-            lambda x: ivy.zeros_like(x), xs, include_derived=True, shallow=False
+
+def value_and_grad(func):
+    def callback_fn(xs):
+        xs = ivy.nested_map(
+            lambda x: ivy.to_native(x), xs, include_derived=True, shallow=False
         )
-        y = func(xs)
-        y = ivy.to_ivy(y)
-        return y, grads
+        with _Tape() as tape:
+            ivy.nested_map(tape.watch, xs, include_derived=True)
+            y = ivy.to_native(func(ivy.to_ivy(xs, nested=True)))
+        grads = _grad_func(tape, y, xs)
+        return ivy.to_ivy(y), ivy.to_ivy(grads, nested=True)
 
-    return grad_fn
+    return callback_fn
 
 
-def jac(func):
-    logging.warning(
-        "NumPy does not support autograd, 'jac' "
-        "has no effect on the array, as gradients are not supported in the first place."
-    )
+def jac(func: Callable):
+    def callback_fn(x_in):
+        x_in = ivy.to_native(x_in, nested=True, include_derived=True)
+        with _Tape() as tape:
+            ivy.nested_map(tape.watch, x_in, include_derived=True)
+            y = ivy.to_native(
+                func(ivy.to_ivy(x_in, nested=True)), nested=True, include_derived=True
+            )
 
-    def grad_fn(xs):
-        jacobian = ivy.nested_map(
-            lambda x: ivy.zeros_like(x), xs, include_derived=True, shallow=False
-        )
-        return jacobian
+        def _jacobian(y):
+            # one backward pass per output element, stacked as y.shape + x.shape
+            rows = []
+            for i in range(y.size):
+                seed = np.zeros(y.size, dtype=y.dtype)
+                seed[i] = 1
+                rows.append(tape.gradient(y, x_in, seed=np.reshape(seed, y.shape)))
+            if _is_tensor(x_in):
+                return np.reshape(np.stack(rows), y.shape + np.shape(x_in))
+            return ivy.nested_multi_map(
+                lambda r, _: np.reshape(np.stack(r), y.shape + np.shape(r[0])),
+                rows,
+                to_ivy=False,
+            )
 
-    return grad_fn
+        return ivy.to_ivy(
+            ivy.nested_map(_jacobian, y, include_derived=True)
+            if not _is_tensor(y)
+            else _jacobian(y),
+            nested=True,
+            include_derived=True,
+        )
 
+    return callback_fn
 
-def grad(func, argnums=0):
-    logging.warning(
-        "NumPy does not support autograd, 'grad' "
-        "has no effect on the array, as gradients are not supported in the first place."
-    )
 
-    def grad_fn(xs):
-        grad = ivy.nested_map(
-            lambda x: ivy.zeros_like(x), xs, include_derived=True, shallow=False
-        )
-        y = func(xs)
-        y = ivy.to_ivy(y)
-        return grad
+def grad(func: Callable, argnums: Union[int, Tuple[int]] = 0):
+    def callback_fn(*args):
+        args = [ivy.to_native(arg, nested=True) for arg in args]
+        idxs = [argnums] if isinstance(argnums, int) else list(argnums)
+        with _Tape() as tape:
+            for i in idxs:
+                ivy.nested_map(tape.watch, args[i], include_derived=True)
+            y = ivy.to_native(func(*ivy.to_ivy(args, nested=True)))
+        grads = [_grad_func(tape, y, args[i]) for i in idxs]
+        grads = grads[0] if isinstance(argnums, int) else tuple(grads)
+        return ivy.to_ivy(grads, nested=True)
 
-    return grad_fn
+    return callback_fn
 
 
 def stop_gradient(x, /, *, preserve_type=True, out=None):
-    logging.warning(
-        "NumPy does not support autograd, 'stop_gradient' "
-        "has no effect on the array, as gradients are not supported in the first place."
-    )
-    return x
+    # a new view is not watched by any tape, so no gradient flows through it
+    return np.asarray(x).view() if _active_tapes else x
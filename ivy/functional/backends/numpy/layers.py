@@ -23,10 +23,7 @@ def _add_dilations(x, dilations, axis, values=0):
     )
 
 
-def _dilate_pad_conv(x, filters, strides, padding, dims, dilations):
-    for j in range(dims):
-        if dilations[j] > 1:
-            filters = _add_dilations(filters, dilations[j], axis=j)
+def _conv_pad_list(x, filters, strides, padding, dims):
     if isinstance(padding, str):
         pad_specific = [
             _handle_padding(x.shape[1 + i], strides[i], filters.shape[i], padding)
@@ -40,7 +37,14 @@ def _dilate_pad_conv(x, filters, strides, padding, dims, dilations):
         pad_list = [(padding, padding)] * dims
     else:
         pad_list = [(_p, _p) if isinstance(_p, int) else _p for _p in padding]
+    return pad_list
+
 
+def _dilate_pad_conv(x, filters, strides, padding, dims, dilations):
+    for j in range(dims):
+        if dilations[j] > 1:
+            filters = _add_dilations(filters, dilations[j], axis=j)
+    pad_list = _conv_pad_list(x, filters, strides, padding, dims)
     pad_width = [(0, 0), *pad_list, (0, 0)]
 
     x = np.pad(
@@ -113,6 +117,63 @@ def _ff_xd_before_conv(x, filters, dims, filter_format, x_dilations):
     return x, filters
 
 
+# upper bound on the size of the im2col buffer materialised by a single GEMM call
+_CONV_BLOCK_BYTES = 2**25
+
+
+def _conv_dtype(x, filters):
+    dtype = np.result_type(x, filters)
+    if dtype.kind in "biu":
+        # integers are summed in the default integer of their kind, as by np.sum,
+        # which also keeps the sums of products from overflowing
+        dtype = np.promote_types(dtype, np.uint if dtype.kind == "u" else np.int_)
+    return dtype
+
+
+def _conv_windows(x, filter_shape, strides, dims):
+    # B x O_1 x ... x O_dims x K_1 x ... x K_dims x I view of x, without copying
+    out_shape = [
+        (x.shape[i + 1] - filter_shape[i]) // strides[i] + 1 for i in range(dims)
+    ]
+    new_shape = [x.shape[0], *out_shape, *filter_shape, x.shape[-1]]
+    new_strides = (
+        x.strides[0],
+        *[x.strides[i + 1] * strides[i] for i in range(dims)],
+        *x.strides[1:],
+    )
+    return np.lib.stride_tricks.as_strided(x, new_shape, new_strides, writeable=False)
+
+
+def _conv_gemm(x, filters, strides, dims):
+    """
+    Convolve the padded channel-last input `x` with `filters` (K_1 x ... x K_dims x I
+    x O) using im2col followed by a matrix multiplication.
+
+    The im2col buffer is built one block of samples or output rows at a time, so
+    peak memory is bounded by `_CONV_BLOCK_BYTES` plus the size of the output.
+    """
+    dtype = _conv_dtype(x, filters)
+    x, filters = x.astype(dtype, copy=False), filters.astype(dtype, copy=False)
+    windows = _conv_windows(x, filters.shape[:dims], strides, dims)
+    batch_size, out_rows = windows.shape[0], windows.shape[1]
+    res = np.empty((*windows.shape[: dims + 1], filters.shape[-1]), dtype=dtype)
+    row_bytes = max(1, np.prod(windows.shape[2:]) * windows.itemsize)
+    block_rows = max(1, _CONV_BLOCK_BYTES // row_bytes)
+    if block_rows >= out_rows:
+        block_batch = block_rows // max(1, out_rows)
+        for b in range(0, batch_size, block_batch):
+            res[b : b + block_batch] = np.tensordot(
+                windows[b : b + block_batch], filters, axes=dims + 1
+            )
+    else:
+        for b in range(batch_size):
+            for r in range(0, out_rows, block_rows):
+                res[b, r : r + block_rows] = np.tensordot(
+                    windows[b, r : r + block_rows], filters, axes=dims + 1
+                )
+    return res
+
+
 def conv1d(
     x: np.ndarray,
     filters: np.ndarray,
@@ -134,32 +195,8 @@ def conv1d(
     x, filters = _ff_xd_before_conv(x, filters, 1, filter_format, x_dilations)
     x, filters = _dilate_pad_conv(x, filters, strides, padding, 1, dilations)
 
-    x_shape = x.shape
-    filter_shape = list(filters.shape[0:1])
-    input_dim = filters.shape[-2]
-    output_dim = filters.shape[-1]
-    new_w = (x_shape[1] - filter_shape[0]) // strides[0] + 1
-    new_shape = [x_shape[0], new_w] + filter_shape + [x_shape[-1]]
-    new_strides = (
-        x.strides[0],
-        x.strides[1] * strides[0],
-        x.strides[1],
-        x.strides[2],
-    )
-    # B x OW x KW x I
-    sub_matrices = np.lib.stride_tricks.as_strided(
-        x, new_shape, new_strides, writeable=False
-    )
-    # B x OW x KW x I x O
-    sub_matrices_w_output_dim = np.tile(
-        np.expand_dims(sub_matrices, -1), [1] * 4 + [output_dim]
-    )
-    # B x OW x KW x I x O
-    mult = sub_matrices_w_output_dim * filters.reshape(
-        [1] * 2 + filter_shape + [input_dim, output_dim]
-    )
     # B x OW x O
-    res = np.sum(mult, (2, 3))
+    res = _conv_gemm(x, filters, strides, 1)
     res = np.add(res, bias) if bias is not None else res
     if data_format == "NCW":
         res = np.transpose(res, (0, 2, 1))
@@ -216,35 +253,8 @@ def conv2d(
     x, filters = _ff_xd_before_conv(x, filters, 2, filter_format, x_dilations)
     x, filters = _dilate_pad_conv(x, filters, strides, padding, 2, dilations)
 
-    x_shape = x.shape
-    filter_shape = list(filters.shape[0:2])
-    input_dim = filters.shape[-2]
-    output_dim = filters.shape[-1]
-    new_h = (x_shape[1] - filter_shape[0]) // strides[0] + 1
-    new_w = (x_shape[2] - filter_shape[1]) // strides[1] + 1
-    new_shape = [x_shape[0], new_h, new_w] + filter_shape + [x_shape[-1]]
-    new_strides = (
-        x.strides[0],
-        x.strides[1] * strides[0],
-        x.strides[2] * strides[1],
-        x.strides[1],
-        x.strides[2],
-        x.strides[3],
-    )
-    # B x OH x OW x KH x KW x I
-    sub_matrices = np.lib.stride_tricks.as_strided(
-        x, new_shape, new_strides, writeable=False
-    )
-    # B x OH x OW x KH x KW x I x O
-    sub_matrices_w_output_dim = np.tile(
-        np.expand_dims(sub_matrices, -1), [1] * 6 + [output_dim]
-    )
-    # B x OH x OW x KH x KW x I x O
-    mult = sub_matrices_w_output_dim * filters.reshape(
-        [1] * 3 + filter_shape + [input_dim, output_dim]
-    )
     # B x OH x OW x O
-    res = np.sum(mult, (3, 4, 5))
+    res = _conv_gemm(x, filters, strides, 2)
     res = np.add(res, bias) if bias is not None else res
     if data_format == "NCHW":
         return np.transpose(res, (0, 3, 1, 2))
@@ -293,47 +303,19 @@ def depthwise_conv2d(
 ):
     strides = [strides] * 2 if isinstance(strides, int) else strides
     dilations = [dilations] * 2 if isinstance(dilations, int) else dilations
-    if isinstance(padding, int):
-        padding = [(padding, padding)] * 2
-    if data_format == "NHWC":
-        x = np.transpose(x, (3, 0, 1, 2))
-    else:
-        x = np.transpose(x, (1, 0, 2, 3))
+    if data_format == "NCHW":
+        x = np.transpose(x, (0, 2, 3, 1))
     filters = np.squeeze(filters, 3) if filters.ndim == 4 else filters
-    filters = np.transpose(filters, (2, 0, 1))
-    filters = np.expand_dims(filters, (-1, -2))
-    filter_h = filters.shape[1] + (filters.shape[1] - 1) * (dilations[0] - 1)
-    filter_w = filters.shape[2] + (filters.shape[2] - 1) * (dilations[1] - 1)
-    if isinstance(padding, str):
-        if padding == "VALID":
-            out_height = np.ceil(float(x.shape[2] - filter_h + 1) / float(strides[0]))
-            out_width = np.ceil(float(x.shape[3] - filter_w + 1) / float(strides[1]))
-        else:
-            out_height = np.ceil(float(x.shape[2]) / float(strides[0]))
-            out_width = np.ceil(float(x.shape[3]) / float(strides[1]))
-    else:
-        out_height = np.ceil(
-            float(x.shape[2] - filter_h + padding[0][0] + padding[0][1] + 1)
-            / float(strides[0])
-        )
-        out_width = np.ceil(
-            float(x.shape[3] - filter_w + padding[1][0] + padding[1][1] + 1)
-            / float(strides[1])
-        )
-    if data_format == "NHWC":
-        outputs = np.empty([x.shape[1], int(out_height), int(out_width), 0], x.dtype)
-    else:
-        outputs = np.empty([x.shape[1], 0, int(out_height), int(out_width)], x.dtype)
-    x = np.expand_dims(x, -1)
-    for i in range(x.shape[0]):
-        output = conv2d(
-            x[i], filters[i], strides, padding, data_format="NHWC", dilations=dilations
-        )
-        if data_format == "NHWC":
-            outputs = np.append(outputs, output, axis=-1)
-        else:
-            outputs = np.append(outputs, np.transpose(output, (0, 3, 1, 2)), axis=1)
-    return outputs
+    x, filters = _dilate_pad_conv(x, filters, strides, padding, 2, dilations)
+    dtype = _conv_dtype(x, filters)
+    x, filters = x.astype(dtype, copy=False), filters.astype(dtype, copy=False)
+    # B x OH x OW x KH x KW x C
+    windows = _conv_windows(x, filters.shape[:2], strides, 2)
+    # B x OH x OW x C
+    res = np.einsum("bhwijc,ijc->bhwc", windows, filters)
+    if data_format == "NCHW":
+        return np.transpose(res, (0, 3, 1, 2))
+    return res
 
 
 def conv3d(
@@ -357,38 +339,8 @@ def conv3d(
     x, filters = _ff_xd_before_conv(x, filters, 3, filter_format, x_dilations)
     x, filters = _dilate_pad_conv(x, filters, strides, padding, 3, dilations)
 
-    x_shape = x.shape
-    filter_shape = list(filters.shape[0:3])
-    input_dim = filters.shape[-2]
-    output_dim = filters.shape[-1]
-    new_d = (x_shape[1] - filter_shape[0]) // strides[0] + 1
-    new_h = (x_shape[2] - filter_shape[1]) // strides[1] + 1
-    new_w = (x_shape[3] - filter_shape[2]) // strides[2] + 1
-    new_shape = [x_shape[0], new_d, new_h, new_w] + filter_shape + [x_shape[-1]]
-    new_strides = (
-        x.strides[0],
-        x.strides[1] * strides[0],
-        x.strides[2] * strides[1],
-        x.strides[3] * strides[2],
-        x.strides[1],
-        x.strides[2],
-        x.strides[3],
-        x.strides[4],
-    )
-    # B x OD X OH x OW x KD X KH x KW x I
-    sub_matrices = np.lib.stride_tricks.as_strided(
-        x, new_shape, new_strides, writeable=False
-    )
-    # B x OD X OH x OW x KD X KH x KW x I x O
-    sub_matrices_w_output_dim = np.tile(
-        np.expand_dims(sub_matrices, -1), [1] * 8 + [output_dim]
-    )
-    # B x OD X OH x OW x KD X KH x KW x I x O
-    mult = sub_matrices_w_output_dim * filters.reshape(
-        [1] * 4 + filter_shape + [input_dim, output_dim]
-    )
     # B x OD X OH x OW x O
-    res = np.sum(mult, (4, 5, 6, 7))
+    res = _conv_gemm(x, filters, strides, 3)
     res = np.add(res, bias) if bias is not None else res
     if data_format == "NCDHW":
         return np.transpose(res, (0, 4, 1, 2, 3))
@@ -455,45 +407,22 @@ def conv_general_dilated(
             x = _add_dilations(x, x_dilations[j], axis=j + 1)
     x, filters = _dilate_pad_conv(x, filters, strides, padding, dims, dilations)
 
-    x_shape = x.shape
-    filter_shape = list(filters.shape[0:dims])
     input_dim = filters.shape[-2]
     output_dim = filters.shape[-1]
-    new_shape = [
-        (x_shape[i + 1] - filter_shape[i]) // strides[i] + 1 for i in range(dims)
-    ]
-    res = []
-    new_shape = [x_shape[0], *new_shape] + filter_shape + [input_dim]
-    for i, j in zip(
-        range(0, x.shape[-1], input_dim),
-        range(0, output_dim, output_dim // feature_group_count),
-    ):
-        sliced_x = x[..., i : i + input_dim]
-        sliced_filters = filters[..., j : j + output_dim // feature_group_count]
-        normal_strides = [sliced_x.strides[i] for i in range(1, dims + 2)]
-        changed_strides = [
-            sliced_x.strides[i] * strides[i - 1] for i in range(1, dims + 1)
-        ]
-        new_strides = (x.strides[0], *changed_strides, *normal_strides)
-        # B x OH x OW x KH x KW x I
-        sub_matrices = np.lib.stride_tricks.as_strided(
-            sliced_x, new_shape, new_strides, writeable=False
-        )
-
-        # B x OH x OW x KH x KW x I x O
-        sub_matrices_w_output_dim = np.tile(
-            np.expand_dims(sub_matrices, -1),
-            [1] * (dims * 2 + 2) + [output_dim // feature_group_count],
+    group_output_dim = output_dim // feature_group_count
+    res = [
+        # B x OH x OW x O
+        _conv_gemm(
+            x[..., i : i + input_dim],
+            filters[..., j : j + group_output_dim],
+            strides,
+            dims,
         )
-        # B x OH x OW x KH x KW x I x O
-        mult = sub_matrices_w_output_dim * sliced_filters.reshape(
-            [1] * (dims + 1)
-            + filter_shape
-            + [input_dim, output_dim // feature_group_count]
+        for i, j in zip(
+            range(0, x.shape[-1], input_dim),
+            range(0, output_dim, group_output_dim),
         )
-
-        # B x OH x OW x O
-        res.append(np.sum(mult, tuple([i for i in range(dims + 1, dims * 2 + 2)])))
+    ]
     res = np.concatenate(res, axis=-1)
     res = np.add(res, bias) if bias is not None else res
 
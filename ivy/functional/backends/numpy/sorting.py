@@ -1,4 +1,5 @@
 # global
+import math
 import numpy as np
 from typing import Optional, Literal, Union, List
 
@@ -52,6 +53,26 @@ def msort(
 msort.support_native_out = False
 
 
+def _searchsorted_rows(x, v, side):
+    # search each row of v in the same sorted row of x, all at once. The rows are
+    # merged with one stable sort along the last axis, which puts the values of v
+    # before the equal values of x for the left side and after them for the right
+    # side, and the index of each value of v is the number of values of x before it
+    num_rows, row_length = x.shape
+    if side == "left":
+        order = np.argsort(np.concatenate([v, x], -1), axis=-1, kind="stable")
+        from_v = order < v.shape[-1]
+        positions = order[from_v]
+    else:
+        order = np.argsort(np.concatenate([x, v], -1), axis=-1, kind="stable")
+        from_v = order >= row_length
+        positions = order[from_v] - row_length
+    counts = np.cumsum(~from_v, axis=-1)[from_v]
+    ret = np.empty(v.shape, dtype=np.int64)
+    np.put_along_axis(ret, positions.reshape(v.shape), counts.reshape(v.shape), -1)
+    return ret
+
+
 def searchsorted(
     x: np.ndarray,
     v: np.ndarray,
@@ -80,12 +101,17 @@ def searchsorted(
         if is_sorter_provided:
             x = np.take_along_axis(x, sorter, axis=-1)
         original_shape = v.shape
-        x = x.reshape(-1, x.shape[-1])
-        v = v.reshape(-1, v.shape[-1])
-        out_array = np.empty_like(v)
-        for i in range(x.shape[0]):
-            out_array[i] = np.searchsorted(x[i], v[i], side=side)
-        ret = out_array.reshape(original_shape)
+        num_rows = math.prod(v.shape[:-1])
+        x = x.reshape(num_rows, x.shape[-1])
+        v = v.reshape(num_rows, v.shape[-1])
+        # merging the rows sorts them again, which only pays off for short rows
+        if x.shape[-1] + v.shape[-1] <= 64:
+            ret = _searchsorted_rows(x, v, side)
+        else:
+            ret = np.empty(v.shape, dtype=np.int64)
+            for i in range(x.shape[0]):
+                ret[i] = np.searchsorted(x[i], v[i], side=side)
+        ret = ret.reshape(original_shape)
     else:
         ret = np.searchsorted(x, v, side=side, sorter=sorter)
     return ret.astype(ret_dtype)
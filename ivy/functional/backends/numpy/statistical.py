@@ -255,3 +255,6 @@ def einsum(
 
 
 einsum.support_native_out = True
+
+
+einsum.partial_mixed_handler = lambda equation, *operands, **kwargs: len(operands) < 3
@@ -13,6 +13,7 @@ from ivy.func_wrapper import (
 
 # local
 import ivy
+from ivy.functional.ivy.general import cache_fn
 from .. import backend_version
 
 # noinspection PyProtectedMember
@@ -101,6 +102,52 @@ def tril_indices(
     )
 
 
+# the lowest and largest values of each dtype, as paddle.full overflows for int64
+_SEGMENT_LIMITS = {
+    paddle.float32: (-3.4028234663852886e38, 3.4028234663852886e38),
+    paddle.float64: (-1.7976931348623157e308, 1.7976931348623157e308),
+    paddle.int32: (-2147483648, 2147483647),
+    paddle.int64: (-9223372036854775808, 9223372036854775807),
+}
+
+
+def _segment_initial(dtype, reduction):
+    # the value of segments without any element, as in tf.math.unsorted_segment_*
+    if reduction == "sum":
+        return 0
+    if dtype not in _SEGMENT_LIMITS:
+        raise ValueError("Unsupported data type")
+    lowest, largest = _SEGMENT_LIMITS[dtype]
+    return largest if reduction == "min" else lowest
+
+
+def _unsorted_segment_reduce(data, segment_ids, num_segments, reduction):
+    ivy.utils.assertions.check_unsorted_segment_valid_params(
+        data, segment_ids, num_segments
+    )
+    res = paddle.empty((num_segments,) + tuple(data.shape[1:]), dtype=data.dtype)
+    res[:] = _segment_initial(data.dtype, reduction)
+    kept = segment_ids >= 0
+    if not paddle.all(kept):
+        data, segment_ids = data[kept], segment_ids[kept]
+    if segment_ids.shape[0] == 0:
+        return res
+    # sort the values by segment, so that paddle.geometric reduces each segment over
+    # a contiguous range, rather than with a mask per segment
+    order = paddle.argsort(segment_ids)
+    segment_ids = paddle.gather(segment_ids, order)
+    reduce = getattr(paddle.geometric, f"segment_{reduction}")
+    ret = reduce(paddle.gather(data, order), segment_ids)
+    num_found = ret.shape[0]
+    if reduction != "sum":
+        # paddle.geometric fills the segments without any element with 0
+        counts = paddle.bincount(segment_ids, minlength=num_found)
+        found = (counts > 0).reshape([-1] + [1] * (len(data.shape) - 1))
+        ret = paddle.where(found.expand(ret.shape), ret, res[:num_found])
+    res[:num_found] = ret
+    return res
+
+
 @with_supported_dtypes(
     {"2.4.2 and below": ("float64", "float32", "int32", "int64")},
     backend_version,
@@ -110,28 +157,37 @@ def unsorted_segment_min(
     segment_ids: paddle.Tensor,
     num_segments: Union[int, paddle.Tensor],
 ) -> paddle.Tensor:
-    ivy.utils.assertions.check_unsorted_segment_min_valid_params(
+    return _unsorted_segment_reduce(data, segment_ids, num_segments, "min")
+
+
+def unsorted_segment_max(
+    data: paddle.Tensor,
+    segment_ids: paddle.Tensor,
+    num_segments: Union[int, paddle.Tensor],
+) -> paddle.Tensor:
+    return _unsorted_segment_reduce(data, segment_ids, num_segments, "max")
+
+
+def unsorted_segment_prod(
+    data: paddle.Tensor,
+    segment_ids: paddle.Tensor,
+    num_segments: Union[int, paddle.Tensor],
+) -> paddle.Tensor:
+    ivy.utils.assertions.check_unsorted_segment_valid_params(
         data, segment_ids, num_segments
     )
-    if data.dtype == paddle.float32:
-        init_val = 3.4028234663852886e38  # float32 max
-    elif data.dtype == paddle.float64:
-        init_val = 1.7976931348623157e308  # float64 max
-    elif data.dtype == paddle.int32:
-        init_val = 2147483647
-    elif data.dtype == paddle.int64:
-        init_val = 9223372036854775807
-    else:
-        raise ValueError("Unsupported data type")
-    # Using paddle.full is causing interger overflow for int64
-    res = paddle.empty((num_segments,) + tuple(data.shape[1:]), dtype=data.dtype)
-    res[:] = init_val
-    for i in range(num_segments):
-        mask_index = segment_ids == i
-        if paddle.any(mask_index):
-            res[i] = paddle.min(data[mask_index], 0)
-
-    return res
+    res = paddle.ones((num_segments,) + tuple(data.shape[1:]), dtype=data.dtype)
+    kept = segment_ids >= 0
+    if not paddle.all(kept):
+        data, segment_ids = data[kept], segment_ids[kept]
+    if segment_ids.shape[0] == 0:
+        return res
+    # paddle.geometric has no segment product, so the values are multiplied into
+    # their segments with a single scatter instead
+    indices = segment_ids.astype("int64").reshape([-1] + [1] * (len(data.shape) - 1))
+    return paddle.put_along_axis(
+        res, indices.expand(data.shape), data, 0, reduce="multiply"
+    )
 
 
 def blackman_window(
@@ -159,33 +215,7 @@ def unsorted_segment_sum(
     segment_ids: paddle.Tensor,
     num_segments: Union[int, paddle.Tensor],
 ) -> paddle.Tensor:
-    # Used the same check which is used for unsorted_segment_min as the
-    # check should be same
-    # Might require to change the assertion function name to
-    # check_unsorted_segment_valid_params
-    ivy.utils.assertions.check_unsorted_segment_min_valid_params(
-        data, segment_ids, num_segments
-    )
-
-    # Sum computation in paddle does not support int32, so needs to
-    # be converted to float32
-    needs_conv = False
-    if data.dtype == paddle.int32:
-        data = paddle.cast(data, "float32")
-        needs_conv = True
-
-    res = paddle.zeros((num_segments,) + tuple(data.shape[1:]), dtype=data.dtype)
-
-    for i in range(num_segments):
-        mask_index = segment_ids == i
-        if paddle.any(mask_index):
-            res[i] = paddle.sum(data[mask_index], axis=0)
-
-    # condition for converting float32 back to int32
-    if needs_conv is True:
-        res = paddle.cast(res, "int32")
-
-    return res
+    return _unsorted_segment_reduce(data, segment_ids, num_segments, "sum")
 
 
 @with_unsupported_device_and_dtypes(
@@ -214,6 +244,7 @@ def trilu(
     return paddle.tril(x=x, diagonal=k)
 
 
+@cache_fn(max_size=32)
 def mel_weight_matrix(
     num_mel_bins: int,
     dft_length: int,
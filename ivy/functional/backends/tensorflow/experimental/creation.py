@@ -6,6 +6,7 @@ import tensorflow as tf
 # local
 from ivy.func_wrapper import with_unsupported_device_and_dtypes, with_unsupported_dtypes
 from .. import backend_version
+from ivy.functional.ivy.general import cache_fn
 
 
 # Array API Standard #
@@ -126,6 +127,22 @@ def unsorted_segment_sum(
     return tf.math.unsorted_segment_sum(data, segment_ids, num_segments)
 
 
+def unsorted_segment_max(
+    data: tf.Tensor,
+    segment_ids: tf.Tensor,
+    num_segments: Union[int, tf.Tensor],
+) -> tf.Tensor:
+    return tf.math.unsorted_segment_max(data, segment_ids, num_segments)
+
+
+def unsorted_segment_prod(
+    data: tf.Tensor,
+    segment_ids: tf.Tensor,
+    num_segments: Union[int, tf.Tensor],
+) -> tf.Tensor:
+    return tf.math.unsorted_segment_prod(data, segment_ids, num_segments)
+
+
 @with_unsupported_dtypes({"2.13.0 and below": ("bool",)}, backend_version)
 def trilu(
     x: Union[tf.Tensor, tf.Variable],
@@ -140,6 +157,7 @@ def trilu(
     return tf.experimental.numpy.tril(x, k)
 
 
+@cache_fn(max_size=32)
 def mel_weight_matrix(
     num_mel_bins: int,
     dft_length: int,
@@ -1,12 +1,12 @@
 from typing import Union, Optional, Tuple, List, Sequence
 import tensorflow as tf
-from functools import reduce as _reduce
 
 import ivy
 
 from ivy.functional.ivy.experimental.linear_algebra import _check_valid_dimension_size
 
 from ivy.func_wrapper import with_unsupported_dtypes, with_supported_dtypes
+from ivy.utils.einsum_path import matrix_chain_order
 from ivy.utils.exceptions import IvyNotImplementedException
 from .. import backend_version
 
@@ -143,11 +143,28 @@ def multi_dot(
     *,
     out: Optional[Union[tf.Tensor, tf.Variable]] = None,
 ) -> tf.Tensor:
-    # This implementation simply chains tf.tensordot multiple times
-    # TODO: reimplement this function once tf adds multi_dot or inplace updates
+    # tf has no multi_dot, so the products are chained in the order with the fewest
+    # flops, vectors at either end being taken as row and column vectors
     if len(x) < 2:
         raise ValueError("Expecting at least two tensors.")
-    dot_out = _reduce(tf.matmul, x)
+    order = matrix_chain_order(tuple(tuple(matrix.shape) for matrix in x))
+    x = list(x)
+    squeeze = []
+    if len(x[0].shape) == 1:
+        x[0] = tf.expand_dims(x[0], 0)
+        squeeze.append(-2)
+    if len(x[-1].shape) == 1:
+        x[-1] = tf.expand_dims(x[-1], -1)
+        squeeze.append(-1)
+
+    def _dot(node):
+        if isinstance(node, int):
+            return x[node]
+        return tf.matmul(_dot(node[0]), _dot(node[1]))
+
+    dot_out = _dot(order)
+    if squeeze:
+        dot_out = tf.squeeze(dot_out, axis=squeeze)
     return dot_out
 
 
@@ -219,3 +219,6 @@ def einsum(
     dtype = _get_promoted_type_of_operands(operands)
     equation = legalise_einsum_expr(*[equation, *operands])
     return tf.cast(tf.einsum(equation, *operands), dtype)
+
+
+einsum.partial_mixed_handler = lambda equation, *operands, **kwargs: len(operands) < 3
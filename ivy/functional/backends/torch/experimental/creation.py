@@ -6,6 +6,7 @@ import torch
 
 # local
 import ivy
+from ivy.functional.ivy.general import cache_fn
 from ivy.func_wrapper import (
     with_unsupported_dtypes,
     with_unsupported_device_and_dtypes,
@@ -126,30 +127,54 @@ def tril_indices(
     )
 
 
-def unsorted_segment_min(
-    data: torch.Tensor,
-    segment_ids: torch.Tensor,
-    num_segments: Union[int, torch.Tensor],
-) -> torch.Tensor:
-    ivy.utils.assertions.check_unsorted_segment_min_valid_params(
+def _unsorted_segment_reduce(data, segment_ids, num_segments, reduce):
+    ivy.utils.assertions.check_unsorted_segment_valid_params(
         data, segment_ids, num_segments
     )
-    if data.dtype in [torch.float32, torch.float64, torch.float16, torch.bfloat16]:
-        init_val = torch.finfo(data.dtype).max
+    if reduce == "sum":
+        init_val = 0
+    elif reduce == "prod":
+        init_val = 1
+    elif data.dtype in [torch.float32, torch.float64, torch.float16, torch.bfloat16]:
+        info = torch.finfo(data.dtype)
+        init_val = info.max if reduce == "amin" else info.min
     elif data.dtype in [torch.int32, torch.int64, torch.int8, torch.int16, torch.uint8]:
-        init_val = torch.iinfo(data.dtype).max
+        info = torch.iinfo(data.dtype)
+        init_val = info.max if reduce == "amin" else info.min
     else:
         raise ValueError("Unsupported data type")
 
     res = torch.full(
         (num_segments,) + data.shape[1:], init_val, dtype=data.dtype, device=data.device
     )
-    for i in range(num_segments):
-        mask_index = segment_ids == i
-        if torch.any(mask_index):
-            res[i] = torch.min(data[mask_index], 0)[0]
+    kept = segment_ids >= 0
+    data, segment_ids = data[kept], segment_ids[kept]
+    index = segment_ids.long().reshape((-1,) + (1,) * (data.dim() - 1))
+    return res.scatter_reduce(0, index.expand_as(data), data, reduce)
 
-    return res
+
+def unsorted_segment_min(
+    data: torch.Tensor,
+    segment_ids: torch.Tensor,
+    num_segments: Union[int, torch.Tensor],
+) -> torch.Tensor:
+    return _unsorted_segment_reduce(data, segment_ids, num_segments, "amin")
+
+
+def unsorted_segment_max(
+    data: torch.Tensor,
+    segment_ids: torch.Tensor,
+    num_segments: Union[int, torch.Tensor],
+) -> torch.Tensor:
+    return _unsorted_segment_reduce(data, segment_ids, num_segments, "amax")
+
+
+def unsorted_segment_prod(
+    data: torch.Tensor,
+    segment_ids: torch.Tensor,
+    num_segments: Union[int, torch.Tensor],
+) -> torch.Tensor:
+    return _unsorted_segment_reduce(data, segment_ids, num_segments, "prod")
 
 
 @with_unsupported_dtypes({"2.0.1 and below": ("float16",)}, backend_version)
@@ -176,24 +201,7 @@ def unsorted_segment_sum(
     segment_ids: torch.Tensor,
     num_segments: Union[int, torch.Tensor],
 ) -> torch.Tensor:
-    # Used the same check which is used for unsorted_segment_min as the
-    # check should be same
-    # Might require to change the assertion function name to
-    # check_unsorted_segment_valid_params
-    ivy.utils.assertions.check_unsorted_segment_min_valid_params(
-        data, segment_ids, num_segments
-    )
-
-    res = torch.zeros(
-        (num_segments,) + data.shape[1:], dtype=data.dtype, device=data.device
-    )
-
-    for i in range(num_segments):
-        mask_index = segment_ids == i
-        if torch.any(mask_index):
-            res[i] = torch.sum(data[mask_index], dim=0)
-
-    return res
+    return _unsorted_segment_reduce(data, segment_ids, num_segments, "sum")
 
 
 def trilu(
@@ -212,6 +220,7 @@ def trilu(
 trilu.support_native_out = True
 
 
+@cache_fn(max_size=32)
 def mel_weight_matrix(
     num_mel_bins: int,
     dft_length: int,
@@ -1,5 +1,6 @@
 # global
 from typing import Optional, Union, Tuple, Sequence
+import math
 import torch
 
 # local
@@ -483,15 +484,32 @@ def bincount(
     *,
     weights: Optional[torch.Tensor] = None,
     minlength: int = 0,
+    axis: Optional[int] = None,
     out: Optional[torch.Tensor] = None,
 ) -> torch.Tensor:
-    if weights is None:
-        ret = torch.bincount(x, minlength=minlength)
-        ret = ret.to(x.dtype)
-    else:
-        ret = torch.bincount(x, weights=weights, minlength=minlength)
-        ret = ret.to(weights.dtype)
-    return ret
+    dtype = x.dtype if weights is None else weights.dtype
+    if axis is None:
+        if weights is not None:
+            weights = weights.flatten()
+        return torch.bincount(x.flatten(), weights=weights, minlength=minlength).to(
+            dtype
+        )
+    # count all the positions of the other axes at once, with the values of each
+    # offset past those of the previous ones
+    x = torch.movedim(x, axis, -1)
+    # a negative value would be counted in the bins of the previous row
+    if x.numel() and x.min() < 0:
+        raise RuntimeError("bincount only supports 1-d non-negative integral inputs.")
+    length = int(x.max().clamp(min=minlength - 1)) + 1 if x.numel() else minlength
+    num_rows = math.prod(x.shape[:-1])
+    offsets = torch.arange(num_rows, device=x.device).reshape((*x.shape[:-1], 1))
+    if weights is not None:
+        weights = torch.movedim(weights, axis, -1).flatten()
+    ret = torch.bincount(
+        (x + offsets * length).flatten(), weights=weights, minlength=num_rows * length
+    )
+    ret = ret.reshape((*x.shape[:-1], length))
+    return torch.movedim(ret, -1, axis).to(dtype)
 
 
 bincount.support_native_out = False
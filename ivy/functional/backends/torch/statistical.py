@@ -332,3 +332,6 @@ def einsum(
 ) -> torch.Tensor:
     dtype = _get_promoted_type_of_operands(operands)
     return ivy.astype(torch.einsum(equation, *operands), dtype, copy=False)
+
+
+einsum.partial_mixed_handler = lambda equation, *operands, **kwargs: len(operands) < 3
@@ -1,5 +1,6 @@
 # global
 import ast
+import functools
 import logging
 import inspect
 import math
@@ -24,6 +25,7 @@ from ivy.func_wrapper import (
     handle_backend_invalid,
 )
 from ivy.utils.exceptions import handle_exceptions
+from ivy.utils import support_index
 from collections.abc import Hashable
 
 
@@ -1658,6 +1660,7 @@ def dtype(
 
 @handle_exceptions
 @handle_nestable
+@support_index.indexed("supported_dtypes")
 def function_supported_dtypes(fn: Callable, recurse: bool = True) -> Union[Tuple, dict]:
     """
     Return the supported data types of the current backend's function. The function
@@ -1707,6 +1710,7 @@ def function_supported_dtypes(fn: Callable, recurse: bool = True) -> Union[Tuple
 
 @handle_exceptions
 @handle_nestable
+@support_index.indexed("unsupported_dtypes")
 def function_unsupported_dtypes(
     fn: Callable, recurse: bool = True
 ) -> Union[Tuple, dict]:
@@ -2445,6 +2449,45 @@ def valid_dtype(dtype_in: Union[ivy.Dtype, ivy.NativeDtype, str, None], /) -> bo
     return ivy.as_ivy_dtype(dtype_in) in ivy.valid_dtypes
 
 
+_SCALAR_TYPES = (bool, int, float, complex)
+
+
+@functools.lru_cache(maxsize=None)
+def _promote_scalar_dtype(backend, dtype, scalar_type, array_api_promotion, precise):
+    # the native dtype an array of `dtype` and a python scalar of `scalar_type` are
+    # both cast to, per backend and promotion table, or None when the dtype of the
+    # scalar is left to ivy.asarray to infer
+    dtype = ivy.as_ivy_dtype(dtype)
+    if scalar_type is float and "int" in dtype:
+        target = "float64"
+    elif dtype == "bool" and scalar_type is not bool:
+        return None
+    elif scalar_type is complex and not ivy.is_complex_dtype(dtype):
+        target = "complex128"
+    else:
+        return ivy.as_native_dtype(dtype)
+    promoted = promote_types(dtype, target, array_api_promotion=array_api_promotion)
+    return ivy.as_native_dtype(promoted)
+
+
+def _promote_array_and_scalar(x, scalar, array_api_promotion):
+    # along a numpy array, the scalar becomes a numpy scalar of the promoted dtype,
+    # which the numpy kernels take as is, without the wrapped ivy.asarray and
+    # ivy.astype calls. Other backends still get a 0-d array of that dtype
+    dtype = _promote_scalar_dtype(
+        ivy.backend, x.dtype, type(scalar), array_api_promotion, ivy.precise_mode
+    )
+    if dtype is None:
+        return None
+    if isinstance(x, np.ndarray):
+        return x.astype(dtype, copy=False), dtype.type(scalar)
+    if x.dtype != dtype:
+        x = ivy.astype(x, dtype, copy=False)
+    device = ivy.default_device(item=x, as_native=True)
+    scalar = ivy.asarray(scalar, dtype=dtype, device=device)
+    return ivy.to_native(x), ivy.to_native(scalar)
+
+
 @handle_exceptions
 def promote_types_of_inputs(
     x1: Union[ivy.NativeArray, Number, Iterable[Number]],
@@ -2462,7 +2505,21 @@ def promote_types_of_inputs(
     array-like object. Therefore, outputs from this function should be
     used as inputs only for those functions that expect an array-like or
     tensor-like objects, otherwise it might give unexpected results.
-    """
+
+    Python scalars given along a NumPy array are returned as NumPy scalars of the
+    promoted dtype rather than as arrays, and the promoted dtype of each array dtype
+    and scalar type is only computed once.
+    """
+    if type(x2) in _SCALAR_TYPES and hasattr(x1, "dtype"):
+        ret = _promote_array_and_scalar(x1, x2, array_api_promotion)
+        if ret is not None:
+            ivy.utils.assertions._check_jax_x64_flag(ret[0].dtype)
+            return ret
+    elif type(x1) in _SCALAR_TYPES and hasattr(x2, "dtype"):
+        ret = _promote_array_and_scalar(x2, x1, array_api_promotion)
+        if ret is not None:
+            ivy.utils.assertions._check_jax_x64_flag(ret[0].dtype)
+            return ret[::-1]
 
     def _special_case(a1, a2):
         # check for float number and integer array case
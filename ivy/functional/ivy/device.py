@@ -2,12 +2,13 @@
 
 # global
 import os
-import gc
 import abc
+import itertools
 import math
 import psutil
 import warnings
 import types
+from concurrent.futures import ThreadPoolExecutor
 from typing import Type, Optional, Tuple
 
 # noinspection PyUnresolvedReferences
@@ -38,6 +39,7 @@ from ivy.func_wrapper import (
     handle_backend_invalid,
 )
 from ivy.utils.exceptions import handle_exceptions
+from ivy.utils import support_index
 
 default_device_stack = list()
 soft_device_mode_stack = list()
@@ -198,16 +200,7 @@ def get_all_ivy_arrays_on_dev(
     >>> print(z)
     {139740789224448:ivy.array([1,0,2])},
     """
-    device = ivy.as_ivy_dev(device)
-    all_arrays = list()
-    for obj in gc.get_objects():
-        if (
-            obj is ivy.data_classes.array.array.Array
-            and ivy.is_ivy_array(obj)
-            and ivy.dev(obj) == device
-        ):
-            all_arrays.append(obj)
-
+    all_arrays = ivy.utils.backend.handler._get_live_arrays(ivy.backend, device)
     return ivy.Container(dict(zip([str(id(a)) for a in all_arrays], all_arrays)))
 
 
@@ -1030,6 +1023,45 @@ def set_split_factor(
     split_factors[device] = factor
 
 
+def _split_row_bytes(inputs, input_axes):
+    # the number of bytes of one slice of all the inputs along their split axes
+    row_bytes = 0
+    for inp, inp_ax in zip(inputs, input_axes):
+        leaves = [inp] if ivy.is_array(inp) else inp.cont_to_flat_list()
+        for leaf in leaves:
+            if ivy.is_array(leaf) and leaf.shape[inp_ax]:
+                nbytes = math.prod(leaf.shape) * ivy.dtype_bits(leaf.dtype) / 8
+                row_bytes += nbytes / leaf.shape[inp_ax]
+    return row_bytes
+
+
+def _split_chunk_size_from_mem(
+    inputs, input_axes, dim_size, device, max_mem_fraction, num_in_flight
+):
+    device = ivy.as_ivy_dev(device)
+    free_bytes = (ivy.total_mem_on_dev(device) - ivy.used_mem_on_dev(device)) * 1e9
+    row_bytes = _split_row_bytes(inputs, input_axes)
+    if not row_bytes:
+        return dim_size
+    chunk_size = int(max_mem_fraction * free_bytes / (row_bytes * num_in_flight))
+    return min(max(chunk_size, 1), dim_size)
+
+
+def _map_in_flight(executor, fn, items, max_in_flight):
+    # like executor.map, but with at most max_in_flight items submitted at once, so
+    # that the pending chunks and their results are bounded in memory
+    items = iter(items)
+    futures = [
+        executor.submit(fn, item) for item in itertools.islice(items, max_in_flight)
+    ]
+    while futures:
+        ret = futures.pop(0).result()
+        for item in items:
+            futures.append(executor.submit(fn, item))
+            break
+        yield ret
+
+
 @handle_exceptions
 def split_func_call(
     func: Callable,
@@ -1043,6 +1075,9 @@ def split_func_call(
     output_axes: Optional[Union[int, Iterable[int]]] = None,
     stop_gradients: bool = False,
     device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
+    num_workers: int = 0,
+    devices: Optional[Iterable[Union[ivy.Device, ivy.NativeDevice]]] = None,
+    max_mem_fraction: Optional[float] = None,
 ) -> Union[ivy.Array, ivy.NativeArray]:
     """
     Call a function by splitting its inputs along a given axis, and calling the function
@@ -1073,14 +1108,49 @@ def split_func_call(
         Whether to stop the gradients for each computed return. Default is ``False``.
     device
         The device to set the split factor for. Sets the default device by default.
+        This is also the device whose memory is queried when `max_mem_fraction` is
+        set, and the device the returns are gathered on when `devices` is set.
+    num_workers
+        The number of threads calling the function on different chunks at the same
+        time. Default is ``0``, in which case the chunks are called one after another,
+        unless `devices` is specified.
+    devices
+        Devices to spread the chunks over, in a round robin fashion. Each chunk is
+        copied to its device before the call, and its returns are copied back to
+        `device`, and one thread is used per device unless `num_workers` is
+        specified, so that the copies of some chunks overlap with the computation of
+        others. Default is ``None``, in which case the chunks stay where they are.
+    max_mem_fraction
+        If specified, and neither `chunk_size` nor `max_chunk_size` are, the chunk
+        size is picked so that the inputs of the chunks in flight take up at most this
+        fraction of the currently free memory of `device`. The fraction should leave
+        room for the intermediate values and returns of `func`. Default is ``None``.
 
     Returns
     -------
     ret
         The return from the function, following input splitting and re-concattenation.
+        With the ``concat`` mode, array returns are written into preallocated arrays
+        as the chunks complete when the backend supports inplace updates.
     """
     if isinstance(input_axes, int):
         input_axes = [input_axes] * len(inputs)
+    devices = list(devices) if ivy.exists(devices) else []
+    num_workers = num_workers if num_workers else len(devices)
+    dim_size = inputs[0].shape[input_axes[0]]
+    if (
+        ivy.exists(max_mem_fraction)
+        and not ivy.exists(max_chunk_size)
+        and not ivy.exists(chunk_size)
+    ):
+        chunk_size = _split_chunk_size_from_mem(
+            inputs,
+            input_axes,
+            dim_size,
+            ivy.default_device(device),
+            max_mem_fraction,
+            max(2 * num_workers, 1),
+        )
     if not ivy.exists(max_chunk_size) and not ivy.exists(chunk_size):
         shape_key = "_".join([str(inp.shape) for inp in inputs])
         if shape_key in max_chunk_sizes:
@@ -1088,7 +1158,10 @@ def split_func_call(
         else:
             max_chunk_size = 0
         max_dim = max(
-            [inp.cont_shape[inp_ax] for inp, inp_ax in zip(inputs, input_axes)]
+            [
+                (inp.shape if ivy.is_array(inp) else inp.cont_shape)[inp_ax]
+                for inp, inp_ax in zip(inputs, input_axes)
+            ]
         )
         if max_dim > max_chunk_size:
             max_chunk_sizes[shape_key] = max_dim
@@ -1101,7 +1174,6 @@ def split_func_call(
         ),
         with_callable=True,
     )
-    dim_size = inputs[0].shape[input_axes[0]]
     if chunk_size >= dim_size:
         return func(*inputs)
     num_chunks = dim_size / chunk_size
@@ -1125,43 +1197,87 @@ def split_func_call(
         )
         for i, inp in enumerate(inputs)
     ]
-    is_mean = mode == "mean"
-    is_sum = mode == "sum"
     post_fn = ivy.stop_gradient if stop_gradients else lambda x: x
-    if is_mean or is_sum:
-        sums = None
-        for inps in zip(*inputs_split):
-            if not sums:
-                sums = func(*inps)
-                sums = (
-                    [post_fn(s) for s in sums]
-                    if isinstance(sums, tuple)
-                    else [post_fn(sums)]
+    ret_device = ivy.default_device(device)
+
+    def _call_chunk(idx_and_inps):
+        idx, inps = idx_and_inps
+        if devices:
+            chunk_device = devices[idx % len(devices)]
+            inps = [ivy.to_device(inp, chunk_device) for inp in inps]
+        ret = func(*inps)
+        ret = ret if isinstance(ret, tuple) else (ret,)
+        if devices:
+            ret = [ivy.to_device(r, ret_device) for r in ret]
+        return tuple(post_fn(r) for r in ret)
+
+    chunks = enumerate(zip(*inputs_split))
+    if num_workers:
+        executor = ThreadPoolExecutor(max_workers=num_workers)
+        rets = _map_in_flight(executor, _call_chunk, chunks, 2 * num_workers)
+    else:
+        executor = None
+        rets = map(_call_chunk, chunks)
+    try:
+        if mode in ("mean", "sum"):
+            sums = list(next(rets))
+            for ret in rets:
+                for i, r in enumerate(ret):
+                    sums[i] = sums[i] + r
+            sums_or_means = (
+                [s / num_chunks_ceiled for s in sums] if mode == "mean" else sums
+            )
+            return sums_or_means[0] if len(sums_or_means) == 1 else tuple(sums_or_means)
+        first = next(rets)
+        num_outputs = len(first)
+        if output_axes is None:
+            output_axes = [input_axes[0]] * num_outputs
+        elif isinstance(output_axes, int):
+            output_axes = [output_axes] * num_outputs
+        output_axes = [
+            ax % len(r.shape) if ivy.is_array(r) else ax
+            for ax, r in zip(output_axes, first)
+        ]
+
+        def _concat(rets):
+            ret = [
+                ivy.concat([r[i] for r in rets], axis=output_axes[i])
+                for i in range(num_outputs)
+            ]
+            return ret[0] if len(ret) == 1 else ret
+
+        # write the array returns into preallocated arrays as they arrive, rather
+        # than keeping all of them around for a final concat, whenever the returns
+        # follow the chunking of the inputs
+        preallocate = ivy.inplace_arrays_supported() and all(
+            ivy.is_array(r)
+            and not ivy.functional.ivy.gradients._is_variable(r)
+            and r.shape[ax] == chunk_sizes[0]
+            for r, ax in zip(first, output_axes)
+        )
+        if not preallocate:
+            return _concat([first] + list(rets))
+        ret = []
+        for r, ax in zip(first, output_axes):
+            shape = list(r.shape)
+            shape[ax] = dim_size
+            ret.append(ivy.empty(shape, dtype=ivy.dtype(r), device=ivy.dev(r)))
+        start = 0
+        for chunk, chunk_rets in zip(chunk_sizes, itertools.chain([first], rets)):
+            if any(r.shape[ax] != chunk for r, ax in zip(chunk_rets, output_axes)):
+                # the returns stopped following the chunking, so concat the rest
+                written = tuple(
+                    out[(slice(None),) * ax + (slice(0, start),)]
+                    for out, ax in zip(ret, output_axes)
                 )
-            else:
-                ret = func(*inps)
-                if isinstance(ret, tuple):
-                    for i, r in enumerate(ret):
-                        sums[i] = sums[i] + post_fn(r)
-                else:
-                    sums[0] = sums[0] + post_fn(ret)
-        sums_or_means = [s / num_chunks_ceiled for s in sums] if is_mean else sums
-        return sums_or_means[0] if len(sums_or_means) == 1 else tuple(sums_or_means)
-    rets = [func(*i) for i in zip(*inputs_split)]
-    rets = [
-        tuple([post_fn(r) for r in ret]) if isinstance(ret, tuple) else (post_fn(ret),)
-        for ret in rets
-    ]
-    num_outputs = len(rets[0])
-    if output_axes is None:
-        output_axes = [input_axes[0]] * num_outputs
-    elif isinstance(output_axes, int):
-        output_axes = [output_axes] * num_outputs
-    ret = [
-        ivy.concat([r[i] for r in rets], axis=output_axes[i])
-        for i in range(num_outputs)
-    ]
-    return ret[0] if len(ret) == 1 else ret
+                return _concat([written, chunk_rets] + list(rets))
+            for out, r, ax in zip(ret, chunk_rets, output_axes):
+                out[(slice(None),) * ax + (slice(start, start + chunk),)] = r
+            start += chunk
+        return ret[0] if len(ret) == 1 else ret
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
 
 
 def _is_valid_devices_attributes(fn: Callable) -> bool:
@@ -1220,6 +1336,7 @@ def _get_devices(fn: Callable, complement: bool = True) -> Tuple:
 
 @handle_exceptions
 @handle_nestable
+@support_index.indexed("supported_devices")
 def function_supported_devices(
     fn: Callable, recurse: bool = True
 ) -> Union[Tuple, dict]:
@@ -1272,6 +1389,7 @@ def function_supported_devices(
 
 @handle_exceptions
 @handle_nestable
+@support_index.indexed("unsupported_devices")
 def function_unsupported_devices(
     fn: Callable, recurse: bool = True
 ) -> Union[Tuple, dict]:
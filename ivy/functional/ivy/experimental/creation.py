@@ -686,6 +686,489 @@ def unsorted_segment_sum(
     return ivy.current_backend().unsorted_segment_sum(data, segment_ids, num_segments)
 
 
+@handle_exceptions
+@handle_backend_invalid
+@handle_nestable
+@to_native_arrays_and_back
+def unsorted_segment_max(
+    data: Union[ivy.Array, ivy.NativeArray],
+    segment_ids: Union[ivy.Array, ivy.NativeArray],
+    num_segments: Union[int, ivy.Array, ivy.NativeArray],
+) -> ivy.Array:
+    """
+    Compute the maximum along segments of an array. Segments are defined by an integer
+    array of segment IDs.
+
+    Note
+    ----
+    If the given segment ID `i` is negative, then the corresponding
+    value is dropped, and will not be included in the result. Segments without any
+    value are filled with the lowest value of the data type of `data`.
+
+    Parameters
+    ----------
+    data
+        The array from which to gather values.
+
+    segment_ids
+        Must be in the same size with the first dimension of `data`. Has to be
+        of integer data type. The index-th element of `segment_ids` array is
+        the segment identifier for the index-th element of `data`.
+
+    num_segments
+        An integer or array representing the total number of distinct segment IDs.
+
+    Returns
+    -------
+    ret
+        The output array, representing the result of a segmented max operation.
+        For each segment, it computes the maximum of values in `data` where
+        `segment_ids` equals to segment ID.
+    """
+    return ivy.current_backend().unsorted_segment_max(data, segment_ids, num_segments)
+
+
+@handle_exceptions
+@handle_backend_invalid
+@handle_nestable
+@to_native_arrays_and_back
+def unsorted_segment_prod(
+    data: Union[ivy.Array, ivy.NativeArray],
+    segment_ids: Union[ivy.Array, ivy.NativeArray],
+    num_segments: Union[int, ivy.Array, ivy.NativeArray],
+) -> ivy.Array:
+    """
+    Compute the product along segments of an array. Segments are defined by an integer
+    array of segment IDs.
+
+    Note
+    ----
+    If the given segment ID `i` is negative, then the corresponding
+    value is dropped, and will not be included in the result. Segments without any
+    value are filled with ones.
+
+    Parameters
+    ----------
+    data
+        The array from which to gather values.
+
+    segment_ids
+        Must be in the same size with the first dimension of `data`. Has to be
+        of integer data type. The index-th element of `segment_ids` array is
+        the segment identifier for the index-th element of `data`.
+
+    num_segments
+        An integer or array representing the total number of distinct segment IDs.
+
+    Returns
+    -------
+    ret
+        The output array, representing the result of a segmented prod operation.
+        For each segment, it computes the product of values in `data` where
+        `segment_ids` equals to segment ID.
+    """
+    return ivy.current_backend().unsorted_segment_prod(data, segment_ids, num_segments)
+
+
+def _segment_counts(data, segment_ids, num_segments):
+    # the number of values of each segment, at least one so that empty segments are
+    # zero once divided, broadcastable against the segmented values
+    counts = ivy.unsorted_segment_sum(
+        ivy.ones_like(segment_ids), segment_ids, num_segments
+    )
+    dtype = data.dtype if ivy.is_float_dtype(data) else ivy.default_float_dtype()
+    counts = ivy.astype(ivy.maximum(counts, 1), dtype)
+    return ivy.reshape(counts, (-1,) + (1,) * (len(data.shape) - 1))
+
+
+@handle_exceptions
+@handle_nestable
+@inputs_to_ivy_arrays
+def unsorted_segment_mean(
+    data: Union[ivy.Array, ivy.NativeArray],
+    segment_ids: Union[ivy.Array, ivy.NativeArray],
+    num_segments: Union[int, ivy.Array, ivy.NativeArray],
+) -> ivy.Array:
+    """
+    Compute the mean along segments of an array. Segments are defined by an integer
+    array of segment IDs.
+
+    Note
+    ----
+    If the given segment ID `i` is negative, then the corresponding
+    value is dropped, and will not be included in the result. Segments without any
+    value are filled with zeros, and integer data is averaged in the default float
+    data type.
+
+    Parameters
+    ----------
+    data
+        The array from which to gather values.
+
+    segment_ids
+        Must be in the same size with the first dimension of `data`. Has to be
+        of integer data type. The index-th element of `segment_ids` array is
+        the segment identifier for the index-th element of `data`.
+
+    num_segments
+        An integer or array representing the total number of distinct segment IDs.
+
+    Returns
+    -------
+    ret
+        The output array, representing the result of a segmented mean operation.
+        For each segment, it computes the mean of values in `data` where
+        `segment_ids` equals to segment ID.
+
+    Examples
+    --------
+    >>> data = ivy.array([[1., 2.], [3., 4.], [5., 6.]])
+    >>> segment_ids = ivy.array([0, 2, 0])
+    >>> ivy.unsorted_segment_mean(data, segment_ids, 3)
+    ivy.array([[3., 4.],
+               [0., 0.],
+               [3., 4.]])
+    """
+    total = ivy.unsorted_segment_sum(data, segment_ids, num_segments)
+    return ivy.divide(total, _segment_counts(data, segment_ids, num_segments))
+
+
+@handle_exceptions
+@handle_nestable
+@inputs_to_ivy_arrays
+def unsorted_segment_sqrt_n(
+    data: Union[ivy.Array, ivy.NativeArray],
+    segment_ids: Union[ivy.Array, ivy.NativeArray],
+    num_segments: Union[int, ivy.Array, ivy.NativeArray],
+) -> ivy.Array:
+    """
+    Compute the sum along segments of an array, divided by the square root of the
+    number of values of each segment. Segments are defined by an integer array of
+    segment IDs.
+
+    Note
+    ----
+    If the given segment ID `i` is negative, then the corresponding
+    value is dropped, and will not be included in the result. Segments without any
+    value are filled with zeros, and integer data is summed in the default float
+    data type.
+
+    Parameters
+    ----------
+    data
+        The array from which to gather values.
+
+    segment_ids
+        Must be in the same size with the first dimension of `data`. Has to be
+        of integer data type. The index-th element of `segment_ids` array is
+        the segment identifier for the index-th element of `data`.
+
+    num_segments
+        An integer or array representing the total number of distinct segment IDs.
+
+    Returns
+    -------
+    ret
+        The output array, representing the result of a segmented sqrt_n operation.
+        For each segment, it computes the sum of values in `data` where
+        `segment_ids` equals to segment ID, divided by the square root of their
+        number.
+
+    Examples
+    --------
+    >>> data = ivy.array([1., 2., 3., 4.])
+    >>> segment_ids = ivy.array([0, 1, 1, 1])
+    >>> ivy.unsorted_segment_sqrt_n(data, segment_ids, 2)
+    ivy.array([1.        , 5.19615269])
+    """
+    total = ivy.unsorted_segment_sum(data, segment_ids, num_segments)
+    counts = _segment_counts(data, segment_ids, num_segments)
+    return ivy.divide(total, ivy.sqrt(counts))
+
+
+def _sorted_segments(segment_ids, num_segments):
+    if segment_ids.shape[0] > 1 and ivy.any(segment_ids[1:] < segment_ids[:-1]):
+        raise ivy.utils.exceptions.IvyValueError(
+            "segment_ids must be sorted in ascending order"
+        )
+    if num_segments is None:
+        num_segments = int(segment_ids[-1]) + 1 if segment_ids.shape[0] else 0
+    return num_segments
+
+
+@handle_exceptions
+@handle_nestable
+@inputs_to_ivy_arrays
+def segment_sum(
+    data: Union[ivy.Array, ivy.NativeArray],
+    segment_ids: Union[ivy.Array, ivy.NativeArray],
+    num_segments: Optional[int] = None,
+) -> ivy.Array:
+    """
+    Compute the sum along segments of an array, with sorted segment IDs. This is
+    :func:`ivy.unsorted_segment_sum`, with `num_segments` inferred from the
+    segment IDs by default.
+
+    Parameters
+    ----------
+    data
+        The array from which to gather values.
+
+    segment_ids
+        Must be in the same size with the first dimension of `data`. Has to be
+        of integer data type, and sorted. The index-th element of `segment_ids`
+        array is the segment identifier for the index-th element of `data`.
+
+    num_segments
+        The total number of distinct segment IDs. Default is ``None``, the last
+        segment ID plus one.
+
+    Returns
+    -------
+    ret
+        The output array, of the sum of the values of each segment.
+
+    Examples
+    --------
+    >>> data = ivy.array([[1, 2], [3, 4], [5, 6]])
+    >>> segment_ids = ivy.array([0, 0, 2])
+    >>> ivy.segment_sum(data, segment_ids)
+    ivy.array([[4, 6],
+               [0, 0],
+               [5, 6]])
+    """
+    num_segments = _sorted_segments(segment_ids, num_segments)
+    return ivy.unsorted_segment_sum(data, segment_ids, num_segments)
+
+
+@handle_exceptions
+@handle_nestable
+@inputs_to_ivy_arrays
+def segment_min(
+    data: Union[ivy.Array, ivy.NativeArray],
+    segment_ids: Union[ivy.Array, ivy.NativeArray],
+    num_segments: Optional[int] = None,
+) -> ivy.Array:
+    """
+    Compute the minimum along segments of an array, with sorted segment IDs. This is
+    :func:`ivy.unsorted_segment_min`, with `num_segments` inferred from the
+    segment IDs by default.
+
+    Parameters
+    ----------
+    data
+        The array from which to gather values.
+
+    segment_ids
+        Must be in the same size with the first dimension of `data`. Has to be
+        of integer data type, and sorted. The index-th element of `segment_ids`
+        array is the segment identifier for the index-th element of `data`.
+
+    num_segments
+        The total number of distinct segment IDs. Default is ``None``, the last
+        segment ID plus one.
+
+    Returns
+    -------
+    ret
+        The output array, of the minimum of the values of each segment.
+
+    Examples
+    --------
+    >>> data = ivy.array([[1, 2], [3, 4], [5, 6]])
+    >>> segment_ids = ivy.array([0, 0, 2])
+    >>> ivy.segment_min(data, segment_ids, num_segments=4)
+    ivy.array([[         1,          2],
+               [2147483647, 2147483647],
+               [         5,          6],
+               [2147483647, 2147483647]])
+    """
+    num_segments = _sorted_segments(segment_ids, num_segments)
+    return ivy.unsorted_segment_min(data, segment_ids, num_segments)
+
+
+@handle_exceptions
+@handle_nestable
+@inputs_to_ivy_arrays
+def segment_max(
+    data: Union[ivy.Array, ivy.NativeArray],
+    segment_ids: Union[ivy.Array, ivy.NativeArray],
+    num_segments: Optional[int] = None,
+) -> ivy.Array:
+    """
+    Compute the maximum along segments of an array, with sorted segment IDs. This is
+    :func:`ivy.unsorted_segment_max`, with `num_segments` inferred from the
+    segment IDs by default.
+
+    Parameters
+    ----------
+    data
+        The array from which to gather values.
+
+    segment_ids
+        Must be in the same size with the first dimension of `data`. Has to be
+        of integer data type, and sorted. The index-th element of `segment_ids`
+        array is the segment identifier for the index-th element of `data`.
+
+    num_segments
+        The total number of distinct segment IDs. Default is ``None``, the last
+        segment ID plus one.
+
+    Returns
+    -------
+    ret
+        The output array, of the maximum of the values of each segment.
+
+    Examples
+    --------
+    >>> data = ivy.array([[1, 2], [3, 4], [5, 6]])
+    >>> segment_ids = ivy.array([0, 0, 2])
+    >>> ivy.segment_max(data, segment_ids)
+    ivy.array([[          3,           4],
+               [-2147483648, -2147483648],
+               [          5,           6]])
+    """
+    num_segments = _sorted_segments(segment_ids, num_segments)
+    return ivy.unsorted_segment_max(data, segment_ids, num_segments)
+
+
+@handle_exceptions
+@handle_nestable
+@inputs_to_ivy_arrays
+def segment_prod(
+    data: Union[ivy.Array, ivy.NativeArray],
+    segment_ids: Union[ivy.Array, ivy.NativeArray],
+    num_segments: Optional[int] = None,
+) -> ivy.Array:
+    """
+    Compute the product along segments of an array, with sorted segment IDs. This is
+    :func:`ivy.unsorted_segment_prod`, with `num_segments` inferred from the
+    segment IDs by default.
+
+    Parameters
+    ----------
+    data
+        The array from which to gather values.
+
+    segment_ids
+        Must be in the same size with the first dimension of `data`. Has to be
+        of integer data type, and sorted. The index-th element of `segment_ids`
+        array is the segment identifier for the index-th element of `data`.
+
+    num_segments
+        The total number of distinct segment IDs. Default is ``None``, the last
+        segment ID plus one.
+
+    Returns
+    -------
+    ret
+        The output array, of the product of the values of each segment.
+
+    Examples
+    --------
+    >>> data = ivy.array([[1, 2], [3, 4], [5, 6]])
+    >>> segment_ids = ivy.array([0, 0, 2])
+    >>> ivy.segment_prod(data, segment_ids)
+    ivy.array([[3, 8],
+               [1, 1],
+               [5, 6]])
+    """
+    num_segments = _sorted_segments(segment_ids, num_segments)
+    return ivy.unsorted_segment_prod(data, segment_ids, num_segments)
+
+
+@handle_exceptions
+@handle_nestable
+@inputs_to_ivy_arrays
+def segment_mean(
+    data: Union[ivy.Array, ivy.NativeArray],
+    segment_ids: Union[ivy.Array, ivy.NativeArray],
+    num_segments: Optional[int] = None,
+) -> ivy.Array:
+    """
+    Compute the mean along segments of an array, with sorted segment IDs. This is
+    :func:`ivy.unsorted_segment_mean`, with `num_segments` inferred from the
+    segment IDs by default.
+
+    Parameters
+    ----------
+    data
+        The array from which to gather values.
+
+    segment_ids
+        Must be in the same size with the first dimension of `data`. Has to be
+        of integer data type, and sorted. The index-th element of `segment_ids`
+        array is the segment identifier for the index-th element of `data`.
+
+    num_segments
+        The total number of distinct segment IDs. Default is ``None``, the last
+        segment ID plus one.
+
+    Returns
+    -------
+    ret
+        The output array, of the mean of the values of each segment.
+
+    Examples
+    --------
+    >>> data = ivy.array([[1., 2.], [3., 4.], [5., 6.]])
+    >>> segment_ids = ivy.array([0, 0, 2])
+    >>> ivy.segment_mean(data, segment_ids)
+    ivy.array([[2., 3.],
+               [0., 0.],
+               [5., 6.]])
+    """
+    num_segments = _sorted_segments(segment_ids, num_segments)
+    return ivy.unsorted_segment_mean(data, segment_ids, num_segments)
+
+
+@handle_exceptions
+@handle_nestable
+@inputs_to_ivy_arrays
+def segment_sqrt_n(
+    data: Union[ivy.Array, ivy.NativeArray],
+    segment_ids: Union[ivy.Array, ivy.NativeArray],
+    num_segments: Optional[int] = None,
+) -> ivy.Array:
+    """
+    Compute the sum along segments of an array, divided by the square root of the
+    number of values of each segment, with sorted segment IDs. This is
+    :func:`ivy.unsorted_segment_sqrt_n`, with `num_segments` inferred from the
+    segment IDs by default.
+
+    Parameters
+    ----------
+    data
+        The array from which to gather values.
+
+    segment_ids
+        Must be in the same size with the first dimension of `data`. Has to be
+        of integer data type, and sorted. The index-th element of `segment_ids`
+        array is the segment identifier for the index-th element of `data`.
+
+    num_segments
+        The total number of distinct segment IDs. Default is ``None``, the last
+        segment ID plus one.
+
+    Returns
+    -------
+    ret
+        The output array, of the sum of the values of each segment divided by the
+        square root of their number.
+
+    Examples
+    --------
+    >>> data = ivy.array([[1., 2.], [3., 4.], [5., 6.]])
+    >>> segment_ids = ivy.array([0, 0, 2])
+    >>> ivy.segment_sqrt_n(data, segment_ids)
+    ivy.array([[2.82842708, 4.24264097],
+               [0.        , 0.        ],
+               [5.        , 6.        ]])
+    """
+    num_segments = _sorted_segments(segment_ids, num_segments)
+    return ivy.unsorted_segment_sqrt_n(data, segment_ids, num_segments)
+
+
 @handle_exceptions
 @handle_nestable
 @handle_out_argument
@@ -1046,6 +1529,9 @@ def mel_weight_matrix(
     range on the mel scale. This function defines the mel scale in terms of a frequency
     in hertz according to the following formula: mel(f) = 2595 * log10(1 + f/700)
 
+    The matrices are cached by each backend, so that they aren't recomputed for every
+    spectrogram, and shouldn't be updated in place.
+
     Parameters
     ----------
     num_mel_bins
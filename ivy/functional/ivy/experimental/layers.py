@@ -2805,6 +2805,67 @@ def rfftn(
     return ivy.current_backend(x).rfftn(x, s=s, axes=axes, norm=norm, out=out)
 
 
+def _stft_params(num_samples, frame_length, frame_step, fft_length, pad_end):
+    # the fft length, number of frames and padding of the signals of ivy.stft
+    if fft_length is None:
+        fft_length = 1
+        while fft_length < frame_length:
+            fft_length *= 2
+    if pad_end:
+        num_frames = -(-num_samples // frame_step)
+        pad_length = max(0, frame_length + frame_step * (num_frames - 1) - num_samples)
+    else:
+        num_frames = max(0, 1 + (num_samples - frame_length) // frame_step)
+        pad_length = 0
+    return fft_length, num_frames, pad_length
+
+
+def _istft_params(num_bins, frame_length, frame_step, fft_length):
+    # the fft length of ivy.istft, which must give the number of bins of the stfts
+    for name, value in [
+        ("frame_length", frame_length),
+        ("frame_step", frame_step),
+        ("fft_length", fft_length),
+    ]:
+        if value is None and name == "fft_length":
+            continue
+        if not isinstance(value, int):
+            raise ivy.utils.exceptions.IvyError(
+                f"Expecting <class 'int'> instead of {type(value)}"
+            )
+        if value < 1:
+            raise ivy.utils.exceptions.IvyError(
+                f"Invalid data points {value}, expecting {name} larger than or equal"
+                " to 1"
+            )
+    fft_length = _stft_params(0, frame_length, frame_step, fft_length, False)[0]
+    if num_bins != fft_length // 2 + 1:
+        raise ivy.utils.exceptions.IvyError(
+            f"Expecting {fft_length // 2 + 1} frequency bins for an fft_length of"
+            f" {fft_length}, but got {num_bins}"
+        )
+    return fft_length
+
+
+def _overlap_and_add(frames, frame_step):
+    # sum the [..., frames, frame_length] frames, frame_step samples apart, by
+    # splitting them into blocks of frame_step samples and adding each block
+    # position of all the frames at once
+    *batch, num_frames, frame_length = frames.shape
+    num_blocks = -(-frame_length // frame_step)
+    no_pad = [(0, 0)] * len(batch)
+    frames = ivy.pad(
+        frames, no_pad + [(0, 0), (0, num_blocks * frame_step - frame_length)]
+    )
+    frames = ivy.reshape(frames, (*batch, num_frames, num_blocks, frame_step))
+    ret = None
+    for i in range(num_blocks):
+        block = ivy.pad(frames[..., i, :], no_pad + [(i, num_blocks - 1 - i), (0, 0)])
+        ret = block if ret is None else ret + block
+    ret = ivy.reshape(ret, (*batch, (num_frames + num_blocks - 1) * frame_step))
+    return ret[..., : (num_frames - 1) * frame_step + frame_length]
+
+
 # stft
 @handle_exceptions
 @handle_backend_invalid
@@ -2871,3 +2932,92 @@ def stft(
         name=name,
         out=out,
     )
+
+
+@handle_exceptions
+@handle_nestable
+@handle_array_like_without_promotion
+@handle_out_argument
+@inputs_to_ivy_arrays
+@handle_array_function
+def istft(
+    stfts: Union[ivy.Array, ivy.NativeArray],
+    frame_length: int,
+    frame_step: int,
+    /,
+    *,
+    fft_length: Optional[int] = None,
+    window_fn: Optional[Callable] = None,
+    name: Optional[str] = None,
+    out: Optional[ivy.Array] = None,
+) -> ivy.Array:
+    """
+    Compute the inverse Short-time Fourier Transform of stfts.
+
+    Each frame is transformed back with an inverse real FFT, cut to frame_length
+    samples and windowed, and the frames are overlap-added frame_step samples apart.
+    This inverts :func:`ivy.stft` when the windows of the two transforms sum to one
+    over the overlapping frames, such as with no window and a frame_step equal to
+    frame_length.
+
+    Parameters
+    ----------
+    stfts
+        A [..., frames, fft_unique_bins] array of complex STFT values, where
+        fft_unique_bins is fft_length // 2 + 1.
+    frame_length
+        An integer scalar. The window length in samples.
+    frame_step
+        An integer scalar. The number of samples to step.
+    fft_length
+        An integer scalar. The size of the FFT that produced stfts. If not provided,
+        uses the smallest power of 2 enclosing frame_length.
+    window_fn
+        A callable that takes a window length and returns a [window_length] array of
+        samples, to window the frames with. If set to None, no windowing is used.
+    name
+        An optional name for the operation.
+    out
+        Optional output array for writing the result.
+
+    Returns
+    -------
+    ret
+        A [..., samples] array of real signals, where samples is
+        (frames - 1) * frame_step + frame_length.
+
+    Examples
+    --------
+    >>> x = ivy.array([1., 2., 3., 4., 5., 6.])
+    >>> y = ivy.stft(x, 3, 3, fft_length=4)
+    >>> ivy.istft(y, 3, 3, fft_length=4)
+    ivy.array([1., 2., 3., 4., 5., 6.])
+    """
+    fft_length = _istft_params(stfts.shape[-1], frame_length, frame_step, fft_length)
+    # the inverse real fft, from the unique half of the spectrum, is the real part
+    # of the inverse fft with the bins that have a conjugate pair counted twice
+    weights = [1.0] + [2.0] * (stfts.shape[-1] - 1)
+    if fft_length % 2 == 0:
+        weights[-1] = 1.0
+    real_dtype = "float64" if stfts.dtype == "complex128" else "float32"
+    weights = ivy.asarray(weights, dtype=real_dtype, device=ivy.dev(stfts))
+    frames = ivy.real(ivy.ifft(stfts * weights, -1, n=fft_length))
+    frames = frames.astype(real_dtype)
+    if frame_length > fft_length:
+        no_pad = [(0, 0)] * (frames.ndim - 1)
+        frames = ivy.pad(frames, no_pad + [(0, frame_length - fft_length)])
+    frames = frames[..., :frame_length]
+    if window_fn is not None:
+        frames = frames * window_fn(frame_length)
+    return _overlap_and_add(frames, frame_step)
+
+
+istft.mixed_backend_wrappers = {
+    "to_add": (
+        "handle_backend_invalid",
+        "inputs_to_native_arrays",
+        "outputs_to_ivy_arrays",
+        "handle_device_shifting",
+    ),
+    "to_skip": ("inputs_to_ivy_arrays",),
+}
@@ -1,5 +1,6 @@
 # global
 import logging
+import math
 from typing import Union, Optional, Tuple, List, Sequence, Literal
 
 # local
@@ -903,7 +904,7 @@ def multi_mode_dot(
     return res
 
 
-def _svd_checks(x, n_eigenvecs=None):
+def _svd_checks(x, n_eigenvecs=None, shape=None):
     """
     Run common checks to all of the SVD methods.
 
@@ -912,6 +913,8 @@ def _svd_checks(x, n_eigenvecs=None):
     matrix : 2D-array
     n_eigenvecs : int, optional, default is None
         if specified, number of eigen[vectors-values] to return
+    shape : tuple, optional, default is None
+        if specified, the shape of the matrix, which `x` needn't have been reshaped to
 
     Returns
     -------
@@ -926,7 +929,7 @@ def _svd_checks(x, n_eigenvecs=None):
     # if ndims != 2:
     #    raise ValueError(f"matrix be a matrix. matrix.ndim is {ndims} != 2")
 
-    dim_1, dim_2 = ivy.shape(x)[-2:]
+    dim_1, dim_2 = ivy.shape(x)[-2:] if shape is None else shape
     min_dim, max_dim = min(dim_1, dim_2), max(dim_1, dim_2)
 
     if n_eigenvecs is None:
@@ -1153,8 +1156,238 @@ def truncated_svd(
         return S[:n_eigenvecs]
 
 
-# TODO uncommment the code below when these svd
-# methods have been added
+def _unfolding_blocks(x, mode, block_size, rows=False):
+    # yield the mode-`mode` unfolding of `x` a block of at most `block_size` columns,
+    # or rows, at a time, in order. Viewing `x` as (outer, rows, inner) doesn't copy
+    # it, and each block of the unfolding is gathered from whole slices of it.
+    shape = ivy.shape(x)
+    n_rows = shape[mode]
+    n_outer = math.prod(shape[:mode])
+    n_inner = math.prod(shape[mode + 1 :])
+    x = ivy.reshape(x, (n_outer, n_rows, n_inner))
+    if rows:
+        for i in range(0, n_rows, block_size):
+            block = ivy.permute_dims(x[:, i : i + block_size], (1, 0, 2))
+            yield ivy.reshape(block, (block.shape[0], -1))
+    elif n_inner >= block_size:
+        for i in range(n_outer):
+            for j in range(0, n_inner, block_size):
+                yield x[i, :, j : j + block_size]
+    else:
+        step = block_size // n_inner
+        for i in range(0, n_outer, step):
+            block = ivy.permute_dims(x[i : i + step], (1, 0, 2))
+            yield ivy.reshape(block, (n_rows, -1))
+
+
+def _gram_eigh(gram, n_eigenvecs):
+    # the leading eigenvectors of a Gram matrix are singular vectors of the matrix,
+    # and the square roots of its eigenvalues the singular values
+    S, U = ivy.eigh(gram)
+    S = ivy.sqrt(ivy.maximum(ivy.flip(S)[:n_eigenvecs], 0))
+    U = ivy.flip(U, axis=1)[:, :n_eigenvecs]
+    # the singular vectors of zero singular values are returned as zeros
+    return U, S, ivy.where(S > 0, S, ivy.ones_like(S))
+
+
+# The following function has been adapted from TensorLy
+# https://github.com/tensorly/tensorly/blob/main/tensorly/tenalg/svd.py
+@handle_nestable
+@handle_exceptions
+@handle_array_like_without_promotion
+@inputs_to_ivy_arrays
+@handle_array_function
+@handle_device_shifting
+def randomized_svd(
+    x: Union[ivy.Array, ivy.NativeArray],
+    /,
+    n_eigenvecs: Optional[int] = None,
+    *,
+    n_oversamples: int = 5,
+    n_iter: int = 2,
+    seed: Optional[int] = None,
+) -> Tuple[ivy.Array, ivy.Array, ivy.Array]:
+    """
+    Compute a truncated SVD on `x` using a randomized range finder [1].
+
+    The range of `x` is sketched by `n_eigenvecs + n_oversamples` random projections,
+    refined by `n_iter` power iterations, and `x` is only decomposed within that
+    range. This is much cheaper than ``truncated_svd`` when `n_eigenvecs` is small
+    compared to the dimensions of `x`.
+
+    Parameters
+    ----------
+    x
+        2D-array
+    n_eigenvecs
+        if specified, number of eigen[vectors-values] to return
+        else full matrices will be returned
+    n_oversamples
+        number of random projections sketched on top of `n_eigenvecs`, which improves
+        the accuracy of the trailing singular vectors.
+    n_iter
+        number of power iterations, which improve the accuracy when the singular
+        values of `x` decay slowly.
+    seed
+        seed of the random projections.
+
+    Returns
+    -------
+    ret
+        a namedtuple ``(U, S, Vh)``
+
+    [1]: Halko, Martinsson & Tropp. Finding structure with randomness: Probabilistic
+    algorithms for constructing approximate matrix decompositions. SIAM Review,
+    53(2): 217-288, 2011.
+    """
+    n_eigenvecs, min_dim, _ = _svd_checks(x, n_eigenvecs=n_eigenvecs)
+    n_dims = n_eigenvecs + n_oversamples
+    if n_dims >= min_dim:
+        # the sketch would be as large as x
+        return truncated_svd(x, n_eigenvecs=n_eigenvecs)
+
+    Q = ivy.random_normal(shape=(x.shape[1], n_dims), dtype=x.dtype, seed=seed)
+    Q, _ = ivy.qr(ivy.matmul(x, Q))
+    for _ in range(n_iter):
+        # orthonormalise in between, or the sketch collapses onto the leading vector
+        Q, _ = ivy.qr(ivy.matmul(x, Q, transpose_a=True))
+        Q, _ = ivy.qr(ivy.matmul(x, Q))
+
+    U, S, Vh = ivy.svd(ivy.matmul(Q, x, transpose_a=True), full_matrices=False)
+    U = ivy.matmul(Q, U[:, :n_eigenvecs])
+    return U, S[:n_eigenvecs], Vh[:n_eigenvecs, :]
+
+
+# The following function has been adapted from TensorLy
+# https://github.com/tensorly/tensorly/blob/main/tensorly/tenalg/svd.py
+@handle_nestable
+@handle_exceptions
+@handle_array_like_without_promotion
+@inputs_to_ivy_arrays
+@handle_array_function
+@handle_device_shifting
+def symeig_svd(
+    x: Union[ivy.Array, ivy.NativeArray],
+    /,
+    n_eigenvecs: Optional[int] = None,
+) -> Tuple[ivy.Array, ivy.Array, ivy.Array]:
+    """
+    Compute a truncated SVD on `x` from the eigendecomposition of its Gram matrix.
+
+    The Gram matrix is taken along the smaller dimension of `x`, which makes this much
+    cheaper than ``truncated_svd`` for tall-skinny or short-wide matrices. Squaring
+    `x` also squares its condition number, so the smallest singular values lose
+    accuracy. Requests for more singular vectors than ``min(x.shape)`` fall back to
+    ``truncated_svd``.
+
+    Parameters
+    ----------
+    x
+        2D-array
+    n_eigenvecs
+        if specified, number of eigen[vectors-values] to return
+        else full matrices will be returned
+
+    Returns
+    -------
+    ret
+        a namedtuple ``(U, S, Vh)``
+    """
+    n_eigenvecs, min_dim, _ = _svd_checks(x, n_eigenvecs=n_eigenvecs)
+    if n_eigenvecs > min_dim:
+        # the singular vectors completing the larger dimension aren't in either Gram
+        return truncated_svd(x, n_eigenvecs=n_eigenvecs)
+
+    if x.shape[0] > x.shape[1]:
+        V, S, S_safe = _gram_eigh(ivy.matmul(x, x, transpose_a=True), n_eigenvecs)
+        return ivy.matmul(x, V) / S_safe, S, ivy.matrix_transpose(V)
+    U, S, S_safe = _gram_eigh(ivy.matmul(x, x, transpose_b=True), n_eigenvecs)
+    return U, S, ivy.matmul(U, x, transpose_a=True) / ivy.expand_dims(S_safe, axis=1)
+
+
+@handle_nestable
+@handle_exceptions
+@handle_array_like_without_promotion
+@inputs_to_ivy_arrays
+@handle_array_function
+@handle_device_shifting
+def streaming_svd(
+    x: Union[ivy.Array, ivy.NativeArray],
+    /,
+    n_eigenvecs: Optional[int] = None,
+    *,
+    mode: Optional[int] = None,
+    block_size: int = 4096,
+) -> Tuple[ivy.Array, ivy.Array, ivy.Array]:
+    """
+    Compute a truncated SVD on `x`, or on an unfolding of `x`, a block of columns at a
+    time.
+
+    The Gram matrix along the smaller dimension of the matrix is accumulated over
+    blocks of at most `block_size` columns, or rows for tall matrices, so that only one
+    block is held in memory besides `x` itself. If `mode` is given, the mode-`mode`
+    unfolding of the tensor `x` is decomposed without ever being materialised.
+
+    Parameters
+    ----------
+    x
+        2D-array, or tensor if `mode` is given
+    n_eigenvecs
+        if specified, number of eigen[vectors-values] to return
+        else full matrices will be returned
+    mode
+        if specified, decompose ``ivy.unfold(x, mode)`` instead of `x`
+    block_size
+        maximum number of columns, or rows for tall matrices, in each block.
+
+    Returns
+    -------
+    ret
+        a namedtuple ``(U, S, Vh)``. Unlike ``truncated_svd``, at most as many right
+        singular vectors as the matrix has rows are returned.
+    """
+    if mode is None:
+        mode = 0
+        if len(x.shape) != 2:
+            raise ValueError(
+                f"expected x to be a matrix if no mode is given, got {len(x.shape)}"
+                " dimension(s)"
+            )
+    n_rows = x.shape[mode]
+    n_cols = math.prod(x.shape) // n_rows
+    n_eigenvecs, min_dim, _ = _svd_checks(
+        x, n_eigenvecs=n_eigenvecs, shape=(n_rows, n_cols)
+    )
+
+    # the Gram matrix is taken along the smaller dimension, unless more left singular
+    # vectors than columns are requested
+    rows = n_rows > n_cols and n_eigenvecs <= n_cols
+    gram_size = n_cols if rows else n_rows
+    gram = ivy.zeros((gram_size, gram_size), dtype=x.dtype, device=x.device)
+    for block in _unfolding_blocks(x, mode, block_size, rows=rows):
+        gram = gram + ivy.matmul(block, block, transpose_a=rows, transpose_b=not rows)
+    vecs, S, S_safe = _gram_eigh(gram, n_eigenvecs)
+
+    if rows:
+        U = ivy.concat(
+            [
+                ivy.matmul(block, vecs) / S_safe
+                for block in _unfolding_blocks(x, mode, block_size, rows=True)
+            ],
+            axis=0,
+        )
+        return U, S, ivy.matrix_transpose(vecs)
+    S_safe = ivy.expand_dims(S_safe, axis=1)
+    Vh = ivy.concat(
+        [
+            ivy.matmul(vecs, block, transpose_a=True) / S_safe
+            for block in _unfolding_blocks(x, mode, block_size)
+        ],
+        axis=1,
+    )
+    return vecs, S[:min_dim], Vh[: min(n_eigenvecs, n_cols), :]
+
+
 def _svd_interface(
     matrix,
     method="truncated_svd",
@@ -1164,18 +1397,33 @@ def _svd_interface(
     non_negative=None,
     mask=None,
     n_iter_mask_imputation=5,
+    mode=None,
+    seed=None,
     **kwargs,
 ):
+    # if `mode` is given, `matrix` is a tensor, whose mode-`mode` unfolding is only
+    # materialised if the method needs it
     if method == "truncated_svd":
         svd_fun = truncated_svd
-    # elif method == "symeig_svd":
-    #    svd_fun = symeig_svd
-    # elif method == "randomized_svd":
-    #    svd_fun = randomized_svd
+    elif method == "symeig_svd":
+        svd_fun = symeig_svd
+    elif method == "randomized_svd":
+        svd_fun = randomized_svd
+        kwargs.setdefault("seed", seed)
+    elif method == "streaming_svd":
+        svd_fun = streaming_svd
+        if mask is None and mode is not None:
+            kwargs["mode"] = mode
+            mode = None
     elif callable(method):
         svd_fun = method
     else:
-        raise ValueError("Invalid Choice")
+        raise ValueError(
+            f"Invalid svd method {method}, expected one of 'truncated_svd',"
+            " 'symeig_svd', 'randomized_svd', 'streaming_svd' or a callable"
+        )
+    if mode is not None:
+        matrix = ivy.unfold(matrix, mode)
 
     U, S, V = svd_fun(matrix, n_eigenvecs=n_eigenvecs, **kwargs)
     if mask is not None and n_eigenvecs is not None:
@@ -1196,9 +1444,6 @@ def _svd_interface(
 # This function has been adapted from TensorLy
 # https://github.com/tensorly/tensorly/blob/main/tensorly/decomposition/_tucker.py#L22
 
-
-# TODO update svd type hints when other svd methods have been added
-# also update the test
 @handle_nestable
 @handle_exceptions
 @handle_array_like_without_promotion
@@ -1213,7 +1458,9 @@ def initialize_tucker(
     *,
     init: Optional[Union[Literal["svd", "random"], ivy.TuckerTensor]] = "svd",
     seed: Optional[int] = None,
-    svd: Optional[Literal["truncated_svd"]] = "truncated_svd",
+    svd: Optional[
+        Literal["truncated_svd", "symeig_svd", "randomized_svd", "streaming_svd"]
+    ] = "truncated_svd",
     non_negative: Optional[bool] = False,
     mask: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
     svd_mask_repeats: Optional[int] = 5,
@@ -1234,11 +1481,12 @@ def initialize_tucker(
         modes to consider in the input tensor
     seed
         Used to create a random seed distribution
-        when init == 'random'
+        when init == 'random' or svd == 'randomized_svd'
     init
         initialization scheme for tucker decomposition.
     svd
-        function to use to compute the SVD
+        function to use to compute the SVD, one of 'truncated_svd', 'symeig_svd',
+        'randomized_svd' and 'streaming_svd', or a callable
     non_negative
         if True, non-negative factors are returned
     mask
@@ -1271,13 +1519,14 @@ def initialize_tucker(
         for index, mode in enumerate(modes):
             mask_unfold = None if mask is None else ivy.unfold(mask, mode)
             U, _, _ = _svd_interface(
-                ivy.unfold(x, mode),
+                x,
                 n_eigenvecs=rank[index],
                 method=svd,
                 non_negative=non_negative,
                 mask=mask_unfold,
                 n_iter_mask_imputation=svd_mask_repeats,
-                # random_state=random_state,
+                mode=mode,
+                seed=seed,
             )
             factors.append(U)
 
@@ -1326,7 +1575,9 @@ def partial_tucker(
     *,
     n_iter_max: Optional[int] = 100,
     init: Optional[Union[Literal["svd", "random"], ivy.TuckerTensor]] = "svd",
-    svd: Optional[Literal["truncated_svd"]] = "truncated_svd",
+    svd: Optional[
+        Literal["truncated_svd", "symeig_svd", "randomized_svd", "streaming_svd"]
+    ] = "truncated_svd",
     seed: Optional[int] = None,
     mask: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
     svd_mask_repeats: Optional[int] = 5,
@@ -1357,10 +1608,11 @@ def partial_tucker(
         if a TuckerTensor is provided, this is used for initialization
     svd
         str, default is 'truncated_svd'
-        function to use to compute the SVD,
+        function to use to compute the SVD, one of 'truncated_svd', 'symeig_svd',
+        'randomized_svd' and 'streaming_svd', or a callable
     seed
         Used to create a random seed distribution
-        when init == 'random'
+        when init == 'random' or svd == 'randomized_svd'
     mask
         array of booleans with the same shape as ``tensor`` should be 0 where
         the values are missing and 1 everywhere else. Note:  if tensor is
@@ -1430,9 +1682,11 @@ def partial_tucker(
                 x, factors, modes=modes, skip=index, transpose=True
             )
             eigenvecs, _, _ = _svd_interface(
-                ivy.unfold(core_approximation, mode),
+                core_approximation,
                 n_eigenvecs=rank[index],
-                # random_state=random_state,
+                method=svd,
+                mode=mode,
+                seed=seed,
             )
             factors[index] = eigenvecs
 
@@ -1475,7 +1729,9 @@ def tucker(
     fixed_factors: Optional[Sequence[int]] = None,
     n_iter_max: Optional[int] = 100,
     init: Optional[Union[Literal["svd", "random"], ivy.TuckerTensor]] = "svd",
-    svd: Optional[Literal["truncated_svd"]] = "truncated_svd",
+    svd: Optional[
+        Literal["truncated_svd", "symeig_svd", "randomized_svd", "streaming_svd"]
+    ] = "truncated_svd",
     seed: Optional[int] = None,
     mask: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
     svd_mask_repeats: Optional[int] = 5,
@@ -1506,10 +1762,11 @@ def tucker(
         if a TuckerTensor is provided, this is used for initialization
     svd
         str, default is 'truncated_svd'
-        function to use to compute the SVD,
+        function to use to compute the SVD, one of 'truncated_svd', 'symeig_svd',
+        'randomized_svd' and 'streaming_svd', or a callable
     seed
         Used to create a random seed distribution
-        when init == 'random'
+        when init == 'random' or svd == 'randomized_svd'
     mask
         array of booleans with the same shape as ``tensor`` should be 0 where
         the values are missing and 1 everywhere else. Note:  if tensor is
@@ -1609,6 +1866,325 @@ def tucker(
             return ivy.TuckerTensor((core, factors))
 
 
+def _initialize_cp(x, rank, init, svd, seed):
+    # initialize the factors of `parafac` from the leading left singular vectors of
+    # each unfolding, or at random
+    if init == "random":
+        return ivy.random_cp(
+            x.shape, rank, dtype=x.dtype, seed=seed, normalise_factors=False
+        )
+    if init != "svd":
+        weights, factors = init
+        return ivy.CPTensor((weights, [ivy.copy_array(f) for f in factors]))
+
+    factors = []
+    for mode in range(len(x.shape)):
+        U, _, _ = _svd_interface(
+            x, n_eigenvecs=rank, method=svd, mode=mode, seed=seed
+        )
+        if x.shape[mode] < rank:
+            # fewer singular vectors than components, fill in the rest at random
+            fill = ivy.random_uniform(
+                shape=(U.shape[0], rank - x.shape[mode]), dtype=x.dtype, seed=seed
+            )
+            U = ivy.concat([U, fill], axis=1)
+        factors.append(U[:, :rank])
+    return ivy.CPTensor((None, factors))
+
+
+def _cp_error(x, norm_x, weights, factors, mttkrp, mask):
+    # the unnormalised reconstruction error, and the tensor and norm to use for the
+    # next iteration, which are imputed at the missing values when masked
+    if mask is not None:
+        rec = ivy.CPTensor.cp_to_tensor((weights, factors))
+        x = x * mask + rec * (1 - mask)
+        return ivy.sqrt(ivy.sum((x - rec) ** 2)), x, ivy.sqrt(ivy.sum(x**2))
+
+    # ||x - rec||^2 = ||x||^2 - 2<x, rec> + ||rec||^2, where <x, rec> follows from
+    # the weighted mttkrp of the last mode, without forming rec
+    factors_norm = ivy.CPTensor.cp_norm((weights, factors))
+    iprod = ivy.sum(mttkrp * ivy.conj(factors[-1]))
+    error = ivy.sqrt(ivy.abs(norm_x**2 + factors_norm**2 - 2 * iprod))
+    return error, x, norm_x
+
+
+# This function has been adapted from TensorLy
+# https://github.com/tensorly/tensorly/blob/main/tensorly/decomposition/_cp.py
+@handle_nestable
+@handle_exceptions
+@handle_array_like_without_promotion
+@inputs_to_ivy_arrays
+@handle_array_function
+@handle_device_shifting
+def parafac(
+    x: Union[ivy.Array, ivy.NativeArray],
+    rank: int,
+    /,
+    *,
+    n_iter_max: Optional[int] = 100,
+    init: Optional[Union[Literal["svd", "random"], ivy.CPTensor]] = "svd",
+    svd: Optional[
+        Literal["truncated_svd", "symeig_svd", "randomized_svd", "streaming_svd"]
+    ] = "truncated_svd",
+    normalize_factors: Optional[bool] = False,
+    tol: Optional[float] = 1e-8,
+    seed: Optional[int] = None,
+    mask: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
+    l2_reg: Optional[float] = 0.0,
+    linesearch: Optional[bool] = False,
+    cvg_criterion: Optional[Literal["abs_rec_error", "rec_error"]] = "abs_rec_error",
+    verbose: Optional[bool] = False,
+    return_errors: Optional[bool] = False,
+):
+    """
+    CANDECOMP/PARAFAC decomposition via alternating least squares (ALS)
+
+        Computes a rank-`rank` decomposition of `x` [1]_ such that::
+
+            x = [|weights; factors[0], ..., factors[-1] |].
+
+    Each factor is updated from the mode-`mode` unfolding of `x` times the
+    khatri-rao product of the other factors, which is computed by
+    ``ivy.CPTensor.unfolding_dot_khatri_rao`` without forming either of them.
+
+    Parameters
+    ----------
+    x
+        input tensor
+    rank
+        number of components
+    n_iter_max
+        maximum number of iteration
+    init
+        {'svd', 'random'}, or CPTensor optional
+        if a CPTensor is provided, this is used for initialization
+    svd
+        str, default is 'truncated_svd'
+        function to use to compute the SVD when init == 'svd', one of
+        'truncated_svd', 'symeig_svd', 'randomized_svd' and 'streaming_svd', or a
+        callable
+    normalize_factors
+        if True, aggregate the weights of each factor in a 1D-tensor
+        of shape (rank, ), which will contain the norms of the factors
+    tol
+        tolerance: the algorithm stops when the variation in
+        the reconstruction error is less than the tolerance.
+    seed
+        Used to create a random seed distribution
+        when init == 'random' or svd == 'randomized_svd'
+    mask
+        array of booleans with the same shape as ``tensor`` should be 0 where
+        the values are missing and 1 everywhere else. The missing values are
+        imputed from the reconstruction at each iteration.
+    l2_reg
+        L2 regularization of the factors.
+    linesearch
+        whether to extrapolate the factors every other iteration, which is kept only
+        if it lowers the reconstruction error [2]_
+    cvg_criterion
+        {'abs_rec_error', 'rec_error'}, stop when the absolute variation in the
+        reconstruction error, or its decrease, is less than `tol`
+    verbose
+        if True, the reconstruction error is printed at each iteration.
+    return_errors
+        if True, list of reconstruction errors are returned.
+
+    Returns
+    -------
+        ivy.CPTensor or ivy.CPTensor and
+        list of reconstruction errors if return_errors is True.
+
+    References
+    ----------
+    .. [1] T.G.Kolda and B.W.Bader, "Tensor Decompositions and Applications", SIAM
+       REVIEW, vol. 51, n. 3, pp. 455-500, 2009.
+
+    .. [2] Bro, R., "Multi-Way Analysis in the Food Industry: Models, Algorithms, and
+       Applications", PhD., University of Amsterdam, 1998
+    """
+    rank = ivy.CPTensor.validate_cp_rank(x.shape, rank=rank)
+    if cvg_criterion not in ("abs_rec_error", "rec_error"):
+        raise ValueError(
+            f"Invalid cvg_criterion {cvg_criterion}, expected 'abs_rec_error' or"
+            " 'rec_error'"
+        )
+    if mask is not None:
+        x = x * mask
+
+    weights, factors = _initialize_cp(x, rank, init, svd, seed)
+    n_modes = len(x.shape)
+    eye = ivy.eye(rank, dtype=x.dtype)
+
+    rec_errors = []
+    norm_x = ivy.sqrt(ivy.sum(x**2))
+    # the exponent of the line search jumps, grown after max_fail rejected jumps
+    acc_pow, acc_fail, max_fail = 2.0, 0, 4
+
+    for iteration in range(n_iter_max):
+        if linesearch and iteration % 2 == 0:
+            factors_last = [ivy.copy_array(f) for f in factors]
+            weights_last = ivy.copy_array(weights)
+
+        for mode in range(n_modes):
+            # the gram of the khatri-rao product is the hadamard product of the
+            # factors' grams
+            pseudo_inverse = ivy.ones((rank, rank), dtype=x.dtype)
+            for i, factor in enumerate(factors):
+                if i != mode:
+                    pseudo_inverse = pseudo_inverse * ivy.matmul(
+                        ivy.conj(factor), factor, transpose_a=True
+                    )
+            pseudo_inverse = pseudo_inverse * ivy.outer(weights, weights)
+            pseudo_inverse = pseudo_inverse + l2_reg * eye
+
+            mttkrp = ivy.CPTensor.unfolding_dot_khatri_rao(x, (weights, factors), mode)
+            factors[mode] = ivy.matrix_transpose(
+                ivy.solve(
+                    ivy.conj(ivy.matrix_transpose(pseudo_inverse)),
+                    ivy.matrix_transpose(mttkrp),
+                )
+            )
+            if normalize_factors and mode != n_modes - 1:
+                weights, factors = ivy.CPTensor.cp_normalize((weights, factors))
+
+        line_iter = linesearch and iteration % 2 == 0 and iteration > 5
+        if line_iter:
+            jump = iteration ** (1.0 / acc_pow)
+            new_weights = weights_last + (weights - weights_last) * jump
+            new_factors = [
+                last + (factor - last) * jump
+                for last, factor in zip(factors_last, factors)
+            ]
+            # the mttkrp of the jump is needed for its error
+            mttkrp = ivy.CPTensor.unfolding_dot_khatri_rao(
+                x, (new_weights, new_factors), n_modes - 1
+            )
+            new_error, new_x, new_norm_x = _cp_error(
+                x, norm_x, new_weights, new_factors, mttkrp, mask
+            )
+            if rec_errors and new_error / new_norm_x < rec_errors[-1]:
+                weights, factors = new_weights, new_factors
+                x, norm_x = new_x, new_norm_x
+                error = new_error
+                acc_fail = 0
+                if verbose:
+                    print(f"Accepted line search jump of {jump}.")
+            else:
+                mttkrp = ivy.CPTensor.unfolding_dot_khatri_rao(
+                    x, (weights, factors), n_modes - 1
+                )
+                error, x, norm_x = _cp_error(x, norm_x, weights, factors, mttkrp, mask)
+                acc_fail += 1
+                if verbose:
+                    print(f"Line search failed for jump of {jump}.")
+                if acc_fail == max_fail:
+                    acc_pow += 1.0
+                    acc_fail = 0
+        else:
+            error, x, norm_x = _cp_error(x, norm_x, weights, factors, mttkrp, mask)
+
+        rec_errors.append(error / norm_x)
+
+        if tol and iteration >= 1:
+            decrease = rec_errors[-2] - rec_errors[-1]
+            if verbose:
+                print(
+                    f"iteration {iteration}, reconstruction error: {rec_errors[-1]},"
+                    f" decrease = {decrease}"
+                )
+            if cvg_criterion == "abs_rec_error":
+                stop = ivy.abs(decrease) < tol
+            else:
+                stop = decrease < tol
+            if stop:
+                if verbose:
+                    print(f"PARAFAC converged after {iteration} iterations")
+                break
+
+    cp_tensor = ivy.CPTensor((weights, factors))
+    if return_errors:
+        return cp_tensor, rec_errors
+    return cp_tensor
+
+
+# This function has been adapted from TensorLy
+# https://github.com/tensorly/tensorly/blob/main/tensorly/decomposition/_tt.py
+@handle_nestable
+@handle_exceptions
+@handle_array_like_without_promotion
+@inputs_to_ivy_arrays
+@handle_array_function
+@handle_device_shifting
+def tensor_train(
+    x: Union[ivy.Array, ivy.NativeArray],
+    rank: Union[int, Sequence[int]],
+    /,
+    *,
+    svd: Optional[
+        Literal["truncated_svd", "symeig_svd", "randomized_svd", "streaming_svd"]
+    ] = "truncated_svd",
+    seed: Optional[int] = None,
+    verbose: Optional[bool] = False,
+):
+    """
+    TT decomposition via recursive SVD (TT-SVD) [1]_
+
+        Decomposes `x` into a sequence of order-3 tensors (the TT-cores), each
+        obtained from the SVD of a reshaping of the remainder of the previous one.
+        The reshapings are views, so that only the remainders, whose first
+        dimension is bounded by the rank, are ever copied.
+
+    Parameters
+    ----------
+    x
+        input tensor
+    rank
+        maximum allowable TT-ranks of the decomposition,
+        if int, the same rank is used for all the cores
+    svd
+        str, default is 'truncated_svd'
+        function to use to compute the SVD, one of 'truncated_svd', 'symeig_svd',
+        'randomized_svd' and 'streaming_svd', or a callable
+    seed
+        Used to create a random seed distribution
+        when svd == 'randomized_svd'
+    verbose
+        if True, the rank of each core is printed.
+
+    Returns
+    -------
+        ivy.TTTensor
+
+    References
+    ----------
+    .. [1] Ivan V. Oseledets. "Tensor-train decomposition", SIAM J. Scientific
+       Computing, 33(5):2295-2317, 2011.
+    """
+    rank = ivy.TTTensor.validate_tt_rank(x.shape, rank=rank)
+    shape = x.shape
+    n_dim = len(shape)
+    unfolding = x
+    factors = [None] * n_dim
+
+    for k in range(n_dim - 1):
+        n_row = int(rank[k] * shape[k])
+        unfolding = ivy.reshape(unfolding, (n_row, -1))
+        n_column = unfolding.shape[1]
+        current_rank = min(n_row, n_column, rank[k + 1])
+        U, S, V = _svd_interface(
+            unfolding, n_eigenvecs=current_rank, method=svd, seed=seed
+        )
+        rank[k + 1] = current_rank
+        factors[k] = ivy.reshape(U, (rank[k], shape[k], rank[k + 1]))
+        if verbose:
+            print(f"TT-core {k}: rank {rank[k + 1]}")
+        # the remainder, S @ V, is decomposed next
+        unfolding = ivy.reshape(S[:current_rank], (-1, 1)) * V[:current_rank, :]
+
+    factors[-1] = ivy.reshape(unfolding, (unfolding.shape[0], shape[-1], 1))
+    return ivy.TTTensor(factors)
+
+
 @handle_exceptions
 @handle_backend_invalid
 @handle_nestable
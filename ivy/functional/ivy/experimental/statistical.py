@@ -9,6 +9,7 @@ from ivy.func_wrapper import (
     infer_dtype,
     handle_device_shifting,
     handle_backend_invalid,
+    inputs_to_ivy_arrays,
 )
 from ivy.utils.exceptions import handle_exceptions
 
@@ -510,6 +511,7 @@ def bincount(
     *,
     weights: Optional[ivy.Array] = None,
     minlength: int = 0,
+    axis: Optional[int] = None,
     out: Optional[ivy.Array] = None,
 ) -> ivy.Array:
     """
@@ -517,12 +519,16 @@ def bincount(
 
     Parameters
     ----------
-    self
-        Input array.
+    x
+        Input array of non-negative integers.
     weights
-        An optional input array.
+        An optional input array, of the same shape as x.
     minlength
         A minimum number of bins for the output array.
+    axis
+        The axis to count the values along, separately for each position of the
+        other axes. The counts replace this axis in the output. If ``None``, all of x
+        is counted. Default: ``None``.
 
     Returns
     -------
@@ -531,17 +537,82 @@ def bincount(
 
     Examples
     --------
-    >>> a = ivy.Container([[10.0, ivy.nan, 4], [3, 2, 1]])
-    >>> a.bincount(a)
-        3.0
-    >>> a.bincount(a, axis=0)
-        array([6.5, 2. , 2.5])
+    >>> x = ivy.array([0, 1, 1, 3])
+    >>> ivy.bincount(x)
+    ivy.array([1, 2, 0, 1])
+
+    >>> x = ivy.array([[0, 1, 1], [2, 2, 0]])
+    >>> ivy.bincount(x, axis=-1)
+    ivy.array([[1, 2, 0],
+           [1, 0, 2]])
     """
     return ivy.current_backend(x).bincount(
-        x, weights=weights, minlength=minlength, out=out
+        x, weights=weights, minlength=minlength, axis=axis, out=out
     )
 
 
+@handle_exceptions
+@handle_nestable
+@handle_array_like_without_promotion
+@handle_out_argument
+@inputs_to_ivy_arrays
+@handle_array_function
+def digitize(
+    x: Union[ivy.Array, ivy.NativeArray],
+    bins: Union[ivy.Array, ivy.NativeArray],
+    /,
+    *,
+    right: bool = False,
+    out: Optional[ivy.Array] = None,
+) -> ivy.Array:
+    """
+    Return the indices of the bins to which each value in the input array belongs.
+
+    Parameters
+    ----------
+    x
+        Input array of values to bin.
+    bins
+        Array of bin edges, monotonically increasing or decreasing along the last
+        axis. If bins has more than one dimension, its leading dimensions must match
+        those of x, and each row of x is binned by the matching row of bins.
+    right
+        Whether the intervals include their right edge instead of their left edge.
+        Default: ``False``.
+    out
+        optional output array, for writing the result to.
+
+    Returns
+    -------
+    ret
+        The indices of the bins, of the same shape as x.
+
+    Examples
+    --------
+    >>> x = ivy.array([0.2, 6.4, 3.0, 1.6])
+    >>> bins = ivy.array([0.0, 1.0, 2.5, 4.0, 10.0])
+    >>> ivy.digitize(x, bins)
+    ivy.array([1, 4, 3, 2])
+
+    >>> x = ivy.array([[1, 5], [1, 5]])
+    >>> bins = ivy.array([[0, 1, 5], [5, 1, 0]])
+    >>> ivy.digitize(x, bins, right=True)
+    ivy.array([[1, 2],
+           [2, 1]])
+    """
+    side = "left" if right else "right"
+    ret = ivy.searchsorted(bins, x, side=side)
+    if bins.shape[-1] < 2:
+        return ret
+    decreasing = bins[..., -1] < bins[..., 0]
+    if ivy.any(decreasing):
+        flipped = ivy.searchsorted(ivy.flip(bins, axis=-1), x, side=side)
+        ret = ivy.where(
+            ivy.expand_dims(decreasing, axis=-1), bins.shape[-1] - flipped, ret
+        )
+    return ret
+
+
 @handle_exceptions
 @handle_backend_invalid
 @handle_nestable
@@ -727,12 +798,43 @@ def cov(
     )
 
 
+def _cumulative_scan(x, axis, fn):
+    # a log-step scan, each step combining every element with the one `shift`
+    # positions before it, so that whatever the length of the axis it takes
+    # log2(length) vectorised calls of fn, which must be idempotent as the first
+    # `shift` elements are combined with themselves
+    length = x.shape[axis]
+    positions = ivy.arange(length)
+    positions = ivy.reshape(positions, (-1,) + (1,) * (len(x.shape) - axis - 1))
+    shift = 1
+    while shift < length:
+        before = ivy.where(positions >= shift, ivy.roll(x, shift, axis=axis), x)
+        x = fn(x, before)
+        shift *= 2
+    return x
+
+
+def _cumulative_extremum(x, axis, fn):
+    ret = _cumulative_scan(x, axis, fn)
+    if ivy.is_float_dtype(x) and ivy.any(ivy.isnan(x)):
+        # nans propagate, as in np.maximum.accumulate, whichever way fn treats them
+        seen = _cumulative_scan(ivy.isnan(x), axis, ivy.logical_or)
+        ret = ivy.where(seen, ivy.full_like(ret, float("nan")), ret)
+    return ret
+
+
+def _shift_forward(x, axis):
+    # the exclusive variants, which start from zero
+    lead = (slice(None),) * axis
+    first = ivy.zeros_like(x[lead + (slice(1),)])
+    return ivy.concat((first, x[lead + (slice(-1),)]), axis=axis)
+
+
 @handle_exceptions
-@handle_backend_invalid
 @handle_nestable
 @handle_array_like_without_promotion
 @handle_out_argument
-@to_native_arrays_and_back
+@inputs_to_ivy_arrays
 @handle_array_function
 def cummax(
     x: Union[ivy.Array, ivy.NativeArray],
@@ -823,17 +925,51 @@ def cummax(
     >>> print(y)
     (ivy.array([ 15,  15,  15,  15, -23, -45]), ivy.array([2, 2, 2, 2, 1, 0]))
     """
-    return ivy.current_backend(x).cummax(
-        x, axis=axis, exclusive=exclusive, reverse=reverse, dtype=dtype, out=out
-    )
+    if x.dtype in ("bool", "float16"):
+        x = x.astype("float64")
+    elif x.dtype in ("int8", "int16", "uint8"):
+        x = x.astype("int64")
+    elif ivy.is_complex_dtype(x):
+        x = ivy.real(x).astype("float64")
+    axis = axis % len(x.shape)
+    if reverse:
+        x = ivy.flip(x, axis=axis)
+    elif exclusive:
+        x = _shift_forward(x, axis)
+    values = _cumulative_extremum(x, axis, ivy.maximum)
+    # the index of each maximum is the last position at which it was reached, or
+    # at which a nan was met, as for torch.cummax
+    reached = x == values
+    if ivy.is_float_dtype(x):
+        reached = ivy.logical_or(reached, ivy.isnan(x))
+    positions = ivy.arange(x.shape[axis], dtype="int64")
+    positions = ivy.reshape(positions, (-1,) + (1,) * (len(x.shape) - axis - 1))
+    positions = ivy.where(reached, positions, ivy.zeros_like(positions))
+    indices = _cumulative_scan(positions, axis, ivy.maximum)
+    if reverse:
+        if exclusive:
+            values = _shift_forward(values, axis)
+            indices = _shift_forward(indices, axis)
+        values = ivy.flip(values, axis=axis)
+        indices = ivy.flip(indices, axis=axis)
+    return values, indices
+
+
+cummax.mixed_backend_wrappers = {
+    "to_add": (
+        "handle_backend_invalid",
+        "inputs_to_native_arrays",
+        "outputs_to_ivy_arrays",
+    ),
+    "to_skip": ("inputs_to_ivy_arrays",),
+}
 
 
 @handle_exceptions
-@handle_backend_invalid
 @handle_nestable
 @handle_array_like_without_promotion
 @handle_out_argument
-@to_native_arrays_and_back
+@inputs_to_ivy_arrays
 @handle_array_function
 def cummin(
     x: Union[ivy.Array, ivy.NativeArray],
@@ -959,6 +1095,20 @@ def cummin(
                       [1, 2]])
     }
     """
-    return ivy.current_backend(x).cummin(
-        x, axis=axis, exclusive=exclusive, reverse=reverse, dtype=dtype, out=out
-    )
+    axis = axis % len(x.shape)
+    if reverse:
+        x = ivy.flip(x, axis=axis)
+    ret = _cumulative_extremum(x, axis, ivy.minimum)
+    if reverse:
+        ret = ivy.flip(ret, axis=axis)
+    return ret if dtype is None else ret.astype(dtype)
+
+
+cummin.mixed_backend_wrappers = {
+    "to_add": (
+        "handle_backend_invalid",
+        "inputs_to_native_arrays",
+        "outputs_to_ivy_arrays",
+    ),
+    "to_skip": ("inputs_to_ivy_arrays",),
+}
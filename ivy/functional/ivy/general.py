@@ -4,7 +4,7 @@
 import gc
 import inspect
 import math
-from functools import wraps
+from functools import lru_cache, wraps
 from numbers import Number
 from typing import (
     Callable,
@@ -26,6 +26,7 @@ import ivy
 from ivy.utils.backend import current_backend, backend_stack
 from ivy.functional.ivy.gradients import _is_variable
 from ivy.utils.exceptions import handle_exceptions
+from ivy.utils import fn_cache, support_index
 from ivy.func_wrapper import (
     handle_array_function,
     inputs_to_ivy_arrays,
@@ -44,7 +45,7 @@ from ivy.func_wrapper import (
 )
 from ivy.functional.ivy.device import dev
 
-FN_CACHE = dict()
+FN_CACHE = fn_cache.CACHES
 INF = float("inf")
 
 precise_mode_stack = list()
@@ -1749,22 +1750,49 @@ def match_kwargs(
 
 
 @handle_exceptions
-def cache_fn(func: Callable) -> Callable:
+def cache_fn(
+    func: Optional[Callable] = None,
+    /,
+    *,
+    max_size: Optional[int] = 256,
+    max_bytes: Optional[int] = None,
+    array_key: Literal["content", "identity"] = "content",
+    persist: bool = False,
+) -> Callable:
     """
     Cache function outputs.
 
     A decorator to wrap a function, such that computed outputs are cached to avoid
-    recalculating them later.
+    recalculating them later. The least recently used outputs are evicted once the
+    cache is full. All the wrappers of a function share its cache, which is created
+    with the options of the first one.
 
     Parameters
     ----------
     func
-        The function to wrap, whose output should be cached for later.
+        The function to wrap, whose output should be cached for later. If not given,
+        a decorator taking the function is returned.
+    max_size
+        The maximum number of outputs to cache, or ``None`` for no limit. Default is
+        ``256``.
+    max_bytes
+        The maximum number of bytes of arrays to cache in the outputs, or ``None`` for
+        no limit. Default is ``None``.
+    array_key
+        How array arguments are told apart, besides by their shape, dtype and device.
+        ``"content"`` hashes their contents, ``"identity"`` uses the arrays themselves,
+        which is cheaper for large arrays but misses in-place updates, other than to
+        torch tensors. Default is ``"content"``.
+    persist
+        Whether to also store the outputs on disk, for pure functions worth computing
+        only once across processes. They are written to ``$IVY_FN_CACHE_DIR``, by
+        default ``~/.cache/ivy/fn_cache``. Default is ``False``.
 
     Returns
     -------
     ret
-        The newly cache wrapped function.
+        The newly cache wrapped function. Its ``cache_info()`` returns the hits,
+        misses and size of the cache, and ``cache_clear()`` empties it.
 
     Examples
     --------
@@ -1781,25 +1809,38 @@ def cache_fn(func: Callable) -> Callable:
     >>> cached_line_eq = ivy.cache_fn(line_eq)
     >>> print(cached_line_eq(3, itc=5, slp=2))
     11
-    """
-    global FN_CACHE
-    if func not in FN_CACHE:
-        FN_CACHE[func] = dict()
+
+    As a decorator, with options:
+
+    >>> @ivy.cache_fn(max_size=2)
+    ... def square(x): return x ** 2
+    >>> print(square(ivy.array([1., 2.])), square(ivy.array([1., 2.])))
+    ivy.array([1., 4.]) ivy.array([1., 4.])
+    >>> square.cache_info()
+    CacheInfo(hits=1, misses=1, disk_hits=0, max_size=2, size=1, nbytes=8)
+    """
+    if func is None:
+        return lambda func: cache_fn(
+            func,
+            max_size=max_size,
+            max_bytes=max_bytes,
+            array_key=array_key,
+            persist=persist,
+        )
+    cache = fn_cache.get(
+        func,
+        max_size=max_size,
+        max_bytes=max_bytes,
+        array_key=array_key,
+        persist=persist,
+    )
 
     @wraps(func)
     def cached_fn(*args, **kwargs):
-        key = "".join(
-            [str(i) + ", " for i in args]
-            + [" kw, "]
-            + [str(i) + ", " for i in sorted(kwargs.items())]
-        )
-        cache = FN_CACHE[func]
-        if key in cache:
-            return cache[key]
-        ret = func(*args, **kwargs)
-        cache[key] = ret
-        return ret
+        return cache(*args, **kwargs)
 
+    cached_fn.cache_info = cache.cache_info
+    cached_fn.cache_clear = cache.cache_clear
     return cached_fn
 
 
@@ -2415,6 +2456,10 @@ def get_all_arrays_in_memory() -> List[Union[ivy.Array, ivy.NativeArray]]:
     """
     Get all arrays which are currently alive.
 
+    With the NumPy backend, or no backend set, these are the live ivy arrays. With
+    other backends, these are the native arrays wrapped by the live ivy arrays of the
+    current backend.
+
     Returns
     -------
     ret
@@ -2431,19 +2476,14 @@ def get_all_arrays_in_memory() -> List[Union[ivy.Array, ivy.NativeArray]]:
     >>> x
     [ivy.array([0, 1, 2])]
     """
-    all_arrays = list()
-    for obj in gc.get_objects():
-        try:
-            if ivy.current_backend_str() in ["", "numpy"]:
-                if ivy.is_ivy_array(obj):
-                    all_arrays.append(obj)
-            else:
-                if ivy.is_native_array(obj):
-                    all_arrays.append(obj)
-
-        except Exception:
-            pass
-    return all_arrays
+    # the live ivy arrays are tracked with weak references when they are created, so
+    # there is no need to scan the whole heap
+    if ivy.current_backend_str() in ["", "numpy"]:
+        return ivy.utils.backend.handler._get_live_arrays()
+    native_arrays = dict()
+    for arr in ivy.utils.backend.handler._get_live_arrays(ivy.current_backend_str()):
+        native_arrays[id(arr.data)] = arr.data
+    return list(native_arrays.values())
 
 
 @handle_exceptions
@@ -2925,25 +2965,109 @@ set_item.mixed_backend_wrappers = {
 
 def _parse_query(query, x_shape):
     query = (query,) if not isinstance(query, tuple) else query
-    query_ = tuple([q.to_numpy() if ivy.is_array(q) else q for q in query])
-
-    # array containing all of x's flat indices
-    x_ = ivy.arange(0, _numel(x_shape)).reshape(x_shape)
-
-    # use numpy's __getitem__ to get the queried indices
-    x_idxs = ivy.array(x_.to_numpy()[query_])
-    target_shape = x_idxs.shape
+    x_shape = tuple(x_shape)
+    signature = _query_signature(query)
+    if signature is not None:
+        indices, target_shape = _parse_basic_query(signature, x_shape)
+    else:
+        indices, target_shape = _compile_query(
+            tuple(_to_numpy_index(q) for q in query), x_shape
+        )
+    if indices is None:
+        return None, target_shape
+    return ivy.array(indices), target_shape
+
+
+def _query_signature(query):
+    # a hashable form of queries made only of integers, slices, None and ellipsis
+    signature = []
+    for q in query:
+        if isinstance(q, slice):
+            signature.append((q.start, q.stop, q.step))
+        elif q is None or q is Ellipsis:
+            signature.append(q)
+        elif isinstance(q, (int, np.integer)) and not isinstance(q, (bool, np.bool_)):
+            signature.append(int(q))
+        else:
+            return None
+    return tuple(signature)
+
+
+def _to_numpy_index(q):
+    if ivy.is_array(q):
+        return ivy.to_numpy(q)
+    if isinstance(q, (list, tuple, bool, np.bool_)):
+        return np.asarray(q)
+    return q
+
+
+@lru_cache(maxsize=256)
+def _parse_basic_query(signature, x_shape):
+    query = tuple(slice(*q) if isinstance(q, tuple) else q for q in signature)
+    indices, target_shape = _compile_query(query, x_shape)
+    if indices is not None:
+        # shared between the calls hitting the cache
+        indices.setflags(write=False)
+    return indices, target_shape
+
+
+def _compile_query(query, x_shape):
+    """
+    Compute the gather_nd indices of x[query], for an x of shape x_shape.
+
+    The indices along each dimension are found by applying the query to a view of
+    that dimension's range, broadcast to x_shape with zero strides, so this follows
+    NumPy's indexing rules while only allocating memory for the output.
+    """
+    num_dims = len(x_shape)
+    num_consumed = sum(_num_consumed_dims(q) for q in query)
+    num_indexed = num_dims
+    ellipses = [i for i, q in enumerate(query) if q is Ellipsis]
+    if len(ellipses) <= 1 and num_consumed <= num_dims:
+        # make the whole slices implied by the ellipsis, or its absence, explicit
+        i = ellipses[0] if ellipses else len(query)
+        fill = (slice(None),) * (num_dims - num_consumed)
+        # an ellipsis standing for no dimensions is kept, as it still separates the
+        # advanced indices on either side of it, which moves their dimensions first
+        if fill or not ellipses:
+            query = query[:i] + fill + query[i + 1 :]
+        # the trailing dimensions taken whole are gathered as slices
+        while num_indexed > 1 and _is_whole_slice(query[-1], x_shape[num_indexed - 1]):
+            query = query[:-1]
+            num_indexed -= 1
+    indexed_shape = x_shape[:num_indexed]
+
+    # numpy raises for invalid queries here, as for x[query]
+    dim_indices = [
+        np.broadcast_to(
+            np.arange(dim, dtype=np.int64).reshape(
+                [-1 if i == d else 1 for i in range(num_indexed)]
+            ),
+            indexed_shape,
+        )[query]
+        for d, dim in enumerate(indexed_shape)
+    ]
+    if dim_indices:
+        gathered_shape = dim_indices[0].shape
+    else:
+        gathered_shape = np.zeros((), dtype=bool)[query].shape
+    target_shape = tuple(gathered_shape) + x_shape[num_indexed:]
 
-    if 0 in x_idxs.shape or 0 in x_shape:
+    if 0 in target_shape or 0 in x_shape:
         return None, target_shape
+    return np.stack(dim_indices, axis=-1), target_shape
+
 
-    # convert the flat indices to multi-D indices
-    x_idxs = ivy.unravel_index(x_idxs, x_shape)
+def _is_whole_slice(q, dim):
+    return isinstance(q, slice) and q.indices(dim) == (0, dim, 1)
 
-    # stack the multi-D indices to bring them to gather_nd/scatter_nd format
-    x_idxs = ivy.stack(x_idxs, axis=-1).astype(ivy.int64)
 
-    return x_idxs, target_shape
+def _num_consumed_dims(q):
+    if q is None or q is Ellipsis:
+        return 0
+    if isinstance(q, np.ndarray) and q.dtype == bool:
+        return q.ndim
+    return 1
 
 
 def _numel(shape):
@@ -3995,6 +4119,7 @@ def _get_devices_and_dtypes(fn, recurse=False, complement=True):
 
 @handle_exceptions
 @handle_nestable
+@support_index.indexed("supported_devices_and_dtypes")
 def function_supported_devices_and_dtypes(fn: Callable, recurse: bool = True) -> Dict:
     """
     Return the supported combination of devices and dtypes of the current backend's
@@ -4044,6 +4169,7 @@ def function_supported_devices_and_dtypes(fn: Callable, recurse: bool = True) ->
 
 @handle_exceptions
 @handle_nestable
+@support_index.indexed("unsupported_devices_and_dtypes")
 def function_unsupported_devices_and_dtypes(fn: Callable, recurse: bool = True) -> Dict:
     """
     Return the unsupported combination of devices and dtypes of the current backend's
@@ -72,6 +72,69 @@ def _in_projection(
         )
 
 
+def _tiled_attention(
+    query,
+    key,
+    value,
+    scale,
+    block_size,
+    mask=None,
+    is_causal=False,
+    dropout_p=0.0,
+    training=False,
+    dropout_on_scores=False,
+):
+    """
+    Compute attention over tiles of ``block_size`` keys with an online softmax.
+
+    The running row maximum and softmax denominator are rescaled as each tile is
+    added, so only a *[batch_shape,num_queries,block_size]* slice of the query-key
+    similarity matrix exists at any time, and causal and boolean masks are applied
+    per tile without building a dense mask. Dropout is applied either to the scaled
+    scores before masking, as in ``scaled_dot_product_attention``, or to the
+    attention weights, as in ``multi_head_attention``.
+    """
+    num_queries, num_keys = query.shape[-2], key.shape[-2]
+    if ivy.exists(mask):
+        mask = ivy.astype(mask, ivy.bool)
+    elif is_causal:
+        query_positions = ivy.expand_dims(ivy.arange(num_queries), axis=-1)
+    row_max = row_sum = ret = None
+    for start in range(0, num_keys, block_size):
+        if is_causal and start >= num_queries:
+            # every query precedes the keys of the remaining tiles
+            break
+        stop = min(start + block_size, num_keys)
+        scores = ivy.matmul(query, key[..., start:stop, :], transpose_b=True) * scale
+        if dropout_on_scores:
+            scores = ivy.dropout(scores, dropout_p, training=training)
+        if ivy.exists(mask) or is_causal:
+            if is_causal:
+                tile_mask = query_positions >= ivy.arange(start, stop)
+            else:
+                tile_mask = mask if mask.shape[-1] == 1 else mask[..., start:stop]
+            scores = ivy.where(tile_mask, scores, -ivy.finfo(ivy.dtype(scores)).max)
+        tile_max = ivy.max(scores, axis=-1, keepdims=True)
+        if row_max is None:
+            new_max = tile_max
+        else:
+            new_max = ivy.maximum(row_max, tile_max)
+            correction = ivy.exp(row_max - new_max)
+        weights = ivy.exp(scores - new_max)
+        tile_sum = ivy.sum(weights, axis=-1, keepdims=True)
+        if not dropout_on_scores:
+            # the denominator is unaffected, as with dropout after the softmax
+            weights = ivy.dropout(weights, dropout_p, training=training)
+        tile_ret = ivy.matmul(weights, value[..., start:stop, :])
+        if row_max is None:
+            row_sum, ret = tile_sum, tile_ret
+        else:
+            row_sum = row_sum * correction + tile_sum
+            ret = ret * correction + tile_ret
+        row_max = new_max
+    return ret / row_sum
+
+
 # Linear #
 @handle_exceptions
 @handle_nestable
@@ -434,6 +497,7 @@ def scaled_dot_product_attention(
     dropout_p: Optional[float] = 0.0,
     is_causal: Optional[bool] = False,
     training: Optional[bool] = False,
+    block_size: Optional[int] = None,
     out: Optional[ivy.Array] = None,
 ) -> ivy.Array:
     """
@@ -466,6 +530,12 @@ def scaled_dot_product_attention(
         and errors if both `mask` and `is_causal` are set.
     training
         If True, dropout is used, otherwise dropout is not activated.
+    block_size
+        If set, keys and values are processed in tiles of this many positions with an
+        online softmax, so that the similarity matrix is never held in full and no
+        dense mask is built for causal attention. Peak memory then grows with
+        ``num_queries * block_size`` rather than ``num_queries * num_keys``. Default
+        is ``None``, which computes the full similarity matrix at once.
     out
         optional output array, for writing the result to. It must have a shape that the
         inputs broadcast to.
@@ -679,6 +749,20 @@ def scaled_dot_product_attention(
     )
     embed_dim = query.shape[-1]
     scale = 1 / (embed_dim**0.5) if not scale else scale
+    if block_size:
+        result = _tiled_attention(
+            query,
+            key,
+            value,
+            scale,
+            block_size,
+            mask=mask,
+            is_causal=is_causal,
+            dropout_p=dropout_p,
+            training=training,
+            dropout_on_scores=True,
+        )
+        return result if not ivy.exists(out) else ivy.inplace_update(out, result)
     sim = ivy.einsum("... q f, ... k f -> ... q k", query, key) * scale
     sim = ivy.dropout(sim, dropout_p, training=training)
     if ivy.exists(mask):
@@ -729,6 +813,7 @@ def multi_head_attention(
     average_attention_weights: bool = True,
     dropout: float = 0.0,
     training: bool = False,
+    block_size: Optional[int] = None,
     out: Optional[ivy.Array] = None,
 ) -> Union[ivy.Array, ivy.NativeArray]:
     """
@@ -789,6 +874,11 @@ def multi_head_attention(
         Specifies the dropout probablity, dropout is applied to attention_weights.
     training
         If True, dropout is used, otherwise dropout is not activated.
+    block_size
+        If set, keys and values are processed in tiles of this many positions with an
+        online softmax, as in :func:`ivy.scaled_dot_product_attention`, unless
+        ``return_attention_weights`` is True, which needs the full attention weights.
+        Default is ``None``.
     out
         optional output array, for writing the result to. It must have a shape that the
         inputs broadcast to.
@@ -839,29 +929,43 @@ def multi_head_attention(
         (0, 2, 1, 3)
     )
     k = k.reshape((batch_size, k_seq_length, num_heads, dims_per_head)).permute_dims(
-        (0, 2, 3, 1)
+        (0, 2, 1, 3)
     )
     v = v.reshape((batch_size, k_seq_length, num_heads, dims_per_head)).permute_dims(
         (0, 2, 1, 3)
     )
-    # perform bmm
-    attn_scores = ivy.matmul(q, k)
-    # scale
     scale = 1 / (dims_per_head**0.5) if not scale else scale
-    attn_scores *= scale
-    # apply attention mask
-    if ivy.exists(attention_mask) or is_causal:
-        if is_causal:
-            # create causal mask
-            attention_mask = ivy.tril(ivy.ones((q_seq_length, k_seq_length)))
-        attention_mask = attention_mask.astype("bool")
-        attn_scores = ivy.where(attention_mask, attn_scores, -ivy.inf)
-    # perform softmax
-    attn_weights = ivy.softmax(attn_scores, axis=-1)
-    # perform dropout
-    attn_weights = ivy.dropout(attn_weights, dropout, training=training)
-    # bmm with values
-    attention_out = ivy.matmul(attn_weights, v)
+    if block_size and not return_attention_weights:
+        # stream over tiles of keys and values
+        attention_out = _tiled_attention(
+            q,
+            k,
+            v,
+            scale,
+            block_size,
+            mask=None if is_causal else attention_mask,
+            is_causal=is_causal,
+            dropout_p=dropout,
+            training=training,
+        )
+    else:
+        # perform bmm
+        attn_scores = ivy.matmul(q, k.permute_dims((0, 1, 3, 2)))
+        # scale
+        attn_scores *= scale
+        # apply attention mask
+        if ivy.exists(attention_mask) or is_causal:
+            if is_causal:
+                # create causal mask
+                attention_mask = ivy.tril(ivy.ones((q_seq_length, k_seq_length)))
+            attention_mask = attention_mask.astype("bool")
+            attn_scores = ivy.where(attention_mask, attn_scores, -ivy.inf)
+        # perform softmax
+        attn_weights = ivy.softmax(attn_scores, axis=-1)
+        # perform dropout
+        attn_weights = ivy.dropout(attn_weights, dropout, training=training)
+        # bmm with values
+        attention_out = ivy.matmul(attn_weights, v)
     attention_out = attention_out.permute_dims((0, 2, 1, 3)).reshape(
         (batch_size, q_seq_length, -1)
     )
@@ -651,8 +651,6 @@ def nested_argwhere(
     fn: Callable,
     check_nests: bool = False,
     to_ignore: Optional[Union[type, Tuple[type]]] = None,
-    _index: Optional[List] = None,
-    _base: bool = True,
     stop_after_n_found: Optional[int] = None,
 ) -> Union[Iterable, bool]:
     """
@@ -670,12 +668,6 @@ def nested_argwhere(
         Default is ``False``.
     to_ignore
         Types to ignore when deciding whether to go deeper into the nest or not
-    _index
-        The indices detected so far. None at the beginning. Used internally, do not set
-        manually.
-    _base
-        Whether the current function call is the first function call in the recursive
-        stack. Used internally, do not set manually.
     stop_after_n_found
         to stop after some needed indices are found.
 
@@ -721,90 +713,19 @@ def nested_argwhere(
         ['c', 0]
     ]
     """
-    to_ignore = ivy.default(to_ignore, ())
-    _index = list() if _index is None else _index
-    if isinstance(nest, (tuple, list)) and not isinstance(nest, to_ignore):
-        n = 0
-        _indices = []
-        for i, item in enumerate(nest):
-            ind = (
-                nested_argwhere(
-                    item,
-                    fn,
-                    check_nests,
-                    to_ignore,
-                    _index + [i],
-                    False,
-                    stop_after_n_found - n,
-                )
-                if stop_after_n_found is not None
-                else nested_argwhere(
-                    item,
-                    fn,
-                    check_nests,
-                    to_ignore,
-                    _index + [i],
-                    False,
-                    None,
-                )
-            )
-            if stop_after_n_found is not None and ind:
-                if n < stop_after_n_found:
-                    n += len(ind)
-                    _indices += [ind]
-                else:
-                    break
-            else:
-                _indices += [ind]
-            if stop_after_n_found is not None and n >= stop_after_n_found:
+    kinds = _node_kinds(True, ivy.default(to_ignore, ()), slices=False)
+    if kinds[type(nest)] is None:
+        return [[]] if fn(nest) else False
+    indices = []
+    if stop_after_n_found is not None and stop_after_n_found < 1:
+        return indices
+    for index, value in _walk(nest, [], kinds, check_nests):
+        # the nest itself is not checked
+        if index and fn(value):
+            indices.append(index)
+            if len(indices) == stop_after_n_found:
                 break
-        _indices = [idx for idxs in _indices if idxs for idx in idxs]
-        if check_nests and fn(nest):
-            _indices.append(_index)
-    elif (isinstance(nest, dict) or isinstance(nest, UserDict)) and not isinstance(
-        nest, to_ignore
-    ):
-        n = 0
-        _indices = []
-        for k, v in nest.items():
-            ind = (
-                nested_argwhere(
-                    v,
-                    fn,
-                    check_nests,
-                    to_ignore,
-                    _index + [k],
-                    False,
-                    stop_after_n_found - n,
-                )
-                if stop_after_n_found is not None
-                else nested_argwhere(
-                    v,
-                    fn,
-                    check_nests,
-                    to_ignore,
-                    _index + [k],
-                    False,
-                    None,
-                )
-            )
-            if stop_after_n_found is not None and ind:
-                if n < stop_after_n_found:
-                    n += len(ind)
-                    _indices += [ind]
-                else:
-                    break
-            else:
-                _indices += [ind]
-        _indices = [idx for idxs in _indices if idxs for idx in idxs]
-        if check_nests and fn(nest):
-            _indices.append(_index)
-    else:
-        cond_met = fn(nest)
-        if cond_met:
-            return [_index]
-        return False
-    return [index for index in _indices if index]
+    return indices
 
 
 @handle_exceptions
@@ -1000,9 +921,6 @@ def nested_map(
     include_derived: Optional[Union[Dict[str, bool], bool]] = None,
     to_ignore: Optional[Union[type, Tuple[type]]] = None,
     to_mutable: bool = False,
-    _tuple_check_fn: Optional[Callable] = None,
-    _list_check_fn: Optional[Callable] = None,
-    _dict_check_fn: Optional[Callable] = None,
     shallow: bool = True,
 ) -> Union[ivy.Array, ivy.NativeArray, Iterable, Dict]:
     """
@@ -1024,12 +942,6 @@ def nested_map(
     to_mutable
         Whether to convert the nest to a mutable form, changing all tuples to lists.
         Default is ``False``.
-    _tuple_check_fn
-        Placeholder for the tuple check function, do not set this parameter.
-    _list_check_fn
-        Placeholder for the list check function, do not set this parameter.
-    _dict_check_fn
-        Placeholder for the dict check function, do not set this parameter.
     shallow
         Whether to inplace update the input nest or not
         Only works if nest is a mutable type. Default is ``True``.
@@ -1103,13 +1015,6 @@ def nested_map(
     [[24, 25, 1338], [64, 99, 7]]
     """
     to_ignore = ivy.default(to_ignore, ())
-    if include_derived is True:
-        include_derived = {"tuple": True, "list": True, "dict": True}
-    elif not include_derived:
-        include_derived = {}
-    for t in ("tuple", "list", "dict"):
-        if t not in include_derived:
-            include_derived[t] = False
     class_instance = type(x)
     # TODO: Fixes iterating over tracked instances from the graph
     # during transpilation. However, there might be a better fix
@@ -1120,97 +1025,14 @@ def nested_map(
         and not set(class_instance.__bases__).intersection(set(to_ignore))
     ):
         to_ignore += (class_instance,)
-    tuple_check_fn = ivy.default(
-        _tuple_check_fn,
-        (
-            (lambda x_, t_: isinstance(x_, t_))
-            if include_derived["tuple"]
-            else (lambda x_, t_: type(x_) is t_)
-        ),
-    )
-    list_check_fn = ivy.default(
-        _list_check_fn,
-        (
-            (lambda x_, t_: isinstance(x_, t_))
-            if include_derived["list"]
-            else (lambda x_, t_: type(x_) is t_)
-        ),
-    )
-    dict_check_fn = ivy.default(
-        _dict_check_fn,
-        (
-            (lambda x_, t_: isinstance(x_, t_))
-            if include_derived["dict"]
-            else (lambda x_, t_: type(x_) is t_)
-        ),
-    )
-    if tuple_check_fn(x, tuple) and not isinstance(x, to_ignore):
-        ret_list = [
-            nested_map(
-                fn,
-                i,
-                include_derived,
-                to_ignore,
-                to_mutable,
-                tuple_check_fn,
-                list_check_fn,
-                dict_check_fn,
-                shallow,
-            )
-            for i in x
-        ]
-        if to_mutable:
-            return ret_list
-        elif hasattr(x, "_fields"):
-            # noinspection PyProtectedMember
-            return class_instance(**dict(zip(x._fields, ret_list)))
-        else:
-            return class_instance(ret_list)
-    elif list_check_fn(x, list) and not isinstance(x, to_ignore):
-        ret_list = [
-            nested_map(
-                fn,
-                i,
-                include_derived,
-                to_ignore,
-                to_mutable,
-                tuple_check_fn,
-                list_check_fn,
-                dict_check_fn,
-                shallow,
-            )
-            for i in x
-        ]
-        if shallow:
-            x[:] = ret_list[:]
-            return x
-        return class_instance(ret_list)
-    elif (dict_check_fn(x, dict) or isinstance(x, UserDict)) and not isinstance(
-        x, to_ignore
-    ):
-        class_instance = type(x)
-        ret = {
-            k: nested_map(
-                fn,
-                v,
-                include_derived,
-                to_ignore,
-                to_mutable,
-                tuple_check_fn,
-                list_check_fn,
-                dict_check_fn,
-                shallow,
-            )
-            for k, v in x.items()
-        }
-        if shallow:
-            x.update(ret)
-            return x
-        return class_instance(ret)
-    elif isinstance(x, slice):
-        # TODO: add tests for this
-        return slice(*nested_map(fn, [x.start, x.stop, x.step]))
-    return fn(x)
+    leaves = []
+    treedef = _flatten(x, leaves, _node_kinds(include_derived, to_ignore))
+    if treedef is _LEAF:
+        return fn(x)
+    leaves = iter([fn(leaf) for leaf in leaves])
+    if shallow:
+        return _unflatten_into(treedef, x, leaves, to_mutable)
+    return _unflatten(treedef, leaves, to_mutable)
 
 
 @handle_exceptions
@@ -1218,7 +1040,6 @@ def nested_any(
     nest: Iterable,
     fn: Callable,
     check_nests: bool = False,
-    _base: bool = True,
 ) -> bool:
     """
     Check the leaf nodes of nest x via function fn, and returns True if any evaluate to
@@ -1233,30 +1054,14 @@ def nested_any(
     check_nests
         Whether to also check the nests for the condition, not only nest leaves.
         Default is ``False``.
-    _base
-        Whether the current function call is the first function call in the recursive
-        stack. Used internally, do not set manually.
 
     Returns
     -------
     ret
         A boolean, whether the function evaluates to true for any leaf node.
     """
-    if isinstance(nest, (tuple, list)):
-        for item in nest:
-            if nested_any(item, fn, check_nests, False):
-                return True
-        if check_nests and fn(nest):
-            return True
-    elif isinstance(nest, dict):
-        for v in nest.values():
-            if nested_any(v, fn, check_nests, False):
-                return True
-        if check_nests and fn(nest):
-            return True
-    elif fn(nest):
-        return True
-    return False
+    kinds = _node_kinds(True, slices=False, user_dicts=False)
+    return any(fn(value) for _, value in _walk(nest, [], kinds, check_nests))
 
 
 @handle_exceptions
@@ -1402,6 +1207,10 @@ def nested_multi_map(
         leaf and the value at that leaf in the first nest for a non-applicable leaf if
         prune_unapplied is False else unapplied leaves are pruned.
     """
+    if index_chains is None:
+        ret = _multi_map_leaves(func, nests, prune_unapplied, index_chain, to_ivy)
+        if ret is not _NOT_FLAT:
+            return ret
     nest0 = None
     for nest in nests:
         if isinstance(nest, (tuple, list, dict)):
@@ -1585,3 +1394,382 @@ def prune_empty(nest):
     if not valid and not (ivy.is_array(nest) or isinstance(nest, (int, float, str))):
         return None
     return nest
+
+
+# Trees #
+# ------#
+
+
+class TreeDef:
+    """
+    The structure of a nest, without its leaves, as returned by
+    :func:`ivy.tree_flatten`.
+
+    Treedefs are immutable and hashable, and equal for nests of the same structure.
+    The treedefs of recently flattened structures are cached and shared by all their
+    nests, so that what is derived from the structure alone, such as the indices of
+    the leaves, is only computed once.
+
+    Parameters
+    ----------
+    node_type
+        The class of the node, or ``None`` for a leaf.
+    node_data
+        The keys of a dict node, or ``None`` for other nodes.
+    children
+        The treedefs of the children of the node.
+    """
+
+    __slots__ = (
+        "node_type",
+        "node_data",
+        "children",
+        "num_leaves",
+        "_kind",
+        "_hash",
+        "_leaf_indices",
+    )
+
+    def __init__(
+        self,
+        node_type: Optional[type] = None,
+        node_data: Optional[Tuple] = None,
+        children: Tuple = (),
+    ):
+        self.node_type = node_type
+        self.node_data = node_data
+        self.children = children
+        if node_type is None:
+            self.num_leaves, self._kind = 1, None
+        else:
+            self.num_leaves = sum(child.num_leaves for child in children)
+            self._kind = next(k for c, k in _KINDS if issubclass(node_type, c))
+        self._hash = hash((node_type, _typed_keys(node_data), children))
+        self._leaf_indices = None
+
+    @property
+    def is_leaf(self) -> bool:
+        """Whether the nest is a single leaf."""
+        return self.node_type is None
+
+    @property
+    def leaf_indices(self) -> List[Tuple]:
+        """The indices of the leaves in the nest, in the order they are flattened."""
+        if self._leaf_indices is None:
+            if self.is_leaf:
+                self._leaf_indices = [()]
+            else:
+                keys = self.node_data or range(len(self.children))
+                self._leaf_indices = [
+                    (key,) + index
+                    for key, child in zip(keys, self.children)
+                    for index in child.leaf_indices
+                ]
+        return self._leaf_indices
+
+    def __hash__(self):
+        return self._hash
+
+    def __eq__(self, other):
+        return self is other or (
+            isinstance(other, TreeDef)
+            and self._hash == other._hash
+            and self.node_type is other.node_type
+            and _typed_keys(self.node_data) == _typed_keys(other.node_data)
+            and self.children == other.children
+        )
+
+    def __repr__(self):
+        if self.is_leaf:
+            return "*"
+        children = [repr(child) for child in self.children]
+        if self.node_data is not None:
+            children = [f"{k!r}: {child}" for k, child in zip(self.node_data, children)]
+        return f"{self.node_type.__name__}({', '.join(children)})"
+
+    def __reduce__(self):
+        return _treedef, (self.node_type, self.node_data, self.children)
+
+
+# the classes of nodes, and the kinds they are traversed and rebuilt as
+_KINDS = ((tuple, tuple), (list, list), ((dict, UserDict), dict), (slice, slice))
+
+# the treedefs of the structures flattened so far, so that equal structures share one
+_TREEDEFS = dict()
+_MAX_TREEDEFS = 4096
+
+
+def _typed_keys(keys):
+    # dict keys with their types, as equal keys of different types such as 1, 1.0
+    # and True are different keys of the structure
+    return keys if keys is None else tuple((type(k), k) for k in keys)
+
+
+def _treedef(node_type=None, node_data=None, children=()):
+    key = (node_type, _typed_keys(node_data), children)
+    treedef = _TREEDEFS.get(key)
+    if treedef is None:
+        if len(_TREEDEFS) >= _MAX_TREEDEFS:
+            _TREEDEFS.clear()
+            _TREEDEFS[_LEAF_KEY] = _LEAF
+        treedef = _TREEDEFS[key] = TreeDef(node_type, node_data, children)
+    return treedef
+
+
+_LEAF_KEY = (None, None, ())
+_LEAF = _treedef()
+
+
+class _NodeKinds(dict):
+    # the kind of node of each class, or None for leaves, following the checks of
+    # ivy.nested_map for one way of traversing nests
+    def __init__(self, derived, to_ignore, slices, user_dicts):
+        super().__init__()
+        self.derived, self.to_ignore = derived, to_ignore
+        self.slices, self.user_dicts = slices, user_dicts
+
+    def __missing__(self, cls):
+        if cls is slice:
+            kind = slice if self.slices else None
+        elif issubclass(cls, tuple):
+            kind = tuple if cls is tuple or self.derived[0] else None
+        elif issubclass(cls, list):
+            kind = list if cls is list or self.derived[1] else None
+        elif (self.user_dicts and issubclass(cls, UserDict)) or (
+            issubclass(cls, dict) and (cls is dict or self.derived[2])
+        ):
+            kind = dict
+        else:
+            kind = None
+        if kind not in (None, slice) and issubclass(cls, self.to_ignore):
+            kind = None
+        self[cls] = kind
+        return kind
+
+
+# the node kinds of each way of traversing nests
+_NODE_KINDS = dict()
+
+
+def _node_kinds(include_derived=None, to_ignore=(), slices=True, user_dicts=True):
+    if include_derived is None or isinstance(include_derived, bool):
+        derived = (bool(include_derived),) * 3
+    else:
+        derived = tuple(
+            include_derived.get(t, False) for t in ("tuple", "list", "dict")
+        )
+    key = (derived, to_ignore, slices, user_dicts)
+    kinds = _NODE_KINDS.get(key)
+    if kinds is None:
+        kinds = _NODE_KINDS[key] = _NodeKinds(*key)
+    return kinds
+
+
+def _flatten(x, leaves, kinds):
+    kind = kinds[type(x)]
+    if kind is None:
+        leaves.append(x)
+        return _LEAF
+    if kind is dict:
+        keys, values = tuple(x.keys()), x.values()
+    else:
+        keys, values = None, (x.start, x.stop, x.step) if kind is slice else x
+    children = tuple([_flatten(v, leaves, kinds) for v in values])
+    return _treedef(type(x), keys, children)
+
+
+def _walk(nest, index, kinds, nests):
+    # the indices and values of the leaves of nest, and of the nests within it after
+    # their contents if nests is True, found lazily so that searches can stop early
+    kind = kinds[type(nest)]
+    if kind is None:
+        yield index, nest
+        return
+    for key, value in nest.items() if kind is dict else enumerate(nest):
+        yield from _walk(value, index + [key], kinds, nests)
+    if nests:
+        yield index, nest
+
+
+def _leaf_chains(treedef, chain, chains):
+    # the index chains of nested_multi_map, with the keys of dicts and the positions
+    # in lists and tuples
+    keys = treedef.node_data or _map(str, range(len(treedef.children)))
+    for key, child in zip(keys, treedef.children):
+        this_chain = key if chain == "" else (chain + "/" + key)
+        if child.is_leaf:
+            chains.append(this_chain)
+        else:
+            _leaf_chains(child, this_chain, chains)
+    return chains
+
+
+def _multi_map_build(treedef, rets, prune_unapplied):
+    # the nest nested_multi_map returns, without the leaves which mapped to None
+    if treedef.is_leaf:
+        return next(rets)
+    children = [
+        _multi_map_build(child, rets, prune_unapplied) for child in treedef.children
+    ]
+    if treedef._kind is dict:
+        ret = {k: v for k, v in zip(treedef.node_data, children) if v is not None}
+        if issubclass(treedef.node_type, ivy.Container):
+            ret = ivy.Container(ret)
+    else:
+        ret = [child for child in children if child is not None]
+        if treedef._kind is tuple:
+            ret = tuple(ret)
+    if prune_unapplied and len(ret) == 0:
+        return None
+    return ret
+
+
+_NOT_FLAT = object()
+
+
+def _multi_map_leaves(func, nests, prune_unapplied, index_chain, to_ivy):
+    # nested_multi_map over the flattened leaves of nests of the same structure, or
+    # _NOT_FLAT if they differ, which the leaves of some nests are broadcast against
+    kinds = _node_kinds(True, slices=False, user_dicts=False)
+    treedef, flat = None, []
+    for nest in nests:
+        leaves = []
+        nest_treedef = _flatten(nest, leaves, kinds)
+        if nest_treedef.is_leaf or (treedef is not None and nest_treedef != treedef):
+            return _NOT_FLAT
+        treedef = nest_treedef
+        flat.append(leaves)
+    if treedef is None:
+        return _NOT_FLAT
+    chains = _leaf_chains(treedef, index_chain, [])
+    rets = []
+    for values, chain in zip(zip(*flat), chains):
+        ret = func(list(values), chain)
+        if to_ivy and not isinstance(values[-1], (ivy.Array, ivy.NativeArray)):
+            ret = ivy.array(ret)
+        rets.append(ret)
+    return _multi_map_build(treedef, iter(rets), prune_unapplied)
+
+
+def _build(treedef, children, to_mutable):
+    # a node of the treedef's type, holding the children
+    kind, node_type = treedef._kind, treedef.node_type
+    if kind is tuple:
+        if to_mutable:
+            return children
+        if hasattr(node_type, "_fields"):
+            return node_type(*children)
+        return node_type(children)
+    if kind is list:
+        return node_type(children)
+    if kind is slice:
+        return slice(*children)
+    return node_type(dict(zip(treedef.node_data, children)))
+
+
+def _unflatten(treedef, leaves, to_mutable):
+    if treedef._kind is None:
+        return next(leaves)
+    children = [_unflatten(child, leaves, to_mutable) for child in treedef.children]
+    return _build(treedef, children, to_mutable)
+
+
+def _unflatten_into(treedef, nest, leaves, to_mutable):
+    # like _unflatten, but updating the lists and dicts of nest inplace
+    kind = treedef._kind
+    if kind is None:
+        return next(leaves)
+    values = (
+        (nest.start, nest.stop, nest.step)
+        if kind is slice
+        else nest.values() if kind is dict else nest
+    )
+    children = [
+        _unflatten_into(child, value, leaves, to_mutable)
+        for child, value in zip(treedef.children, values)
+    ]
+    if kind is list:
+        nest[:] = children
+        return nest
+    if kind is dict:
+        nest.update(zip(treedef.node_data, children))
+        return nest
+    return _build(treedef, children, to_mutable)
+
+
+@handle_exceptions
+def tree_flatten(
+    nest: Any,
+    /,
+    *,
+    include_derived: Optional[Union[Dict[str, bool], bool]] = None,
+    to_ignore: Optional[Union[type, Tuple[type]]] = None,
+) -> Tuple[List, TreeDef]:
+    """
+    Flatten a nest into a list of its leaves and a treedef of its structure.
+
+    The nest is traversed as by :func:`ivy.nested_map`, through its lists, tuples,
+    dicts and slices, and its leaves are listed in the order they are visited in. The
+    nest is rebuilt from the treedef and a list of leaves by :func:`ivy.tree_unflatten`.
+
+    Parameters
+    ----------
+    nest
+        The nest to flatten.
+    include_derived
+        Whether to also recurse into classes derived from tuple, list and dict, either
+        for all of them or as a dict of ``"tuple"``, ``"list"`` and ``"dict"`` to
+        booleans. Default is ``False``.
+    to_ignore
+        Types to keep as leaves, rather than going deeper into the nest.
+
+    Returns
+    -------
+    ret
+        The list of leaves of the nest, and its treedef.
+
+    Examples
+    --------
+    >>> leaves, treedef = ivy.tree_flatten({"a": [1, 2], "b": (3, {"c": 4})})
+    >>> print(leaves)
+    [1, 2, 3, 4]
+    >>> print(treedef)
+    dict('a': list(*, *), 'b': tuple(*, dict('c': *)))
+    >>> print(treedef.leaf_indices)
+    [('a', 0), ('a', 1), ('b', 0), ('b', 1, 'c')]
+    """
+    leaves = []
+    to_ignore = () if to_ignore is None else to_ignore
+    treedef = _flatten(nest, leaves, _node_kinds(include_derived, to_ignore))
+    return leaves, treedef
+
+
+@handle_exceptions
+def tree_unflatten(treedef: TreeDef, leaves: Iterable, /) -> Any:
+    """
+    Build a nest from the treedef of its structure and a list of its leaves.
+
+    Parameters
+    ----------
+    treedef
+        The structure of the nest, as returned by :func:`ivy.tree_flatten`.
+    leaves
+        The leaves of the nest, in the order :func:`ivy.tree_flatten` lists them in.
+
+    Returns
+    -------
+    ret
+        The nest.
+
+    Examples
+    --------
+    >>> leaves, treedef = ivy.tree_flatten({"a": [1, 2], "b": (3, {"c": 4})})
+    >>> ivy.tree_unflatten(treedef, [x * 10 for x in leaves])
+    {'a': [10, 20], 'b': (30, {'c': 40})}
+    """
+    leaves = list(leaves)
+    if len(leaves) != treedef.num_leaves:
+        raise ivy.utils.exceptions.IvyValueError(
+            f"the treedef has {treedef.num_leaves} leaves, but {len(leaves)} were given"
+        )
+    return _unflatten(treedef, iter(leaves), False)
@@ -4,6 +4,8 @@ from typing import Union, Optional, Sequence
 # local
 import ivy
 from ivy.utils.backend import current_backend
+from ivy.utils.einsum_parser import legalise_einsum_expr
+from ivy.utils.einsum_path import contract_path
 from ivy.func_wrapper import (
     handle_array_function,
     to_native_arrays_and_back,
@@ -12,6 +14,7 @@ from ivy.func_wrapper import (
     handle_array_like_without_promotion,
     handle_device_shifting,
     handle_backend_invalid,
+    handle_partial_mixed_function,
 )
 from ivy.utils.exceptions import handle_exceptions
 
@@ -1185,6 +1188,7 @@ def cumprod(
 @handle_exceptions
 @handle_backend_invalid
 @handle_nestable
+@handle_partial_mixed_function
 @handle_array_like_without_promotion
 @handle_out_argument
 @to_native_arrays_and_back
@@ -1199,6 +1203,9 @@ def einsum(
     Sum the product of the elements of the input operands along dimensions specified
     using a notation based on the Einstein summation convention.
 
+    More than two operands are contracted pairwise, in the order with the fewest
+    flops found by ``ivy.utils.einsum_path.contract_path``, whatever the backend.
+
     Parameters
     ----------
     equation
@@ -1308,4 +1315,22 @@ def einsum(
         b: ivy.array(15)
     }
     """
-    return current_backend(operands[0]).einsum(equation, *operands, out=out)
+    backend = current_backend(operands[0])
+    if len(operands) < 3:
+        return backend.einsum(equation, *operands, out=out)
+    # contract the operands pairwise, in the order with the fewest flops, rather than
+    # leaving the order to the backend, which may contract all of them at once
+    equation = legalise_einsum_expr(equation, *operands)
+    path, info = contract_path(equation, [operand.shape for operand in operands])
+    operands = list(operands)
+    for num, (positions, step) in enumerate(zip(path, info.equations)):
+        terms = [operands.pop(p) for p in sorted(positions, reverse=True)][::-1]
+        step_out = out if num == len(path) - 1 else None
+        operands.append(backend.einsum(step, *terms, out=step_out))
+    return operands[0]
+
+
+einsum.mixed_backend_wrappers = {
+    "to_add": (),
+    "to_skip": ("handle_partial_mixed_function",),
+}
@@ -3,6 +3,8 @@
 # local
 import ivy
 from ivy.func_wrapper import handle_nestable
+from ivy.functional.ivy.layers import _in_projection
+from ivy.functional.ivy.experimental.layers import _stft_params
 from ivy.stateful.initializers import GlorotUniform, Zeros
 from ivy.stateful.module import Module
 
@@ -191,6 +193,125 @@ class Dropout(Module):
 # ----------#
 
 
+class KVCache:
+    def __init__(
+        self,
+        batch_size,
+        dim,
+        /,
+        *,
+        max_length=64,
+        device=None,
+        dtype=None,
+    ):
+        """
+        Key and value cache for incremental decoding with MultiHeadAttention.
+
+        The projected keys and values of each sequence in the batch are stored in
+        preallocated buffers, which are written in place and doubled in length when
+        they run out of space. Each sequence keeps its own length, so sequences of
+        different lengths can be decoded together.
+
+        Parameters
+        ----------
+        batch_size
+            The number of sequences in the batch.
+        dim
+            The feature size of the projected keys and values, which is
+            ``num_heads * head_dim`` for MultiHeadAttention.
+        max_length
+            The number of positions to preallocate for each sequence. Default is 64.
+        device
+            device on which to create the buffers 'cuda:0', 'cuda:1', 'cpu' etc.
+            Default is cpu.
+        dtype
+            the desired data type of the buffers. Default is ``None``.
+        """
+        self._batch_size = batch_size
+        self._dim = dim
+        self._device = device
+        self._dtype = dtype
+        shape = (batch_size, max_length, dim)
+        self._keys = ivy.zeros(shape, device=device, dtype=dtype)
+        self._values = ivy.zeros(shape, device=device, dtype=dtype)
+        self._lengths = [0] * batch_size
+
+    @property
+    def lengths(self):
+        """The number of cached positions of each sequence."""
+        return list(self._lengths)
+
+    @property
+    def capacity(self):
+        """The number of positions each sequence can hold before the buffers grow."""
+        return self._keys.shape[1]
+
+    @property
+    def keys(self):
+        """The cached keys, up to the length of the longest sequence."""
+        return self._keys[:, : max(self._lengths)]
+
+    @property
+    def values(self):
+        """The cached values, up to the length of the longest sequence."""
+        return self._values[:, : max(self._lengths)]
+
+    @property
+    def nbytes(self):
+        """The number of bytes held by the key and value buffers."""
+        return (self._keys.size + self._values.size) * self._keys.itemsize
+
+    def _grow(self, length):
+        old_capacity = capacity = self.capacity
+        while capacity < length:
+            capacity *= 2
+        shape = (self._batch_size, capacity, self._dim)
+        for name in ["_keys", "_values"]:
+            buffer = ivy.zeros(shape, device=self._device, dtype=self._dtype)
+            buffer[:, :old_capacity] = getattr(self, name)
+            setattr(self, name, buffer)
+
+    def append(self, keys, values, /, *, lengths=None):
+        """
+        Write new projected keys and values after the cached ones.
+
+        Parameters
+        ----------
+        keys
+            The new keys *[batch_size,num_new,dim]*.
+        values
+            The new values *[batch_size,num_new,dim]*.
+        lengths
+            The number of valid new positions of each sequence, for batches of
+            sequences with different numbers of new tokens. Positions past these are
+            padding and are not cached. Default is ``None``, meaning all of them.
+
+        Returns
+        -------
+        ret
+            The lengths of the sequences before the new positions were appended.
+        """
+        num_new = keys.shape[1]
+        lengths = [num_new] * self._batch_size if lengths is None else list(lengths)
+        starts = self.lengths
+        stops = [start + length for start, length in zip(starts, lengths)]
+        if max(stops) > self.capacity:
+            self._grow(max(stops))
+        if len(set(starts)) == 1 and all(length == num_new for length in lengths):
+            self._keys[:, starts[0] : stops[0]] = keys
+            self._values[:, starts[0] : stops[0]] = values
+        else:
+            for b, (start, length) in enumerate(zip(starts, lengths)):
+                self._keys[b, start : start + length] = keys[b, :length]
+                self._values[b, start : start + length] = values[b, :length]
+        self._lengths = stops
+        return starts
+
+    def reset(self):
+        """Empty the cache, keeping the buffers for reuse."""
+        self._lengths = [0] * self._batch_size
+
+
 class MultiHeadAttention(Module):
     def __init__(
         self,
@@ -205,6 +326,7 @@ class MultiHeadAttention(Module):
         use_proj_bias=True,
         attention_axes=None,
         scale=None,
+        block_size=None,
         device=None,
         v=None,
         build_mode="on_init",
@@ -244,6 +366,10 @@ class MultiHeadAttention(Module):
         scale
             The value by which to scale the query-key similarity measure.
             Default is head_dim^-0.5
+        block_size
+            If set, keys and values are processed in tiles of this many positions,
+            which bounds the memory used for long sequences. See
+            :func:`ivy.multi_head_attention`. Default is None.
         device
             device on which to create the layer's variables 'cuda:0', 'cuda:1', 'cpu' etc.
             Default is cpu.
@@ -277,6 +403,7 @@ class MultiHeadAttention(Module):
         self._use_proj_bias = use_proj_bias
         self._attention_axes = attention_axes
         self._scale = ivy.default(scale, self._head_dim**-0.5)
+        self._block_size = block_size
         self._qkv_same_embed_dim = (
             self._key_dim == self._embed_dim and self._value_dim == self._embed_dim
         )
@@ -374,6 +501,8 @@ class MultiHeadAttention(Module):
         is_causal=False,
         return_attention_weights=False,
         average_attention_weights=True,
+        cache=None,
+        lengths=None,
     ):
         """
         Perform forward pass of the MultiHeadAttention layer.
@@ -398,14 +527,37 @@ class MultiHeadAttention(Module):
             If true, indicates that the returned ``attention_weights`` should be averaged across
             heads. Otherwise, ``attention_weights`` are provided separately per head. Note that this flag only has an
             effect when ``return_attention_weights=True``. Default: ``True`` (i.e. average weights across heads)
+        cache
+            A KVCache created with ``init_cache``, for incremental decoding of batched
+            inputs. Only the new query, key and value positions are projected, the new
+            keys and values are appended to the cache, and the queries attend to all of
+            the cached positions of their sequence. With ``is_causal``, each new query
+            only attends to the positions up to its own. Default is ``None``.
+        lengths
+            The number of valid new positions of each sequence when decoding with a
+            cache, for sequences with different numbers of new tokens. Default is
+            ``None``, meaning all of them.
 
         Returns
         -------
         ret
             The output following application of multi-head attention.
             *[batch_shape,num_queries,out_feat_dim]* if input is batched
-            otherwise *[num_queries, out_feat_dim]
-        """
+            otherwise *[num_queries, out_feat_dim]. If a cache is given, this is
+            returned as a tuple alongside the updated cache.
+        """
+        if ivy.exists(cache):
+            return self._forward_with_cache(
+                query,
+                key,
+                value,
+                cache,
+                attention_mask=attention_mask,
+                is_causal=is_causal,
+                lengths=lengths,
+                return_attention_weights=return_attention_weights,
+                average_attention_weights=average_attention_weights,
+            )
         return ivy.multi_head_attention(
             query,
             key=key,
@@ -433,7 +585,95 @@ class MultiHeadAttention(Module):
             average_attention_weights=average_attention_weights,
             dropout=self._dropout_rate,
             training=self.training,
+            block_size=self._block_size,
+        )
+
+    def init_cache(self, batch_size, /, *, max_length=64):
+        """
+        Create an empty key and value cache for incremental decoding.
+
+        Parameters
+        ----------
+        batch_size
+            The number of sequences decoded together.
+        max_length
+            The number of positions to preallocate for each sequence, the cache grows
+            beyond this when needed. Default is 64.
+
+        Returns
+        -------
+        ret
+            A KVCache to pass to the layer as ``cache``.
+        """
+        return KVCache(
+            batch_size,
+            self._inner_dim,
+            max_length=max_length,
+            device=self._device,
+            dtype=ivy.dtype(self.v.out_proj_weights),
+        )
+
+    def _forward_with_cache(
+        self,
+        query,
+        key,
+        value,
+        cache,
+        /,
+        *,
+        attention_mask=None,
+        is_causal=False,
+        lengths=None,
+        return_attention_weights=False,
+        average_attention_weights=True,
+    ):
+        if key is None and value is None:
+            key = value = query
+        bias = self.v.in_proj_bias if self._use_proj_bias else None
+        if self._qkv_same_embed_dim:
+            q, k, v = _in_projection(
+                query, key, value, w=self.v.in_proj_weights, b=bias
+            )
+        else:
+            if ivy.exists(bias):
+                b_q, b_k, b_v = ivy.split(bias, num_or_size_splits=3)
+            else:
+                b_q = b_k = b_v = None
+            q, k, v = (
+                ivy.linear(query, self.v.q_proj_weights, bias=b_q),
+                ivy.linear(key, self.v.k_proj_weights, bias=b_k),
+                ivy.linear(value, self.v.v_proj_weights, bias=b_v),
+            )
+        starts = cache.append(k, v, lengths=lengths)
+        # mask the unused buffer positions of shorter sequences, and with is_causal,
+        # the positions after each new query
+        key_positions = ivy.arange(max(cache.lengths), device=self._device)
+        mask = key_positions < ivy.reshape(
+            ivy.array(cache.lengths, device=self._device), (-1, 1, 1)
+        )
+        if is_causal:
+            query_positions = ivy.reshape(
+                ivy.array(starts, device=self._device), (-1, 1, 1)
+            ) + ivy.reshape(ivy.arange(q.shape[-2], device=self._device), (-1, 1))
+            mask = ivy.logical_and(mask, key_positions <= query_positions)
+        if ivy.exists(attention_mask):
+            mask = ivy.logical_and(mask, ivy.astype(attention_mask, ivy.bool))
+        ret = ivy.multi_head_attention(
+            q,
+            key=cache.keys,
+            value=cache.values,
+            num_heads=self._num_heads,
+            scale=self._scale,
+            attention_mask=ivy.expand_dims(mask, axis=1),
+            out_proj_weights=self.v.out_proj_weights,
+            out_proj_bias=self.v.out_proj_bias if self._use_proj_bias else None,
+            return_attention_weights=return_attention_weights,
+            average_attention_weights=average_attention_weights,
+            dropout=self._dropout_rate,
+            training=self.training,
+            block_size=self._block_size,
         )
+        return ret, cache
 
 
 # Convolutions #
@@ -1987,6 +2227,139 @@ class FFT(Module):
         )
 
 
+class StreamingSTFT:
+    def __init__(
+        self,
+        frame_length,
+        frame_step,
+        /,
+        *,
+        fft_length=None,
+        window_fn=None,
+        pad_end=False,
+    ):
+        """
+        Short-time Fourier Transform of signals which arrive in chunks.
+
+        The samples of each chunk are appended to those left over from the previous
+        chunks, and the frames which are complete are transformed with ivy.stft and
+        returned. Only the samples of the next, incomplete frame are kept, so at most
+        frame_length - 1 samples are buffered however long the stream is. The frames
+        returned for every chunk, followed by those returned by flush at the end of
+        the stream, are the ivy.stft of the whole signals.
+
+        Parameters
+        ----------
+        frame_length
+            The window length in samples.
+        frame_step
+            The number of samples to step.
+        fft_length
+            The size of the FFT to apply. If not provided, uses the smallest power of
+            2 enclosing frame_length.
+        window_fn
+            A callable that takes a window length and returns a [window_length]
+            array of samples. If set to None, no windowing is used.
+        pad_end
+            Whether flush should pad the end of the signals with zeros, and return
+            the frames which lie partially past their end. Default is ``False``.
+        """
+        self._frame_length = frame_length
+        self._frame_step = frame_step
+        self._fft_length = _stft_params(
+            0, frame_length, frame_step, fft_length, False
+        )[0]
+        self._window_fn = window_fn
+        self._pad_end = pad_end
+        self.reset()
+
+    @property
+    def buffered(self):
+        """The number of samples of each signal kept for the next frame."""
+        return 0 if self._buffer is None else self._buffer.shape[-1]
+
+    def _stft(self, signals, pad_end):
+        return ivy.stft(
+            signals,
+            self._frame_length,
+            self._frame_step,
+            fft_length=self._fft_length,
+            window_fn=self._window_fn,
+            pad_end=pad_end,
+        )
+
+    def _no_frames(self):
+        if self._empty is None:
+            batch_shape, dtype, device = (), "float32", None
+            if self._buffer is not None:
+                batch_shape = self._buffer.shape[:-1]
+                dtype, device = self._buffer.dtype, ivy.dev(self._buffer)
+            self._empty = ivy.zeros(
+                (*batch_shape, 0, self._fft_length // 2 + 1),
+                dtype=ivy.promote_types(dtype, "complex64"),
+                device=device,
+            )
+        return self._empty
+
+    def process(self, chunk):
+        """
+        Transform the frames completed by the next chunk of the signals.
+
+        Parameters
+        ----------
+        chunk
+            The next [..., samples] samples of the signals.
+
+        Returns
+        -------
+        ret
+            A [..., frames, fft_unique_bins] array of the STFT values of the frames
+            completed by the chunk, where fft_unique_bins is fft_length // 2 + 1.
+        """
+        # the samples between frames, when frame_step is larger than frame_length
+        skip = min(self._skip, chunk.shape[-1])
+        if skip:
+            chunk = chunk[..., skip:]
+            self._skip -= skip
+        if self._buffer is None:
+            signals = chunk
+        else:
+            signals = ivy.concat([self._buffer, chunk], axis=-1)
+        num_samples = signals.shape[-1]
+        num_frames = max(0, 1 + (num_samples - self._frame_length) // self._frame_step)
+        consumed = num_frames * self._frame_step
+        self._skip += max(0, consumed - num_samples)
+        self._buffer = signals[..., consumed:]
+        if not num_frames:
+            return self._no_frames()
+        end = consumed - self._frame_step + self._frame_length
+        return self._stft(signals[..., :end], False)
+
+    def flush(self):
+        """
+        End the stream, and reset it for the next signals.
+
+        Returns
+        -------
+        ret
+            A [..., frames, fft_unique_bins] array of the STFT values of the frames
+            which lie partially past the end of the signals if pad_end is set, or
+            of no frames otherwise.
+        """
+        if self._pad_end and self.buffered:
+            ret = self._stft(self._buffer, True)
+        else:
+            ret = self._no_frames()
+        self.reset()
+        return ret
+
+    def reset(self):
+        """Drop the buffered samples, to start transforming new signals."""
+        self._buffer = None
+        self._empty = None
+        self._skip = 0
+
+
 class AvgPool1D(Module):
     def __init__(
         self,
@@ -152,6 +152,8 @@ class Module(ModuleHelpers, ModuleConverters, ModuleMeta):
         self._lazy_compiled = False
         self._dynamic_backend = dynamic_backend
         self.training = training
+        self._fast_call = False
+        self._fast_call_v = None
         if build_mode != "on_init":
             return
         if hasattr(Module, "_init_var"):
@@ -629,6 +631,24 @@ class Module(ModuleHelpers, ModuleConverters, ModuleMeta):
         -------
         ret
         """
+        if (
+            self._fast_call
+            and self._built
+            and not buffers
+            and not self._lazy_compiled
+            and not self._module_graph
+        ):
+            if (
+                track_submod_rets
+                or track_submod_call_order
+                or ivy.exists(expected_submod_rets)
+            ):
+                raise ivy.utils.exceptions.IvyException(
+                    "submodules cannot be tracked in fast_call mode, call train() or "
+                    "eval() to leave it"
+                )
+            return self._fast_forward(*args, v=v, **kwargs)
+
         if self._lazy_compiled:
             # we are compiling since we want to transpile module,
             # so set the appropriate backend
@@ -660,6 +680,47 @@ class Module(ModuleHelpers, ModuleConverters, ModuleMeta):
         self._unset_submod_flags()
         return ret
 
+    def _fast_forward(self, *args, v=None, **kwargs):
+        """
+        Forward pass of the inference mode set by ``eval(fast_call=True)``.
+
+        This skips the submodule tracking of ``__call__`` and calls ``_forward``
+        directly. The variables which a submodule shares with the module that built
+        it are extracted once, and cached until that module's variables are replaced.
+        """
+        if v is None and "__call__" in self.__dict__:
+            v = self._fast_call_shared_v(self.__dict__["__call__"])
+        if v is None or v is self.v:
+            return self._forward(*args, **kwargs)
+        v_orig = self.v
+        self.v = v if isinstance(v, Container) else Container(v)
+        try:
+            return self._forward(*args, **kwargs)
+        finally:
+            self.v = v_orig
+
+    def _fast_call_shared_v(self, wrapper):
+        # the innermost wrapper of the call method extracts the variables used
+        while hasattr(wrapper.keywords["fn"], "wrapped"):
+            wrapper = wrapper.keywords["fn"]
+        top_v = wrapper.func.__self__.v
+        if self._fast_call_v is None or self._fast_call_v[0] is not top_v:
+            self._fast_call_v = (
+                top_v,
+                wrapper.keywords["v_fn"](
+                    top_v,
+                    wrapper.keywords["keychain_mappings"],
+                    wrapper.keywords["orig_key_chain"],
+                ),
+            )
+        return self._fast_call_v[1]
+
+    def _set_fast_call(self, mode):
+        self._fast_call = mode
+        self._fast_call_v = None
+        for module in self._sub_mods:
+            module._set_fast_call(mode)
+
     def save_weights(self, weights_path, /):
         """
         Save the weights on the Module.
@@ -821,13 +882,17 @@ class Module(ModuleHelpers, ModuleConverters, ModuleMeta):
         """Set the buffer at any place within the class."""
         self._set_buffers({var_name: value})
 
-    def eval(self):
-        # disables training mode for child modules
+    def eval(self, fast_call: bool = False):
+        # disables training mode for child modules, and with fast_call, skips the
+        # submodule tracking machinery of every call until train() is called
         self.train(mode=False)
+        self._set_fast_call(fast_call)
 
     def train(self, mode: bool = True):
         # enables/disables training mode
         self.training = mode
+        if mode:
+            self._set_fast_call(False)
         for module in self.v:
             module = getattr(self, module, None)
             if isinstance(module, ivy.Module):
@@ -9,6 +9,57 @@ from typing import Union, Optional, Callable
 import ivy
 
 
+# Helpers #
+# --------#
+
+
+def _numel(shape):
+    ret = 1
+    for dim in shape:
+        ret *= dim
+    return ret
+
+
+# The flat buffers are packed and unpacked with the backend functions directly, since
+# the per-variable overhead of the functional API wrappers is what fusing removes.
+
+
+def _native(x):
+    return x.data if isinstance(x, ivy.Array) else x
+
+
+def _flatten(xs):
+    backend = ivy.current_backend()
+    return ivy.Array(backend.concat([backend.reshape(_native(x), (-1,)) for x in xs]))
+
+
+def _unflatten(x, shapes, offsets):
+    backend = ivy.current_backend()
+    x = _native(x)
+    return [
+        ivy.Array(backend.reshape(x[start:stop], shape))
+        for shape, start, stop in zip(shapes, offsets[:-1], offsets[1:])
+    ]
+
+
+def _segment_norms(x, offsets):
+    """Compute the vector norm of each variable held in the flat buffer x at once."""
+    backend = ivy.current_backend()
+    x = _native(x)
+    sizes = [stop - start for start, stop in zip(offsets[:-1], offsets[1:])]
+    segment_ids = backend.repeat(
+        backend.arange(len(sizes), device=ivy.dev(x, as_native=True)), sizes
+    )
+    sums = backend.unsorted_segment_sum(x * x, segment_ids, len(sizes))
+    return ivy.Array(backend.sqrt(sums))
+
+
+def _expand(x, offsets):
+    """Repeat each per-variable value in x over the elements of that variable."""
+    sizes = [stop - start for start, stop in zip(offsets[:-1], offsets[1:])]
+    return ivy.repeat(x, sizes)
+
+
 # Base #
 # -----#
 
@@ -23,6 +74,7 @@ class Optimizer(abc.ABC):
         compile_on_next_step: bool = False,
         fallback_to_non_compiled: bool = False,
         device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
+        fused: bool = False,
     ):
         """
         Construct a general Optimizer. This is an abstract class, and must be derived.
@@ -50,6 +102,11 @@ class Optimizer(abc.ABC):
         device
             Device on which to create the layer's variables 'cuda:0', 'cuda:1', 'cpu'
             etc. (Default value = None)
+        fused
+            Whether to apply each step to a few contiguous buffers, one per dtype and
+            device, holding all of the variables, rather than separately to each
+            variable. The optimizer state is then also kept in such buffers.
+            Default is ``False``.
         """
         self._lr = lr
         self._inplace = inplace
@@ -62,6 +119,9 @@ class Optimizer(abc.ABC):
         self._count = ivy.array([0], device=self._dev)
         self._compiled_step_fn = None
         self._compiled = False
+        self._fused = fused
+        self._fused_layout = None
+        self._fused_structure = None
 
     # Private #
     # --------#
@@ -88,6 +148,29 @@ class Optimizer(abc.ABC):
         """
         raise ivy.utils.exceptions.IvyNotImplementedException
 
+    def _fused_step(self, ws: list, dcdws: list, lr, offsets: list):
+        """
+        Update the flat buffers of variables, one per dtype and device, from the flat
+        buffers of gradients. Override this method to support ``fused=True``.
+
+        Parameters
+        ----------
+        ws
+            Flat buffers of variables to update.
+        dcdws
+            Flat buffers of gradients, matching ``ws``.
+        lr
+            Learning rate.
+        offsets
+            For each buffer, the offsets at which the variables it holds start and end.
+
+        Returns
+        -------
+        ret
+            The updated flat buffers of variables.
+        """
+        raise ivy.utils.exceptions.IvyNotImplementedException
+
     # Given #
 
     def _step_fn(
@@ -107,9 +190,83 @@ class Optimizer(abc.ABC):
             the variables.
             Default is ``False``
         """
+        step = self._fused_step_fn if self._fused else self._step
         if ignore_missing:
-            return v.cont_set_at_keys(self._step(v.cont_at_key_chains(grads), grads))
-        return self._step(v, grads)
+            return v.cont_set_at_keys(step(v.cont_at_key_chains(grads), grads))
+        return step(v, grads)
+
+    def _get_fused_layout(self, v: ivy.Container):
+        """
+        Get the grouping of the variables in v into flat buffers, which is reused for
+        as long as the names, shapes, dtypes and devices of the variables don't change.
+        """
+        signature = [
+            (
+                kc,
+                tuple(x.shape),
+                str(x.dtype),
+                x.device if isinstance(x, ivy.Array) else ivy.dev(x),
+            )
+            for kc, x in v.cont_to_iterator()
+        ]
+        if self._fused_layout is not None:
+            if self._fused_layout[0] == signature:
+                return self._fused_layout[1]
+            # convert the flat state while the previous layout still describes it
+            self.set_state(self.state)
+        groups = dict()
+        for idx, (_, shape, dtype, device) in enumerate(signature):
+            groups.setdefault((dtype, device), []).append(idx)
+        layout = []
+        for idxs in groups.values():
+            offsets = [0]
+            for idx in idxs:
+                offsets.append(offsets[-1] + _numel(signature[idx][1]))
+            layout.append((idxs, [signature[idx][1] for idx in idxs], offsets))
+        self._fused_layout = (signature, layout)
+        return layout
+
+    def _fused_step_fn(self, v: ivy.Container, grads: ivy.Container):
+        """
+        Update nested variables container v with the overridden self._fused_step, by
+        flattening the variables and gradients into one buffer per dtype and device.
+        """
+        layout = self._get_fused_layout(v)
+        self._fused_structure = v
+        xs = v.cont_to_flat_list()
+        ws = self._fused_step(
+            [_flatten([xs[idx] for idx in idxs]) for idxs, _, _ in layout],
+            self._fused_flatten(grads),
+            self._lr if isinstance(self._lr, float) else self._lr(),
+            [offsets for _, _, offsets in layout],
+        )
+        backend = ivy.current_backend()
+        inplace = self._inplace and ivy.inplace_arrays_supported()
+        for w, (idxs, shapes, offsets) in zip(ws, layout):
+            if self._stop_gradients:
+                w = ivy.stop_gradient(w, preserve_type=True)
+            for idx, x in zip(idxs, _unflatten(w, shapes, offsets)):
+                if inplace and isinstance(xs[idx], ivy.Array):
+                    backend.inplace_update(xs[idx], x)
+                else:
+                    xs[idx] = x
+        return v.cont_from_flat_list(xs)
+
+    def _fused_to_container(self, buffers: list):
+        """Convert flat buffers of the optimizer state to a nested container."""
+        xs = [None] * len(self._fused_layout[0])
+        for w, (idxs, shapes, offsets) in zip(buffers, self._fused_layout[1]):
+            for idx, x in zip(idxs, _unflatten(w, shapes, offsets)):
+                xs[idx] = x
+        return self._fused_structure.cont_from_flat_list(xs)
+
+    def _fused_flatten(self, x: ivy.Container):
+        """Flatten a container matching the variables into flat buffers."""
+        x = dict(x.cont_to_iterator())
+        x = [x[kc] for kc, *_ in self._fused_layout[0]]
+        return [
+            _flatten([x[idx] for idx in idxs]) for idxs, _, _ in self._fused_layout[1]
+        ]
 
     # Public #
     # -------#
@@ -168,6 +325,7 @@ class SGD(Optimizer):
         inplace: bool = True,
         stop_gradients: bool = True,
         compile_on_next_step: bool = False,
+        fused: bool = False,
     ):
         """
         Construct a Stochastic-Gradient-Descent (SGD) optimizer.
@@ -186,9 +344,17 @@ class SGD(Optimizer):
             Default is ``True``.
         compile_on_next_step
             Whether to compile the optimizer on the next step. Default is ``False``.
+        fused
+            Whether to update all of the variables together, in one flat buffer per
+            dtype and device. Default is ``False``.
         """
         Optimizer.__init__(
-            self, lr, inplace, stop_gradients, compile_on_next_step=compile_on_next_step
+            self,
+            lr,
+            inplace,
+            stop_gradients,
+            compile_on_next_step=compile_on_next_step,
+            fused=fused,
         )
 
     # Custom Step
@@ -217,6 +383,9 @@ class SGD(Optimizer):
             stop_gradients=self._stop_gradients,
         )
 
+    def _fused_step(self, ws: list, dcdws: list, lr, offsets: list):
+        return [w - dcdw * lr for w, dcdw in zip(ws, dcdws)]
+
     def set_state(self, state: ivy.Container):
         """
         Set state of the optimizer.
@@ -241,6 +410,7 @@ class LARS(Optimizer):
         inplace: bool = True,
         stop_gradients: bool = True,
         compile_on_next_step: bool = False,
+        fused: bool = False,
     ):
         """
         Construct a Layer-wise Adaptive Rate Scaling (LARS) optimizer.
@@ -261,10 +431,18 @@ class LARS(Optimizer):
             Default is ``True``.
         compile_on_next_step
             Whether to compile the optimizer on the next step. Default is ``False``.
+        fused
+            Whether to update all of the variables together, in one flat buffer per
+            dtype and device. Default is ``False``.
         """
         self._decay_lambda = decay_lambda
         Optimizer.__init__(
-            self, lr, inplace, stop_gradients, compile_on_next_step=compile_on_next_step
+            self,
+            lr,
+            inplace,
+            stop_gradients,
+            compile_on_next_step=compile_on_next_step,
+            fused=fused,
         )
 
     # Custom Step
@@ -294,6 +472,16 @@ class LARS(Optimizer):
             stop_gradients=self._stop_gradients,
         )
 
+    def _fused_step(self, ws: list, dcdws: list, lr, offsets: list):
+        ret = []
+        for w, dcdw, offs in zip(ws, dcdws, offsets):
+            w_norm = _segment_norms(w, offs)
+            lrs = ivy.stable_divide(w_norm * lr, _segment_norms(dcdw, offs))
+            if self._decay_lambda > 0:
+                lrs /= w_norm * self._decay_lambda
+            ret.append(w - dcdw * _expand(lrs, offs))
+        return ret
+
     def set_state(self, state: ivy.Container):
         """
         Set state of the optimizer.
@@ -321,6 +509,7 @@ class Adam(Optimizer):
         stop_gradients: bool = True,
         compile_on_next_step: bool = False,
         device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
+        fused: bool = False,
     ):
         """
         Construct an ADAM optimizer.
@@ -349,6 +538,9 @@ class Adam(Optimizer):
         device
             Device on which to create the layer's variables 'cuda:0', 'cuda:1', 'cpu'
             etc. (Default value = None)
+        fused
+            Whether to update all of the variables together, in one flat buffer per
+            dtype and device. Default is ``False``.
         """
         self._beta1 = beta1
         self._beta2 = beta2
@@ -359,7 +551,14 @@ class Adam(Optimizer):
         self._should_compile = False
 
         Optimizer.__init__(
-            self, lr, inplace, stop_gradients, True, compile_on_next_step, device=device
+            self,
+            lr,
+            inplace,
+            stop_gradients,
+            True,
+            compile_on_next_step,
+            device=device,
+            fused=fused,
         )
 
     # Custom Step
@@ -400,6 +599,28 @@ class Adam(Optimizer):
         )
         return new_v
 
+    def _fused_step(self, ws: list, dcdws: list, lr, offsets: list):
+        if self._first_pass:
+            self._mw = list(dcdws)
+            self._vw = [dcdw**2 for dcdw in dcdws]
+            self._first_pass = False
+        elif not isinstance(self._mw, list):
+            self._mw = self._fused_flatten(self._mw)
+            self._vw = self._fused_flatten(self._vw)
+        ret = []
+        for i, (w, dcdw) in enumerate(zip(ws, dcdws)):
+            eff_grads, self._mw[i], self._vw[i] = ivy.adam_step(
+                dcdw,
+                self._mw[i],
+                self._vw[i],
+                self._count,
+                beta1=self._beta1,
+                beta2=self._beta2,
+                epsilon=self._epsilon,
+            )
+            ret.append(w - eff_grads * lr)
+        return ret
+
     def set_state(self, state: ivy.Container):
         """
         Set state of the optimizer.
@@ -414,6 +635,13 @@ class Adam(Optimizer):
 
     @property
     def state(self):
+        if isinstance(self._mw, list):
+            return ivy.Container(
+                {
+                    "mw": self._fused_to_container(self._mw),
+                    "vw": self._fused_to_container(self._vw),
+                }
+            )
         return ivy.Container({"mw": self._mw, "vw": self._vw})
 
 
@@ -430,6 +658,7 @@ class LAMB(Optimizer):
         stop_gradients: bool = True,
         compile_on_next_step: bool = False,
         device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
+        fused: bool = False,
     ):
         """
         Construct an LAMB optimizer.
@@ -463,9 +692,19 @@ class LAMB(Optimizer):
         device
             Device on which to create the layer's variables 'cuda:0', 'cuda:1', 'cpu'
             etc. (Default value = None)
+        fused
+            Whether to update all of the variables together, in one flat buffer per
+            dtype and device. Default is ``False``.
         """
         Optimizer.__init__(
-            self, lr, inplace, stop_gradients, True, compile_on_next_step, device=device
+            self,
+            lr,
+            inplace,
+            stop_gradients,
+            True,
+            compile_on_next_step,
+            device=device,
+            fused=fused,
         )
         self._beta1 = beta1
         self._beta2 = beta2
@@ -516,6 +755,36 @@ class LAMB(Optimizer):
         )
         return new_v
 
+    def _fused_step(self, ws: list, dcdws: list, lr, offsets: list):
+        if self._first_pass:
+            self._mw = list(dcdws)
+            self._vw = [dcdw**2 for dcdw in dcdws]
+            self._first_pass = False
+        elif not isinstance(self._mw, list):
+            self._mw = self._fused_flatten(self._mw)
+            self._vw = self._fused_flatten(self._vw)
+        ret = []
+        for i, (w, dcdw, offs) in enumerate(zip(ws, dcdws, offsets)):
+            r1 = _segment_norms(w, offs)
+            eff_grads, self._mw[i], self._vw[i] = ivy.adam_step(
+                dcdw,
+                self._mw[i],
+                self._vw[i],
+                self._count,
+                beta1=self._beta1,
+                beta2=self._beta2,
+                epsilon=self._epsilon,
+            )
+            if self._decay_lambda > 0:
+                r2 = _segment_norms(eff_grads + self._decay_lambda * w, offs)
+            else:
+                r2 = _segment_norms(eff_grads, offs)
+            r = ivy.minimum(
+                ivy.stable_divide(r1, r2), ivy.array(self._max_trust_ratio)
+            )
+            ret.append(w - eff_grads * _expand(r * lr, offs))
+        return ret
+
     def set_state(self, state: ivy.Container):
         """
         Set state of the optimizer.
@@ -530,4 +799,11 @@ class LAMB(Optimizer):
 
     @property
     def state(self):
+        if isinstance(self._mw, list):
+            return ivy.Container(
+                {
+                    "mw": self._fused_to_container(self._mw),
+                    "vw": self._fused_to_container(self._vw),
+                }
+            )
         return ivy.Container({"mw": self._mw, "vw": self._vw})
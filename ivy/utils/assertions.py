@@ -189,7 +189,7 @@ def check_same_dtype(x1, x2, message=""):
 # -------- #
 
 
-def check_unsorted_segment_min_valid_params(data, segment_ids, num_segments):
+def check_unsorted_segment_valid_params(data, segment_ids, num_segments):
     if not (isinstance(num_segments, int)):
         raise ValueError("num_segments must be of integer type")
 
@@ -233,6 +233,9 @@ def check_unsorted_segment_min_valid_params(data, segment_ids, num_segments):
         raise ValueError("num_segments must be positive")
 
 
+check_unsorted_segment_min_valid_params = check_unsorted_segment_valid_params
+
+
 # General #
 # ------- #
 
@@ -6,7 +6,7 @@ import ivy
 import importlib
 import functools
 import numpy as np
-import gc
+import weakref
 from ivy.utils import _importlib, verbosity
 
 # local
@@ -20,6 +20,12 @@ _compiled_backends_ids = {}
 implicit_backend = "numpy"
 ivy_original_dict = ivy.__dict__.copy()
 ivy_original_fn_dict = dict()
+# wrapped ivy namespace of each backend, keyed by backend module name and the
+# version of the native framework, see `_cached_backend_namespace`
+_backend_namespaces = dict()
+# weak references to the live ivy.Array instances, indexed by the backend they were
+# created with, so they can be found without scanning the heap
+_live_arrays = dict()
 
 
 class ContextManager:
@@ -165,6 +171,12 @@ def fn_name_from_version_specific_fn_name(name, version):
             return name[0:i]
 
 
+def _get_backend_version(backend):
+    f = str(backend.__name__)
+    f = f[f.index("backends") + 9 :]
+    return importlib.import_module(f).__version__
+
+
 def set_backend_to_specific_version(backend):
     """
     Update the backend dict to make the original function name point to the version
@@ -176,11 +188,7 @@ def set_backend_to_specific_version(backend):
         the backend module for which we provide the version support
     """
     # TODO: add functionality and tests
-    f = str(backend.__name__)
-    f = f[f.index("backends") + 9 :]
-
-    f = importlib.import_module(f)
-    f_version = f.__version__
+    f_version = _get_backend_version(backend)
 
     for key in list(backend.__dict__):
         if "_v_" in key:
@@ -274,6 +282,41 @@ def _set_backend_as_ivy(
             )
 
 
+def _cached_backend_namespace(backend):
+    """
+    Return the wrapped ivy namespace of `backend`, building it on first use.
+
+    The namespace is a tuple of the entries to set in `ivy.__dict__`, the keys to
+    delete from it (functions of `invalid_dtypes`) and the entries to set in
+    `ivy.functional.__dict__`. It is cached per backend and framework version, and is
+    rebuilt whenever the keys of `ivy_original_dict` change.
+    """
+    key = (backend.__name__, _get_backend_version(backend))
+    namespace = _backend_namespaces.get(key)
+    if namespace is not None and namespace[0].keys() == ivy_original_dict.keys():
+        return namespace[1:]
+    set_backend_to_specific_version(backend)
+    _set_backend_as_ivy(ivy_original_dict, ivy, backend)
+    ivy_updates = {k: ivy.__dict__[k] for k in ivy_original_dict if k in ivy.__dict__}
+    deleted = tuple(k for k in ivy_original_dict if k not in ivy.__dict__)
+    functional_updates = {
+        k: v
+        for k, v in ivy_updates.items()
+        if k in ivy.functional.__dict__ and not k.startswith("__")
+    }
+    namespace = (ivy_updates, deleted, functional_updates)
+    _backend_namespaces[key] = (ivy_original_dict,) + namespace
+    return namespace
+
+
+def _apply_backend_namespace(namespace):
+    ivy_updates, deleted, functional_updates = namespace
+    ivy.__dict__.update(ivy_updates)
+    for k in deleted:
+        ivy.__dict__.pop(k, None)
+    ivy.functional.__dict__.update(functional_updates)
+
+
 def _handle_backend_specific_vars(target, backend):
     if backend.current_backend_str() == "numpy":
         target.set_default_device("cpu")
@@ -281,82 +324,78 @@ def _handle_backend_specific_vars(target, backend):
         target.set_global_attr("RNG", target.functional.backends.jax.random.RNG)
 
 
-def convert_from_source_backend_to_numpy(variable_ids, numpy_objs, devices):
-    # Dynamic Backend
-    from ivy.functional.ivy.gradients import _is_variable, _variable_data
+def _register_live_array(x, previous_backend=None):
+    """Index the ivy.Array `x` under its backend in the live array registry."""
+    if previous_backend is not None and previous_backend in _live_arrays:
+        _live_arrays[previous_backend].pop(id(x), None)
+    try:
+        _live_arrays[x._backend][id(x)] = x
+    except KeyError:
+        _live_arrays[x._backend] = weakref.WeakValueDictionary({id(x): x})
 
-    def _is_var(obj):
-        if isinstance(obj, ivy.Container):
 
-            def _map_fn(x):
-                x = x.data if isinstance(x, ivy.Array) else x
-                if x.__class__.__module__ in (
-                    "numpy",
-                    "jax.interpreters.xla",
-                    "jaxlib.xla_extension",
-                ):
-                    return False
+def _get_live_arrays(backend=None, device=None):
+    """
+    Return the live ivy.Array instances, optionally only those created with `backend`
+    and those stored on `device`.
+    """
+    if backend is None:
+        arrays = [x for xs in list(_live_arrays.values()) for x in xs.values()]
+    else:
+        arrays = list(_live_arrays.get(backend, {}).values())
+    if device is not None:
+        device = ivy.as_ivy_dev(device)
+        arrays = [x for x in arrays if x.device == device]
+    return arrays
 
-                return _is_variable(x)
 
-            return obj.cont_map(lambda x, kc: _map_fn(x)).cont_all_true()
+def _group_by_device(arrays):
+    groups = dict()
+    for x in arrays:
+        groups.setdefault(x.device, []).append(x)
+    return groups
 
-        else:
-            obj = obj.data if isinstance(obj, ivy.Array) else obj
-            if obj.__class__.__module__ in (
-                "numpy",
-                "jax.interpreters.xla",
-                "jaxlib.xla_extension",
-            ):
-                return False
-            return _is_variable(obj)
-
-    # get all ivy array instances in the project scope
-    container_list = [
-        obj
-        for obj in gc.get_objects()
-        if "ivy" in type(obj).__module__ and isinstance(obj, ivy.Container)
-    ]
-    cont_array_idxs = ivy.nested_argwhere(
-        container_list, lambda x: isinstance(x, ivy.Array)
-    )
-    cont_array_vals = ivy.multi_index_nest(container_list, cont_array_idxs)
-    array_list = [
-        obj
-        for obj in gc.get_objects()
-        if "ivy" in type(obj).__module__ and isinstance(obj, ivy.Array)
-    ]
-    array_list.extend(cont_array_vals)
 
-    # filter uninitialized arrays and arrays with other bakcends, and ensure the order
+def convert_from_source_backend_to_numpy(variable_ids, numpy_objs, devices):
+    # Dynamic Backend
+    from ivy.functional.ivy.gradients import _is_variable, _variable_data
+
+    def _is_var(x):
+        if x.__class__.__module__ in (
+            "numpy",
+            "jax.interpreters.xla",
+            "jaxlib.xla_extension",
+        ):
+            return False
+        return _is_variable(x)
+
+    # get the live ivy arrays of the current backend, the leaves of any containers
+    # are ivy arrays themselves so are found here too
     array_list = [
-        arr
-        for arr in array_list
-        if arr.__dict__ and arr.backend == ivy.current_backend_str()
+        x for x in _get_live_arrays(ivy.current_backend_str()) if x.dynamic_backend
     ]
-    arr_ids = [id(item.data) for item in array_list]
-    new_objs = {k: v for k, v in zip(arr_ids, array_list)}
-    new_objs = list(new_objs.values())
-
-    # now convert all ivy.Array and ivy.Container instances
-    # to numpy using the current backend
-    for obj in new_objs:
-        if obj.dynamic_backend:
-            numpy_objs.append(obj)
-            devices.append(obj.device)
-            if _is_var(obj):
+
+    # now convert all the ivy.Array instances to numpy using the current backend,
+    # one device at a time, converting each native array only once even when it is
+    # shared by several ivy.Array instances
+    backend = current_backend()
+    for device, arrays in _group_by_device(array_list).items():
+        np_datas = dict()
+        var_data_ids = set()
+        for obj in arrays:
+            data_id = id(obj.data)
+            if data_id not in np_datas:
+                if _is_var(obj.data):
+                    var_data_ids.add(data_id)
+                    np_datas[data_id] = ivy.to_numpy(_variable_data(obj.data))
+                else:
+                    np_datas[data_id] = backend.to_numpy(obj.data)
+            if data_id in var_data_ids:
                 # add variable object id to set
                 variable_ids.add(id(obj))
-                native_var = _variable_data(obj)
-                np_data = ivy.to_numpy(native_var)
-
-            else:
-                np_data = obj.to_numpy()
-
-            if isinstance(obj, ivy.Container):
-                obj.cont_inplace_update(np_data)
-            else:
-                obj._data = np_data
+            numpy_objs.append(obj)
+            devices.append(device)
+            obj._data = np_datas[data_id]
 
     return variable_ids, numpy_objs, devices
 
@@ -365,32 +404,26 @@ def convert_from_numpy_to_target_backend(variable_ids, numpy_objs, devices):
     # Dynamic Backend
     from ivy.functional.ivy.gradients import _variable
 
-    # convert all ivy.Array and ivy.Container instances from numpy
-    # to native arrays using the newly set backend
+    # convert all ivy.Array instances from numpy to native arrays using the newly
+    # set backend, one device at a time, converting each shared numpy array once
+    device_groups = dict()
     for obj, device in zip(numpy_objs, devices):
-        np_arr = obj.data if isinstance(obj, ivy.Array) else obj
-        # check if object was originally a variable
-        if id(obj) in variable_ids:
-            native_arr = ivy.nested_map(
-                lambda x: current_backend().asarray(x, device=device),
-                np_arr,
-                include_derived=True,
-                shallow=False,
-            )
-            new_data = _variable(native_arr)
-
-        else:
-            new_data = ivy.nested_map(
-                lambda x: current_backend().asarray(x, device=device),
-                np_arr,
-                include_derived=True,
-                shallow=False,
-            )
-
-        if isinstance(obj, ivy.Container):
-            obj.cont_inplace_update(new_data)
-        else:
-            obj.data = new_data.data
+        device_groups.setdefault(device, []).append(obj)
+    backend = current_backend()
+    for device, objs in device_groups.items():
+        native_device = backend.as_native_dev(device)
+        native_datas = dict()
+        for obj in objs:
+            data_id = id(obj.data)
+            if data_id not in native_datas:
+                native_arr = ivy.to_native(
+                    backend.asarray(obj.data, device=native_device)
+                )
+                # check if object was originally a variable
+                if id(obj) in variable_ids:
+                    native_arr = _variable(native_arr).data
+                native_datas[data_id] = native_arr
+            obj.data = native_datas[data_id]
 
 
 @prevent_access_locally
@@ -452,13 +485,9 @@ def set_backend(backend: str, dynamic: bool = False):
         elif backend.current_backend_str() == "jax":
             ivy.set_global_attr("RNG", ivy.functional.backends.jax.random.RNG)
         backend_stack.append(backend)
-        set_backend_to_specific_version(backend)
-        _set_backend_as_ivy(ivy_original_dict, ivy, backend)
-        # following snippet is required to update the ivy.functional namespace with
-        # backend-specific functions
-        for key, _ in ivy.__dict__.items():
-            if key in ivy.functional.__dict__ and not key.startswith("__"):
-                ivy.functional.__dict__[key] = ivy.__dict__[key]
+        # the wrapped namespace (including the ivy.functional namespace) is only
+        # built the first time a backend is set, later switches reuse it
+        _apply_backend_namespace(_cached_backend_namespace(backend))
 
         if dynamic:
             convert_from_numpy_to_target_backend(variable_ids, numpy_objs, devices)
@@ -573,18 +602,19 @@ def previous_backend():
                 ivy.set_default_device("cpu")
             elif new_backend.current_backend_str() == "jax":
                 ivy.set_global_attr("RNG", ivy.functional.backends.jax.random.RNG)
-        new_backend_dict = (
-            backend_stack[-1].__dict__ if backend_stack else ivy_original_dict
-        )
-        # wrap backend functions if there still is a backend, and add functions
-        # to ivy namespace
-        for k, v in new_backend_dict.items():
-            if backend_stack and k in ivy_original_dict:
-                v = _wrap_function(k, v, ivy_original_dict[k])
-            if k in ivy_original_dict:
-                ivy.__dict__[k] = v
-            if k in ivy.functional.__dict__ and not k.startswith("__"):
-                ivy.functional.__dict__[k] = v
+        # restore the wrapped namespace of the previous backend, or Ivy's own
+        # implementations if there is no previously set backend
+        if backend_stack:
+            _apply_backend_namespace(_cached_backend_namespace(backend_stack[-1]))
+        else:
+            ivy.__dict__.update(ivy_original_dict)
+            ivy.functional.__dict__.update(
+                {
+                    k: ivy_original_dict[k]
+                    for k in ivy_original_dict.keys() & ivy.functional.__dict__.keys()
+                    if not k.startswith("__")
+                }
+            )
     if verbosity.level > 0:
         verbosity.cprint("backend stack: {}".format(backend_stack))
     _handle_inplace_mode()
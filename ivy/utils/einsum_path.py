@@ -0,0 +1,358 @@
+# Contraction path optimisation for einsum, following the cost model and the path
+# format of `opt_einsum` here
+# https://github.com/dgasmith/opt_einsum/blob/master/opt_einsum/paths.py
+
+import functools
+import itertools
+import math
+from typing import Dict, FrozenSet, List, NamedTuple, Sequence, Tuple, Union
+
+TensorShapeType = Tuple[int, ...]
+PathType = Tuple[Tuple[int, ...], ...]
+
+# the exhaustive search visits 3^n splits of the operands, above this many operands
+# the greedy search is used instead
+OPTIMAL_MAX_OPERANDS = 8
+
+
+class ContractionInfo(NamedTuple):
+    """
+    Summary of a contraction path.
+
+    ``equations`` holds the einsum equation of each step, ``flops`` the total number
+    of scalar operations of the path, ``naive_flops`` those of contracting all the
+    operands at once, and ``largest_intermediate`` the number of elements of the
+    largest array created along the way, the output included.
+    """
+
+    equations: Tuple[str, ...]
+    flops: int
+    naive_flops: int
+    largest_intermediate: int
+
+
+def _compute_size(indices, size_dict: Dict[str, int]) -> int:
+    return math.prod(size_dict[i] for i in indices)
+
+
+def _flop_count(indices, inner: bool, num_terms: int, size_dict) -> int:
+    """
+    Count the scalar operations of contracting ``num_terms`` terms, spanning
+    ``indices`` altogether, summing over some of them if ``inner``.
+
+    Examples
+    --------
+    >>> _flop_count("abc", False, 1, {"a": 2, "b": 3, "c": 5})
+    30
+    >>> _flop_count("abc", True, 2, {"a": 2, "b": 3, "c": 5})
+    60
+    """
+    op_factor = max(1, num_terms - 1) + inner
+    return _compute_size(indices, size_dict) * op_factor
+
+
+def _contract_indices(
+    inputs: Sequence[FrozenSet[str]], positions, output: FrozenSet[str]
+) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+    """
+    Find the indices of the result of contracting ``inputs[positions]``, and the
+    indices the contraction spans altogether.
+    """
+    spanned = frozenset().union(*(inputs[p] for p in positions))
+    kept = output.union(*(term for k, term in enumerate(inputs) if k not in positions))
+    return spanned & kept, spanned
+
+
+def _optimal_path(inputs, output, size_dict) -> List[Tuple[int, int]]:
+    """
+    Find the pairwise contraction order of least flops, searching every split of
+    every subset of the operands, smallest subsets first.
+    """
+    n = len(inputs)
+    full = (1 << n) - 1
+    # indices of the contraction of each subset of the operands, which are those it
+    # shares with the other operands or with the output
+    span = [frozenset()] * (full + 1)
+    for subset in range(1, full + 1):
+        low = subset & -subset
+        span[subset] = span[subset ^ low] | inputs[low.bit_length() - 1]
+    result = [frozenset()] * (full + 1)
+    for subset in range(1, full + 1):
+        result[subset] = span[subset] & (output | span[full ^ subset])
+
+    # the flops of contracting each subset, and the size of its largest intermediate
+    # to break ties between orders of the same flops
+    cost = [(0, 0)] * (full + 1)
+    split = [0] * (full + 1)
+    # the subsets of each subset are numerically smaller, so come first
+    for subset in range(1, full + 1):
+        if subset & (subset - 1) == 0:
+            continue
+        best = None
+        size = _compute_size(result[subset], size_dict)
+        # each split is visited once, as the part holding the lowest operand
+        low = subset & -subset
+        rest = subset ^ low
+        part = rest
+        while True:
+            left = part | low
+            right = subset ^ left
+            if right:
+                spanned = result[left] | result[right]
+                inner = bool(spanned - result[subset])
+                step = _flop_count(spanned, inner, 2, size_dict)
+                total = (
+                    cost[left][0] + cost[right][0] + step,
+                    max(cost[left][1], cost[right][1], size),
+                )
+                if best is None or total < best:
+                    best = total
+                    split[subset] = left
+            if part == 0:
+                break
+            part = (part - 1) & rest
+        cost[subset] = best
+
+    # turn the tree of splits into a path over the list of remaining operands
+    path = []
+    remaining = list(range(n))
+
+    def _contract(subset):
+        if subset & (subset - 1) == 0:
+            return subset.bit_length() - 1
+        left = _contract(split[subset])
+        right = _contract(subset ^ split[subset])
+        i, j = sorted((remaining.index(left), remaining.index(right)))
+        path.append((i, j))
+        del remaining[j], remaining[i]
+        remaining.append(subset + n)
+        return subset + n
+
+    _contract(full)
+    return path
+
+
+def _greedy_path(inputs, output, size_dict) -> List[Tuple[int, int]]:
+    """
+    Contract the pair of operands which shrinks the memory footprint the most, or
+    grows it the least, at each step, preferring pairs which share indices.
+    """
+    inputs = list(inputs)
+    path = []
+    while len(inputs) > 1:
+        candidates = [
+            (i, j)
+            for i, j in itertools.combinations(range(len(inputs)), 2)
+            if inputs[i] & inputs[j]
+        ] or list(itertools.combinations(range(len(inputs)), 2))
+        best = None
+        for i, j in candidates:
+            result, spanned = _contract_indices(inputs, (i, j), output)
+            removed = (
+                _compute_size(result, size_dict)
+                - _compute_size(inputs[i], size_dict)
+                - _compute_size(inputs[j], size_dict)
+            )
+            key = (removed, _compute_size(spanned, size_dict))
+            if best is None or key < best[0]:
+                best = (key, (i, j), result)
+        _, (i, j), result = best
+        path.append((i, j))
+        del inputs[j], inputs[i]
+        inputs.append(result)
+    return path
+
+
+def _naive_path(num_operands: int) -> List[Tuple[int, int]]:
+    return [(0, 1)] * (num_operands - 1)
+
+
+@functools.lru_cache(maxsize=256)
+def _contract_path(
+    equation: str, shapes: Tuple[TensorShapeType, ...], optimize
+) -> Tuple[PathType, ContractionInfo]:
+    input_str, output_str = equation.split("->")
+    subscripts = input_str.split(",")
+    if len(subscripts) != len(shapes):
+        raise ValueError(
+            f"Number of einsum subscripts, {len(subscripts)}, must be equal to the "
+            f"number of operands, {len(shapes)}."
+        )
+    size_dict = {}
+    for term, shape in zip(subscripts, shapes):
+        if len(term) != len(shape):
+            raise ValueError(
+                f"Einsum subscript '{term}' does not match the number of dimensions "
+                f"of an operand of shape {tuple(shape)}."
+            )
+        for index, dim in zip(term, shape):
+            # dimensions of size 1 are broadcast
+            if size_dict.get(index, 1) not in (1, dim) and dim != 1:
+                raise ValueError(
+                    f"Size of label '{index}' for operand of shape {tuple(shape)} "
+                    f"({dim}) does not match previous terms ({size_dict[index]})."
+                )
+            size_dict[index] = max(size_dict.get(index, 1), dim)
+
+    inputs = [frozenset(term) for term in subscripts]
+    output = frozenset(output_str)
+    num_operands = len(inputs)
+    if num_operands == 1:
+        path = [(0,)]
+    elif not isinstance(optimize, str):
+        path = [tuple(step) for step in optimize]
+    elif optimize == "naive":
+        path = _naive_path(num_operands)
+    elif optimize == "optimal" or (
+        optimize == "auto" and num_operands <= OPTIMAL_MAX_OPERANDS
+    ):
+        path = _optimal_path(inputs, output, size_dict)
+    elif optimize in ("greedy", "auto"):
+        path = _greedy_path(inputs, output, size_dict)
+    else:
+        raise ValueError(
+            "optimize must be one of 'auto', 'optimal', 'greedy' or 'naive', or an "
+            f"explicit path, but got {optimize!r}."
+        )
+
+    equations = []
+    flops = 0
+    largest = 0
+    for num, positions in enumerate(path):
+        positions = tuple(sorted(positions, reverse=True))
+        if num == len(path) - 1:
+            result = output_str
+            if len(inputs) != len(positions):
+                raise ValueError(f"The path {path} does not contract every operand.")
+        else:
+            result_set, _ = _contract_indices(inputs, positions, output)
+            # keep the indices in their order of appearance
+            result = "".join(
+                dict.fromkeys(
+                    i
+                    for p in reversed(positions)
+                    for i in subscripts[p]
+                    if i in result_set
+                )
+            )
+        terms = [subscripts.pop(p) for p in positions][::-1]
+        for p in positions:
+            del inputs[p]
+        spanned = frozenset("".join(terms))
+        inner = bool(spanned - set(result))
+        flops += _flop_count(spanned, inner, len(terms), size_dict)
+        largest = max(largest, _compute_size(result, size_dict))
+        equations.append(",".join(terms) + "->" + result)
+        subscripts.append(result)
+        inputs.append(frozenset(result))
+
+    all_indices = frozenset(input_str) - {","}
+    naive_flops = _flop_count(
+        all_indices, bool(all_indices - output), num_operands, size_dict
+    )
+    info = ContractionInfo(tuple(equations), flops, naive_flops, largest)
+    return tuple(path), info
+
+
+def contract_path(
+    equation: str,
+    shapes: Sequence[TensorShapeType],
+    /,
+    *,
+    optimize: Union[str, Sequence[Tuple[int, ...]]] = "auto",
+) -> Tuple[PathType, ContractionInfo]:
+    """
+    Find the order in which to contract the operands of an einsum, pairwise.
+
+    Paths are cached per equation and shapes, so that repeated contractions only
+    search for the order once.
+
+    Parameters
+    ----------
+    equation
+        A legalised einsum equation, with explicit output and no ellipsis, as
+        returned by ``legalise_einsum_expr``.
+    shapes
+        The shapes of the operands.
+    optimize
+        ``"optimal"`` searches every pairwise order for the one with the fewest
+        flops, ``"greedy"`` contracts the pair which shrinks the memory footprint
+        the most at each step, and ``"auto"``, the default, is optimal for up to
+        ``OPTIMAL_MAX_OPERANDS`` operands and greedy above. ``"naive"`` contracts
+        from left to right. An explicit path is evaluated as is.
+
+    Returns
+    -------
+    ret
+        The path, as positions in the list of operands left to contract, where the
+        result of each step is appended, and a summary of the path.
+
+    Examples
+    --------
+    >>> path, info = contract_path("ab,bc,cd->ad", [(10, 1000), (1000, 2), (2, 100)])
+    >>> path
+    ((0, 1), (0, 1))
+    >>> info.equations
+    ('ab,bc->ac', 'cd,ac->ad')
+    >>> info.flops, info.largest_intermediate
+    (44000, 1000)
+    """
+    if not isinstance(optimize, str):
+        optimize = tuple(tuple(step) for step in optimize)
+    shapes = tuple(tuple(int(d) for d in shape) for shape in shapes)
+    return _contract_path(equation, shapes, optimize)
+
+
+def contract_path_cache_info():
+    """Return the hit and miss counts of the cache of contraction paths."""
+    return _contract_path.cache_info()
+
+
+@functools.lru_cache(maxsize=256)
+def matrix_chain_order(shapes: Tuple[TensorShapeType, ...]) -> Union[int, Tuple]:
+    """
+    Find the order of multiplication of a chain of matrices with the fewest flops.
+
+    Parameters
+    ----------
+    shapes
+        The shapes of the matrices, 1-D operands at either end being taken as row
+        and column vectors respectively.
+
+    Returns
+    -------
+    ret
+        The order as a nested tuple of pairs of positions in the chain.
+
+    Examples
+    --------
+    >>> matrix_chain_order(((10, 100), (100, 5), (5, 50)))
+    ((0, 1), 2)
+    >>> matrix_chain_order(((10, 100), (100, 5), (5,)))
+    (0, (1, 2))
+    """
+    dims = [1 if len(shapes[0]) == 1 else shapes[0][-2]]
+    dims += [shape[-1] for shape in shapes[:-1]]
+    dims.append(1 if len(shapes[-1]) == 1 else shapes[-1][-1])
+    n = len(shapes)
+    cost = [[0] * n for _ in range(n)]
+    split = [[0] * n for _ in range(n)]
+    for length in range(1, n):
+        for i in range(n - length):
+            j = i + length
+            cost[i][j] = None
+            for k in range(i, j):
+                step = dims[i] * dims[k + 1] * dims[j + 1]
+                total = cost[i][k] + cost[k + 1][j] + step
+                if cost[i][j] is None or total < cost[i][j]:
+                    cost[i][j] = total
+                    split[i][j] = k
+
+    def _order(i, j):
+        if i == j:
+            return i
+        k = split[i][j]
+        return _order(i, k), _order(k + 1, j)
+
+    return _order(0, n - 1)
+
@@ -0,0 +1,284 @@
+"""
+Caches of function outputs, used by ``ivy.cache_fn``.
+
+Each cached function has its own least recently used cache, bounded in number of
+entries and optionally in bytes of arrays held, which counts its hits and misses.
+Array arguments are keyed by their shape, dtype and device, plus a hash of their
+contents or their identity. Other hashable arguments are keyed as they are.
+
+Caches created with ``persist=True`` also write their outputs to
+``$IVY_FN_CACHE_DIR``, or by default to ``~/.cache/ivy/fn_cache``, and look them up
+there on a miss, so that expensive pure functions are only computed once across
+processes. Outputs are pickled, the directory should only be writable by its user.
+Set ``IVY_FN_CACHE_DIR`` to an empty string to keep every cache in memory only.
+"""
+
+import collections
+import hashlib
+import inspect
+import math
+import os
+import pickle
+from typing import Callable, NamedTuple, Optional
+
+import numpy as np
+
+import ivy
+
+# {function: FnCache}, shared by all the wrappers ivy.cache_fn returns for a function
+CACHES = dict()
+
+_MISSING = object()
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    disk_hits: int
+    max_size: Optional[int]
+    size: int
+    nbytes: int
+
+
+def _default_dir():
+    cache_home = os.environ.get(
+        "XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache")
+    )
+    return os.path.join(cache_home, "ivy", "fn_cache")
+
+
+def cache_dir():
+    """Return the directory outputs are persisted to, or ``None`` if they aren't."""
+    return os.environ.get("IVY_FN_CACHE_DIR", _default_dir()) or None
+
+
+class _Identity:
+    # keys an array by the object itself, which the key keeps alive so that its id
+    # can't be reused while the entry is cached
+    __slots__ = ("x",)
+
+    def __init__(self, x):
+        self.x = x
+
+    def __hash__(self):
+        return id(self.x)
+
+    def __eq__(self, other):
+        return isinstance(other, _Identity) and self.x is other.x
+
+
+def _array_key(x, array_key):
+    native = ivy.to_native(x)
+    key = ("array", tuple(x.shape), str(x.dtype), str(ivy.dev(x)))
+    if array_key == "identity":
+        # torch counts the in-place updates of tensors
+        return key + (_Identity(native), getattr(native, "_version", None))
+    contents = np.ascontiguousarray(ivy.to_numpy(native))
+    return key + (hashlib.blake2b(contents, digest_size=16).hexdigest(),)
+
+
+def _arg_key(x, array_key):
+    if ivy.is_array(x):
+        return _array_key(x, array_key)
+    if isinstance(x, (list, tuple)):
+        return (type(x).__name__,) + tuple(_arg_key(v, array_key) for v in x)
+    if isinstance(x, dict):
+        items = [(k, _arg_key(v, array_key)) for k, v in x.items()]
+        try:
+            items.sort()
+        except TypeError:
+            pass
+        return (type(x).__name__,) + tuple(items)
+    try:
+        hash(x)
+    except TypeError:
+        return ("str", str(x))
+    # 1, 1.0 and True are equal, but may give different outputs
+    return (type(x), x)
+
+
+def make_key(args, kwargs, /, *, array_key="content"):
+    """
+    Build the cache key of a call.
+
+    Parameters
+    ----------
+    args
+        The positional arguments of the call.
+    kwargs
+        The keyword arguments of the call.
+    array_key
+        ``"content"`` keys arrays by a hash of their contents, ``"identity"`` by the
+        array objects, and for torch their version, which is much cheaper for large
+        arrays but misses in-place updates on other backends.
+
+    Returns
+    -------
+    ret
+        A hashable key.
+    """
+    return (
+        tuple(_arg_key(x, array_key) for x in args),
+        tuple(sorted((k, _arg_key(v, array_key)) for k, v in kwargs.items())),
+    )
+
+
+def _nbytes(x):
+    if ivy.is_array(x):
+        return math.prod(x.shape) * math.ceil(ivy.dtype_bits(x.dtype) / 8)
+    if isinstance(x, (list, tuple)):
+        return sum(_nbytes(v) for v in x)
+    if isinstance(x, dict):
+        return sum(_nbytes(v) for v in x.values())
+    return 0
+
+
+def _fn_dir(fn):
+    # the outputs of a function are invalidated along with its source
+    name = f"{getattr(fn, '__module__', None)}.{getattr(fn, '__qualname__', fn)}"
+    try:
+        source = inspect.getsource(fn)
+    except (OSError, TypeError):
+        source = ""
+    digest = hashlib.sha1(source.encode()).hexdigest()[:16]
+    name = "".join(c if c.isalnum() or c in "._-" else "_" for c in name)
+    return f"{name}-{digest}"
+
+
+class FnCache:
+    """
+    Least recently used cache of the outputs of a function.
+
+    Parameters
+    ----------
+    fn
+        The function to cache the outputs of.
+    max_size
+        The maximum number of outputs to keep, or ``None`` for no limit.
+    max_bytes
+        The maximum number of bytes of arrays to keep in the outputs, or ``None`` for
+        no limit. Outputs larger than this on their own aren't cached.
+    array_key
+        How array arguments are keyed, see :func:`make_key`.
+    persist
+        Whether to also write outputs to :func:`cache_dir`, and look them up there
+        when they are not cached in memory. Arrays must be keyed by content.
+    """
+
+    def __init__(
+        self,
+        fn: Callable,
+        /,
+        *,
+        max_size: Optional[int] = 256,
+        max_bytes: Optional[int] = None,
+        array_key: str = "content",
+        persist: bool = False,
+    ):
+        if array_key not in ("content", "identity"):
+            raise ValueError(
+                f"array_key must be 'content' or 'identity', but got {array_key!r}"
+            )
+        if persist and array_key != "content":
+            raise ValueError("persisted outputs must key arrays by content")
+        self.fn = fn
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.array_key = array_key
+        self.persist = persist
+        self._entries = collections.OrderedDict()
+        self.hits = self.misses = self.disk_hits = self.nbytes = 0
+
+    def __call__(self, *args, **kwargs):
+        key = make_key(args, kwargs, array_key=self.array_key)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+        self.misses += 1
+        path = self._path(key) if self.persist else None
+        ret = self._read(path) if path else _MISSING
+        if ret is _MISSING:
+            ret = self.fn(*args, **kwargs)
+            if path:
+                self._write(path, ret)
+        else:
+            self.disk_hits += 1
+        self._insert(key, ret)
+        return ret
+
+    def _insert(self, key, ret):
+        nbytes = _nbytes(ret)
+        if self.max_bytes is not None and nbytes > self.max_bytes:
+            return
+        self._entries[key] = (ret, nbytes)
+        self.nbytes += nbytes
+        while (self.max_size is not None and len(self._entries) > self.max_size) or (
+            self.max_bytes is not None and self.nbytes > self.max_bytes
+        ):
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self.nbytes -= evicted
+
+    def _path(self, key):
+        directory = cache_dir()
+        text = repr((ivy.current_backend_str(), key))
+        # the repr of objects without a value based one holds their address
+        if directory is None or " at 0x" in text:
+            return None
+        name = hashlib.sha1(text.encode()).hexdigest() + ".pkl"
+        return os.path.join(directory, _fn_dir(self.fn), name)
+
+    @staticmethod
+    def _read(path):
+        try:
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except Exception:
+            # a missing or unreadable entry is recomputed, and overwritten
+            return _MISSING
+
+    @staticmethod
+    def _write(path, ret):
+        try:
+            data = pickle.dumps(ret)
+        except Exception:
+            return
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # write then rename, so that concurrent processes never read a partial
+            # entry
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+
+    def cache_info(self) -> CacheInfo:
+        """Return the hits, misses and size of the cache."""
+        return CacheInfo(
+            self.hits,
+            self.misses,
+            self.disk_hits,
+            self.max_size,
+            len(self._entries),
+            self.nbytes,
+        )
+
+    def cache_clear(self):
+        """Drop the outputs cached in memory, and reset the statistics."""
+        self._entries.clear()
+        self.hits = self.misses = self.disk_hits = self.nbytes = 0
+
+
+def get(fn, /, **kwargs) -> FnCache:
+    """Return the cache of ``fn``, creating it with the given options if needed."""
+    if fn not in CACHES:
+        CACHES[fn] = FnCache(fn, **kwargs)
+    return CACHES[fn]
+
+
+def stats():
+    """Return the :class:`CacheInfo` of the cache of every function."""
+    return {fn: cache.cache_info() for fn, cache in CACHES.items()}
@@ -2,8 +2,16 @@ import cProfile
 import pstats
 import subprocess
 import logging
+import functools
+import json
+import os
+import threading
+import time
 from tempfile import NamedTemporaryFile
 from importlib.util import find_spec
+from types import FunctionType
+
+import ivy
 
 is_snakeviz = find_spec("snakeviz")
 
@@ -54,3 +62,227 @@ class Profiler(cProfile.Profile):
 
             if self.print_stats:
                 stats.print_stats()
+
+
+# Wrapper Profiling #
+# ------------------#
+
+
+def _dummy_fn(*args, **kwargs):
+    return None
+
+
+def _decorator_codes():
+    # every wrapper produced by a given decorator shares the same code object
+    codes = dict()
+    for name in ivy.func_wrapper.FN_DECORATORS:
+        decorator = getattr(ivy, name, None)
+        if decorator is not None:
+            codes[decorator(_dummy_fn).__code__] = name
+    return codes
+
+
+def _unwrap_layers(fn, codes):
+    # returns the kernel and the decorator layers around it, from outer to inner
+    layers = []
+    if getattr(fn, "fused_dispatch", False):
+        fn = fn.__wrapped__
+    while hasattr(fn, "__code__") and fn.__code__ in codes:
+        layers.append(codes[fn.__code__])
+        fn = fn.__wrapped__
+    return fn, layers
+
+
+def _arg_shapes(args, kwargs):
+    return tuple(
+        tuple(x.shape)
+        for x in args + tuple(kwargs.values())
+        # not ivy.is_array, which would itself be instrumented
+        if isinstance(x, (ivy.Array, ivy.NativeArray))
+    )
+
+
+class WrapperProfiler:
+    """
+    A profiler which measures the overhead of each decorator in the ivy wrapper stack.
+
+    While active, every wrapped function in the ivy namespace is rebuilt with its
+    nested `FN_DECORATORS` chain (the fused dispatch is bypassed so that the layers
+    can be told apart) and a timer around each layer and around the backend kernel.
+    The time spent in each layer excludes the time spent in the layers below it, as
+    well as in any nested ivy function calls, which are recorded separately.
+
+    Attributes
+    ----------
+        save_dir (str, optional): directory in which the chrome trace is saved when
+            the profiler is stopped.
+        print_stats (bool, optional): prints the aggregated table when stopped.
+
+    Example
+    -------
+        with WrapperProfiler(print_stats=True) as prof:
+            fn(x, y)
+        prof.save_chrome_trace("trace.json")
+    """
+
+    def __init__(self, save_dir=None, print_stats=False):
+        self._save_dir = save_dir
+        self.print_stats = print_stats
+        self._originals = dict()
+        self._local = threading.local()
+        self.events = []
+        self.calls = dict()
+
+    def _stack(self):
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    def _timed(self, fn, fn_name, layer, outer=False):
+        @functools.wraps(fn)
+        def _timed_layer(*args, **kwargs):
+            stack = self._stack()
+            if outer:
+                key = (fn_name, _arg_shapes(args, kwargs))
+                self.calls[key] = self.calls.get(key, 0) + 1
+            stack.append(0.0)
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                end = time.perf_counter()
+                child_time = stack.pop()
+                if stack:
+                    stack[-1] += end - start
+                self.events.append(
+                    (fn_name, layer, start, end, end - start - child_time)
+                )
+
+        return _timed_layer
+
+    def _instrument(self, fn_name, fn, codes):
+        kernel, layers = _unwrap_layers(fn, codes)
+        if not layers:
+            return None
+        wrapped = self._timed(kernel, fn_name, "kernel")
+        for i, layer in enumerate(reversed(layers)):
+            wrapped = getattr(ivy, layer)(wrapped)
+            wrapped = self._timed(wrapped, fn_name, layer, outer=i == len(layers) - 1)
+        return wrapped
+
+    def start(self):
+        """Instrument the functions in the ivy namespace and start recording."""
+        codes = _decorator_codes()
+        for fn_name, fn in list(ivy.__dict__.items()):
+            if not isinstance(fn, FunctionType):
+                continue
+            instrumented = self._instrument(fn_name, fn, codes)
+            if instrumented is not None:
+                self._originals[fn_name] = (fn, instrumented)
+                ivy.__dict__[fn_name] = instrumented
+        self._start_time = time.perf_counter()
+
+    def stop(self):
+        """Restore the original functions and stop recording."""
+        for fn_name, (fn, instrumented) in self._originals.items():
+            if ivy.__dict__.get(fn_name) is instrumented:
+                ivy.__dict__[fn_name] = fn
+        self._originals = dict()
+        if self._save_dir is not None:
+            os.makedirs(self._save_dir, exist_ok=True)
+            self.save_chrome_trace(os.path.join(self._save_dir, "wrapper_trace.json"))
+        if self.print_stats:
+            print(self.table())
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def stats(self):
+        """
+        Aggregate the recorded events.
+
+        Returns
+        -------
+        ret
+            dict mapping each function name to a dict with the number of calls, the
+            argument shapes it was called with (and how often), and the total self
+            time in seconds for each decorator layer and for the ``"kernel"``.
+        """
+        ret = dict()
+        for fn_name, layer, _, _, self_time in self.events:
+            fn_stats = ret.setdefault(
+                fn_name, {"calls": 0, "shapes": dict(), "layers": dict()}
+            )
+            fn_stats["layers"][layer] = fn_stats["layers"].get(layer, 0.0) + self_time
+        for (fn_name, shapes), count in self.calls.items():
+            fn_stats = ret.setdefault(
+                fn_name, {"calls": 0, "shapes": dict(), "layers": dict()}
+            )
+            fn_stats["calls"] += count
+            fn_stats["shapes"][shapes] = count
+        return ret
+
+    def table(self):
+        """Return the aggregated stats as a table, sorted by total time."""
+        rows = []
+        for fn_name, fn_stats in self.stats().items():
+            total = sum(fn_stats["layers"].values())
+            kernel = fn_stats["layers"].get("kernel", 0.0)
+            rows.append((total, fn_name, fn_stats, kernel))
+        rows.sort(key=lambda row: row[0], reverse=True)
+        lines = [
+            "{:<32}{:<40}{:>8}{:>14}{:>8}".format(
+                "function", "layer", "calls", "time (us)", "%"
+            )
+        ]
+        for total, fn_name, fn_stats, kernel in rows:
+            lines.append(
+                "{:<32}{:<40}{:>8}{:>14.1f}{:>8.1f}".format(
+                    fn_name,
+                    "wrappers: {:.1f}%".format(
+                        100 * (total - kernel) / total if total else 0.0
+                    ),
+                    fn_stats["calls"],
+                    total * 1e6,
+                    100.0,
+                )
+            )
+            for layer, layer_time in sorted(
+                fn_stats["layers"].items(), key=lambda item: item[1], reverse=True
+            ):
+                lines.append(
+                    "{:<32}{:<40}{:>8}{:>14.1f}{:>8.1f}".format(
+                        "",
+                        layer,
+                        "",
+                        layer_time * 1e6,
+                        100 * layer_time / total if total else 0.0,
+                    )
+                )
+        return "\n".join(lines)
+
+    def chrome_trace(self):
+        """Return the recorded events in the Chrome trace event format."""
+        trace_events = [
+            {
+                "name": "{}.{}".format(fn_name, layer),
+                "cat": "kernel" if layer == "kernel" else "wrapper",
+                "ph": "X",
+                "ts": (start - self._start_time) * 1e6,
+                "dur": (end - start) * 1e6,
+                "pid": os.getpid(),
+                "tid": 0,
+                "args": {"self_time_us": self_time * 1e6},
+            }
+            for fn_name, layer, start, end, self_time in self.events
+        ]
+        return {"traceEvents": trace_events, "displayTimeUnit": "ns"}
+
+    def save_chrome_trace(self, path):
+        """Save the Chrome trace JSON to `path`, viewable in chrome://tracing."""
+        with open(path, "w") as f:
+            json.dump(self.chrome_trace(), f)
@@ -0,0 +1,372 @@
+"""
+Index of the dtypes and devices supported by each function.
+
+``ivy.function_supported_dtypes``, ``ivy.function_unsupported_dtypes`` and the devices
+variants resolve the support of a function by parsing its source, and recursively
+the source of every function it calls. Their results are stored here per backend and
+backend version, so that each one is only resolved once.
+
+By default the index is kept in memory only. Set ``IVY_SUPPORT_INDEX`` to a path,
+such as ``~/.cache/ivy/support_index.json``, to persist it there when the interpreter
+exits and load it again in later processes, for as long as the ivy sources it was
+built from are unchanged. :func:`save` persists it explicitly.
+
+The index can be rebuilt ahead of time and checked against a fresh resolution with
+``python scripts/support_index.py {regenerate,validate}``.
+"""
+
+import atexit
+import contextlib
+import functools
+import hashlib
+import importlib
+import inspect
+import json
+import os
+
+import ivy
+
+KINDS = (
+    "supported_dtypes",
+    "unsupported_dtypes",
+    "supported_devices",
+    "unsupported_devices",
+    "supported_devices_and_dtypes",
+    "unsupported_devices_and_dtypes",
+)
+
+# {section: {(kind, recurse, fn_key): support}}, loaded on first use
+_index = None
+_fingerprint = None
+_dirty = False
+_bypass = False
+
+
+def index_path():
+    """Return the path the index is persisted to, or ``None`` if it isn't."""
+    path = os.environ.get("IVY_SUPPORT_INDEX")
+    return os.path.expanduser(path) if path else None
+
+
+def _source_fingerprint():
+    # the sizes and modification times of the ivy sources, which is enough to detect
+    # that the decorators or bodies the index was resolved from have changed
+    global _fingerprint
+    if _fingerprint is None:
+        root = os.path.dirname(ivy.__file__)
+        digest = hashlib.sha1(ivy.__version__.encode())
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames.sort()
+            for name in sorted(filenames):
+                if name.endswith(".py"):
+                    path = os.path.join(dirpath, name)
+                    stat = os.stat(path)
+                    digest.update(
+                        f"{os.path.relpath(path, root)}:{stat.st_size}:"
+                        f"{stat.st_mtime_ns};".encode()
+                    )
+        _fingerprint = digest.hexdigest()
+    return _fingerprint
+
+
+def _section():
+    backend = ivy.current_backend_str()
+    if not backend:
+        return f"none=={ivy.__version__}"
+    return f"{backend}=={ivy.current_backend().backend_version['version']}"
+
+
+def _fn_key(fn):
+    module = getattr(fn, "__module__", None)
+    qualname = getattr(fn, "__qualname__", None)
+    # local functions and lambdas can't be told apart by name
+    if not module or not qualname or "<" in qualname:
+        return None
+    return f"{module}:{qualname}"
+
+
+def _to_json(support):
+    if isinstance(support, dict):
+        return {k: _to_json(v) for k, v in support.items()}
+    # ivy.Dtype orders by promotion, which fails for dtypes the backend lacks
+    return sorted(support, key=str)
+
+
+def _from_json(support, dtypes):
+    if isinstance(support, dict):
+        return {k: _from_json(v, dtypes) for k, v in support.items()}
+    # restore the dtype classes, such as ivy.FloatDtype, the devices are strings
+    return tuple(dtypes.get(x, x) for x in support)
+
+
+def _copy(support):
+    # the partial mixed functions, and the devices and dtypes queries, return dicts
+    if isinstance(support, dict):
+        return {k: _copy(v) for k, v in support.items()}
+    return support
+
+
+def _read(path, strict=False):
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        if strict:
+            raise
+        return dict()
+    if data.get("fingerprint") != _source_fingerprint():
+        if strict:
+            raise ivy.utils.exceptions.IvyException(
+                f"the index at {path} was built from different ivy sources, "
+                "it needs to be regenerated"
+            )
+        return dict()
+    dtypes = {str(dtype): dtype for dtype in ivy.all_dtypes}
+    return {
+        section: {
+            (kind, recurse, fn_key): _from_json(support, dtypes)
+            for kind, recurse, fn_key, support in rows
+        }
+        for section, rows in data.get("sections", {}).items()
+    }
+
+
+def _load():
+    global _index
+    if _index is None:
+        path = index_path()
+        _index = _read(path) if path else dict()
+    return _index
+
+
+def save(path=None, /, *, merge=True):
+    """
+    Persist the index.
+
+    Parameters
+    ----------
+    path
+        The path to write the index to. Default is :func:`index_path`.
+    merge
+        Whether to keep the entries of the index already at that path, if it was built
+        from the same ivy sources, e.g. by another process. Default is ``True``.
+    """
+    global _dirty
+    path = path or index_path()
+    if path is None:
+        return
+    index = _read(path) if merge else dict()
+    for section, entries in _load().items():
+        index.setdefault(section, dict()).update(entries)
+    data = {
+        "fingerprint": _source_fingerprint(),
+        "sections": {
+            section: [
+                [kind, recurse, fn_key, _to_json(support)]
+                for (kind, recurse, fn_key), support in sorted(entries.items())
+            ]
+            for section, entries in index.items()
+        },
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    # write then rename, so that concurrent processes never read a partial index
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(data, f)
+    os.replace(tmp_path, path)
+    _dirty = False
+
+
+@atexit.register
+def _save_on_exit():
+    if _dirty:
+        try:
+            save()
+        except OSError:
+            pass
+
+
+def clear():
+    """Drop the in-memory index, so that it is loaded from disk again on next use."""
+    global _index, _dirty
+    _index = None
+    _dirty = False
+
+
+@contextlib.contextmanager
+def bypassed():
+    """Resolve the support of functions from their sources, ignoring the index."""
+    global _bypass
+    bypass, _bypass = _bypass, True
+    try:
+        yield
+    finally:
+        _bypass = bypass
+
+
+def indexed(kind):
+    """
+    Store the results of the decorated support query, such as
+    ``function_supported_dtypes``, in the index.
+
+    Parameters
+    ----------
+    kind
+        Which of :data:`KINDS` the decorated function resolves.
+    """
+
+    def _indexed(fn):
+        @functools.wraps(fn)
+        def _indexed_wrapper(f, recurse=True):
+            global _dirty
+            key = _fn_key(f)
+            if _bypass or key is None:
+                return fn(f, recurse=recurse)
+            entries = _load().setdefault(_section(), dict())
+            key = (kind, bool(recurse), key)
+            if key not in entries:
+                entries[key] = fn(f, recurse=recurse)
+                _dirty = True
+            return _copy(entries[key])
+
+        return _indexed_wrapper
+
+    return _indexed
+
+
+# Regeneration #
+# -------------#
+
+
+def _functions(modules):
+    ret = dict()
+    for module in modules:
+        for name, fn in inspect.getmembers(module, inspect.isfunction):
+            if name.startswith("_") or not fn.__module__.startswith("ivy."):
+                continue
+            ret[_fn_key(fn)] = fn
+            # the implementation of the current backend
+            backend_fn = getattr(ivy, name, None)
+            if inspect.isfunction(backend_fn):
+                ret[_fn_key(backend_fn)] = backend_fn
+    ret.pop(None, None)
+    return ret
+
+
+def _submodules(package):
+    ret = [package]
+    for name in sorted(getattr(package, "__all__", None) or dir(package)):
+        module = getattr(package, name, None)
+        if inspect.ismodule(module) and module.__name__.startswith(
+            package.__name__ + "."
+        ):
+            ret.extend(_submodules(module))
+    return ret
+
+
+def indexed_functions(frontends=()):
+    """
+    Return the ivy functions, and the functions of the given frontends, which the
+    index is regenerated for, by their keys in the index.
+
+    Parameters
+    ----------
+    frontends
+        The names of the frontends to include, such as ``"torch"``.
+    """
+    modules = _submodules(importlib.import_module("ivy.functional.ivy"))
+    for frontend in frontends:
+        modules += _submodules(
+            importlib.import_module(f"ivy.functional.frontends.{frontend}")
+        )
+    return _functions(dict.fromkeys(modules))
+
+
+def _resolve(fn):
+    ret = dict()
+    for kind in KINDS:
+        try:
+            ret[kind] = getattr(ivy, f"function_{kind}")(fn)
+        except Exception:
+            # functions without any valid support, e.g. with conflicting attributes
+            continue
+    return ret
+
+
+def regenerate(backends, /, *, frontends=(), path=None):
+    """
+    Rebuild the index for the given backends, and persist it.
+
+    Parameters
+    ----------
+    backends
+        The backends to build the index for. Each must be installed.
+    frontends
+        The frontends whose functions to include, besides the ivy functions.
+    path
+        The path to write the index to. Default is :func:`index_path`.
+
+    Returns
+    -------
+    ret
+        The number of entries in the index, for each backend.
+    """
+    global _index
+    _index = index = dict()
+    ret = dict()
+    for backend in backends:
+        with ivy.utils.backend.ContextManager(backend):
+            for fn in indexed_functions(frontends).values():
+                _resolve(fn)
+            ret[backend] = len(index.get(_section(), ()))
+    save(path, merge=False)
+    return ret
+
+
+def _lookup_fn(fn_key):
+    module, qualname = fn_key.split(":")
+    ret = importlib.import_module(module)
+    for name in qualname.split("."):
+        ret = getattr(ret, name)
+    return ret
+
+
+def validate(backends, /, *, path=None):
+    """
+    Check the persisted index against resolving each of its entries from the sources.
+
+    Parameters
+    ----------
+    backends
+        The backends whose part of the index to check. Each must be installed.
+    path
+        The path the index is persisted to. Default is :func:`index_path`.
+
+    Returns
+    -------
+    ret
+        A list of ``(section, kind, recurse, fn_key, indexed, resolved)`` for each
+        entry which doesn't match its resolution. ``resolved`` is ``None`` for the
+        entries whose function no longer exists.
+
+    Raises
+    ------
+    IvyException
+        If the index was built from different ivy sources.
+    """
+    index = _read(path or index_path(), strict=True)
+    ret = []
+    for backend in backends:
+        with ivy.utils.backend.ContextManager(backend):
+            section = _section()
+            for (kind, recurse, fn_key), support in index.get(section, {}).items():
+                try:
+                    with bypassed():
+                        resolved = getattr(ivy, f"function_{kind}")(
+                            _lookup_fn(fn_key), recurse=recurse
+                        )
+                except (ImportError, AttributeError):
+                    resolved = None
+                if resolved is None or _to_json(resolved) != _to_json(support):
+                    ret.append((section, kind, recurse, fn_key, support, resolved))
+    return ret
@@ -571,6 +571,70 @@ def test_split_func_call(
         )
 
 
+@handle_test(
+    fn_tree="functional.ivy.split_func_call",
+    dim_size=helpers.ints(min_value=1, max_value=20),
+    chunk_size=st.one_of(st.none(), helpers.ints(min_value=1, max_value=7)),
+    num_workers=helpers.ints(min_value=0, max_value=3),
+    mode=st.sampled_from(["concat", "sum", "mean"]),
+)
+def test_split_func_call_parallel(
+    *,
+    dim_size,
+    chunk_size,
+    num_workers,
+    mode,
+    on_device,
+    backend_fw,
+):
+    with BackendHandler.update_backend(backend_fw) as ivy_backend:
+        x1 = ivy_backend.asarray(
+            np.random.uniform(size=(dim_size, 3)).astype("float32"), device=on_device
+        )
+        x2 = ivy_backend.asarray(
+            np.random.uniform(size=(dim_size, 3)).astype("float32"), device=on_device
+        )
+
+        # function
+        def func(t0, t1):
+            if mode == "concat":
+                return t0 * t1, t0 - t1
+            return ivy_backend.sum(t0 * t1), ivy_backend.sum(t0 - t1)
+
+        # predictions, with the chunk size picked from the free memory when it is
+        # not specified
+        a, b = ivy_backend.split_func_call(
+            func,
+            [x1, x2],
+            mode,
+            chunk_size=chunk_size,
+            num_workers=num_workers,
+            devices=[on_device] if num_workers == 1 else None,
+            max_mem_fraction=None if chunk_size else 1e-9,
+            device=on_device,
+        )
+
+        # true
+        a_true, b_true = func(x1, x2)
+        if mode == "mean":
+            num_chunks = -(-dim_size // (chunk_size or 1))
+            a_true, b_true = a_true / num_chunks, b_true / num_chunks
+
+        # value test
+        helpers.assert_all_close(
+            ivy_backend.to_numpy(a),
+            ivy_backend.to_numpy(a_true),
+            rtol=1e-4,
+            backend=backend_fw,
+        )
+        helpers.assert_all_close(
+            ivy_backend.to_numpy(b),
+            ivy_backend.to_numpy(b_true),
+            rtol=1e-4,
+            backend=backend_fw,
+        )
+
+
 @handle_test(
     fn_tree="functional.ivy.split_func_call",
     array_shape=helpers.lists(
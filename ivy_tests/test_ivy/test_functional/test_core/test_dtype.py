@@ -2,6 +2,7 @@
 
 # global
 import numpy as np
+import pytest
 from hypothesis import strategies as st
 import typing
 
@@ -893,6 +894,36 @@ def test_promote_types(*, type1, type2, test_flags, backend_fw, fn_name, on_devi
     )
 
 
+# promote_types_of_inputs with python scalars
+@pytest.mark.parametrize(
+    ("dtype", "scalar", "expected"),
+    [
+        ("float32", 0.5, "float32"),
+        ("float32", 2, "float32"),
+        ("int32", 1.5, "float64"),
+        ("int8", -3, "int8"),
+        ("uint8", True, "uint8"),
+        ("float32", 1 + 2j, "complex128"),
+        ("bool", False, "bool"),
+        ("bool", 2, None),
+    ],
+)
+def test_promote_types_of_inputs_scalar(dtype, scalar, expected, backend_fw):
+    with BackendHandler.update_backend(backend_fw) as ivy_backend:
+        if expected is None:
+            expected = ivy_backend.default_int_dtype()
+        x = ivy_backend.native_array(np.arange(4).astype(dtype))
+        for _ in range(2):
+            x1, x2 = ivy_backend.promote_types_of_inputs(x, scalar)
+            y1, y2 = ivy_backend.promote_types_of_inputs(scalar, x)
+            for ret in (x1, x2, y1, y2):
+                assert ivy_backend.as_ivy_dtype(ret.dtype) == expected
+            assert ivy_backend.is_native_array(x1)
+            assert ivy_backend.is_native_array(y2)
+            assert np.asarray(ivy_backend.to_numpy(x2)) == scalar
+            assert np.asarray(ivy_backend.to_numpy(y1)) == scalar
+
+
 # result_type
 @handle_test(
     fn_tree="functional.ivy.result_type",
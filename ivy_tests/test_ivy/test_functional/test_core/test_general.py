@@ -1,6 +1,7 @@
 """Collection of tests for unified general functions."""
 
 # global
+import functools
 import time
 import math
 from types import SimpleNamespace
@@ -524,6 +525,68 @@ def test_cache_fn_with_args():
     assert ret0 is not ret1
 
 
+def test_cache_fn_keys_and_eviction():
+    calls = []
+
+    @ivy.cache_fn(max_size=2)
+    def func(x, scale=1):
+        calls.append(1)
+        return x * scale
+
+    x = ivy.array([1.0, 2.0, 3.0])
+    ret = func(x)
+    # arrays are keyed by content, and scalars by type as well as value
+    assert func(ivy.array([1.0, 2.0, 3.0])) is ret
+    assert func(x, scale=1.0) is not ret
+    assert func(ivy.array([1.0, 2.0, 4.0])) is not ret
+    assert len(calls) == 3
+    info = func.cache_info()
+    assert (info.hits, info.misses, info.size) == (1, 3, 2)
+    assert info.nbytes == 2 * 3 * ivy.dtype_bits(x.dtype) // 8
+    # the least recently used output was evicted
+    func(x)
+    assert len(calls) == 4
+
+    func.cache_clear()
+    assert func.cache_info().size == 0
+
+    @ivy.cache_fn(array_key="identity")
+    def identity_func(x):
+        calls.append(1)
+        return x + 1
+
+    ret = identity_func(x)
+    assert identity_func(x) is ret
+    assert identity_func(ivy.array([1.0, 2.0, 3.0])) is not ret
+
+    @ivy.cache_fn(max_bytes=4)
+    def large_func(x):
+        return x
+
+    large_func(x)
+    assert large_func.cache_info().size == 0
+
+
+def test_cache_fn_persist(tmp_path, monkeypatch):
+    monkeypatch.setenv("IVY_FN_CACHE_DIR", str(tmp_path))
+    calls = []
+
+    def weights(n, *, scale):
+        calls.append(1)
+        return ivy.arange(n) * scale
+
+    cached = ivy.cache_fn(weights, persist=True)
+    ret = cached(4, scale=ivy.array(2.0))
+    cached.cache_clear()
+    # read back from disk
+    ret_again = cached(4, scale=ivy.array(2.0))
+    assert len(calls) == 1
+    assert cached.cache_info().disk_hits == 1
+    assert np.array_equal(ivy.to_numpy(ret), ivy.to_numpy(ret_again))
+    cached(5, scale=ivy.array(2.0))
+    assert len(calls) == 2
+
+
 # clip_matrix_norm
 @handle_test(
     fn_tree="functional.ivy.clip_matrix_norm",
@@ -1096,6 +1159,44 @@ def test_get_item(
             raise
 
 
+@pytest.mark.parametrize(
+    "query",
+    [
+        (1, 2),
+        (slice(None, None, -1),),
+        (slice(1, 3), Ellipsis, slice(None, None, 2)),
+        (None, 0, None, slice(1, 3)),
+        ([0, 2], slice(None), [1, 3]),
+        (slice(None), [0, 1], [2, 3]),
+        ([1, 0], 2, [3, 4]),
+        (Ellipsis, [0, -1]),
+        # an ellipsis standing for no dimensions between advanced indices
+        (None, [0, 1], Ellipsis, 0, [1, 2]),
+        (slice(1, 2), [0, 1], Ellipsis, [2, 3]),
+        (slice(None), np.arange(20).reshape(4, 5) % 3 == 0),
+        (np.array([True, False, True]), slice(2, 4)),
+        (slice(2, 2),),
+    ],
+)
+def test_get_item_compositional(query, backend_fw):
+    # the compositional implementation, which backends fall back to for some queries
+    ivy.set_backend(backend_fw)
+    x = np.arange(60).reshape(3, 4, 5)
+    expected = x[query]
+    ret = ivy.functional.ivy.general.get_item(ivy.array(x), query)
+    assert tuple(ret.shape) == expected.shape
+    assert np.array_equal(ivy.to_numpy(ret), expected)
+
+    val = -np.arange(expected.size).reshape(expected.shape)
+    expected = x.copy()
+    expected[query] = val
+    ret = ivy.functional.ivy.general.set_item(
+        ivy.array(x), query, ivy.array(val), copy=True
+    )
+    assert np.array_equal(ivy.to_numpy(ret), expected)
+    ivy.previous_backend()
+
+
 # get_min_base
 def test_get_min_base():
     assert ivy.min_base == 1e-5
@@ -2023,6 +2124,85 @@ def test_vmap(func, dtype_and_arrays_and_axes, in_axes_as_cont, backend_fw):
         assert False, "One of the results is None while other isn't"
 
 
+@pytest.mark.parametrize(
+    "func",
+    [
+        lambda ivy, x, w: ivy.sum(ivy.relu(ivy.matmul(x, w)), axis=-1),
+        lambda ivy, x, w: ivy.softmax(ivy.einsum("ij,jk->ik", x, w), axis=0),
+        lambda ivy, x, w: ivy.concat(
+            [ivy.reshape(x, (-1,)), ivy.flip(w, axis=0)[0]], axis=0
+        ),
+        lambda ivy, x, w: ivy.conv1d(
+            ivy.expand_dims(x, axis=0), ivy.expand_dims(w, axis=0), 1, "SAME"
+        ),
+    ],
+)
+@pytest.mark.parametrize("in_axes", [(0, None), (1, None)])
+def test_vmap_batching(func, in_axes, backend_fw):
+    # vmap agrees with calling func on each example in turn
+    with BackendHandler.update_backend(backend_fw) as ivy_backend:
+        x = ivy_backend.native_array(
+            np.random.uniform(-1, 1, (6, 6, 4)).astype("float32")
+        )
+        w = ivy_backend.native_array(np.random.uniform(-1, 1, (4, 4)).astype("float32"))
+        func = functools.partial(func, ivy_backend)
+        vmapped_func = ivy_backend.vmap(func, in_axes=in_axes, out_axes=0)
+        ret = ivy_backend.to_numpy(vmapped_func(x, w))
+        examples = ivy_backend.unstack(x, axis=in_axes[0])
+        expected = np.stack([ivy_backend.to_numpy(func(ex, w)) for ex in examples])
+        assert_all_close(ret, expected, rtol=1e-4, atol=1e-5, backend=backend_fw)
+        if backend_fw == "numpy":
+            # every function called by func has a batching rule
+            assert not vmapped_func.fallback_ops
+
+
+@pytest.mark.parametrize(
+    "func",
+    [
+        # native operators and indexing, which bypass the backend functions
+        lambda ivy, x: x * 2.0,
+        lambda ivy, x: ivy.sin(x.reshape((2, 1))),
+        lambda ivy, x: ivy.stack([x[0], x[1]]),
+        # control flow which depends on the values of the example
+        lambda ivy, x: ivy.sum(x) * 2.0 if float(ivy.sum(x)) > 5 else ivy.sum(x),
+        lambda ivy, x: x if ivy.to_scalar(ivy.max(x)) > 5 else -x,
+    ],
+)
+def test_vmap_untraced(func, backend_fw):
+    # the first and last examples are equal, so only the second one tells
+    # whether the batched result is the one of the first example
+    with BackendHandler.update_backend(backend_fw) as ivy_backend:
+        x = ivy_backend.native_array(
+            np.array([[1.0, 2.0], [5.0, 6.0], [1.0, 2.0]], dtype="float32")
+        )
+        func = functools.partial(func, ivy_backend)
+        ret = ivy_backend.to_numpy(ivy_backend.vmap(func)(x))
+        expected = np.stack(
+            [ivy_backend.to_numpy(func(ex)) for ex in ivy_backend.unstack(x)]
+        )
+        assert_all_close(ret, expected, backend=backend_fw)
+
+
+def test_vmap_ragged(backend_fw):
+    # the unique values of each example differ in number, so they cannot be
+    # stacked, while the counts returned by func can
+    calls = []
+    with BackendHandler.update_backend(backend_fw) as ivy_backend:
+
+        def func(x):
+            calls.append(x)
+            return ivy_backend.array(ivy_backend.unique_values(x).shape[0])
+
+        x = ivy_backend.native_array(
+            np.array([[1, 1, 2], [1, 2, 3], [4, 4, 4], [5, 6, 5]], dtype="int32")
+        )
+        ret = ivy_backend.to_numpy(ivy_backend.vmap(func)(x))
+        assert ret.tolist() == [2, 3, 1, 2]
+        if backend_fw == "numpy":
+            # func is called once per example, as it would be without vmap
+            assert len(calls) == 4
+
+
 _composition_1.test_unsupported_devices_and_dtypes = {
     "cpu": {
         "numpy": ("bfloat16",),
@@ -194,9 +194,6 @@ def test_adam_update(
 def test_execute_with_gradients(
     *, dtype_and_xs, retain_grads, test_flags, backend_fw, fn_name, on_device
 ):
-    if backend_fw == "numpy":
-        return
-
     def func(xs):
         with BackendHandler.update_backend(
             ivy.current_backend(xs.to_native()).backend
@@ -238,10 +235,8 @@ def test_execute_with_gradients(
 )
 @pytest.mark.parametrize("nth", [1, 2, 3])
 def test_grad(x, dtype, func, backend_fw, nth):
-    # ToDo: Remove skipping for paddle and jax for nth > 1
-    if backend_fw == "numpy" or (
-        (backend_fw == "paddle" or backend_fw == "jax") and nth > 1
-    ):
+    # ToDo: Remove skipping for paddle, jax and numpy for nth > 1
+    if backend_fw in ["paddle", "jax", "numpy"] and nth > 1:
         return
 
     with BackendHandler.update_backend(backend_fw) as ivy_backend:
@@ -308,9 +303,6 @@ def test_gradient_descent_update(
 @pytest.mark.parametrize("dtype", ["float32", "float64"])
 @pytest.mark.parametrize("func_str", ["square", "cos"])
 def test_jac(x, dtype, func_str, backend_fw):
-    if backend_fw == "numpy":
-        pytest.skip()
-
     with BackendHandler.update_backend(backend_fw) as ivy_backend:
         f = ivy_backend.__dict__[func_str]
         func = lambda x: ivy_backend.mean(f(x))
@@ -557,8 +549,6 @@ def test_stop_gradient(
     "func", [lambda x: ivy.mean(ivy.square(x)), lambda x: ivy.mean(ivy.cos(x))]
 )
 def test_value_and_grad(x, dtype, func, backend_fw):
-    if backend_fw == "numpy":
-        return
     with BackendHandler.update_backend(backend_fw) as ivy_backend:
         var = ivy_backend.ivy.functional.ivy.gradients._variable(
             ivy_backend.array(x, dtype=dtype)
@@ -585,3 +575,60 @@ def test_value_and_grad(x, dtype, func, backend_fw):
     for grad, grad_from_gt in zip(grad_np, grad_np_from_gt):
         assert grad.shape == grad_from_gt.shape
         assert np.allclose(grad, grad_from_gt)
+
+
+# numpy reverse-mode tape
+@pytest.mark.parametrize(
+    ("func", "shape"),
+    [
+        (lambda x: ivy.sum(ivy.tanh(x) * x + ivy.exp(x[0])), (3, 4)),
+        (lambda x: ivy.mean(ivy.softmax(x @ ivy.matrix_transpose(x)) ** 2), (3, 4)),
+        (lambda x: ivy.max(ivy.concat([x, x**2], axis=0), axis=1)[1], (3, 4)),
+        (lambda x: ivy.sum(ivy.gather(x, ivy.array([0, 2, 2]), axis=1) ** 2), (3, 4)),
+        (
+            lambda x: ivy.sum(
+                ivy.conv2d(ivy.reshape(x, (1, 3, 4, 1)), ivy.ones((2, 2, 1, 2)), 1, 1)
+                ** 2
+            ),
+            (3, 4),
+        ),
+        (lambda x: ivy.vector_norm(x, axis=1)[0] + ivy.vector_norm(x, ord=3), (3, 4)),
+        (lambda x: ivy.matrix_norm(x) + ivy.matrix_norm(x, ord="nuc"), (3, 4)),
+        (lambda x: ivy.sum(ivy.asin(ivy.tanh(x)) * ivy.acos(ivy.tanh(x))), (3, 4)),
+        (lambda x: ivy.sum(ivy.atan(x) * ivy.sort(x, axis=0, descending=True)), (3, 4)),
+        (lambda x: ivy.sum(ivy.cumprod(x, axis=1, exclusive=True) ** 2), (3, 4)),
+    ],
+)
+def test_numpy_tape_gradients(func, shape, backend_fw):
+    if backend_fw != "numpy":
+        pytest.skip()
+    ivy.set_backend(backend_fw)
+    x = np.random.default_rng(0).standard_normal(shape)
+    _, grad = ivy.execute_with_gradients(func, ivy.array(x))
+    # central differences
+    expected = np.zeros_like(x)
+    for idx in np.ndindex(*shape):
+        step = np.zeros_like(x)
+        step[idx] = 1e-6
+        expected[idx] = (
+            ivy.to_scalar(func(ivy.array(x + step)))
+            - ivy.to_scalar(func(ivy.array(x - step)))
+        ) / 2e-6
+    assert np.allclose(ivy.to_numpy(grad), expected, atol=1e-4)
+    ivy.previous_backend()
+
+
+def test_numpy_tape_no_rule(backend_fw):
+    if backend_fw != "numpy":
+        pytest.skip()
+    ivy.set_backend(backend_fw)
+    x = ivy.array([0.5, 1.5])
+    # logaddexp has no gradient rule, and is not composed of recorded functions
+    with pytest.raises(ivy.utils.exceptions.IvyNotImplementedException):
+        ivy.execute_with_gradients(lambda x: ivy.sum(ivy.logaddexp(x, x)), x)
+    # functions without a rule can still be called on arrays which aren't watched
+    _, grad = ivy.execute_with_gradients(
+        lambda x: ivy.sum(x * ivy.logaddexp(ivy.array(1.0), ivy.array(2.0))), x
+    )
+    assert np.allclose(ivy.to_numpy(grad), np.logaddexp(1.0, 2.0))
+    ivy.previous_backend()
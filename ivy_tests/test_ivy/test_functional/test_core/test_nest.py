@@ -1,7 +1,9 @@
 """Collection of tests for unified general functions."""
 
 # global
+import collections
 import copy
+import pickle
 import warnings
 import pytest
 import numpy as np
@@ -440,3 +442,61 @@ def test_set_nest_at_indices(nest, indices, values, shallow):
         assert nest == nest_copy
     else:
         assert nest != nest_copy
+
+
+# tree_flatten
+@pytest.mark.parametrize(
+    "nest",
+    [
+        {"a": [[0], [1]], "b": {"c": [[[2], [4]], [[6], [8]]]}},
+        ([1, (2, 3)], {"d": [], "e": ()}, 5),
+        7,
+    ],
+)
+def test_tree_flatten(nest):
+    leaves, treedef = ivy.tree_flatten(nest)
+    visited = []
+    ivy.nested_map(lambda x: visited.append(x), nest, shallow=False)
+    assert leaves == visited and len(leaves) == treedef.num_leaves
+    assert [ivy.index_nest(nest, index) for index in treedef.leaf_indices] == leaves
+    assert ivy.tree_unflatten(treedef, leaves) == nest
+    # nests of the same structure share their treedef
+    other_leaves, other_treedef = ivy.tree_flatten(
+        ivy.nested_map(lambda x: x, nest, shallow=False)
+    )
+    assert other_treedef is treedef and hash(other_treedef) == hash(treedef)
+    assert pickle.loads(pickle.dumps(treedef)) == treedef
+    assert ivy.tree_flatten([nest, 0])[1] != treedef
+
+
+def test_tree_flatten_derived():
+    point = collections.namedtuple("Point", ["x", "y"])
+    nest = [point(1, [2, 3]), collections.OrderedDict(a=4), {"b": slice(5, 6)}]
+    leaves, treedef = ivy.tree_flatten(nest)
+    assert leaves == [nest[0], nest[1], 5, 6, None]
+    leaves, treedef = ivy.tree_flatten(nest, include_derived=True)
+    assert leaves == [1, 2, 3, 4, 5, 6, None]
+    ret = ivy.tree_unflatten(treedef, [x and x * 2 for x in leaves])
+    assert ret == [
+        point(2, [4, 6]),
+        collections.OrderedDict(a=8),
+        {"b": slice(10, 12)},
+    ]
+    assert type(ret[0]) is point and type(ret[1]) is collections.OrderedDict
+    leaves, _ = ivy.tree_flatten(nest, include_derived={"tuple": True}, to_ignore=list)
+    assert leaves == [nest]
+
+
+def test_tree_unflatten_num_leaves():
+    _, treedef = ivy.tree_flatten({"a": [1, 2]})
+    with pytest.raises(ivy.utils.exceptions.IvyException):
+        ivy.tree_unflatten(treedef, [1, 2, 3])
+
+
+def test_tree_flatten_key_types():
+    # equal keys of different types must not share a treedef
+    treedefs = [ivy.tree_flatten({k: 5})[1] for k in (True, 1.0, 1)]
+    assert len(set(treedefs)) == 3
+    ret = ivy.nested_map(lambda x: x * 2, {1: 5}, shallow=False)
+    assert ret == {1: 10}
+    assert type(next(iter(ret))) is int
@@ -3,8 +3,10 @@
 # global
 from hypothesis import strategies as st
 import numpy as np
+import pytest
 
 # local
+import ivy
 import ivy_tests.test_ivy.helpers as helpers
 from ivy_tests.test_ivy.helpers import handle_test
 
@@ -160,6 +162,35 @@ def test_searchsorted(
     )
 
 
+@pytest.mark.parametrize("use_sorter", [False, True])
+@pytest.mark.parametrize("side", ["left", "right"])
+def test_searchsorted_rows(backend_fw, side, use_sorter):
+    ivy.set_backend(backend_fw)
+    rng = np.random.default_rng(0)
+    # ties within and across the rows, and values outside of them
+    x = rng.integers(-5, 5, (3, 4, 8)).astype(np.float64)
+    v = rng.integers(-7, 7, (3, 4, 6)).astype(np.float64)
+    sorter = np.argsort(x, axis=-1) if use_sorter else None
+    if not use_sorter:
+        x = np.sort(x, axis=-1)
+    ret = ivy.searchsorted(
+        ivy.array(x),
+        ivy.array(v),
+        side=side,
+        sorter=None if sorter is None else ivy.array(sorter),
+    )
+    if use_sorter:
+        x = np.take_along_axis(x, sorter, axis=-1)
+    expected = np.stack(
+        [
+            np.searchsorted(row, values, side=side)
+            for row, values in zip(x.reshape(-1, 8), v.reshape(-1, 6))
+        ]
+    ).reshape(v.shape)
+    assert np.array_equal(ivy.to_numpy(ret), expected)
+    ivy.previous_backend()
+
+
 # sort
 @handle_test(
     fn_tree="functional.ivy.sort",
@@ -1,5 +1,6 @@
 from hypothesis import strategies as st
 import numpy as np
+import pytest
 
 # local
 import ivy
@@ -44,6 +45,28 @@ def _random_parafac2_data(draw):
     normalise_factors = draw(st.booleans())
     return shapes, rank, dtype[0], full, seed, normalise_factors
 
+
+def _segment_reference(data, segment_ids, num_segments, reduction):
+    # a mask per segment, as the backends used to compute them
+    out = []
+    for i in range(num_segments):
+        values = data[segment_ids == i]
+        if reduction == "mean":
+            out.append(values.sum(0) / max(len(values), 1))
+        elif reduction == "sqrt_n":
+            out.append(values.sum(0) / np.sqrt(max(len(values), 1)))
+        else:
+            initial = {
+                "sum": 0,
+                "prod": 1,
+                "min": np.finfo(data.dtype).max,
+                "max": np.finfo(data.dtype).min,
+            }[reduction]
+            fn = getattr(np, reduction)
+            out.append(fn(values, 0, initial=initial))
+    return np.stack(out).astype(data.dtype)
+
+
 @st.composite
 def _random_tt_data(draw):
     shape = draw(
@@ -362,6 +385,19 @@ def test_mel_weight_matrix(
     )
 
 
+def test_mel_weight_matrix_cached(backend_fw):
+    ivy.set_backend(backend_fw)
+    backend_fn = ivy.current_backend().mel_weight_matrix
+    backend_fn.cache_clear()
+    first = ivy.mel_weight_matrix(8, 9, 16000, 0.0, 4000.0)
+    second = ivy.mel_weight_matrix(8, 9, 16000, 0.0, 4000.0)
+    assert np.array_equal(ivy.to_numpy(first), ivy.to_numpy(second))
+    ivy.mel_weight_matrix(8, 9, 8000, 0.0, 4000.0)
+    info = backend_fn.cache_info()
+    assert (info.hits, info.misses, info.size) == (1, 2, 2)
+    ivy.previous_backend()
+
+
 # ndenumerate
 @handle_test(
     fn_tree="functional.ivy.experimental.ndenumerate",
@@ -685,6 +721,59 @@ def test_trilu(*, dtype_and_x, k, upper, test_flags, backend_fw, fn_name, on_dev
     )
 
 
+@pytest.mark.parametrize("reduction", ["sum", "min", "max", "prod", "mean", "sqrt_n"])
+@pytest.mark.parametrize("shape", [(50,), (50, 3, 2)])
+def test_segment_reductions(backend_fw, reduction, shape):
+    ivy.set_backend(backend_fw)
+    rng = np.random.default_rng(0)
+    data = rng.uniform(0.5, 1.5, shape)
+    # some segments are left empty, and negative ids are dropped
+    segment_ids = rng.integers(-2, 10, shape[0])
+    segment_ids[segment_ids == 4] = 7
+    expected = _segment_reference(data, segment_ids, 12, reduction)
+    fn = getattr(ivy, "unsorted_segment_" + reduction)
+    ret = fn(ivy.array(data), ivy.array(segment_ids), 12)
+    assert np.allclose(ivy.to_numpy(ret), expected)
+
+    segment_ids = np.sort(np.abs(segment_ids))
+    expected = _segment_reference(data, segment_ids, 10, reduction)
+    fn = getattr(ivy, "segment_" + reduction)
+    ret = fn(ivy.array(data), ivy.array(segment_ids))
+    assert ret.shape == (10,) + shape[1:]
+    assert np.allclose(ivy.to_numpy(ret), expected)
+    with pytest.raises(ValueError):
+        fn(ivy.array(data), ivy.array(segment_ids[::-1]))
+    ivy.previous_backend()
+
+
+# unsorted_segment_max
+@handle_test(
+    fn_tree="functional.ivy.experimental.unsorted_segment_max",
+    d_x_n_s=valid_unsorted_segment_min_inputs(),
+    test_with_out=st.just(False),
+    test_gradients=st.just(False),
+)
+def test_unsorted_segment_max(
+    *,
+    d_x_n_s,
+    test_flags,
+    backend_fw,
+    fn_name,
+    on_device,
+):
+    dtypes, data, num_segments, segment_ids = d_x_n_s
+    helpers.test_function(
+        input_dtypes=dtypes,
+        backend_to_test=backend_fw,
+        test_flags=test_flags,
+        on_device=on_device,
+        fn_name=fn_name,
+        data=data,
+        segment_ids=segment_ids,
+        num_segments=num_segments,
+    )
+
+
 # unsorted_segment_min
 @handle_test(
     fn_tree="functional.ivy.experimental.unsorted_segment_min",
@@ -713,6 +802,33 @@ def test_unsorted_segment_min(
     )
 
 
+@handle_test(
+    fn_tree="functional.ivy.experimental.unsorted_segment_prod",
+    d_x_n_s=valid_unsorted_segment_min_inputs(),
+    test_with_out=st.just(False),
+    test_gradients=st.just(False),
+)
+def test_unsorted_segment_prod(
+    *,
+    d_x_n_s,
+    test_flags,
+    backend_fw,
+    fn_name,
+    on_device,
+):
+    dtypes, data, num_segments, segment_ids = d_x_n_s
+    helpers.test_function(
+        input_dtypes=dtypes,
+        test_flags=test_flags,
+        on_device=on_device,
+        backend_to_test=backend_fw,
+        fn_name=fn_name,
+        data=data,
+        segment_ids=segment_ids,
+        num_segments=num_segments,
+    )
+
+
 @handle_test(
     fn_tree="functional.ivy.experimental.unsorted_segment_sum",
     d_x_n_s=valid_unsorted_segment_min_inputs(),
@@ -1387,6 +1387,44 @@ def test_multi_mode_dot_tensorly_2(shape):
         assert np.allclose(res, 1)
 
 
+# test adapted from TensorLy
+# https://github.com/tensorly/tensorly/blob/main/tensorly/decomposition/tests/test_cp.py
+@pytest.mark.parametrize(
+    ("linesearch", "normalize_factors", "init"),
+    [(False, False, "svd"), (True, False, "svd"), (False, True, "random")],
+)
+def test_parafac_tensorly(linesearch, normalize_factors, init):
+    shape, rank = (6, 8, 7, 5), 3
+    rng = np.random.default_rng(0)
+    factors = [ivy.array(rng.standard_normal((s, rank))) for s in shape]
+    tensor = ivy.CPTensor.cp_to_tensor((None, factors))
+    res, errors = ivy.parafac(
+        tensor,
+        rank,
+        n_iter_max=500,
+        init=init,
+        seed=1,
+        tol=1e-12,
+        normalize_factors=normalize_factors,
+        linesearch=linesearch,
+        return_errors=True,
+    )
+    assert res.shape == shape
+    assert all(f.shape == (s, rank) for f, s in zip(res.factors, shape))
+    rec = res.to_tensor()
+    error = ivy.sqrt(ivy.sum((rec - tensor) ** 2)) / ivy.sqrt(ivy.sum(tensor**2))
+    np.testing.assert_(error < 1e-5, f"reconstruction error {error} too high")
+    # the error tracked without forming the reconstruction
+    assert abs(errors[-1] - error) < 1e-5
+
+    # the missing values are recovered from the low-rank structure
+    mask = ivy.array((rng.random(shape) > 0.2).astype("float64"))
+    res = ivy.parafac(tensor, rank, mask=mask, n_iter_max=500, tol=1e-12)
+    rec = res.to_tensor()
+    error = ivy.sqrt(ivy.sum((rec - tensor) ** 2)) / ivy.sqrt(ivy.sum(tensor**2))
+    np.testing.assert_(error < 1e-3, f"reconstruction error {error} too high")
+
+
 @handle_test(
     fn_tree="functional.ivy.experimental.partial_tucker",
     data=_partial_tucker_data(),
@@ -1526,6 +1564,59 @@ def test_svd_flip(*, uv, u_based_decision, test_flags, backend_fw, fn_name, on_d
     )
 
 
+@pytest.mark.parametrize("method", ["symeig_svd", "randomized_svd", "streaming_svd"])
+@pytest.mark.parametrize("shape", [(12, 40), (40, 12), (20, 20)])
+def test_svd_methods(method, shape):
+    # a matrix of rank 4, so that the randomized sketch captures its range exactly
+    rng = np.random.default_rng(0)
+    x = rng.standard_normal((shape[0], 4)) @ rng.standard_normal((4, shape[1]))
+    x = ivy.array(x)
+    kwargs = {"block_size": 7} if method == "streaming_svd" else {}
+    for n_eigenvecs in [2, 4, min(shape)]:
+        U, S, Vh = getattr(ivy, method)(x, n_eigenvecs, **kwargs)
+        U_gt, S_gt, Vh_gt = ivy.truncated_svd(x, n_eigenvecs=n_eigenvecs)
+        assert U.shape == U_gt.shape
+        assert S.shape == S_gt.shape
+        assert Vh.shape == Vh_gt.shape
+        assert np.allclose(S[:4], S_gt[:4], atol=1e-6)
+        assert np.allclose(
+            ivy.to_numpy(U[:, :4] * S[:4] @ Vh[:4]),
+            ivy.to_numpy(U_gt[:, :4] * S_gt[:4] @ Vh_gt[:4]),
+            atol=1e-6,
+        )
+
+    # streaming the unfoldings of a tensor
+    if method == "streaming_svd":
+        tensor = ivy.reshape(x, (4, -1, 5))
+        for mode in range(3):
+            _, S, Vh = ivy.streaming_svd(tensor, 2, mode=mode, block_size=3)
+            _, S_gt, Vh_gt = ivy.truncated_svd(ivy.unfold(tensor, mode), n_eigenvecs=2)
+            assert np.allclose(S, S_gt)
+            assert np.allclose(np.abs(ivy.to_numpy(Vh)), np.abs(ivy.to_numpy(Vh_gt)))
+
+
+# test adapted from TensorLy's test_tt_decomposition.py
+# https://github.com/tensorly/tensorly/blob/main/tensorly/decomposition/tests
+@pytest.mark.parametrize("svd", ["truncated_svd", "randomized_svd", "streaming_svd"])
+def test_tensor_train_tensorly(svd):
+    shape, rank = (4, 5, 6, 3), [1, 3, 4, 3, 1]
+    rng = np.random.default_rng(0)
+    factors = [
+        ivy.array(rng.standard_normal((rank[i], s, rank[i + 1])))
+        for i, s in enumerate(shape)
+    ]
+    tensor = ivy.TTTensor.tt_to_tensor(factors)
+    tt = ivy.tensor_train(tensor, rank, svd=svd, seed=0)
+    assert tt.shape == shape
+    assert tt.rank == tuple(rank)
+    assert np.allclose(tt.to_tensor(), tensor)
+
+    # the ranks are capped by the sizes of the reshapings
+    tt = ivy.tensor_train(tensor, 10, svd=svd, seed=0)
+    assert tt.rank == (1, 4, 10, 3, 1)
+    assert np.allclose(tt.to_tensor(), tensor)
+
+
 @handle_test(
     fn_tree="functional.ivy.experimental.truncated_svd",
     data=_truncated_svd_data(),
@@ -1724,3 +1815,21 @@ def test_tucker_tensorly(tol_norm_2, tol_max_abs, shape, ranks):
         ivy.max(ivy.abs(rec_svd - rec_random)) < tol_max_abs,
         "abs norm of difference between svd and random init too high",
     )
+
+
+@pytest.mark.parametrize(
+    "svd", ["truncated_svd", "symeig_svd", "randomized_svd", "streaming_svd"]
+)
+def test_tucker_svd_methods(svd):
+    rng = np.random.default_rng(0)
+    core = rng.standard_normal((3, 4, 2))
+    factors = [rng.standard_normal((d, r)) for d, r in [(10, 3), (12, 4), (14, 2)]]
+    tensor = ivy.array(ivy.multi_mode_dot(core, factors, modes=[0, 1, 2]))
+    tucker = ivy.tucker(tensor, [3, 4, 2], svd=svd, seed=0, n_iter_max=10)
+    rec = tucker.to_tensor()
+    error = ivy.sqrt(ivy.sum((rec - tensor) ** 2)) / ivy.sqrt(ivy.sum(tensor**2))
+    np.testing.assert_(error < 1e-6, f"reconstruction error {error} too high")
+
+    (core, factors) = ivy.partial_tucker(tensor, [4, 2], [1, 2], svd=svd, seed=0)
+    assert core.shape == (10, 4, 2)
+    assert [f.shape for f in factors] == [(12, 4), (14, 2)]
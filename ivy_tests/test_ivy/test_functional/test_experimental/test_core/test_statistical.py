@@ -1,8 +1,11 @@
 # global
 from hypothesis import strategies as st
+import pytest
 
 # local
 import numpy as np
+import ivy
+from ivy.functional.ivy.experimental import statistical as ivy_statistical
 import ivy_tests.test_ivy.helpers as helpers
 from ivy_tests.test_ivy.helpers import handle_test
 from ivy_tests.test_ivy.test_functional.test_core.test_statistical import (
@@ -15,6 +18,57 @@ from ivy_tests.test_ivy.test_functional.test_core.test_statistical import (
 # --------------- #
 
 
+def _cummax_reference(x, exclusive, reverse):
+    # the running maximum and its position, along the last axis
+    if reverse:
+        x = x[..., ::-1]
+    elif exclusive:
+        x = _shift_forward(x)
+    values, indices = np.empty_like(x), np.empty(x.shape, dtype=np.int64)
+    for row in np.ndindex(x.shape[:-1]):
+        best = 0
+        for i, value in enumerate(x[row]):
+            # nans are the maximum, and equal maxima take the last position
+            if np.isnan(value) or value >= x[row][best]:
+                best = i
+            values[row][i], indices[row][i] = x[row][best], best
+    if reverse:
+        if exclusive:
+            values, indices = _shift_forward(values), _shift_forward(indices)
+        values, indices = values[..., ::-1], indices[..., ::-1]
+    return values, indices
+
+
+def _shift_forward(x):
+    return np.concatenate((np.zeros_like(x[..., :1]), x[..., :-1]), -1)
+
+
+@st.composite
+def _digitize_helper(draw):
+    dtype, x = draw(
+        helpers.dtype_and_values(
+            available_dtypes=helpers.get_dtypes("float"),
+            min_num_dims=1,
+            max_num_dims=3,
+            min_value=-10,
+            max_value=10,
+        )
+    )
+    num_bins = draw(st.integers(min_value=1, max_value=6))
+    bins = np.sort(
+        draw(
+            st.lists(
+                st.integers(min_value=-10, max_value=10),
+                min_size=num_bins,
+                max_size=num_bins,
+            )
+        )
+    ).astype(dtype[0])
+    if draw(st.booleans()):
+        bins = bins[::-1]
+    return dtype * 2, x[0], bins
+
+
 @st.composite
 def _get_castable_float_dtype_nan(draw, min_value=None, max_value=None):
     available_dtypes = helpers.get_dtypes("float")
@@ -342,6 +396,49 @@ def test_bincount(*, dtype_and_x, test_flags, backend_fw, fn_name, on_device):
     )
 
 
+@pytest.mark.parametrize("weighted", [False, True])
+@pytest.mark.parametrize("minlength", [0, 12])
+@pytest.mark.parametrize("axis", [0, 1, -1])
+def test_bincount_axis(backend_fw, axis, minlength, weighted):
+    ivy.set_backend(backend_fw)
+    rng = np.random.default_rng(0)
+    x = rng.integers(0, 8, (3, 5, 4))
+    weights = rng.standard_normal(x.shape) if weighted else None
+    ret = ivy.bincount(
+        ivy.array(x),
+        weights=None if weights is None else ivy.array(weights),
+        minlength=minlength,
+        axis=axis,
+    )
+    rows = np.moveaxis(x, axis, -1)
+    if weighted:
+        weights = np.moveaxis(weights, axis, -1)
+    length = np.max([minlength, x.max() + 1])
+    expected = np.zeros(rows.shape[:-1] + (length,))
+    for row in np.ndindex(rows.shape[:-1]):
+        expected[row] = np.bincount(
+            rows[row], None if weights is None else weights[row], minlength=length
+        )
+    assert np.allclose(ivy.to_numpy(ret), np.moveaxis(expected, -1, axis))
+    ivy.previous_backend()
+
+
+def test_bincount_axis_negative(backend_fw):
+    ivy.set_backend(backend_fw)
+    x = ivy.array([[0, 1], [-1, 0]])
+    if backend_fw == "jax":
+        # jnp.bincount counts negative values as 0
+        ret = ivy.bincount(x, axis=-1)
+        assert np.array_equal(ivy.to_numpy(ret), [[1, 1], [2, 0]])
+    else:
+        # negative values are not counted in the bins of the previous row
+        with pytest.raises(Exception):
+            ivy.bincount(x, axis=-1)
+        with pytest.raises(Exception):
+            ivy.bincount(x)
+    ivy.previous_backend()
+
+
 # corrcoef
 @handle_test(
     fn_tree="functional.ivy.experimental.corrcoef",
@@ -454,6 +551,34 @@ def test_cummax(
     )
 
 
+@pytest.mark.parametrize("compositional", [False, True])
+@pytest.mark.parametrize("exclusive", [False, True])
+@pytest.mark.parametrize("reverse", [False, True])
+@pytest.mark.parametrize("axis", [0, -1])
+def test_cummax_indices(backend_fw, axis, exclusive, reverse, compositional):
+    ivy.set_backend(backend_fw)
+    rng = np.random.default_rng(0)
+    # ties, whose index is the last one, and nans, which propagate
+    x = rng.integers(-3, 3, (4, 9)).astype(np.float64)
+    x[1, 4] = x[2, 0] = np.nan
+    fn = ivy_statistical.cummax if compositional else ivy.cummax
+    values, indices = fn(
+        ivy.array(x), axis=axis, exclusive=exclusive, reverse=reverse
+    )
+    expected = _cummax_reference(np.moveaxis(x, axis, -1), exclusive, reverse)
+    expected = [np.moveaxis(ret, -1, axis) for ret in expected]
+    assert np.allclose(ivy.to_numpy(values), expected[0], equal_nan=True)
+    assert np.array_equal(ivy.to_numpy(indices), expected[1])
+    fn = ivy_statistical.cummin if compositional else ivy.cummin
+    ret = fn(ivy.array(x), axis=axis, reverse=reverse)
+    if reverse:
+        expected = np.flip(np.minimum.accumulate(np.flip(x, axis), axis), axis)
+    else:
+        expected = np.minimum.accumulate(x, axis)
+    assert np.allclose(ivy.to_numpy(ret), expected, equal_nan=True)
+    ivy.previous_backend()
+
+
 # cummin
 @handle_test(
     fn_tree="functional.ivy.experimental.cummin",
@@ -488,6 +613,45 @@ def test_cummin(
     )
 
 
+# digitize
+@handle_test(
+    fn_tree="functional.ivy.experimental.digitize",
+    dtype_x_bins=_digitize_helper(),
+    right=st.booleans(),
+    test_gradients=st.just(False),
+)
+def test_digitize(*, dtype_x_bins, right, test_flags, backend_fw, fn_name, on_device):
+    dtypes, x, bins = dtype_x_bins
+    helpers.test_function(
+        input_dtypes=dtypes,
+        test_flags=test_flags,
+        backend_to_test=backend_fw,
+        fn_name=fn_name,
+        on_device=on_device,
+        x=x,
+        bins=bins,
+        right=right,
+    )
+
+
+@pytest.mark.parametrize("compositional", [False, True])
+@pytest.mark.parametrize("right", [False, True])
+def test_digitize_rows(backend_fw, right, compositional):
+    ivy.set_backend(backend_fw)
+    rng = np.random.default_rng(0)
+    x = rng.integers(-1, 9, (4, 7)).astype(np.float64)
+    # repeated edges, and rows of bins in both directions
+    bins = np.sort(rng.integers(0, 8, (4, 5)), axis=-1).astype(np.float64)
+    bins[1::2] = bins[1::2, ::-1]
+    fn = ivy_statistical.digitize if compositional else ivy.digitize
+    ret = fn(ivy.array(x), ivy.array(bins), right=right)
+    expected = [np.digitize(x[i], bins[i], right=right) for i in range(4)]
+    assert np.array_equal(ivy.to_numpy(ret), expected)
+    ret = fn(ivy.array(x), ivy.array(bins[1]), right=right)
+    assert np.array_equal(ivy.to_numpy(ret), np.digitize(x, bins[1], right=right))
+    ivy.previous_backend()
+
+
 # TODO: - Error message from Tensorflow: 'Number of dimensions of `x` and `weights`
 #       must coincide. Found: x has <nd1>, weights has <nd2>'
 #       - Error description: typo that throws unintended exceptions when using both
@@ -537,6 +701,41 @@ def test_histogram(
     )
 
 
+@pytest.mark.parametrize("density", [False, True])
+@pytest.mark.parametrize("weighted", [False, True])
+@pytest.mark.parametrize("axis", [0, -1, (0, 2)])
+def test_histogram_axis(backend_fw, axis, weighted, density):
+    ivy.set_backend(backend_fw)
+    rng = np.random.default_rng(0)
+    # values on the edges, and outside of the bins
+    a = rng.integers(-2, 12, (4, 3, 5)).astype(np.float64)
+    bins = np.array([0.0, 2.0, 5.0, 6.0, 10.0])
+    weights = rng.random(a.shape) if weighted else None
+    ret = ivy.histogram(
+        ivy.array(a),
+        bins=ivy.array(bins),
+        axis=axis,
+        weights=None if weights is None else ivy.array(weights),
+        density=density,
+    )
+    axes = [axis] if isinstance(axis, int) else list(axis)
+    last_axes = list(range(-len(axes), 0))
+    rows = np.moveaxis(a, axes, last_axes)
+    if weighted:
+        weights = np.moveaxis(weights, axes, last_axes)
+    batch_shape = rows.shape[: -len(axes)]
+    expected = np.zeros((len(bins) - 1,) + batch_shape)
+    for row in np.ndindex(batch_shape):
+        expected[(slice(None),) + row] = np.histogram(
+            rows[row],
+            bins=bins,
+            weights=None if weights is None else weights[row],
+            density=density,
+        )[0]
+    assert np.allclose(ivy.to_numpy(ret), expected)
+    ivy.previous_backend()
+
+
 # igamma
 @handle_test(
     fn_tree="functional.ivy.experimental.igamma",
@@ -1,9 +1,11 @@
 # global
 import numpy as np
+import pytest
 from hypothesis import strategies as st, assume
 
 # local
 import ivy
+from ivy.functional.ivy.experimental import layers as ivy_layers
 import ivy_tests.test_ivy.helpers as helpers
 from ivy_tests.test_ivy.helpers import handle_test
 
@@ -168,6 +170,15 @@ def _interp_args(draw, mode=None, mode_list=None):
     return (dtype, x, mode, size, align_corners, scale_factor, recompute_scale_factor)
 
 
+def _overlap_and_add_reference(frames, frame_step):
+    # sum the [..., frames, frame_length] frames, frame_step samples apart
+    *batch, num_frames, frame_length = frames.shape
+    ret = np.zeros((*batch, (num_frames - 1) * frame_step + frame_length))
+    for i in range(num_frames):
+        ret[..., i * frame_step : i * frame_step + frame_length] += frames[..., i, :]
+    return ret
+
+
 @st.composite
 def _reduce_window_helper(draw, get_func_st):
     dtype = draw(helpers.get_dtypes("valid", full=False, index=2))
@@ -250,6 +261,41 @@ def _valid_dct(draw):
     return dtype, x, type, n, axis, norm
 
 
+def _stft_reference(x, frame_length, frame_step, fft_length, window, pad_end):
+    # transform each frame of the last axis of x on its own
+    num_samples = x.shape[-1]
+    if pad_end:
+        num_frames = -(-num_samples // frame_step)
+        pad_length = max(0, frame_length + frame_step * (num_frames - 1) - num_samples)
+        x = np.pad(x, [(0, 0)] * (x.ndim - 1) + [(0, pad_length)])
+    else:
+        num_frames = max(0, 1 + (num_samples - frame_length) // frame_step)
+    ret = np.zeros((*x.shape[:-1], num_frames, fft_length // 2 + 1), np.complex128)
+    for i in range(num_frames):
+        frame = x[..., i * frame_step : i * frame_step + frame_length] * window
+        ret[..., i, :] = np.fft.fft(frame, n=fft_length)[..., : fft_length // 2 + 1]
+    return ret
+
+
+@st.composite
+def _valid_istft(draw):
+    frame_length = draw(helpers.ints(min_value=2, max_value=32))
+    frame_step = draw(helpers.ints(min_value=1, max_value=frame_length))
+    fft_length = draw(st.sampled_from([None, 2 * frame_length]))
+    num_bins = (fft_length or 1 << (frame_length - 1).bit_length()) // 2 + 1
+    batch_shape = draw(helpers.get_shape(min_num_dims=0, max_num_dims=2))
+    num_frames = draw(helpers.ints(min_value=1, max_value=10))
+    dtype, x = draw(
+        helpers.dtype_and_values(
+            available_dtypes=["complex64", "complex128"],
+            shape=(*batch_shape, num_frames, num_bins),
+            min_value=-100,
+            max_value=100,
+        )
+    )
+    return dtype, x, frame_length, frame_step, fft_length
+
+
 @st.composite
 def _valid_stft(draw):
     dtype, x = draw(
@@ -1048,6 +1094,64 @@ def test_interpolate(
     )
 
 
+# test_istft
+@handle_test(
+    fn_tree="functional.ivy.experimental.istft",
+    dtype_x_and_args=_valid_istft(),
+    test_gradients=st.just(False),
+)
+def test_istft(*, dtype_x_and_args, test_flags, backend_fw, fn_name, on_device):
+    dtype, x, frame_length, frame_step, fft_length = dtype_x_and_args
+    helpers.test_function(
+        input_dtypes=dtype,
+        test_flags=test_flags,
+        backend_to_test=backend_fw,
+        on_device=on_device,
+        fn_name=fn_name,
+        rtol_=1e-2,
+        atol_=1e-2,
+        stfts=x[0],
+        frame_length=frame_length,
+        frame_step=frame_step,
+        fft_length=fft_length,
+        window_fn=None,
+    )
+
+
+@pytest.mark.parametrize("compositional", [False, True])
+@pytest.mark.parametrize("window", [False, True])
+@pytest.mark.parametrize(
+    ("frame_length", "frame_step", "fft_length"),
+    [(16, 4, None), (9, 2, 16), (7, 3, None), (8, 8, 4), (5, 7, None)],
+)
+def test_istft_overlap_add(
+    backend_fw, frame_length, frame_step, fft_length, window, compositional
+):
+    ivy.set_backend(backend_fw)
+    rng = np.random.default_rng(0)
+    x = rng.standard_normal((2, 3, 61))
+    window_fn = np.hanning if window else None
+    fn = ivy_layers.istft if compositional else ivy.istft
+    stfts = ivy.stft(ivy.array(x), frame_length, frame_step, fft_length=fft_length)
+    ret = fn(
+        stfts, frame_length, frame_step, fft_length=fft_length, window_fn=window_fn
+    )
+    fft_length = fft_length or 1 << (frame_length - 1).bit_length()
+    frames = np.fft.irfft(ivy.to_numpy(stfts), n=fft_length)[..., :frame_length]
+    padding = [(0, 0)] * (frames.ndim - 1) + [(0, frame_length - frames.shape[-1])]
+    frames = np.pad(frames, padding)
+    if window:
+        frames = frames * np.hanning(frame_length)
+    expected = _overlap_and_add_reference(frames, frame_step)
+    assert ret.dtype == "float64"
+    assert np.allclose(ivy.to_numpy(ret), expected)
+    # frames which don't overlap are inverted back to the signals
+    if not window and frame_step == frame_length <= fft_length:
+        num_samples = expected.shape[-1]
+        assert np.allclose(ivy.to_numpy(ret), x[..., :num_samples])
+    ivy.previous_backend()
+
+
 @handle_test(
     fn_tree="functional.ivy.experimental.max_pool1d",
     x_k_s_p=helpers.arrays_for_pooling(
@@ -1294,3 +1398,40 @@ def test_stft(
         window_fn=None,
         pad_end=True,
     )
+
+
+@pytest.mark.parametrize("window", [False, True])
+@pytest.mark.parametrize("pad_end", [False, True])
+@pytest.mark.parametrize(
+    ("frame_length", "frame_step", "fft_length"),
+    [(16, 4, None), (9, 2, 16), (7, 3, None), (5, 7, None), (40, 8, None)],
+)
+@pytest.mark.parametrize("dtype", ["float32", "float64"])
+def test_stft_frames(
+    backend_fw, dtype, frame_length, frame_step, fft_length, pad_end, window
+):
+    ivy.set_backend(backend_fw)
+    rng = np.random.default_rng(0)
+    x = rng.standard_normal((2, 3, 37)).astype(dtype)
+    window_fn = np.hanning if window else None
+    ret = ivy.stft(
+        ivy.array(x),
+        frame_length,
+        frame_step,
+        fft_length=fft_length,
+        window_fn=window_fn,
+        pad_end=pad_end,
+    )
+    fft_length = fft_length or 1 << (frame_length - 1).bit_length()
+    expected = _stft_reference(
+        x,
+        frame_length,
+        frame_step,
+        fft_length,
+        np.hanning(frame_length) if window else 1,
+        pad_end,
+    )
+    assert ret.dtype == ("complex64" if dtype == "float32" else "complex128")
+    assert ret.shape == expected.shape
+    assert np.allclose(ivy.to_numpy(ret), expected, rtol=1e-4, atol=1e-4)
+    ivy.previous_backend()
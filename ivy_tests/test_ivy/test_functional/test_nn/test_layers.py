@@ -1,6 +1,7 @@
 """Collection of tests for unified neural network layers."""
 
 # global
+import pytest
 from hypothesis import strategies as st, assume
 import ivy
 import numpy as np
@@ -8,7 +9,7 @@ import numpy as np
 
 # local
 import ivy_tests.test_ivy.helpers as helpers
-from ivy_tests.test_ivy.helpers import handle_test
+from ivy_tests.test_ivy.helpers import handle_test, BackendHandler
 from ivy.functional.ivy.layers import _deconv_length
 
 
@@ -1102,6 +1103,40 @@ def test_depthwise_conv2d(*, x_f_d_df, test_flags, backend_fw, fn_name, on_devic
     )
 
 
+@pytest.mark.parametrize("dtype", ["int8", "int32", "uint8"])
+def test_conv_integer(dtype, backend_fw):
+    # the numpy backend sums integer convolutions in the default integer of their
+    # kind, as np.sum does, so that the sums of products do not overflow
+    if backend_fw != "numpy":
+        pytest.skip()
+    rng = np.random.default_rng(0)
+    x = rng.integers(0, 100, (2, 7, 7, 4)).astype(dtype)
+    w = rng.integers(0, 100, (3, 3, 4, 4)).astype(dtype)
+    expected_dtype = np.promote_types(dtype, np.uint if dtype[0] == "u" else np.int_)
+    with BackendHandler.update_backend(backend_fw) as ivy_backend:
+        convs = [
+            lambda x, w: ivy_backend.conv1d(x[:, 0], w[0], 1, "VALID"),
+            lambda x, w: ivy_backend.conv2d(x, w, 2, "SAME"),
+            lambda x, w: ivy_backend.conv3d(x[:, None], w[None], 1, "VALID"),
+            lambda x, w: ivy_backend.depthwise_conv2d(x, w[..., 0], 1, "SAME"),
+            lambda x, w: ivy_backend.conv_general_dilated(
+                x, w[:, :, :2], 1, "VALID", dims=2, feature_group_count=2
+            ),
+        ]
+        for conv in convs:
+            ret = ivy_backend.to_numpy(
+                conv(ivy_backend.native_array(x), ivy_backend.native_array(w))
+            )
+            expected = ivy_backend.to_numpy(
+                conv(
+                    ivy_backend.native_array(x.astype("float64")),
+                    ivy_backend.native_array(w.astype("float64")),
+                )
+            )
+            assert ret.dtype == expected_dtype
+            assert np.array_equal(ret, expected)
+
+
 # dropout
 @handle_test(
     fn_tree="functional.ivy.dropout",
@@ -1209,6 +1244,7 @@ def test_lstm_update(*, dtype_lstm, test_flags, backend_fw, fn_name, on_device):
     is_causal=st.booleans(),
     return_attention_weights=st.booleans(),
     average_attention_weights=st.booleans(),
+    block_size=st.one_of(st.none(), helpers.ints(min_value=1, max_value=4)),
     ground_truth_backend="jax",
 )
 def test_multi_head_attention(
@@ -1220,6 +1256,7 @@ def test_multi_head_attention(
     is_causal,
     return_attention_weights,
     average_attention_weights,
+    block_size,
     test_flags,
     backend_fw,
     fn_name,
@@ -1266,6 +1303,7 @@ def test_multi_head_attention(
         average_attention_weights=average_attention_weights,
         dropout=dropout,
         training=training,
+        block_size=block_size,
     )
 
 
@@ -1279,6 +1317,7 @@ def test_multi_head_attention(
     dropout_p=st.floats(min_value=0, max_value=0.99),
     is_causal=st.booleans(),
     training=st.just(False),  # st.booleans(), disabled until proper testing is used
+    block_size=st.one_of(st.none(), helpers.ints(min_value=1, max_value=4)),
     ground_truth_backend="jax",
     test_with_out=st.just(True),
 )
@@ -1289,6 +1328,7 @@ def test_scaled_dot_product_attention(
     dropout_p,
     is_causal,
     training,
+    block_size,
     test_flags,
     backend_fw,
     fn_name,
@@ -1312,4 +1352,5 @@ def test_scaled_dot_product_attention(
         dropout_p=dropout_p,
         is_causal=is_causal,
         training=training,
+        block_size=block_size,
     )
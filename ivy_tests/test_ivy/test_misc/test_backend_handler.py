@@ -7,7 +7,7 @@ import numpy as np
 
 # local
 import ivy
-from ivy.utils.backend.handler import _backend_dict
+from ivy.utils.backend.handler import _backend_dict, _get_live_arrays
 
 # TODO fix due to refactor
 from ivy_tests.test_ivy.helpers.available_frameworks import _available_frameworks
@@ -139,6 +139,29 @@ def test_dynamic_backend_all_combos(middle_backend, end_backend):
         assert isinstance(nativ_cont["b"].data, ivy.current_backend().NativeArray)
 
 
+def test_dynamic_backend_live_arrays():
+    # clear the backend stack
+    ivy.unset_backend()
+
+    a = ivy.array([1.0, 2.0])
+    b = ivy.Array(a.data)
+    cont = ivy.Container({"w": ivy.array([3.0])})
+    ivy.set_backend("numpy", dynamic=True)
+
+    # the arrays, including the container leaves, are migrated and re-indexed
+    live_ids = [id(x) for x in _get_live_arrays("numpy", "cpu")]
+    for x in (a, b, cont["w"]):
+        assert id(x) in live_ids
+        assert isinstance(x.data, np.ndarray)
+    # shared native arrays are converted once and stay shared
+    assert a.data is b.data
+
+    # arrays are dropped from the registry once they are garbage collected
+    num_live = len(_get_live_arrays())
+    del b
+    assert len(_get_live_arrays()) == num_live - 1
+
+
 def test_dynamic_backend_context_manager():
     with ivy.dynamic_backend_as(True):
         a = ivy.array([0.0, 1.0])
@@ -184,9 +207,13 @@ def test_previous_backend(backend):
 
     previous_backend = ivy.previous_backend()
     stack_after_unset = ivy.backend_stack
-    # check that the function id has changed as inverse=True.
+    # check that the function id has changed as inverse=True, unless the same
+    # backend is still set underneath in which case its cached namespace is reused
     ivy.utils.assertions.check_equal(
-        func_address_before_unset, id(ivy.sum), inverse=True, as_array=False
+        func_address_before_unset,
+        id(ivy.sum),
+        inverse=not stack_after_unset or stack_after_unset[-1] is not previous_backend,
+        as_array=False,
     )
     ivy.utils.assertions.check_equal(
         previous_backend,
@@ -219,9 +246,13 @@ def test_set_backend(backend, array_type):
 
     ivy.set_backend(backend)
     stack_after = ivy.backend_stack
-    # check that the function id has changed as inverse=True.
+    # check that the function id has changed as inverse=True, unless the backend
+    # was already set in which case its cached namespace is reused
     ivy.utils.assertions.check_equal(
-        func_address_before, id(ivy.sum), inverse=True, as_array=False
+        func_address_before,
+        id(ivy.sum),
+        inverse=not stack_before or stack_before[-1] is not stack_after[-1],
+        as_array=False,
     )
     # using ivy assertions to ensure the desired backend is set
     ivy.utils.assertions.check_less(len(stack_before), len(stack_after), as_array=False)
@@ -2970,6 +2970,42 @@ def test_container_to_and_from_disk_as_hdf5(on_device):
     os.remove(save_filepath)
 
 
+@pytest.mark.parametrize(
+    ("chunks", "compression"), [(True, None), (None, None), (True, "gzip")]
+)
+def test_container_to_and_from_disk_as_hdf5_lazy(chunks, compression, on_device):
+    if ivy.current_backend_str() == "tensorflow":
+        # container disk saving requires eager execution
+        pytest.skip()
+    save_filepath = "container_on_disk_lazy.hdf5"
+    container = Container(
+        {
+            "a": ivy.array(np.arange(12, dtype=np.float32).reshape(6, 2)),
+            "b": {"c": ivy.array(np.arange(6), device=on_device)},
+        }
+    )
+    container.cont_to_disk_as_hdf5(
+        save_filepath, mode="w", chunks=chunks, compression=compression
+    )
+
+    # lazy loading keeps the leaves on disk
+    loaded_container = Container.cont_from_disk_as_hdf5(save_filepath, lazy=True)
+    if chunks is None:
+        assert isinstance(loaded_container.a, np.memmap)
+    else:
+        # chunked datasets stay as h5py datasets
+        assert not isinstance(loaded_container.a, np.ndarray)
+    assert np.array_equal(loaded_container.a[2:4], ivy.to_numpy(container.a)[2:4])
+
+    # sliced loading reads only the selected rows
+    loaded_container = Container.cont_from_disk_as_hdf5(save_filepath, slice(2, 4))
+    assert np.array_equal(
+        ivy.to_numpy(loaded_container.b.c), ivy.to_numpy(container.b.c)[2:4]
+    )
+
+    os.remove(save_filepath)
+
+
 def test_container_to_and_from_disk_as_json(on_device):
     save_filepath = "container_on_disk.json"
     dict_in = {
@@ -0,0 +1,105 @@
+import numpy as np
+import pytest
+
+import ivy
+from ivy.utils.einsum_parser import legalise_einsum_expr
+from ivy.utils.einsum_path import (
+    contract_path,
+    contract_path_cache_info,
+    matrix_chain_order,
+)
+
+CONTRACTIONS = [
+    ("ab,bc,cd->ad", [(10, 1000), (1000, 2), (2, 100)]),
+    ("ij,jk,kl,lm,mn->in", [(30, 35), (35, 15), (15, 5), (5, 10), (10, 20)]),
+    ("abc,bd,cde,ef->af", [(4, 5, 6), (5, 7), (6, 7, 3), (3, 2)]),
+    ("ii,ij,jk->k", [(4, 4), (4, 5), (5, 3)]),
+    ("a,b,c->abc", [(2,), (3,), (4,)]),
+    ("ab,ab,ab->", [(3, 4), (1, 4), (3, 4)]),
+    ("...ij,...jk,...kl", [(2, 3, 4), (2, 4, 5), (5, 6)]),
+    ("abc,cd,de,ef,fg,gh,hi,ij,jk->ak", [(2, 3, 4)] + [(4, 4)] * 7 + [(4, 5)]),
+]
+
+
+def _evaluate(equation, operands, path, info):
+    operands = list(operands)
+    for positions, step in zip(path, info.equations):
+        terms = [operands.pop(p) for p in sorted(positions, reverse=True)][::-1]
+        operands.append(np.einsum(step, *terms))
+    return operands[0]
+
+
+@pytest.mark.parametrize("optimize", ["auto", "optimal", "greedy", "naive"])
+@pytest.mark.parametrize(("equation", "shapes"), CONTRACTIONS)
+def test_contract_path(equation, shapes, optimize):
+    rng = np.random.default_rng(0)
+    operands = [rng.standard_normal(shape) for shape in shapes]
+    legal = legalise_einsum_expr(equation, *operands)
+    path, info = contract_path(legal, shapes, optimize=optimize)
+    assert len(path) == len(shapes) - 1
+    assert len(info.equations) == len(path)
+    assert np.allclose(
+        _evaluate(legal, operands, path, info), np.einsum(equation, *operands)
+    )
+    _, optimal = contract_path(legal, shapes, optimize="optimal")
+    assert optimal.flops <= info.flops
+    # the same path again, from the cache
+    hits = contract_path_cache_info().hits
+    assert contract_path(legal, shapes, optimize=optimize) == (path, info)
+    assert contract_path_cache_info().hits == hits + 1
+
+
+def test_contract_path_cost():
+    shapes = [(30, 35), (35, 15), (15, 5), (5, 10), (10, 20), (20, 25)]
+    equation = "ab,bc,cd,de,ef,fg->ag"
+    _, info = contract_path(equation, shapes, optimize="optimal")
+    # the textbook matrix chain, of 15125 multiply-adds
+    assert info.flops == 2 * 15125
+    _, naive = contract_path(equation, shapes, optimize="naive")
+    assert naive.flops > info.flops
+    # an explicit path is evaluated as is
+    path, explicit = contract_path(equation, shapes, optimize=[(0, 1)] * 5)
+    assert path == ((0, 1),) * 5
+    assert explicit == naive
+    with pytest.raises(ValueError):
+        contract_path("ab,bc->ac", [(2, 3), (4, 5)])
+    with pytest.raises(ValueError):
+        contract_path("ab,bc->ac", [(2, 3), (3, 5)], optimize="random")
+
+
+def test_matrix_chain_order():
+    shapes = ((30, 35), (35, 15), (15, 5), (5, 10), (10, 20), (20, 25))
+    assert matrix_chain_order(shapes) == ((0, (1, 2)), ((3, 4), 5))
+    assert matrix_chain_order(((10, 100), (100, 5), (5,))) == (0, (1, 2))
+    assert matrix_chain_order(((3,), (3, 4))) == (0, 1)
+
+
+@pytest.mark.parametrize(("equation", "shapes"), CONTRACTIONS)
+def test_einsum_path(backend_fw, equation, shapes):
+    ivy.set_backend(backend_fw)
+    rng = np.random.default_rng(0)
+    operands = [rng.standard_normal(shape) for shape in shapes]
+    calls = sum(contract_path_cache_info()[:2])
+    ret = ivy.einsum(equation, *[ivy.array(operand) for operand in operands])
+    assert np.allclose(ivy.to_numpy(ret), np.einsum(equation, *operands))
+    # contracted along a path rather than by the backend
+    assert sum(contract_path_cache_info()[:2]) == calls + 1
+    ivy.previous_backend()
+
+
+@pytest.mark.parametrize(
+    "shapes",
+    [
+        [(30, 35), (35, 15), (15, 5), (5, 10)],
+        [(35,), (35, 15), (15, 5), (5, 10)],
+        [(30, 35), (35, 15), (15, 5), (5,)],
+        [(35,), (35, 15), (15,)],
+    ],
+)
+def test_multi_dot_order(backend_fw, shapes):
+    ivy.set_backend(backend_fw)
+    rng = np.random.default_rng(0)
+    matrices = [rng.standard_normal(shape) for shape in shapes]
+    ret = ivy.multi_dot([ivy.array(matrix) for matrix in matrices])
+    assert np.allclose(ivy.to_numpy(ret), np.linalg.multi_dot(matrices))
+    ivy.previous_backend()
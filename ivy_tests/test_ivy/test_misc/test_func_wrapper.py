@@ -209,3 +209,43 @@ def test_views(array_to_update, backend_fw):
     assert np.allclose(d, d_copy + 1)
     assert np.allclose(e[0], e_copy + 1)
     ivy.previous_backend()
+
+
+@pytest.mark.parametrize(
+    ("fn_name", "args", "kwargs"),
+    [
+        ("add", ([1.0, 2.0], [3.0, 4.0]), {}),
+        ("add", ([1.0, 2.0], 3.0), {"alpha": 2}),
+        ("matmul", ([[1.0, 2.0], [3.0, 4.0]], [[1.0], [2.0]]), {}),
+        ("sum", ([[1.0, 2.0], [3.0, 4.0]],), {"axis": 0}),
+        ("zeros", ((2, 3),), {"dtype": "float32"}),
+        ("full_like", ([1, 2, 3], 5), {}),
+    ],
+)
+def test_fused_dispatch(fn_name, args, kwargs, backend_fw):
+    ivy.set_backend(backend_fw)
+    fn = ivy.__dict__[fn_name]
+    assert fn.fused_dispatch
+    args = tuple(ivy.array(a) if isinstance(a, list) else a for a in args)
+    fused_ret = fn(*args, **kwargs)
+    chain_ret = fn.__wrapped__(*args, **kwargs)
+    assert isinstance(fused_ret, ivy.Array)
+    assert fused_ret.dtype == chain_ret.dtype
+    assert np.allclose(ivy.to_numpy(fused_ret), ivy.to_numpy(chain_ret))
+    ivy.previous_backend()
+
+
+def test_fused_dispatch_fallback(backend_fw):
+    ivy.set_backend(backend_fw)
+    x = ivy.array([1.0, 2.0])
+    # containers and out arguments take the nested wrapper chain
+    ret = ivy.add(ivy.Container(a=x), x)
+    assert isinstance(ret, ivy.Container)
+    out = ivy.zeros((2,))
+    ret = ivy.add(x, x, out=out)
+    assert ret is out
+    assert np.allclose(ivy.to_numpy(out), [2.0, 4.0])
+    # exceptions are raised as ivy exceptions on the fast path as well
+    with pytest.raises(ivy.utils.exceptions.IvyException):
+        ivy.add(x, ivy.array([1.0, 2.0, 3.0]))
+    ivy.previous_backend()
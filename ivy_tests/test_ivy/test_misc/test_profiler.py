@@ -0,0 +1,31 @@
+import json
+import os
+
+import ivy
+from ivy.utils.profiler import WrapperProfiler
+
+
+def test_wrapper_profiler(backend_fw, tmp_path):
+    ivy.set_backend(backend_fw)
+    x = ivy.array([[1.0, 2.0], [3.0, 4.0]])
+    add = ivy.add
+    with WrapperProfiler(save_dir=str(tmp_path)) as profiler:
+        for _ in range(3):
+            ivy.add(x, x)
+        assert ivy.add is not add
+    # the original functions are restored once the profiler is stopped
+    assert ivy.add is add
+
+    add_stats = profiler.stats()["add"]
+    assert add_stats["calls"] == 3
+    assert add_stats["shapes"] == {((2, 2), (2, 2)): 3}
+    assert "kernel" in add_stats["layers"]
+    assert "handle_nestable" in add_stats["layers"]
+    assert all(t >= 0 for t in add_stats["layers"].values())
+    assert "add" in profiler.table()
+
+    with open(os.path.join(tmp_path, "wrapper_trace.json")) as f:
+        trace = json.load(f)
+    names = {event["name"] for event in trace["traceEvents"]}
+    assert "add.kernel" in names
+    ivy.previous_backend()
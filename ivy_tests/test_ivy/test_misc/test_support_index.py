@@ -0,0 +1,51 @@
+import ivy
+from ivy.utils import support_index
+
+
+def _normalize(support):
+    if isinstance(support, dict):
+        return {k: _normalize(v) for k, v in support.items()}
+    return set(support)
+
+
+def test_support_index(backend_fw, tmp_path, monkeypatch):
+    monkeypatch.setenv("IVY_SUPPORT_INDEX", str(tmp_path / "support_index.json"))
+    support_index.clear()
+    ivy.set_backend(backend_fw)
+    # a compositional function, whose support is resolved from the functions it calls
+    fn = ivy.multi_head_attention
+    queries = {kind: getattr(ivy, f"function_{kind}") for kind in support_index.KINDS}
+    with support_index.bypassed():
+        expected = {kind: _normalize(query(fn)) for kind, query in queries.items()}
+
+    for kind, query in queries.items():
+        assert _normalize(query(fn)) == expected[kind]
+        # now read from the index
+        assert _normalize(query(fn)) == expected[kind]
+
+    # persisted, and loaded back from disk
+    support_index.save()
+    support_index.clear()
+    for kind, query in queries.items():
+        assert _normalize(query(fn)) == expected[kind]
+    dtypes = queries["supported_dtypes"](fn)
+    assert all(isinstance(dtype, ivy.Dtype) for dtype in dtypes)
+    assert support_index.validate([backend_fw]) == []
+
+    support_index.clear()
+    ivy.previous_backend()
+
+
+def test_support_index_not_persisted_by_default(backend_fw, tmp_path, monkeypatch):
+    monkeypatch.delenv("IVY_SUPPORT_INDEX", raising=False)
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / ".cache"))
+    support_index.clear()
+    ivy.set_backend(backend_fw)
+    assert support_index.index_path() is None
+    ivy.function_unsupported_dtypes(ivy.multi_head_attention)
+    support_index._save_on_exit()
+    assert list(tmp_path.iterdir()) == []
+
+    support_index.clear()
+    ivy.previous_backend()
@@ -2,7 +2,7 @@
 
 # global
 import numpy as np
-from hypothesis import assume
+from hypothesis import assume, given
 from hypothesis import strategies as st
 
 # local
@@ -1513,6 +1513,59 @@ def test_multi_head_attention_layer(
     assert_same_type_and_shape([ret_np_flat, ret_np_from_gt_flat])
 
 
+@given(
+    batch_size=st.integers(min_value=1, max_value=3),
+    prompt_lengths=st.lists(st.integers(min_value=1, max_value=4), min_size=3),
+    num_steps=st.integers(min_value=1, max_value=3),
+    qkv_same_embed_dim=st.booleans(),
+)
+def test_multi_head_attention_layer_with_cache(
+    batch_size, prompt_lengths, num_steps, qkv_same_embed_dim, on_device
+):
+    embed_dim = 8
+    kv_dim = embed_dim if qkv_same_embed_dim else 6
+    layer = ivy.MultiHeadAttention(
+        embed_dim,
+        num_heads=2,
+        key_dim=kv_dim,
+        value_dim=kv_dim,
+        device=on_device,
+    )
+    prompt_lengths = prompt_lengths[:batch_size]
+    total_length = max(prompt_lengths) + num_steps
+    np.random.seed(0)
+    x = np.random.uniform(-1, 1, (batch_size, total_length, embed_dim))
+    x = ivy.array(x, dtype="float32", device=on_device)
+
+    def _call(query, **kwargs):
+        return layer(query, query[..., :kv_dim], query[..., :kv_dim], **kwargs)
+
+    # decode a ragged prompt, then one token at a time
+    cache = layer.init_cache(batch_size, max_length=1)
+    prompt = x[:, : max(prompt_lengths)]
+    ret, cache = _call(prompt, cache=cache, is_causal=True, lengths=prompt_lengths)
+    steps = []
+    for step in range(num_steps):
+        tokens = ivy.stack(
+            [x[b, length + step] for b, length in enumerate(prompt_lengths)]
+        )
+        step_ret, cache = _call(ivy.expand_dims(tokens, axis=1), cache=cache)
+        steps.append(ivy.to_numpy(step_ret)[:, 0])
+    assert cache.lengths == [length + num_steps for length in prompt_lengths]
+    assert cache.capacity >= max(cache.lengths)
+    # float32 key and value buffers of the projected embed_dim features
+    assert cache.nbytes == 2 * batch_size * cache.capacity * embed_dim * 4
+
+    # compare against attending over each full sequence without a cache
+    for b, length in enumerate(prompt_lengths):
+        expected = ivy.to_numpy(
+            _call(x[b : b + 1, : length + num_steps], is_causal=True)
+        )[0]
+        assert np.allclose(ivy.to_numpy(ret)[b, :length], expected[:length], atol=1e-5)
+        for step in range(num_steps):
+            assert np.allclose(steps[step][b], expected[length + step], atol=1e-5)
+
+
 # # Sequential #
 @handle_method(
     method_tree="Sequential.__call__",
@@ -1646,3 +1699,33 @@ def test_sequential_layer(
 all_initializers = (
     all_constant_initializers + all_uniform_initializers + all_gaussian_initializers
 )
+
+
+@given(
+    frame_length=st.integers(min_value=1, max_value=20),
+    frame_step=st.integers(min_value=1, max_value=24),
+    pad_end=st.booleans(),
+    chunk_sizes=st.lists(st.integers(min_value=0, max_value=15), max_size=10),
+)
+def test_streaming_stft(frame_length, frame_step, pad_end, chunk_sizes, on_device):
+    np.random.seed(0)
+    x = np.random.uniform(-1, 1, (2, sum(chunk_sizes)))
+    x = ivy.array(x, dtype="float32", device=on_device)
+    stream = ivy.StreamingSTFT(
+        frame_length, frame_step, window_fn=np.hanning, pad_end=pad_end
+    )
+    frames, start = [], 0
+    for size in [0] + chunk_sizes:
+        frames.append(stream.process(x[:, start : start + size]))
+        start += size
+        # only the samples of the next frame are kept
+        assert stream.buffered < frame_length
+    frames.append(stream.flush())
+    assert stream.buffered == 0
+    ret = ivy.concat(frames, axis=-2)
+    expected = ivy.stft(
+        x, frame_length, frame_step, window_fn=np.hanning, pad_end=pad_end
+    )
+    assert ret.shape == expected.shape
+    assert ret.dtype == expected.dtype
+    assert np.allclose(ivy.to_numpy(ret), ivy.to_numpy(expected), atol=1e-5)
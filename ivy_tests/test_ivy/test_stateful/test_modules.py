@@ -3,6 +3,7 @@
 # global
 import os
 from hypothesis import given, strategies as st
+import pytest
 import numpy as np
 
 # local
@@ -148,6 +149,47 @@ class ModuleWithTrainEval(ivy.Module):
         pass
 
 
+# eval with fast_call
+@given(
+    batch_shape=helpers.get_shape(
+        min_num_dims=2, max_num_dims=2, min_dim_size=1, max_dim_size=2
+    ),
+    input_channels=st.integers(min_value=2, max_value=5),
+    output_channels=st.integers(min_value=2, max_value=5),
+)
+def test_eval_fast_call(batch_shape, input_channels, output_channels, on_device):
+    x = ivy.astype(
+        ivy.linspace(ivy.zeros(batch_shape), ivy.ones(batch_shape), input_channels),
+        "float32",
+    )
+    module = WithNestedModules(input_channels, output_channels, device=on_device)
+    module.eval()
+    expected = ivy.to_numpy(module(x))
+
+    module.eval(fast_call=True)
+    assert not module.training
+    assert np.allclose(ivy.to_numpy(module(x)), expected)
+
+    # variables passed explicitly, and variables replaced on the module
+    v = module.v.cont_map(lambda x_, kc: x_ * 2)
+    module.eval()
+    expected_v = ivy.to_numpy(module(x, v=v))
+    module.eval(fast_call=True)
+    assert np.allclose(ivy.to_numpy(module(x, v=v)), expected_v)
+    module.v = v
+    assert np.allclose(ivy.to_numpy(module(x)), expected_v)
+
+    # tracking is not available in fast_call mode
+    with pytest.raises(ivy.utils.exceptions.IvyException):
+        module(x, track_submod_rets=True)
+
+    # switching to training mode leaves fast_call mode
+    module.train()
+    assert module.training
+    module(x, track_submod_rets=True)
+    assert module.submod_rets
+
+
 @given(
     buffer=st.just(
         [
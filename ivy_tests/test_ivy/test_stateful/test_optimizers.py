@@ -1,9 +1,11 @@
 """Collection of tests for Ivy optimizers."""
 
 # global
-from hypothesis import strategies as st
+import numpy as np
+from hypothesis import given, strategies as st
 
 # local
+import ivy
 import ivy_tests.test_ivy.helpers as helpers
 from ivy_tests.test_ivy.helpers import handle_method
 from ivy_tests.test_ivy.test_functional.test_core.test_gradients import (
@@ -251,3 +253,53 @@ def test_sgd_optimizer(
         xs_grad_idxs=xs_grad_idxs,
         on_device=on_device,
     )
+
+
+@given(
+    optimizer=st.sampled_from(["SGD", "LARS", "Adam", "LAMB"]),
+    decay_lambda=st.sampled_from([0, 0.1]),
+    inplace=st.booleans(),
+    num_steps=st.integers(min_value=1, max_value=3),
+)
+def test_fused_optimizer(optimizer, decay_lambda, inplace, num_steps, on_device):
+    kwargs = {"lr": 0.1, "inplace": inplace}
+    if optimizer in ["LARS", "LAMB"]:
+        kwargs["decay_lambda"] = decay_lambda
+    np.random.seed(0)
+
+    def _variables():
+        # mixed dtypes, so that the fused step holds more than one flat buffer
+        return ivy.Container(
+            {
+                name: ivy.array(
+                    np.random.uniform(-1, 1, shape), dtype=dtype, device=on_device
+                )
+                for name, shape, dtype in [
+                    ("a", (3, 4), "float32"),
+                    ("b", (4,), "float32"),
+                    ("c", (2, 2, 2), "float64"),
+                    ("d", (5,), "float32"),
+                ]
+            }
+        )
+
+    v = _variables()
+    grads = [_variables() for _ in range(num_steps)]
+    unfused = getattr(ivy, optimizer)(**kwargs)
+    fused = getattr(ivy, optimizer)(fused=True, **kwargs)
+    v_unfused = v.cont_deep_copy()
+    v_fused = v.cont_deep_copy()
+    for g in grads:
+        v_unfused = unfused.step(v_unfused, g)
+        v_fused = fused.step(v_fused, g)
+    assert [x.dtype for x in v_fused.cont_to_flat_list()] == [
+        x.dtype for x in v_unfused.cont_to_flat_list()
+    ]
+    # the moments are kept per dtype of the variables, so only compare their values
+    for ret, expected in [(v_fused, v_unfused), (fused.state, unfused.state)]:
+        ret = list(ret.cont_to_iterator())
+        expected = list(expected.cont_to_iterator())
+        assert [kc for kc, _ in ret] == [kc for kc, _ in expected]
+        for (_, x), (_, y) in zip(ret, expected):
+            assert x.shape == y.shape
+            assert np.allclose(ivy.to_numpy(x), ivy.to_numpy(y), rtol=1e-5, atol=1e-6)
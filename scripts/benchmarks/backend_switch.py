@@ -0,0 +1,65 @@
+"""
+Benchmark backend switching with and without the cached wrapped namespaces.
+
+The uncached numbers clear the namespace cache before every switch, which reproduces
+the previous behaviour of re-wrapping the whole ivy namespace on each switch.
+
+Usage: ``python scripts/benchmarks/backend_switch.py``
+"""
+
+import importlib
+import time
+import warnings
+
+import ivy
+from ivy.utils.backend import handler
+
+REPEATS = 20
+
+
+def _available_backends():
+    backends = []
+    for backend in ["numpy", "torch", "jax", "tensorflow", "paddle"]:
+        try:
+            importlib.import_module(backend)
+        except ImportError:
+            continue
+        backends.append(backend)
+    return backends
+
+
+def _switch(backends, cached):
+    # set each backend on top of the previous one, then unwind the stack
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        for backend in backends:
+            if not cached:
+                handler._backend_namespaces.clear()
+            ivy.set_backend(backend)
+        for _ in backends:
+            if not cached:
+                handler._backend_namespaces.clear()
+            ivy.previous_backend()
+    return (time.perf_counter() - start) / (REPEATS * len(backends) * 2)
+
+
+if __name__ == "__main__":
+    # setting a backend warns about inplace updates, which is irrelevant here
+    warnings.simplefilter("ignore")
+    backends = _available_backends()
+    # warm up, so that the import and first wrapping of each backend isn't timed
+    for backend in backends:
+        ivy.set_backend(backend)
+        ivy.previous_backend()
+    scenarios = [[backend] for backend in backends]
+    if len(backends) > 1:
+        scenarios.append(backends)
+    print(f"{'backends':<40}{'uncached (ms)':>16}{'cached (ms)':>16}")
+    for scenario in scenarios:
+        uncached = _switch(scenario, cached=False)
+        # rebuild the cache cleared by the uncached run before timing
+        _switch(scenario, cached=True)
+        cached = _switch(scenario, cached=True)
+        print(
+            f"{' -> '.join(scenario):<40}{uncached * 1e3:>16.3f}{cached * 1e3:>16.3f}"
+        )
@@ -0,0 +1,99 @@
+"""
+Benchmark ivy.searchsorted, ivy.histogram, ivy.bincount and ivy.digitize on rows.
+
+Each function bins 10^5 short rows at once with the NumPy backend. histogram and
+bincount offset every row into its own range of bins, so that one flat np.bincount
+call counts all of them, while searchsorted and digitize merge each row of values
+into its sorted row with one stable sort. They are timed against the loops over
+the rows which the backend used before, or which batching needed without an axis
+argument.
+
+Usage: ``python scripts/benchmarks/binning.py``
+"""
+
+import time
+
+import numpy as np
+
+import ivy
+
+NUM_ROWS = 100_000
+ROW_LENGTH = 16
+NUM_BINS = 8
+
+
+def _searchsorted_loop(x, v):
+    ret = np.empty(v.shape, dtype=np.int64)
+    for i in range(x.shape[0]):
+        ret[i] = np.searchsorted(x[i], v[i])
+    return ret
+
+
+def _histogram_loop(a, bins, weights):
+    ret = np.empty((NUM_BINS, a.shape[0]))
+    for i in range(a.shape[0]):
+        ret[:, i] = np.histogram(a[i], bins=bins, weights=weights[i])[0]
+    return ret
+
+
+def _bincount_loop(x, weights):
+    ret = np.empty((x.shape[0], NUM_BINS))
+    for i in range(x.shape[0]):
+        ret[i] = np.bincount(x[i], weights=weights[i], minlength=NUM_BINS)
+    return ret
+
+
+def _digitize_loop(x, bins):
+    ret = np.empty(x.shape, dtype=np.int64)
+    for i in range(x.shape[0]):
+        ret[i] = np.digitize(x[i], bins[i])
+    return ret
+
+
+def _time(fn, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        ret = fn()
+        best = min(best, time.perf_counter() - start)
+    return ret, best
+
+
+if __name__ == "__main__":
+    ivy.set_backend("numpy")
+    rng = np.random.default_rng(0)
+    x = np.sort(rng.standard_normal((NUM_ROWS, ROW_LENGTH)), axis=-1)
+    v = rng.standard_normal((NUM_ROWS, ROW_LENGTH))
+    counts = rng.integers(0, NUM_BINS, (NUM_ROWS, ROW_LENGTH))
+    weights = rng.random((NUM_ROWS, ROW_LENGTH))
+    bins = np.linspace(-2, 2, NUM_BINS + 1)
+    ivy_x, ivy_v, ivy_counts = ivy.array(x), ivy.array(v), ivy.array(counts)
+    ivy_weights, ivy_bins = ivy.array(weights), ivy.array(bins)
+    cases = {
+        "searchsorted": (
+            lambda: ivy.searchsorted(ivy_x, ivy_v),
+            lambda: _searchsorted_loop(x, v),
+        ),
+        "histogram": (
+            lambda: ivy.histogram(ivy_v, bins=ivy_bins, axis=-1, weights=ivy_weights),
+            lambda: _histogram_loop(v, bins, weights),
+        ),
+        "bincount": (
+            lambda: ivy.bincount(ivy_counts, weights=ivy_weights, axis=-1),
+            lambda: _bincount_loop(counts, weights),
+        ),
+        "digitize": (
+            lambda: ivy.digitize(ivy_v, ivy_x),
+            lambda: _digitize_loop(v, x),
+        ),
+    }
+    print(f"{NUM_ROWS} rows of {ROW_LENGTH} values")
+    print(f"{'function':<14}{'loop (ms)':>12}{'batched (ms)':>14}{'speedup':>10}")
+    for name, (fn, loop) in cases.items():
+        ret, elapsed = _time(fn)
+        expected, loop_time = _time(loop, repeat=1)
+        assert np.allclose(ivy.to_numpy(ret), expected)
+        print(
+            f"{name:<14}{loop_time * 1e3:>12.1f}{elapsed * 1e3:>14.1f}"
+            f"{loop_time / elapsed:>10.1f}x"
+        )
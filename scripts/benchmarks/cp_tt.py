@@ -0,0 +1,95 @@
+"""
+Benchmark ivy.parafac and ivy.tensor_train on 4-D tensors.
+
+The MTTKRP, the unfolding of the tensor times the khatri-rao product of the other
+factors, dominates every ALS iteration of ``parafac``. It is compared between
+``ivy.CPTensor.unfolding_dot_khatri_rao``, forming the khatri-rao product
+explicitly, and contracting one rank-1 component at a time. Peak memory is measured
+with tracemalloc, which tracks the allocations of NumPy arrays, so the NumPy backend
+is used.
+
+Usage: ``python scripts/benchmarks/cp_tt.py``
+"""
+
+import time
+import tracemalloc
+
+import numpy as np
+
+import ivy
+
+RANK = 16
+SHAPES = [(32, 32, 32, 32), (64, 64, 64, 64), (16, 128, 128, 32)]
+
+
+def _measure(fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    ret = fn()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return ret, elapsed, peak
+
+
+def _mttkrp_khatri_rao(x, factors, mode):
+    return ivy.matmul(ivy.unfold(x, mode), ivy.khatri_rao(factors, skip_matrix=mode))
+
+
+def _mttkrp_per_component(x, factors, mode):
+    return ivy.stack(
+        [
+            ivy.multi_mode_dot(x, [f[:, r] for f in factors], skip=mode)
+            for r in range(RANK)
+        ],
+        axis=1,
+    )
+
+
+def _print(name, shape, elapsed, peak, error=None):
+    error = "" if error is None else f"{error:>10.1e}"
+    print(
+        f"{str(shape):<20}{name:<26}{elapsed * 1e3:>12.1f}{peak / 2**20:>12.1f}{error}"
+    )
+
+
+if __name__ == "__main__":
+    ivy.set_backend("numpy")
+    rng = np.random.default_rng(0)
+    print(f"{'tensor':<20}{'':<26}{'time (ms)':>12}{'peak (MB)':>12}{'error':>10}")
+    for shape in SHAPES:
+        factors = [
+            ivy.array(rng.standard_normal((s, RANK)).astype("float32")) for s in shape
+        ]
+        x = ivy.CPTensor.cp_to_tensor((None, factors))
+        x = x + 0.01 * ivy.array(rng.standard_normal(shape).astype("float32"))
+        norm = ivy.sqrt(ivy.sum(x**2))
+
+        for name, fn in [
+            ("mttkrp", ivy.CPTensor.unfolding_dot_khatri_rao),
+            ("mttkrp (khatri-rao)", _mttkrp_khatri_rao),
+            ("mttkrp (per component)", _mttkrp_per_component),
+        ]:
+            if fn is ivy.CPTensor.unfolding_dot_khatri_rao:
+                call = lambda mode: fn(x, (None, factors), mode)  # noqa: E731
+            else:
+                call = lambda mode: fn(x, factors, mode)  # noqa: E731
+            _, elapsed, peak = _measure(lambda: [call(m) for m in range(4)])
+            _print(name, shape, elapsed, peak)
+
+        for linesearch in [False, True]:
+            cp, elapsed, peak = _measure(
+                lambda: ivy.parafac(
+                    x, RANK, n_iter_max=10, tol=0, linesearch=linesearch
+                )
+            )
+            error = float(ivy.sqrt(ivy.sum((cp.to_tensor() - x) ** 2)) / norm)
+            name = "parafac (10 iters, ls)" if linesearch else "parafac (10 iters)"
+            _print(name, shape, elapsed, peak, error)
+
+        for svd in ["truncated_svd", "randomized_svd", "streaming_svd"]:
+            tt, elapsed, peak = _measure(
+                lambda: ivy.tensor_train(x, RANK, svd=svd, seed=0)
+            )
+            error = float(ivy.sqrt(ivy.sum((tt.to_tensor() - x) ** 2)) / norm)
+            _print(f"tensor_train ({svd})", shape, elapsed, peak, error)
@@ -0,0 +1,57 @@
+"""
+Benchmark ivy.cummax with indices.
+
+The NumPy backend is timed against the loop it used to find the index of each
+maximum, and against the compositional implementation, which the backends without
+a native cummax with indices run. The loop only handled 1-D arrays.
+
+Usage: ``python scripts/benchmarks/cummax.py``
+"""
+
+import time
+
+import numpy as np
+
+import ivy
+from ivy.functional.ivy.experimental import statistical
+
+SIZES = [1_000, 10_000, 100_000, 1_000_000]
+SHAPES = [(1_000, 1_000), (100, 10_000)]
+
+
+def _loop(x):
+    indices, n = [], 0
+    for i, value in enumerate(x):
+        if x[n] <= value or i == 0:
+            n = i
+        indices.append(n)
+    return np.maximum.accumulate(x), np.array(indices, dtype=np.int64)
+
+
+def _time(fn, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        ret = fn()
+        best = min(best, time.perf_counter() - start)
+    return ret, best
+
+
+if __name__ == "__main__":
+    ivy.set_backend("numpy")
+    rng = np.random.default_rng(0)
+    print(f"{'shape':<16}{'loop (ms)':>12}{'numpy (ms)':>12}{'compos. (ms)':>14}")
+    for shape in [(size,) for size in SIZES] + SHAPES:
+        x = rng.standard_normal(shape).cumsum(-1)
+        ret, elapsed = _time(lambda: ivy.cummax(x, axis=-1))
+        compos, compos_time = _time(lambda: statistical.cummax(x, axis=-1))
+        assert np.array_equal(ivy.to_numpy(ret[1]), ivy.to_numpy(compos[1]))
+        loop = ""
+        if len(shape) == 1:
+            expected, loop_time = _time(lambda: _loop(x), repeat=1)
+            assert np.array_equal(ivy.to_numpy(ret[1]), expected[1])
+            loop = f"{loop_time * 1e3:.1f}"
+        print(
+            f"{str(shape):<16}{loop:>12}{elapsed * 1e3:>12.2f}"
+            f"{compos_time * 1e3:>14.2f}"
+        )
@@ -0,0 +1,96 @@
+"""
+Benchmark the contraction paths of ivy.einsum.
+
+Each contraction is run with the path found by ``contract_path``, as ``ivy.einsum``
+does, and pairwise from left to right. The flops and the size of the largest
+intermediate of both paths are reported, along with the flops of contracting all
+the operands in a single pass, which is what ``np.einsum`` does by default. Peak
+memory is measured with tracemalloc, which tracks the allocations of NumPy arrays,
+so the NumPy backend is used.
+
+Usage: ``python scripts/benchmarks/einsum_path.py``
+"""
+
+import time
+import tracemalloc
+
+import numpy as np
+
+import ivy
+from ivy.utils.einsum_parser import legalise_einsum_expr
+from ivy.utils.einsum_path import contract_path
+
+CHAIN = [(11, 37), (37, 9), (9, 53), (53, 7), (7, 61), (61, 5), (5, 47), (47, 13)]
+CHAIN += [(13, 59), (59, 3), (3, 41)]
+CONTRACTIONS = {
+    "matrix chain": ("ab,bc,cd,de->ae", [(512, 8), (8, 512), (512, 8), (8, 512)]),
+    "matrix-vector chain": (
+        "ab,bc,cd,d->a",
+        [(1024, 1024), (1024, 1024), (1024, 1024), (1024,)],
+    ),
+    "bilinear layer": ("bi,ioj,bj->bo", [(64, 128), (128, 64, 128), (64, 128)]),
+    "tensor train": (
+        "aib,bjc,ckd,dle,i,j,k,l->ae",
+        [(1, 24, 24), (24, 24, 24), (24, 24, 24), (24, 24, 1)] + [(24,)] * 4,
+    ),
+    "11 matrix chain": (
+        ",".join(chr(97 + i) + chr(98 + i) for i in range(11)) + "->al",
+        CHAIN,
+    ),
+}
+
+
+def _contract(operands, path, info):
+    operands = list(operands)
+    for positions, step in zip(path, info.equations):
+        terms = [operands.pop(p) for p in sorted(positions, reverse=True)][::-1]
+        operands.append(ivy.einsum(step, *terms))
+    return operands[0]
+
+
+def _measure(fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    ret = fn()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return ret, elapsed, peak
+
+
+if __name__ == "__main__":
+    ivy.set_backend("numpy")
+    rng = np.random.default_rng(0)
+    print(
+        f"{'contraction':<22}{'path':<16}{'MFLOP':>12}{'largest':>12}"
+        f"{'time (ms)':>12}{'peak (MB)':>12}"
+    )
+    for name, (equation, shapes) in CONTRACTIONS.items():
+        operands = [ivy.array(rng.random(shape)) for shape in shapes]
+        legal = legalise_einsum_expr(equation, *operands)
+        start = time.perf_counter()
+        path, info = contract_path(legal, shapes)
+        search = time.perf_counter() - start
+        start = time.perf_counter()
+        contract_path(legal, shapes)
+        cached = time.perf_counter() - start
+        naive_path, naive = contract_path(legal, shapes, optimize="naive")
+
+        expected, naive_time, naive_peak = _measure(
+            lambda: _contract(operands, naive_path, naive)
+        )
+        ret, elapsed, peak = _measure(lambda: ivy.einsum(equation, *operands))
+        assert np.allclose(ret, expected)
+        print(f"{name:<22}{'single pass':<16}{info.naive_flops / 1e6:>12.1f}")
+        for label, summary, t, p in (
+            ("left to right", naive, naive_time, naive_peak),
+            ("ivy.einsum", info, elapsed, peak),
+        ):
+            print(
+                f"{'':<22}{label:<16}{summary.flops / 1e6:>12.1f}"
+                f"{summary.largest_intermediate:>12}{t * 1e3:>12.1f}{p / 2**20:>12.1f}"
+            )
+        print(
+            f"{'':<22}path search {search * 1e3:.2f} ms, "
+            f"from the cache {cached * 1e6:.1f} us"
+        )
@@ -0,0 +1,55 @@
+"""
+Benchmark the step time of ivy.stateful optimizers with and without ``fused=True``,
+for an increasing number of variables.
+
+Each variable is a small 64x64 matrix, so that the step time is dominated by the
+per-variable overhead which fusing the update removes.
+
+Usage: ``python scripts/benchmarks/fused_optimizers.py``
+"""
+
+import time
+
+import numpy as np
+
+import ivy
+
+REPEATS = 5
+SHAPE = (64, 64)
+
+
+def _variables(rng, num_vars):
+    return ivy.Container(
+        {
+            f"v{i}": ivy.array(rng.standard_normal(SHAPE).astype("float32"))
+            for i in range(num_vars)
+        }
+    )
+
+
+def _time(optimizer, v, grads):
+    v = optimizer.step(v, grads)
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        v = optimizer.step(v, grads)
+    return (time.perf_counter() - start) / REPEATS
+
+
+if __name__ == "__main__":
+    ivy.set_backend("numpy")
+    rng = np.random.default_rng(0)
+    print(
+        f"{'optimizer':<10}{'variables':>10}{'parameters':>12}"
+        f"{'unfused (ms)':>14}{'fused (ms)':>12}"
+    )
+    for cls in [ivy.SGD, ivy.Adam, ivy.LAMB]:
+        for num_vars in [10, 100, 500]:
+            v = _variables(rng, num_vars)
+            grads = _variables(rng, num_vars)
+            unfused = _time(cls(lr=1e-3), v.cont_deep_copy(), grads)
+            fused = _time(cls(lr=1e-3, fused=True), v.cont_deep_copy(), grads)
+            num_params = num_vars * SHAPE[0] * SHAPE[1]
+            print(
+                f"{cls.__name__:<10}{num_vars:>10}{num_params:>12}"
+                f"{unfused * 1e3:>14.2f}{fused * 1e3:>12.2f}"
+            )
@@ -0,0 +1,48 @@
+"""
+Benchmark the compositional ivy.get_item, which the backends without native support
+for a query fall back to, for growing inputs and fixed size outputs.
+
+Peak memory is measured with tracemalloc, which tracks the allocations of NumPy
+arrays, so the NumPy backend is used.
+
+Usage: ``python scripts/benchmarks/get_item_query.py``
+"""
+
+import time
+import tracemalloc
+
+import numpy as np
+
+import ivy
+from ivy.functional.ivy.general import get_item
+
+QUERIES = {
+    "x[-1:-9:-1]": (slice(-1, -9, -1),),
+    "x[8:16, 2]": (slice(8, 16), 2),
+    "x[[1, 5, 9]]": ([1, 5, 9],),
+    "x[:4, ..., [0, -1]]": (slice(0, 4), Ellipsis, [0, -1]),
+}
+
+
+def _measure(x, query):
+    tracemalloc.start()
+    start = time.perf_counter()
+    get_item(x, query)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+if __name__ == "__main__":
+    ivy.set_backend("numpy")
+    print(f"{'query':<22}{'input (MB)':>12}{'time (ms)':>12}{'peak (MB)':>12}")
+    for rows in [1024, 4096, 16384]:
+        x = ivy.array(np.ones((rows, 1024), dtype="float32"))
+        for name, query in QUERIES.items():
+            get_item(x, query)
+            elapsed, peak = _measure(x, query)
+            print(
+                f"{name:<22}{x.size * 4 / 2**20:>12.0f}"
+                f"{elapsed * 1e3:>12.2f}{peak / 2**20:>12.2f}"
+            )
@@ -0,0 +1,55 @@
+"""
+Benchmark autoregressive decoding with ivy.MultiHeadAttention, with and without a
+KVCache.
+
+Without a cache, every step re-projects and re-attends the whole sequence generated
+so far. With a cache, each step projects only the new token.
+
+Usage: ``python scripts/benchmarks/kv_cache.py``
+"""
+
+import time
+
+import numpy as np
+
+import ivy
+
+BATCH_SIZE = 2
+EMBED_DIM = 512
+NUM_HEADS = 8
+
+
+def _decode_uncached(layer, x):
+    for t in range(1, x.shape[1] + 1):
+        layer(x[:, :t], is_causal=True)
+
+
+def _decode_cached(layer, x):
+    cache = layer.init_cache(BATCH_SIZE)
+    for t in range(x.shape[1]):
+        _, cache = layer(x[:, t : t + 1], cache=cache)
+    return cache
+
+
+if __name__ == "__main__":
+    ivy.set_backend("numpy")
+    rng = np.random.default_rng(0)
+    layer = ivy.MultiHeadAttention(EMBED_DIM, num_heads=NUM_HEADS)
+    layer.eval(fast_call=True)
+    print(
+        f"{'tokens':<10}{'uncached (ms/token)':>22}{'cached (ms/token)':>20}"
+        f"{'cache (KB)':>12}"
+    )
+    for length in [64, 256, 512]:
+        x = rng.standard_normal((BATCH_SIZE, length, EMBED_DIM)).astype("float32")
+        x = ivy.array(x)
+        start = time.perf_counter()
+        _decode_uncached(layer, x)
+        uncached = (time.perf_counter() - start) / length
+        start = time.perf_counter()
+        cache = _decode_cached(layer, x)
+        cached = (time.perf_counter() - start) / length
+        print(
+            f"{length:<10}{uncached * 1e3:>22.2f}{cached * 1e3:>20.2f}"
+            f"{cache.nbytes / 2**10:>12.1f}"
+        )
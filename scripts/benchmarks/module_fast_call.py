@@ -0,0 +1,67 @@
+"""
+Benchmark ivy.Module calls in eval mode with and without ``fast_call``.
+
+The default numbers go through the full ``Module.__call__`` bookkeeping, while the
+fast numbers use ``module.eval(fast_call=True)``, which calls ``_forward`` directly.
+
+Usage: ``python scripts/benchmarks/module_fast_call.py``
+"""
+
+import time
+
+import numpy as np
+
+import ivy
+
+REPEATS = 50
+
+
+def _time(fn):
+    fn()
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        fn()
+    return (time.perf_counter() - start) / REPEATS
+
+
+def _deep_mlp(depth, width):
+    layers = []
+    for _ in range(depth):
+        layers += [ivy.Linear(width, width), ivy.ReLU()]
+    return ivy.Sequential(*layers)
+
+
+if __name__ == "__main__":
+    ivy.set_backend("numpy")
+    rng = np.random.default_rng(0)
+    cases = {
+        "Linear (32 -> 32)": (
+            lambda: ivy.Linear(32, 32),
+            rng.standard_normal((8, 32)),
+        ),
+        "Conv2D (3 -> 8, 3x3)": (
+            lambda: ivy.Conv2D(3, 8, [3, 3], 1, "SAME"),
+            rng.standard_normal((1, 16, 16, 3)),
+        ),
+        "LayerNorm (32)": (
+            lambda: ivy.LayerNorm([32]),
+            rng.standard_normal((8, 32)),
+        ),
+        "Dropout (0.5)": (
+            lambda: ivy.Dropout(0.5),
+            rng.standard_normal((8, 32)),
+        ),
+        "Sequential (10 x Linear + ReLU)": (
+            lambda: _deep_mlp(10, 16),
+            rng.standard_normal((4, 16)),
+        ),
+    }
+    print(f"{'module':<36}{'default (ms)':>14}{'fast_call (ms)':>16}")
+    for name, (build, x) in cases.items():
+        x = ivy.array(x.astype("float32"))
+        module = build()
+        module.eval()
+        default = _time(lambda: module(x))
+        module.eval(fast_call=True)
+        fast = _time(lambda: module(x))
+        print(f"{name:<36}{default * 1e3:>14.3f}{fast * 1e3:>16.3f}")
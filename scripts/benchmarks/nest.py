@@ -0,0 +1,65 @@
+"""
+Benchmark the nest functions, which are implemented on flattened nests.
+
+Each nest is flattened once into its leaves and a treedef of its structure, which
+is shared by all the nests of the same structure, and rebuilt from the treedef,
+instead of recursing through the public functions level by level. Times are for the
+arguments of a typical call, a dict of parameters and a long list of arrays.
+
+Usage: ``python scripts/benchmarks/nest.py``
+"""
+
+import time
+
+import numpy as np
+
+import ivy
+
+REPEATS = 200
+
+
+def _time(fn):
+    fn()
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        fn()
+    return (time.perf_counter() - start) / REPEATS
+
+
+def _is_array(x):
+    return isinstance(x, ivy.Array)
+
+
+def _nests(x):
+    return {
+        "[args, kwargs]": [(x, 1, True), {"axis": -1, "out": None}],
+        "100 parameters": {
+            f"layer{i}": {"w": x, "b": x, "stats": [x, x]} for i in range(25)
+        },
+        "1000 arrays": [x] * 1000,
+    }
+
+
+if __name__ == "__main__":
+    ivy.set_backend("numpy")
+    x = ivy.array(np.random.default_rng(0).standard_normal(4))
+    fns = {
+        "nested_map": lambda n: ivy.nested_map(lambda v: v, n, shallow=False),
+        "nested_map (in place)": lambda n: ivy.nested_map(lambda v: v, n),
+        "nested_argwhere": lambda n: ivy.nested_argwhere(n, _is_array),
+        "nested_argwhere (first)": lambda n: ivy.nested_argwhere(
+            n, _is_array, stop_after_n_found=1
+        ),
+        "nested_any (nests)": lambda n: ivy.nested_any(
+            n, ivy.is_ivy_container, check_nests=True
+        ),
+        "nested_multi_map": lambda n: ivy.nested_multi_map(
+            lambda vs, _: vs[0], [n, n], to_ivy=False
+        ),
+        "tree_flatten": ivy.tree_flatten,
+    }
+    nests = _nests(x)
+    print(f"{'function':<26}" + "".join(f"{name:>18}" for name in nests))
+    for name, fn in fns.items():
+        times = [_time(lambda: fn(nest)) for nest in nests.values()]
+        print(f"{name:<26}" + "".join(f"{t * 1e6:>16.1f}us" for t in times))
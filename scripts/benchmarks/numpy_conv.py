@@ -0,0 +1,93 @@
+"""
+Benchmark the im2col/GEMM NumPy convolutions against the previous tiled approach.
+
+Usage: ``python scripts/benchmarks/numpy_conv.py``
+"""
+
+import importlib
+import time
+import tracemalloc
+
+import numpy as np
+
+import ivy
+
+ivy.set_backend("numpy")
+layers = importlib.import_module("ivy.functional.backends.numpy.layers")
+
+
+def _tiled_conv2d(x, filters, strides, padding):
+    # the previous implementation, which tiles the windows over the output channels
+    strides = [strides] * 2 if isinstance(strides, int) else strides
+    x, filters = layers._dilate_pad_conv(x, filters, strides, padding, 2, [1, 1])
+    filter_shape = list(filters.shape[0:2])
+    input_dim, output_dim = filters.shape[-2:]
+    new_h = (x.shape[1] - filter_shape[0]) // strides[0] + 1
+    new_w = (x.shape[2] - filter_shape[1]) // strides[1] + 1
+    new_shape = [x.shape[0], new_h, new_w] + filter_shape + [x.shape[-1]]
+    new_strides = (
+        x.strides[0],
+        x.strides[1] * strides[0],
+        x.strides[2] * strides[1],
+        x.strides[1],
+        x.strides[2],
+        x.strides[3],
+    )
+    sub_matrices = np.lib.stride_tricks.as_strided(
+        x, new_shape, new_strides, writeable=False
+    )
+    sub_matrices_w_output_dim = np.tile(
+        np.expand_dims(sub_matrices, -1), [1] * 6 + [output_dim]
+    )
+    mult = sub_matrices_w_output_dim * filters.reshape(
+        [1] * 3 + filter_shape + [input_dim, output_dim]
+    )
+    return np.sum(mult, (3, 4, 5))
+
+
+def _measure(fn, *args):
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn(*args)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+CASES = [
+    # batch, height, width, in channels, out channels, kernel
+    (1, 32, 32, 16, 16, 3),
+    (8, 32, 32, 32, 32, 3),
+    (8, 56, 56, 64, 64, 3),
+    (16, 28, 28, 128, 128, 3),
+]
+
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    print(
+        "{:<28}{:>14}{:>14}{:>16}{:>16}".format(
+            "case (B, H, W, I, O, K)", "tiled (s)", "gemm (s)", "tiled peak MB",
+            "gemm peak MB",
+        )
+    )
+    for b, h, w, i, o, k in CASES:
+        x = rng.standard_normal((b, h, w, i)).astype(np.float32)
+        filters = rng.standard_normal((k, k, i, o)).astype(np.float32)
+        gemm_time, gemm_peak = _measure(layers.conv2d, x, filters, 1, "SAME")
+        # the tiled approach needs B*H*W*K*K*I*O elements, skip it when too large
+        if b * h * w * k * k * i * o * 4 < 2**30:
+            tiled_time, tiled_peak = _measure(_tiled_conv2d, x, filters, 1, "SAME")
+            tiled_time, tiled_peak = f"{tiled_time:.4f}", f"{tiled_peak / 2**20:.1f}"
+        else:
+            tiled_time, tiled_peak = "skipped", "> 1024"
+        print(
+            "{:<28}{:>14}{:>14.4f}{:>16}{:>16.1f}".format(
+                str((b, h, w, i, o, k)),
+                tiled_time,
+                gemm_time,
+                tiled_peak,
+                gemm_peak / 2**20,
+            )
+        )
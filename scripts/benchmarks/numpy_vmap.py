@@ -0,0 +1,84 @@
+"""
+Benchmark vmap on the NumPy backend against a per-example Python loop.
+
+The loop reproduces the previous implementation of vmap, which called the mapped
+function once per example and stacked the results.
+
+Usage: ``python scripts/benchmarks/numpy_vmap.py``
+"""
+
+import time
+
+import numpy as np
+
+import ivy
+
+REPEATS = 5
+
+
+def _mlp(x, w1, w2):
+    return ivy.sum(ivy.tanh(ivy.matmul(ivy.relu(ivy.matmul(x, w1)), w2)), axis=-1)
+
+
+def _attention(q, k):
+    return ivy.softmax(ivy.einsum("qd,kd->qk", q, k) / 8.0, axis=-1)
+
+
+def _conv(x, w):
+    return ivy.mean(ivy.conv2d(x, w, 1, "SAME"), axis=(1, 2))
+
+
+def _loop(func, args, in_axes):
+    mapped = [axis is not None for axis in in_axes]
+    size = [a.shape[0] for a, m in zip(args, mapped) if m][0]
+    return np.stack(
+        [
+            ivy.to_numpy(func(*[a[b] if m else a for a, m in zip(args, mapped)]))
+            for b in range(size)
+        ]
+    )
+
+
+def _time(fn):
+    fn()
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        fn()
+    return (time.perf_counter() - start) / REPEATS
+
+
+if __name__ == "__main__":
+    ivy.set_backend("numpy")
+    rng = np.random.default_rng(0)
+    cases = {
+        "mlp (256 x 64)": (
+            _mlp,
+            [
+                rng.standard_normal(shape).astype("float32")
+                for shape in [(256, 64), (64, 64), (64, 8)]
+            ],
+            (0, None, None),
+        ),
+        "attention (64 x 32 x 16)": (
+            _attention,
+            [rng.standard_normal((64, 32, 16)).astype("float32")] * 2,
+            (0, 0),
+        ),
+        "conv2d (32 x 1 x 16 x 16 x 3)": (
+            _conv,
+            [
+                rng.standard_normal((32, 1, 16, 16, 3)).astype("float32"),
+                rng.standard_normal((3, 3, 3, 8)).astype("float32"),
+            ],
+            (0, None),
+        ),
+    }
+    print(f"{'function':<32}{'loop (ms)':>12}{'vmap (ms)':>12}{'fallbacks':>12}")
+    for name, (func, args, in_axes) in cases.items():
+        vmapped = ivy.current_backend().vmap(func, in_axes, 0)
+        looped = _time(lambda: _loop(func, args, in_axes))
+        batched = _time(lambda: vmapped(*args))
+        print(
+            f"{name:<32}{looped * 1e3:>12.2f}{batched * 1e3:>12.2f}"
+            f"{len(vmapped.fallback_ops):>12}"
+        )
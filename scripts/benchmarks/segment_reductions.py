@@ -0,0 +1,70 @@
+"""
+Benchmark the segment reductions of the NumPy backend.
+
+Each reduction of a million values is timed at increasing numbers of segments, as
+``ivy.unsorted_segment_*`` computes it, with a single scatter, and with a mask per
+segment, as the backend used to. The masks are only timed up to
+``MAX_LOOP_SEGMENTS`` segments, as they take quadratic time.
+
+Usage: ``python scripts/benchmarks/segment_reductions.py``
+"""
+
+import time
+
+import numpy as np
+
+import ivy
+
+NUM_VALUES = 1_000_000
+NUM_SEGMENTS = [100, 1_000, 10_000, 100_000, 1_000_000]
+MAX_LOOP_SEGMENTS = 10_000
+SHAPES = {"vector": (NUM_VALUES,), "rows of 16": (NUM_VALUES // 16, 16)}
+
+
+def _loop(data, segment_ids, num_segments, reduce, initial):
+    res = np.full((num_segments,) + data.shape[1:], initial, dtype=data.dtype)
+    for i in range(num_segments):
+        mask_index = segment_ids == i
+        if np.any(mask_index):
+            res[i] = reduce(data[mask_index], axis=0)
+    return res
+
+
+def _time(fn, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        ret = fn()
+        best = min(best, time.perf_counter() - start)
+    return ret, best
+
+
+if __name__ == "__main__":
+    ivy.set_backend("numpy")
+    rng = np.random.default_rng(0)
+    print(
+        f"{'data':<12}{'reduction':<10}{'segments':>10}{'loop (ms)':>12}"
+        f"{'ivy (ms)':>12}"
+    )
+    for label, shape in SHAPES.items():
+        data = rng.random(shape)
+        for name, reduce, initial in (
+            ("sum", np.sum, 0),
+            ("max", np.max, np.finfo(data.dtype).min),
+        ):
+            fn = getattr(ivy, f"unsorted_segment_{name}")
+            for num_segments in NUM_SEGMENTS:
+                segment_ids = rng.integers(0, num_segments, shape[0])
+                ret, elapsed = _time(lambda: fn(data, segment_ids, num_segments))
+                loop = ""
+                if num_segments <= MAX_LOOP_SEGMENTS:
+                    expected, loop_time = _time(
+                        lambda: _loop(data, segment_ids, num_segments, reduce, initial),
+                        repeat=1,
+                    )
+                    assert np.allclose(ret, expected)
+                    loop = f"{loop_time * 1e3:.1f}"
+                print(
+                    f"{label:<12}{name:<10}{num_segments:>10}{loop:>12}"
+                    f"{elapsed * 1e3:>12.1f}"
+                )
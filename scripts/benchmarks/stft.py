@@ -0,0 +1,96 @@
+"""
+Benchmark ivy.stft, ivy.istft, ivy.StreamingSTFT and ivy.mel_weight_matrix.
+
+The NumPy backend's stft is timed against the loop it used to transform one frame
+at a time, which only batched by recursing over the leading axes. istft is timed
+for the NumPy backend and the compositional implementation, streaming for 20 ms
+chunks against transforming the whole signal at once, and mel_weight_matrix for
+cache hits against computing the matrix.
+
+Usage: ``python scripts/benchmarks/stft.py``
+"""
+
+import time
+
+import numpy as np
+
+import ivy
+from ivy.functional.ivy.experimental import layers
+
+SAMPLE_RATE = 16_000
+SECONDS = [1, 10, 60]
+FRAME_LENGTH, FRAME_STEP = 512, 128
+
+
+def _loop(x, frame_length, frame_step, fft_length, window):
+    num_frames = 1 + (x.shape[-1] - frame_length) // frame_step
+    frames = []
+    for i in range(num_frames):
+        frame = x[..., i * frame_step : i * frame_step + frame_length] * window
+        frame = np.pad(frame, [(0, fft_length - frame_length)])
+        frames.append(np.fft.fft(frame.astype(np.complex64))[: fft_length // 2 + 1])
+    return np.stack(frames)
+
+
+def _stream(x, chunk_size):
+    stream = ivy.StreamingSTFT(FRAME_LENGTH, FRAME_STEP, window_fn=np.hanning)
+    frames = [
+        stream.process(x[..., i : i + chunk_size])
+        for i in range(0, x.shape[-1], chunk_size)
+    ]
+    return ivy.concat(frames + [stream.flush()], axis=-2)
+
+
+def _time(fn, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        ret = fn()
+        best = min(best, time.perf_counter() - start)
+    return ret, best
+
+
+if __name__ == "__main__":
+    ivy.set_backend("numpy")
+    rng = np.random.default_rng(0)
+    window = np.hanning(FRAME_LENGTH)
+    print(
+        f"{'seconds':<10}{'loop (ms)':>12}{'stft (ms)':>12}{'istft (ms)':>12}"
+        f"{'compos. (ms)':>14}{'stream (ms)':>13}"
+    )
+    for seconds in SECONDS:
+        x = rng.standard_normal(seconds * SAMPLE_RATE).astype(np.float32)
+        ret, elapsed = _time(
+            lambda: ivy.stft(x, FRAME_LENGTH, FRAME_STEP, window_fn=np.hanning)
+        )
+        expected, loop_time = _time(
+            lambda: _loop(x, FRAME_LENGTH, FRAME_STEP, FRAME_LENGTH, window), repeat=1
+        )
+        assert np.allclose(ivy.to_numpy(ret), expected, atol=1e-3)
+        signals, inverse_time = _time(lambda: ivy.istft(ret, FRAME_LENGTH, FRAME_STEP))
+        compos, compos_time = _time(
+            lambda: layers.istft(ret, FRAME_LENGTH, FRAME_STEP)
+        )
+        assert np.allclose(ivy.to_numpy(signals), ivy.to_numpy(compos), atol=1e-3)
+        streamed, stream_time = _time(lambda: _stream(x, SAMPLE_RATE // 50))
+        assert np.allclose(ivy.to_numpy(streamed), ivy.to_numpy(ret), atol=1e-3)
+        print(
+            f"{seconds:<10}{loop_time * 1e3:>12.1f}{elapsed * 1e3:>12.2f}"
+            f"{inverse_time * 1e3:>12.2f}{compos_time * 1e3:>14.2f}"
+            f"{stream_time * 1e3:>13.2f}"
+        )
+
+    backend_fn = ivy.current_backend().mel_weight_matrix
+
+    def _uncached():
+        backend_fn.cache_clear()
+        return ivy.mel_weight_matrix(128, FRAME_LENGTH // 2 + 1, SAMPLE_RATE)
+
+    _, uncached_time = _time(_uncached)
+    _, cached_time = _time(
+        lambda: ivy.mel_weight_matrix(128, FRAME_LENGTH // 2 + 1, SAMPLE_RATE)
+    )
+    print(
+        f"mel_weight_matrix: {uncached_time * 1e3:.2f} ms computed, "
+        f"{cached_time * 1e3:.2f} ms cached"
+    )
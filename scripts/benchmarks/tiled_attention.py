@@ -0,0 +1,56 @@
+"""
+Benchmark ivy.scaled_dot_product_attention with and without ``block_size``.
+
+Peak memory is measured with tracemalloc, which tracks the allocations of NumPy
+arrays, so the NumPy backend is used.
+
+Usage: ``python scripts/benchmarks/tiled_attention.py``
+"""
+
+import time
+import tracemalloc
+
+import numpy as np
+
+import ivy
+
+FEAT_DIM = 64
+BLOCK_SIZE = 256
+
+
+def _measure(fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+if __name__ == "__main__":
+    ivy.set_backend("numpy")
+    rng = np.random.default_rng(0)
+    print(
+        f"{'sequence length':<18}{'causal':>8}{'dense (ms)':>12}{'dense (MB)':>12}"
+        f"{'tiled (ms)':>12}{'tiled (MB)':>12}"
+    )
+    for length in [512, 2048, 4096]:
+        q, k, v = (
+            ivy.array(rng.standard_normal((1, length, FEAT_DIM)).astype("float32"))
+            for _ in range(3)
+        )
+        for is_causal in [False, True]:
+            dense = _measure(
+                lambda: ivy.scaled_dot_product_attention(q, k, v, is_causal=is_causal)
+            )
+            tiled = _measure(
+                lambda: ivy.scaled_dot_product_attention(
+                    q, k, v, is_causal=is_causal, block_size=BLOCK_SIZE
+                )
+            )
+            print(
+                f"{length:<18}{str(is_causal):>8}"
+                f"{dense[0] * 1e3:>12.1f}{dense[1] / 2**20:>12.1f}"
+                f"{tiled[0] * 1e3:>12.1f}{tiled[1] / 2**20:>12.1f}"
+            )
@@ -0,0 +1,71 @@
+"""
+Benchmark the SVD methods available to ivy.tucker against ``truncated_svd``.
+
+Each method computes the leading singular vectors of a low-rank matrix, and of the
+unfoldings of a low-rank tensor during a Tucker decomposition. Peak memory is
+measured with tracemalloc, which tracks the allocations of NumPy arrays, so the NumPy
+backend is used.
+
+Usage: ``python scripts/benchmarks/tucker_svd.py``
+"""
+
+import time
+import tracemalloc
+
+import numpy as np
+
+import ivy
+
+METHODS = ["truncated_svd", "symeig_svd", "randomized_svd", "streaming_svd"]
+RANK = 16
+
+
+def _measure(fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    ret = fn()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return ret, elapsed, peak
+
+
+def _low_rank(rng, shape):
+    factors = [rng.standard_normal((d, RANK)).astype("float32") for d in shape]
+    core = rng.standard_normal((RANK,) * len(shape)).astype("float32")
+    x = ivy.multi_mode_dot(core, factors, modes=list(range(len(shape))))
+    return x + 1e-3 * ivy.array(rng.standard_normal(shape).astype("float32"))
+
+
+if __name__ == "__main__":
+    ivy.set_backend("numpy")
+    rng = np.random.default_rng(0)
+
+    print(f"{'matrix':<16}{'method':<18}{'time (ms)':>12}{'peak (MB)':>12}{'error':>10}")
+    for shape in [(256, 8192), (1024, 32768), (8192, 512)]:
+        x = _low_rank(rng, shape)
+        _, S_gt, _ = ivy.truncated_svd(x, n_eigenvecs=RANK)
+        for method in METHODS:
+            (_, S, _), elapsed, peak = _measure(
+                lambda: getattr(ivy, method)(x, n_eigenvecs=RANK)
+            )
+            error = float(ivy.max(ivy.abs(S - S_gt)) / S_gt[0])
+            print(
+                f"{str(shape):<16}{method:<18}{elapsed * 1e3:>12.1f}"
+                f"{peak / 2**20:>12.1f}{error:>10.1e}"
+            )
+
+    print()
+    print(f"{'tensor':<16}{'method':<18}{'time (ms)':>12}{'peak (MB)':>12}{'error':>10}")
+    for shape in [(128, 128, 128), (64, 128, 2048)]:
+        x = _low_rank(rng, shape)
+        norm = ivy.sqrt(ivy.sum(x**2))
+        for method in METHODS:
+            tucker, elapsed, peak = _measure(
+                lambda: ivy.tucker(x, [RANK] * 3, svd=method, seed=0, n_iter_max=3)
+            )
+            error = float(ivy.sqrt(ivy.sum((tucker.to_tensor() - x) ** 2)) / norm)
+            print(
+                f"{str(shape):<16}{method:<18}{elapsed * 1e3:>12.1f}"
+                f"{peak / 2**20:>12.1f}{error:>10.1e}"
+            )
@@ -0,0 +1,65 @@
+"""
+Regenerate or validate the index of the dtypes and devices supported by each function,
+which ``ivy.function_supported_dtypes`` and its variants read from.
+
+Usage:
+``python scripts/support_index.py regenerate [--backends ...] [--frontends ...]``
+``python scripts/support_index.py validate [--backends ...]``
+
+The index is written to, and read from, ``--path``, or by default
+``$IVY_SUPPORT_INDEX``, which ivy then loads it from. Unless given, the backends are
+those installed.
+"""
+
+import argparse
+import importlib.util
+import sys
+
+import ivy
+from ivy.utils import support_index
+
+
+def _installed_backends():
+    return [
+        backend
+        for backend in ivy.utils.backend.handler._backend_dict
+        if importlib.util.find_spec(backend) is not None
+    ]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("command", choices=["regenerate", "validate"])
+    parser.add_argument("--backends", nargs="+", default=None)
+    parser.add_argument(
+        "--frontends",
+        nargs="+",
+        default=[],
+        help="frontends whose functions to index as well, e.g. torch",
+    )
+    parser.add_argument("--path", default=None)
+    args = parser.parse_args()
+    if not (args.path or support_index.index_path()):
+        parser.error("either --path or IVY_SUPPORT_INDEX must be given")
+    backends = args.backends or _installed_backends()
+
+    if args.command == "regenerate":
+        counts = support_index.regenerate(
+            backends, frontends=args.frontends, path=args.path
+        )
+        for backend, count in counts.items():
+            print(f"{backend}: {count} entries")
+        print(f"written to {args.path or support_index.index_path()}")
+    else:
+        try:
+            mismatches = support_index.validate(backends, path=args.path)
+        except (OSError, ivy.utils.exceptions.IvyException) as e:
+            print(e)
+            sys.exit(1)
+        for section, kind, recurse, fn_key, indexed, resolved in mismatches:
+            print(
+                f"{section} {fn_key} {kind} (recurse={recurse}): "
+                f"indexed {indexed}, resolved {resolved}"
+            )
+        print(f"{len(mismatches)} mismatched entries")
+        sys.exit(1 if mismatches else 0)